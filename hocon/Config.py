@@ -1,3 +1,6 @@
+from .ConfigMergeable import ConfigMergeable
+
+
 class Config(ConfigMergeable):
     """
      * An immutable map from config paths to config values. Paths are dot-separated
@@ -0,0 +1,39 @@
+import collections
+
+
+class ConfigEvent(collections.namedtuple('ConfigEvent', (
+    'event_type', 'path', 'value', 'origin'
+))):
+    """
+    One step through a parsed file, as produced by
+    {@link config_factory#parse_file_events}.
+
+    :param event_type: ConfigEventType
+
+    :param path: Path
+        Where the event happens: for a key, the path of the field; for
+        anything else, the path of the field or list that holds it. None at
+        the root of the file.
+
+    :param value:
+        Depends on event_type:
+
+        key
+            True if the field was set with +=, appending to a list,
+            otherwise False.
+
+        value
+            The unwrapped scalar: a string, int, long, float, bool or None.
+
+        substitution
+            (Path, boolean) - the path referred to, and whether the
+            substitution is optional, as in ${?a.b}.
+
+        include
+            (String, String) - the kind of include ("file", "url" or
+            "classpath", or None for a bare quoted name) and the name.
+
+        None for the start and end of objects and lists.
+
+    :param origin: ConfigOrigin - the file and line the event comes from
+    """
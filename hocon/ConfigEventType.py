@@ -0,0 +1,34 @@
+"""
+The kind of a {@link ConfigEvent} read from a stream of HOCON or JSON.
+
+Values:
+
+    start_object, end_object
+        Around the fields of an object, including the root object even when
+        the file leaves out its braces.
+
+    start_list, end_list
+        Around the elements of a list.
+
+    key
+        A field name, as the path from the root of the file to the field.
+        The field's value comes next.
+
+    value
+        A scalar: a string, number, boolean or null, or the string made by
+        concatenating several scalars on one line.
+
+    substitution
+        A ${} reference, which is not resolved.
+
+    include
+        An include statement, which is not followed.
+"""
+
+from enum import Enum
+
+
+ConfigEventType = Enum('ConfigEventType', (
+    'start_object', 'end_object', 'start_list', 'end_list', 'key', 'value',
+    'substitution', 'include'
+))
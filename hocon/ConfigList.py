@@ -1,3 +1,6 @@
+from .ConfigValue import ConfigValue
+
+
 class ConfigList(ConfigValue):
     """
     public interface ConfigList extends List<ConfigValue>, ConfigValue
@@ -1,3 +1,6 @@
+from .ConfigValue import ConfigValue
+
+
 class ConfigObject(ConfigValue):
     """
      * Subtype of {@link ConfigValue} representing an object (AKA dictionary or map)
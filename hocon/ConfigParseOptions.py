@@ -1,8 +1,9 @@
 import collections
 
 
-class ConfigParseOptions(collections.nametuple('ConfigParseOptions', (
-    'syntax', 'origin_description', 'allow_missing', 'includer'
+class ConfigParseOptions(collections.namedtuple('ConfigParseOptions', (
+    'syntax', 'origin_description', 'allow_missing', 'includer', 'use_mmap',
+    'drop_comments', 'only_paths', 'url_cache', 'native_json'
 ))):
     """
     A set of options related to parsing.
@@ -37,6 +38,39 @@ class ConfigParseOptions(collections.nametuple('ConfigParseOptions', (
 
     :param includer: ConfigIncluder
         A ConfigIncluder which customizes how includes are handled.
+
+    :param use_mmap: boolean
+        Set to true to memory-map files instead of reading them through a
+        file object. The mapped bytes are decoded a block at a time as the
+        tokenizer asks for them. Only affects parsing of files.
+
+    :param drop_comments: boolean
+        Set to true if the comments in the parsed text are never going to be
+        looked at, through {@link ConfigOrigin#comments} or by rendering with
+        comments. The tokenizer then skips over each comment without keeping
+        its text, and the parsed values have no comments.
+
+    :param only_paths: tuple<String>
+        Path expressions; if set, only the parts of the document at or under
+        these paths are parsed, and everything else is skipped over without
+        building any values for it. None to parse everything. Only applies
+        to HOCON and JSON; included files are parsed whole, then cut down
+        along with the rest.
+
+    :param url_cache: UrlCache
+        If set, http and https URLs, including included ones, are fetched
+        through it: over pooled keep-alive connections, conditionally when
+        fetched before, and an unchanged URL's earlier parse is reused.
+        None to open each URL afresh.
+
+    :param native_json: String
+        If set, JSON is parsed with the json module instead of the HOCON
+        tokenizer and parser, which is much faster for large documents.
+        "file" gives every value the origin of the document, without line
+        numbers; "line" gives each value the origin of the line it starts
+        on, at some cost in speed. Documents the json module rejects are
+        handed to the usual parser, to report the error. None to always use
+        the usual parser.
     """
 
     @classmethod
@@ -46,9 +80,14 @@ class ConfigParseOptions(collections.nametuple('ConfigParseOptions', (
         """
         return ConfigParseOptions(
             syntax=None,
-            origin_decription=None,
+            origin_description=None,
             allow_missing=True,
             includer=None,
+            use_mmap=False,
+            drop_comments=False,
+            only_paths=None,
+            url_cache=None,
+            native_json=None,
         )
 
     def set_syntax(self, syntax):
@@ -83,7 +122,7 @@ class ConfigParseOptions(collections.nametuple('ConfigParseOptions', (
 
     def _with_fallback_origin_description(self, origin_description):
         if self.origin_description is None:
-            return self.replace(origin_description=origin_description)
+            return self._replace(origin_description=origin_description)
         else:
             return self
 
@@ -113,12 +152,91 @@ class ConfigParseOptions(collections.nametuple('ConfigParseOptions', (
         """
         return self._replace(includer=includer)
 
+    def set_use_mmap(self, use_mmap):
+        """
+        Set to true to memory-map files instead of reading them through a
+        file object. JSON files parsed with native_json are read as usual,
+        since the json module needs the whole text as one string.
+
+        @param useMmap
+        @return options with the "use mmap" flag set
+
+        :param use_mmap: boolean
+        :return: ConfigParseOptions
+        """
+        return self._replace(use_mmap=use_mmap)
+
+    def set_drop_comments(self, drop_comments):
+        """
+        Set to true to skip over comments while parsing rather than keeping
+        them with the values they precede.
+
+        @param dropComments
+        @return options with the "drop comments" flag set
+
+        :param drop_comments: boolean
+        :return: ConfigParseOptions
+        """
+        return self._replace(drop_comments=drop_comments)
+
+    def set_only_paths(self, only_paths):
+        """
+        Set path expressions to restrict parsing to, like calling
+        {@link Config#withOnlyPath} for each of them and merging the results,
+        but without ever building most of the values that would be left
+        out. A substitution in what's kept that refers to something left out
+        will not resolve. An object merged with a substitution on the way to
+        one of the paths, which withOnlyPath can't look into until it's
+        resolved, is kept whole.
+
+        @param onlyPaths
+        @return options with the paths to parse set
+
+        :param only_paths: Iterable<String> - None to parse everything
+        :return: ConfigParseOptions
+        """
+        if only_paths is not None:
+            only_paths = tuple(sorted(set(only_paths)))
+        return self._replace(only_paths=only_paths)
+
+    def set_url_cache(self, url_cache):
+        """
+        Set a UrlCache to fetch http and https URLs through.
+
+        @param urlCache
+        @return options with the URL cache set
+
+        :param url_cache: UrlCache - None to open each URL afresh
+        :return: ConfigParseOptions
+        """
+        return self._replace(url_cache=url_cache)
+
+    def set_native_json(self, native_json):
+        """
+        Set how JSON is parsed with the json module, if at all. The file
+        is read whole, without use_mmap.
+
+        @param nativeJson
+        @return options with the native JSON mode set
+
+        :param native_json: String - "file" or "line", for the granularity
+            of the origins, or None to use the usual parser
+        :return: ConfigParseOptions
+        :raises: ValueError for anything else
+        """
+        if native_json not in (None, "file", "line"):
+            raise ValueError("native_json must be 'file', 'line' or None, not "
+                             + repr(native_json))
+        return self._replace(native_json=native_json)
+
     def prepend_includer(self, includer):
         """
         :param includer: ConfigIncluder
         :return: ConfigParseOptions
         """
-        if self.includer is not None:
+        if self.includer is includer:
+            return self
+        elif self.includer is not None:
             return self.set_includer(includer.with_fallback(self.includer))
         else:
             return self.set_includer(includer)
@@ -128,7 +246,9 @@ class ConfigParseOptions(collections.nametuple('ConfigParseOptions', (
         :param includer: ConfigIncluder
         :return: ConfigParseOptions
         """
-        if self.includer is not None:
+        if self.includer is includer:
+            return self
+        elif self.includer is not None:
             return self.set_includer(self.includer.with_fallback(includer))
         else:
             return self.set_includer(includer)
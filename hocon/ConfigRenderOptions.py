@@ -49,7 +49,7 @@ class ConfigRenderOptions(collections.namedtuple('ConfigRenderOptions',
          *
          * @return the default render options
         """
-        return ConfigRenderOptions(true, true, true, true)
+        return ConfigRenderOptions(True, True, True, True)
 
     @classmethod
     def concise(cls):
@@ -59,7 +59,7 @@ class ConfigRenderOptions(collections.namedtuple('ConfigRenderOptions',
          *
          * @return the concise render options
         """
-        return ConfigRenderOptions(false, false, false, true)
+        return ConfigRenderOptions(False, False, False, True)
 
     def set_comments(self, value):
         """
@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class ConfigSyntax(Enum('ConfigSyntax', ('json', 'conf', 'properties'))):
+class ConfigSyntax(Enum):
     """
     The syntax of a character stream (<a href="http://json.org">JSON</a>, <a
     href="https://github.com/typesafehub/config/blob/master/HOCON.md">HOCON</a>
@@ -29,3 +29,9 @@ class ConfigSyntax(Enum('ConfigSyntax', ('json', 'conf', 'properties'))):
             >Java properties</a> format. Associated with the <code>.properties</code>
             file extension and <code>text/x-java-properties</code> Content-Type.
     """
+
+    # numbered as the functional API would; Python 3 won't subclass an enum
+    # that already has members
+    json = 1
+    conf = 2
+    properties = 3
@@ -1,3 +1,6 @@
+from .ConfigMergeable import ConfigMergeable
+
+
 class ConfigValue(ConfigMergeable):
     """
     public interface ConfigValue extends ConfigMergeable
@@ -1,10 +1,17 @@
 from enum import Enum
 
 
-class ConfigValueType(Enum('ConfigValueType', (
-    'object', 'list', 'number', 'boolean', 'null', 'string'
-))):
+class ConfigValueType(Enum):
     """
     The type of a configuration value (following the <a
     href="http://json.org">JSON</a> type schema).
     """
+
+    # numbered as the functional API would; Python 3 won't subclass an enum
+    # that already has members
+    object = 1
+    list = 2
+    number = 3
+    boolean = 4
+    null = 5
+    string = 6
@@ -0,0 +1,37 @@
+from enum import Enum
+
+
+class TimeUnit(Enum):
+    """
+    Stands in for java.util.concurrent.TimeUnit in the duration getters of
+    Config. The value of each unit is its length in nanoseconds.
+    """
+
+    nanoseconds = 1
+    microseconds = 1000
+    milliseconds = 1000 * 1000
+    seconds = 1000 * 1000 * 1000
+    minutes = 60 * 1000 * 1000 * 1000
+    hours = 60 * 60 * 1000 * 1000 * 1000
+    days = 24 * 60 * 60 * 1000 * 1000 * 1000
+
+    def convert(self, duration, source_unit):
+        """
+        Converts a duration in source_unit to this unit, truncating toward
+        zero like Java does.
+
+        :param duration: int
+        :param source_unit: TimeUnit
+        :return: int
+        """
+        nanos = duration * source_unit.value
+        if nanos < 0:
+            return -(-nanos // self.value)
+        return nanos // self.value
+
+    def to_nanos(self, duration):
+        """
+        :param duration: int
+        :return: int
+        """
+        return duration * self.value
@@ -20,7 +20,22 @@ overview</a> which describes the big picture as shown in those
 examples.
 """
 
-from . import impl
+import sys
+
+from . import exceptions
+from .impl import ConfigImpl
+from .impl import ConfigReloader
+from .impl import EventReader
+from .impl import Merger
+from .impl import ParallelLoader
+from .impl import ParseCache
+from .impl import Parseable
+from .impl import SerializedConfigValue
+from .impl.Path import Path
+from .Config import Config
+from .ConfigObject import ConfigObject
+from .ConfigParseOptions import ConfigParseOptions
+from .ConfigResolveOptions import ConfigResolveOptions
 
 
 def empty(origin_description=None):
@@ -46,7 +61,7 @@ def empty(origin_description=None):
      *            description of the config
      * @return an empty configuration
     """
-    return impl.ConfigImpl.empty_config(origin_description)
+    return ConfigImpl.empty_config(origin_description)
 
 
 def system_environment():
@@ -66,7 +81,7 @@ def system_environment():
      *
      * @return system environment variables parsed into a <code>Config</code>
     """
-    return impl.ConfigImpl.env_variables_as_config()
+    return ConfigImpl.env_variables_as_config()
 
 
 def parse_file(f, options=None):
@@ -77,7 +92,37 @@ def parse_file(f, options=None):
     """
     if options is None:
         options = ConfigParseOptions.defaults()
-    return impl.Parseable.new_file(f, options).parse().to_config()
+    return Parseable.new_file(f, options).parse().to_config()
+
+
+def parse_file_events(f, options=None):
+    """
+    Reads a file as a stream of ConfigEvents instead of building a Config,
+    in memory that doesn't grow with the size of the file. The file is
+    read as it's iterated over, so stopping early skips the rest of it.
+    Substitutions and includes come out as events and are neither
+    resolved nor followed.
+
+    :param f: String - filesystem path
+    :param options: ConfigParseOptions
+    :return: Iterator<ConfigEvent> - closing it closes the file
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    return EventReader.read_events(Parseable.new_file(f, options))
+
+
+def parse_string_events(s, options=None):
+    """
+    Like parse_file_events, for a string.
+
+    :param s: String
+    :param options: ConfigParseOptions
+    :return: Iterator<ConfigEvent>
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    return EventReader.read_events(Parseable.new_string(s, options))
 
 
 def parse_url(url, options=None):
@@ -88,7 +133,55 @@ def parse_url(url, options=None):
     """
     if options is None:
         options = ConfigParseOptions.defaults()
-    return impl.Parseable.new_url(url, options).parse().to_config()
+    return Parseable.new_url(url, options).parse().to_config()
+
+
+def _async_loader():
+    """
+    :return: module - hocon.impl.AsyncLoader, imported only when it's used,
+        since it isn't Python 2 syntax
+    """
+    if sys.version_info < (3, 5):
+        raise NotImplementedError(
+            "loading with asyncio needs Python 3.5 or later")
+    from .impl import AsyncLoader
+    return AsyncLoader
+
+
+def parse_file_async(f, options=None, includer=None, executor=None):
+    """
+    Like parse_file, as a coroutine that doesn't block the event loop. The
+    file and everything it includes are read through includer, includes at
+    the same depth concurrently, and then parsed in executor.
+
+    :param f: String - filesystem path
+    :param options: ConfigParseOptions
+    :param includer: AsyncIncluder - from hocon.impl.AsyncLoader, or None
+        to do the blocking reads in executor
+    :param executor: Executor - or None for the event loop's default
+    :return: coroutine returning a Config
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    return _async_loader().parse_config(
+        Parseable.new_file(f, options), includer, executor)
+
+
+def parse_url_async(url, options=None, includer=None, executor=None):
+    """
+    Like parse_url, as a coroutine that doesn't block the event loop; see
+    parse_file_async.
+
+    :param url: String
+    :param options: ConfigParseOptions
+    :param includer: AsyncIncluder
+    :param executor: Executor
+    :return: coroutine returning a Config
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    return _async_loader().parse_config(
+        Parseable.new_url(url, options), includer, executor)
 
 
 def parse_path(path, options=None):
@@ -99,7 +192,82 @@ def parse_path(path, options=None):
     """
     if options is None:
         options = ConfigParseOptions.defaults()
-    return impl.ConfigImpl.parse_path(path, options).to_config()
+    return ConfigImpl.parse_path(path, options).to_config()
+
+
+def parse_path_cached(path, cache_directory, options=None,
+                      resolve_options=None):
+    """
+    Like parse_path, but keeps the parsed tree in an on-disk cache under
+    cache_directory, so that later calls only have to unpickle it. An entry
+    is discarded as soon as the file, or any file it includes, changes.
+
+    :param path: String - filesystem path
+    :param cache_directory: String
+    :param options: ConfigParseOptions
+    :param resolve_options: ConfigResolveOptions - if given, the tree is
+        resolved with these options before being cached
+    :return: Config
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    return ParseCache.ParseCache(cache_directory) \
+        .parse_file(path, options, resolve_options).to_config()
+
+
+def parse_serialized(data, path=None):
+    """
+    Loads a config written by hocon.util.serialize. Decoding is cheaper
+    than parsing the original text, and with a path only the subtree at
+    that path is decoded; everything else is skipped over unread.
+
+    :param data: bytes - as returned by hocon.util.serialize
+    :param path: String - path expression of the subtree to load, or None
+        for the whole config
+    :return: Config - the serialized config, or the object at path as a
+        config (empty if there is nothing there)
+    :raises: ConfigException.WrongType if the value at path, or the
+        serialized value itself, isn't an object
+    """
+    if path is None:
+        value = SerializedConfigValue.deserialize(data)
+        if isinstance(value, Config):
+            return value
+        if not isinstance(value, ConfigObject):
+            raise exceptions.WrongType(
+                origin=value.origin(),
+                message="serialized value has type "
+                + value.value_type().name + " rather than object")
+        return value.to_config()
+    value = SerializedConfigValue.deserialize_path(
+        data, Path.new_path(path))
+    if value is None:
+        return empty()
+    if not isinstance(value, ConfigObject):
+        raise exceptions.WrongType(
+            origin=value.origin(), path=path, expected="object",
+            actual=value.value_type().name)
+    return value.to_config()
+
+
+def parse_paths_reloadable(paths, options=None, resolve_options=None):
+    """
+    Parses and resolves a list of files, merged with the first taking
+    priority, into an object that can bring the result up to date when they
+    are edited. Its reload() re-parses only the files that changed and
+    re-resolves only the substitutions that depend on what changed.
+
+    :param paths: List<String> - filesystem paths, highest priority first
+    :param options: ConfigParseOptions
+    :param resolve_options: ConfigResolveOptions
+    :return: ConfigReloader - config() is the current Config, reload()
+        updates and returns it
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    if resolve_options is None:
+        resolve_options = ConfigResolveOptions.defaults()
+    return ConfigReloader.ConfigReloader(paths, options, resolve_options)
 
 
 def parse_path_any_syntax(path_basename, options=None):
@@ -136,10 +304,33 @@ def parse_path_any_syntax(path_basename, options=None):
     """
     if options is None:
         options = ConfigParseOptions.defaults()
-    return impl.ConfigImpl.parse_path_any_syntax(path_basename, options) \
+    return ConfigImpl.parse_path_any_syntax(path_basename, options) \
         .to_config()
 
 
+def parse_path_parallel(path_basename, options=None, max_workers=None):
+    """
+    Like parse_path_any_syntax, but the siblings and the files they include
+    are parsed side by side in a pool of processes, each file once all the
+    files it includes are done. The result is the same as
+    parse_path_any_syntax's: the files are merged in the same order.
+
+    Falls back to parse_path_any_syntax when concurrent.futures isn't
+    available (the futures backport on Python 2) or options has a custom
+    includer.
+
+    :param path_basename: String - a filename with or without extension
+    :param options: ConfigParseOptions
+    :param max_workers: int - size of the process pool, or None for the
+        number of processors
+    :return: Config - the parsed configuration
+    """
+    if options is None:
+        options = ConfigParseOptions.defaults()
+    return ParallelLoader.parse_path_any_syntax(
+        path_basename, options, max_workers).to_config()
+
+
 def parse_string(s, options=None):
     """
     :param s: String
@@ -148,7 +339,7 @@ def parse_string(s, options=None):
     """
     if options is None:
         options = ConfigParseOptions.defaults()
-    return impl.Parseable.new_string(s, options).parse().to_config()
+    return Parseable.new_string(s, options).parse().to_config()
 
 
 def parse_dict(values, origin_description=None):
@@ -174,5 +365,27 @@ def parse_dict(values, origin_description=None):
         error messages)
     :return: Config - the map converted to a {@code Config}
     """
-    return impl.ConfigImpl.from_path_dict(values, origin_description) \
+    return ConfigImpl.from_path_dict(values, origin_description) \
         .to_config()
+
+
+def merge(configs):
+    """
+    Merges a stack of configs or values in one go, with the same result as
+    configs[0].with_fallback(configs[1]).with_fallback(configs[2])... but
+    merging each key down the whole stack at once, so the objects of the
+    result are made once each instead of once per layer.
+
+    :param configs: List<ConfigMergeable> - Configs or ConfigValues, highest
+        priority first
+    :return: Config if configs[0] is one, otherwise ConfigValue
+    :raises: ValueError if configs is empty
+    """
+    if not configs:
+        raise ValueError("merge: configs is empty")
+    if len(configs) == 1:
+        return configs[0]
+    merged = Merger.merge_all([c.to_fallback_value() for c in configs])
+    if isinstance(configs[0], Config):
+        return merged.to_config()
+    return merged
@@ -4,7 +4,7 @@ instances. See also {@link ConfigFactory} which has methods for parsing files
 and certain in-memory data structures.
 """
 
-from . import impl
+from .impl import ConfigImpl
 
 
 def from_any_ref(object, origin_description=None):
@@ -64,7 +64,7 @@ def from_any_ref(object, origin_description=None):
      * @param object
      * @return a new {@link ConfigValue}
     """
-    return impl.ConfigImpl.fromAnyRef(object, origin_description)
+    return ConfigImpl.from_any_ref(object, origin_description)
 
 
 def from_dict(values, origin_description):
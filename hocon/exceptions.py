@@ -17,6 +17,7 @@ class ConfigException(Exception):
                          origin.description() + ': ' + message)
         self._cause = cause
         self._origin = origin
+        super(ConfigException, self).__init__(self._message)
 
     def origin(self):
         """
@@ -53,7 +54,7 @@ class WrongType(ConfigException):
             origin=origin,
             cause=cause,
             message=(message if message is not None else
-                     path + " has type " + actual + "rather than " + expected),
+                     path + " has type " + actual + " rather than " + expected),
         )
 
 
@@ -116,7 +117,7 @@ class BadValue(ConfigException):
         super(BadValue, self).__init__(
             origin=origin,
             cause=cause,
-            message=(message if message is not None else
+            message=(message if path is None else
                      "Invalid value at '" + path + "': " + message),
         )
 
@@ -222,7 +223,7 @@ class ValidationFailed(ConfigException):
         :param problems: Iterable<ValidationProblem>
         """
         super(ValidationFailed, self).__init__(
-            self, message=ValidationFailed._make_message(problems))
+            message=ValidationFailed._make_message(problems))
         self._problems = problems
 
     def problems(self):
@@ -242,7 +243,7 @@ class ValidationFailed(ConfigException):
                 description=p.origin.description(),
                 path=p.path,
                 problem=p.problem,
-            ) for p in self._problems
+            ) for p in problems
         ])
         if len(s) == 0:
             raise BugOrBroken(
@@ -0,0 +1,239 @@
+from .. import exceptions
+from ..ConfigObject import ConfigObject
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+class AbstractConfigObject(AbstractConfigValue, ConfigObject):
+    """
+    Attributes:
+
+        _config: SimpleConfig - made on first use of to_config(); Java
+            makes it in the constructor
+    """
+
+    def __init__(self, origin):
+        """
+        :param origin: ConfigOrigin
+        """
+        super(AbstractConfigObject, self).__init__(origin)
+        self._config = None
+
+    def to_config(self):
+        """
+        :return: SimpleConfig
+        """
+        config = self._config
+        if config is None:
+            from .SimpleConfig import SimpleConfig
+            config = self._config = SimpleConfig(self)
+        return config
+
+    def to_fallback_value(self):
+        return self
+
+    def with_only_key(self, key):
+        """
+        :param key: String
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    def without_key(self, key):
+        """
+        :param key: String
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    def with_only_path_or_none(self, path):
+        """
+        :param path: Path
+        :return: AbstractConfigObject - None if the path doesn't exist
+        """
+        raise NotImplementedError
+
+    def with_only_path(self, path):
+        """
+        :param path: Path
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    def without_path(self, path):
+        """
+        :param path: Path
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    def peek_assuming_resolved(self, key, original_path):
+        """
+        This looks up the key with no transformation or type conversion of
+        any kind, and returns None if the key is not present. The object
+        must be resolved; use attempt_peek_with_partial_resolve() if it is
+        not.
+
+        :param key: String
+        :param original_path: Path
+        :return: AbstractConfigValue - the unmodified raw value or None
+        """
+        try:
+            return self.attempt_peek_with_partial_resolve(key)
+        except exceptions.NotResolved as e:
+            from . import ConfigImpl
+            raise ConfigImpl.improve_not_resolved(original_path, e)
+
+    def attempt_peek_with_partial_resolve(self, key):
+        """
+        Look up the key on an only-partially-resolved object, with no
+        transformation or type conversion of any kind; if 'this' is not
+        resolved then try to look up the key anyway if possible.
+
+        :param key: String
+        :return: AbstractConfigValue - the value of the key, or None if known
+            not to exist
+        :raise NotResolved: if can't figure out key's value or can't know
+            whether it exists
+        """
+        raise NotImplementedError
+
+    def peek_path(self, path, context=None):
+        """
+        Looks up the path with no transformation, type conversion, or
+        exceptions (just returns None if path not found). Does however
+        resolve the path, if context is not None.
+
+        :param path: Path
+        :param context: ResolveContext - or None to look up without
+            resolving
+        :return: AbstractConfigValue - or None
+        :raise NotPossibleToResolve:
+        """
+        if context is not None:
+            # walk down through the path resolving only things along that
+            # path, and then recursively call ourselves with no resolve
+            # context.
+            partially_resolved = context.restrict(path).resolve(self)
+            if isinstance(partially_resolved, AbstractConfigObject):
+                return partially_resolved.peek_path(path)
+            else:
+                raise exceptions.BugOrBroken(
+                    "resolved object to non-object " + repr(self) + " to "
+                    + repr(partially_resolved))
+
+        try:
+            next = path.remainder
+            v = self.attempt_peek_with_partial_resolve(path.first)
+
+            if next is None:
+                return v
+            elif isinstance(v, AbstractConfigObject):
+                return v.peek_path(next)
+            else:
+                return None
+        except exceptions.NotResolved as e:
+            from . import ConfigImpl
+            raise ConfigImpl.improve_not_resolved(path, e)
+
+    def value_type(self):
+        return ConfigValueType.object
+
+    def new_copy(self, status, origin, ignores_fallbacks=None):
+        """
+        :param status: ResolveStatus
+        :param origin: ConfigOrigin
+        :param ignores_fallbacks: boolean - None to keep this object's
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    def with_origin(self, origin):
+        """
+        :param origin: ConfigOrigin
+        :return: AbstractConfigObject
+        """
+        if self._origin is origin:
+            return self
+        else:
+            return self.new_copy(self.resolve_status(), origin)
+
+    def construct_delayed_merge(self, origin, stack):
+        from .ConfigDelayedMergeObject import ConfigDelayedMergeObject
+        return ConfigDelayedMergeObject(origin, stack)
+
+    def merged_with_object(self, fallback):
+        """
+        :param fallback: AbstractConfigObject
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def merge_origins(cls, stack):
+        """
+        :param stack: Collection<AbstractConfigValue>
+        :return: ConfigOrigin
+        """
+        if len(stack) == 0:
+            raise exceptions.BugOrBroken("can't merge origins on empty list")
+        origins = []
+        first_origin = None
+        num_merged = 0
+        for v in stack:
+            if first_origin is None:
+                first_origin = v.origin()
+
+            if isinstance(v, AbstractConfigObject) \
+                    and v.resolve_status() == ResolveStatus.resolved \
+                    and v.is_empty():
+                # don't include empty files or the .empty()
+                # config in the description, since they are
+                # likely to be "implementation details"
+                pass
+            else:
+                origins.append(v.origin())
+                num_merged += 1
+
+        if num_merged == 0:
+            # the configs were all empty, so just use the first one
+            origins.append(first_origin)
+
+        return SimpleConfigOrigin.merge_origins(origins)
+
+    def resolve_substitutions(self, context):
+        """
+        :param context: ResolveContext
+        :return: AbstractConfigObject
+        :raise NotPossibleToResolve:
+        """
+        raise NotImplementedError
+
+    def relativized(self, prefix):
+        """
+        :param prefix: Path
+        :return: AbstractConfigObject
+        """
+        raise NotImplementedError
+
+    def get(self, key):
+        """
+        :param key: String
+        :return: AbstractConfigValue - or None
+        """
+        raise NotImplementedError
+
+    def is_empty(self):
+        """
+        :return: boolean
+        """
+        return len(self) == 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # made again on first use
+        state['_config'] = None
+        return state
@@ -0,0 +1,335 @@
+"""
+Trying very hard to avoid a parent reference in config values; when you have
+a tree like this, the availability of parent() tends to result in a lot of
+improperly-factored and non-modular code. Please don't add parent().
+"""
+
+from .. import exceptions
+from ..ConfigRenderOptions import ConfigRenderOptions
+from ..ConfigValue import ConfigValue
+
+from .MergeableValue import MergeableValue
+from .Path import Path
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigOrigin import SimpleConfigOrigin
+from .Unmergeable import Unmergeable
+
+
+class NotPossibleToResolve(Exception):
+    """
+    This exception means that a value is inherently not resolveable, at the
+    moment the only known cause is a cycle of substitutions. It's internal
+    to the library and always handled before reaching the public API. This
+    is only supposed to be raised by the target of a cyclic reference and
+    it's supposed to be caught by the ConfigReference looking up that
+    reference, so it should be impossible for an outermost resolve() to
+    raise this.
+
+    Contrast with exceptions.NotResolved which just means nobody called
+    resolve().
+    """
+
+    def __init__(self, context):
+        """
+        :param context: ResolveContext
+        """
+        super(NotPossibleToResolve, self).__init__(
+            "was not possible to resolve")
+        self._trace_string = context.trace_string()
+
+    def trace_string(self):
+        """
+        :return: String
+        """
+        return self._trace_string
+
+
+class AbstractConfigValue(ConfigValue, MergeableValue):
+
+    def __init__(self, origin):
+        """
+        :param origin: SimpleConfigOrigin
+        """
+        self._origin = origin
+
+    def origin(self):
+        """
+        :return: SimpleConfigOrigin
+        """
+        return self._origin
+
+    def resolve_substitutions(self, context):
+        """
+        Called only by ResolveContext.resolve().
+
+        :param context: ResolveContext - state of the current resolve
+        :return: AbstractConfigValue - a new value if there were changes, or
+            self if no changes
+        :raise NotPossibleToResolve:
+        """
+        return self
+
+    def resolve_status(self):
+        """
+        :return: ResolveStatus
+        """
+        return ResolveStatus.resolved
+
+    def relativized(self, prefix):
+        """
+        This is used when including one file in another; the included file
+        is relativized to the path it's included into in the parent file.
+        The point is that if you include a file at foo.bar in the parent,
+        and the included file as a substitution ${a.b.c}, the included
+        substitution now needs to be ${foo.bar.a.b.c} because we resolve
+        substitutions globally only after parsing everything.
+
+        :param prefix: Path
+        :return: AbstractConfigValue - relativized to the given path or the
+            same value if nothing to do
+        """
+        return self
+
+    def to_fallback_value(self):
+        return self
+
+    def new_copy(self, origin):
+        """
+        :param origin: ConfigOrigin
+        :return: AbstractConfigValue
+        """
+        raise NotImplementedError
+
+    def ignores_fallbacks(self):
+        """
+        This is virtualized rather than a field because only some subclasses
+        really need to store the boolean.
+
+        :return: boolean
+        """
+        # if we are not resolved, then somewhere in this value there's
+        # a substitution that may need to look at the fallbacks.
+        return self.resolve_status() == ResolveStatus.resolved
+
+    def with_fallbacks_ignored(self):
+        """
+        :return: AbstractConfigValue
+        """
+        if self.ignores_fallbacks():
+            return self
+        else:
+            raise exceptions.BugOrBroken(
+                "value class doesn't implement forced fallback-ignoring "
+                + repr(self))
+
+    def require_not_ignoring_fallbacks(self):
+        """
+        The with_fallback() implementation is supposed to avoid calling
+        merged_with_* if we're ignoring fallbacks.
+        """
+        if self.ignores_fallbacks():
+            raise exceptions.BugOrBroken(
+                "method should not have been called with "
+                "ignoresFallbacks=true " + type(self).__name__)
+
+    def construct_delayed_merge(self, origin, stack):
+        """
+        :param origin: ConfigOrigin
+        :param stack: List<AbstractConfigValue>
+        :return: AbstractConfigValue
+        """
+        from .ConfigDelayedMerge import ConfigDelayedMerge
+        return ConfigDelayedMerge(origin, stack)
+
+    def _merged_stack_with_the_unmergeable(self, stack, fallback):
+        """
+        :param stack: List<AbstractConfigValue>
+        :param fallback: Unmergeable
+        :return: AbstractConfigValue
+        """
+        from .AbstractConfigObject import AbstractConfigObject
+
+        self.require_not_ignoring_fallbacks()
+
+        # if we turn out to be an object, and the fallback also does,
+        # then a merge may be required; delay until we resolve.
+        new_stack = list(stack) + list(fallback.unmerged_values())
+        return self.construct_delayed_merge(
+            AbstractConfigObject.merge_origins(new_stack), new_stack)
+
+    def _delay_merge(self, stack, fallback):
+        """
+        :param stack: List<AbstractConfigValue>
+        :param fallback: AbstractConfigValue
+        :return: AbstractConfigValue
+        """
+        # if we turn out to be an object, and the fallback also does,
+        # then a merge may be required.
+        # if we contain a substitution, resolving it may need to look
+        # back to the fallback.
+        from .AbstractConfigObject import AbstractConfigObject
+
+        new_stack = list(stack) + [fallback]
+        return self.construct_delayed_merge(
+            AbstractConfigObject.merge_origins(new_stack), new_stack)
+
+    def _merged_stack_with_object(self, stack, fallback):
+        """
+        :param stack: List<AbstractConfigValue>
+        :param fallback: AbstractConfigObject
+        :return: AbstractConfigValue
+        """
+        from .AbstractConfigObject import AbstractConfigObject
+
+        self.require_not_ignoring_fallbacks()
+
+        if isinstance(self, AbstractConfigObject):
+            raise exceptions.BugOrBroken(
+                "Objects must reimplement mergedWithObject")
+
+        return self._merged_stack_with_non_object(stack, fallback)
+
+    def _merged_stack_with_non_object(self, stack, fallback):
+        """
+        :param stack: List<AbstractConfigValue>
+        :param fallback: AbstractConfigValue
+        :return: AbstractConfigValue
+        """
+        self.require_not_ignoring_fallbacks()
+
+        if self.resolve_status() == ResolveStatus.resolved:
+            # falling back to a non-object doesn't merge anything, and also
+            # prohibits merging any objects that we fall back to later.
+            # so we have to switch to ignores_fallbacks mode.
+            return self.with_fallbacks_ignored()
+        else:
+            # if unresolved, we may have to look back to fallbacks as part
+            # of the resolution process, so always delay
+            return self._delay_merge(stack, fallback)
+
+    def merged_with_the_unmergeable(self, fallback):
+        """
+        :param fallback: Unmergeable
+        :return: AbstractConfigValue
+        """
+        self.require_not_ignoring_fallbacks()
+        return self._merged_stack_with_the_unmergeable([self], fallback)
+
+    def merged_with_object(self, fallback):
+        """
+        :param fallback: AbstractConfigObject
+        :return: AbstractConfigValue
+        """
+        self.require_not_ignoring_fallbacks()
+        return self._merged_stack_with_object([self], fallback)
+
+    def merged_with_non_object(self, fallback):
+        """
+        :param fallback: AbstractConfigValue
+        :return: AbstractConfigValue
+        """
+        self.require_not_ignoring_fallbacks()
+        return self._merged_stack_with_non_object([self], fallback)
+
+    def with_origin(self, origin):
+        """
+        :param origin: ConfigOrigin
+        :return: AbstractConfigValue
+        """
+        if self._origin is origin:
+            return self
+        else:
+            return self.new_copy(origin)
+
+    def with_fallback(self, mergeable):
+        """
+        :param mergeable: ConfigMergeable
+        :return: AbstractConfigValue
+        """
+        if self.ignores_fallbacks():
+            return self
+        else:
+            from .AbstractConfigObject import AbstractConfigObject
+
+            other = mergeable.to_fallback_value()
+            if isinstance(other, Unmergeable):
+                return self.merged_with_the_unmergeable(other)
+            elif isinstance(other, AbstractConfigObject):
+                return self.merged_with_object(other)
+            else:
+                return self.merged_with_non_object(other)
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        return isinstance(other, ConfigValue) \
+            and self.value_type() == other.value_type() \
+            and self.unwrapped() == other.unwrapped()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        return hash(self.unwrapped())
+
+    def __repr__(self):
+        from . import Renderer
+        return type(self).__name__ + "(" \
+            + Renderer.render(self, ConfigRenderOptions.concise()) + ")"
+
+    def render(self, options=None):
+        """
+        :param options: ConfigRenderOptions - defaults() if None
+        :return: String
+        """
+        from . import Renderer
+        if options is None:
+            options = ConfigRenderOptions.defaults()
+        return Renderer.render(self, options)
+
+    def transform_to_string(self):
+        """
+        This is a debugging-oriented string but this is defined to create a
+        string that would parse back to the value in JSON. It only works for
+        primitive values (that would be a single token) which are
+        auto-converted to strings when concatenating with other strings or
+        by the DefaultTransformer.
+
+        :return: String - or None
+        """
+        return None
+
+    def at_key(self, key, origin=None):
+        """
+        :param key: String
+        :param origin: ConfigOrigin - defaults to "atKey(key)"
+        :return: SimpleConfig
+        """
+        from .SimpleConfigObject import SimpleConfigObject
+
+        if origin is None:
+            origin = SimpleConfigOrigin.new_simple("atKey(" + key + ")")
+        return SimpleConfigObject(origin, {key: self}).to_config()
+
+    def at_path(self, path, origin=None):
+        """
+        :param path: String or Path
+        :param origin: ConfigOrigin - defaults to "atPath(path)"
+        :return: SimpleConfig
+        """
+        if not isinstance(path, Path):
+            if origin is None:
+                origin = SimpleConfigOrigin.new_simple(
+                    "atPath(" + path + ")")
+            path = Path.new_path(path)
+        elif origin is None:
+            origin = SimpleConfigOrigin.new_simple(
+                "atPath(" + str(path) + ")")
+
+        parent = path.parent()
+        result = self.at_key(path.last(), origin)
+        while parent is not None:
+            key = parent.last()
+            result = result.at_key(key, origin)
+            parent = parent.parent()
+        return result
@@ -0,0 +1,256 @@
+"""
+Parses a file or URL, and everything it includes, without blocking an
+asyncio event loop.
+
+The text of the file or URL is read first, then its include statements are
+found by reading the text as events, and the files and URLs they name are
+read, all of them at once, and so on down the include tree. Reading is done
+by an AsyncIncluder. Then the whole tree is parsed in an executor, with the
+texts handed to it through Parseable.prefetched_inputs(), so that Parser and
+the includer run just as they would serially, only without waiting on I/O.
+
+Includes are resolved the way SimpleIncluder resolves them. Whatever isn't
+read ahead, because it's a classpath resource, because reading it failed,
+or because a custom includer opens something else, is read by the parse
+itself in the executor, which also reports any errors as a serial parse
+would.
+"""
+
+import asyncio
+import io
+import urllib.parse
+
+from .. import exceptions
+from ..ConfigEventType import ConfigEventType
+
+from . import EventReader
+from . import Parseable
+
+
+# in the order they fall back to each other
+_EXTENSIONS = (".conf", ".json", ".properties")
+
+
+def _read_file(path):
+    """
+    :param path: String
+    :return: String
+    """
+    reader = Parseable.reader_from_stream(io.open(path, 'rb'))
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+def _read_url(url, url_cache):
+    """
+    :param url: String
+    :param url_cache: UrlCache - or None
+    :return: (String, String) - the text and the Content-Type
+    """
+    connection, content_type = Parseable.open_url(url, url_cache)
+    reader = Parseable.reader_from_stream(connection)
+    try:
+        return reader.read(), content_type
+    finally:
+        reader.close()
+
+
+class AsyncIncluder(object):
+    """
+    The async counterpart of ConfigIncluderFile and ConfigIncluderURL: reads
+    the files and URLs a config and its includes name, for the loader to
+    parse. This one does the blocking reads in an executor; override
+    read_file() or read_url() to read some other way, for example with an
+    async HTTP client. read_url() is handed the parse options' url_cache, so
+    that a URL the cache handles is read the way a serial parse reads it.
+
+    Attributes:
+
+        executor: Executor
+            Where the blocking reads are done, or None for the event loop's
+            default executor.
+    """
+
+    def __init__(self, executor=None):
+        """
+        :param executor: Executor
+        """
+        self.executor = executor
+
+    async def read_file(self, path):
+        """
+        :param path: String - filesystem path
+        :return: String - the text of the file, decoded from UTF-8
+        :raises: IOError or OSError if it can't be read
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _read_file, path)
+
+    async def read_url(self, url, url_cache=None):
+        """
+        :param url: String
+        :param url_cache: UrlCache - the parse options' url_cache, to fetch
+            url through if it handles it, or None
+        :return: (String, String) - the text and the Content-Type without
+            parameters, or None if there isn't one
+        :raises: IOError or OSError if it can't be read
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _read_url, url,
+                                          url_cache)
+
+
+def _included(parseable, kind, name):
+    """
+    The files and URLs an include could open, as SimpleIncluder resolves it.
+
+    :param parseable: Parseable - the including file or URL
+    :param kind: String - "url", "file", or None for a plain quoted name
+    :param name: String
+    :return: List<Parseable>
+    """
+    # SimpleIncluder.clearForInclude
+    options = parseable.options().set_syntax(None) \
+        .set_origin_description(None).set_allow_missing(True)
+
+    # a single letter is a drive, not a scheme
+    if kind == "url" or kind is None \
+            and len(urllib.parse.urlparse(name).scheme) > 1:
+        return [Parseable.new_url(name, options)]
+    elif kind == "file":
+        def source(n):
+            return Parseable.new_file(n, options)
+    elif kind is None:
+        source = parseable.relative_to
+    else:
+        return []
+
+    if name.endswith(_EXTENSIONS):
+        found = [source(name)]
+    else:
+        found = [source(name + extension) for extension in _EXTENSIONS]
+    return [p for p in found if p is not None]
+
+
+def _location(parseable):
+    """
+    :param parseable: Parseable - a ParseableFile or ParseableURL
+    :return: String - its path or URL, as prefetched_inputs() keys it
+    """
+    if isinstance(parseable, Parseable.ParseableURL):
+        return parseable.url()
+    return parseable.path()
+
+
+def _scan_includes(parseable, text):
+    """
+    Runs in the executor.
+
+    :param parseable: Parseable
+    :param text: (String, String) - as read by the includer
+    :return: List<Parseable> - what its includes open
+    """
+    found = []
+    with Parseable.prefetched_inputs({_location(parseable): text}):
+        try:
+            for event in EventReader.read_events(parseable):
+                if event.event_type == ConfigEventType.include:
+                    kind, name = event.value
+                    found.extend(_included(parseable, kind, name))
+        except exceptions.ConfigException:
+            # properties, or broken; the parse will say which
+            pass
+    return found
+
+
+def _parse(parseable, contents):
+    """
+    Runs in the executor.
+
+    :param parseable: Parseable
+    :param contents: Dict<String, (String, String)>
+    :return: AbstractConfigObject
+    """
+    with Parseable.prefetched_inputs(contents):
+        return parseable.parse()
+
+
+class AsyncLoader(object):
+    """
+    One load: the texts read so far.
+
+    Attributes:
+
+        includer: AsyncIncluder
+
+        executor: Executor
+            Where the parsing is done, or None for the event loop's default
+            executor.
+
+        contents: Dict<String, (String, String)>
+            The text read for each path or URL, and its Content-Type.
+    """
+
+    def __init__(self, includer, executor):
+        """
+        :param includer: AsyncIncluder
+        :param executor: Executor
+        """
+        self.includer = includer
+        self.executor = executor
+        self.contents = {}
+        # paths and URLs being read or read already
+        self._seen = set()
+
+    async def fetch(self, parseable):
+        """
+        Reads parseable, then everything its includes open, concurrently.
+
+        :param parseable: Parseable
+        """
+        location = _location(parseable)
+        if location in self._seen:
+            return
+        self._seen.add(location)
+
+        try:
+            if isinstance(parseable, Parseable.ParseableURL):
+                text = await self.includer.read_url(
+                    location, parseable.options().url_cache)
+            else:
+                text = (await self.includer.read_file(location), None)
+        except (IOError, OSError):
+            # missing, or unreachable; the parse will handle it
+            return
+        self.contents[location] = text
+
+        loop = asyncio.get_running_loop()
+        found = await loop.run_in_executor(
+            self.executor, _scan_includes, parseable, text)
+        await asyncio.gather(*[self.fetch(p) for p in found])
+
+    async def load(self, parseable):
+        """
+        :param parseable: Parseable - a ParseableFile or ParseableURL
+        :return: AbstractConfigObject
+        """
+        await self.fetch(parseable)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _parse, parseable, self.contents)
+
+
+async def parse_config(parseable, includer=None, executor=None):
+    """
+    :param parseable: Parseable - a ParseableFile or ParseableURL
+    :param includer: AsyncIncluder - or None to read in executor
+    :param executor: Executor - where parsing is done, or None for the
+        event loop's default executor
+    :return: Config
+    """
+    if includer is None:
+        includer = AsyncIncluder(executor)
+    value = await AsyncLoader(includer, executor).load(parseable)
+    return value.to_config()
@@ -0,0 +1,29 @@
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+
+
+class ConfigBoolean(AbstractConfigValue):
+
+    def __init__(self, origin, value):
+        """
+        :param origin: ConfigOrigin
+        :param value: boolean
+        """
+        super(ConfigBoolean, self).__init__(origin)
+        self._value = value
+
+    def value_type(self):
+        return ConfigValueType.boolean
+
+    def unwrapped(self):
+        """
+        :return: boolean
+        """
+        return self._value
+
+    def transform_to_string(self):
+        return "true" if self._value else "false"
+
+    def new_copy(self, origin):
+        return ConfigBoolean(origin, self._value)
@@ -0,0 +1,246 @@
+from .. import exceptions
+from ..ConfigObject import ConfigObject
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+from .ConfigReference import ConfigReference
+from .ConfigString import ConfigString
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigOrigin import SimpleConfigOrigin
+from .SubstitutionExpression import SubstitutionExpression
+from .Unmergeable import Unmergeable
+
+
+class ConfigConcatenation(AbstractConfigValue, Unmergeable):
+    """
+    A ConfigConcatenation represents a list of values to be concatenated (see
+    the spec). It only has to exist if at least one value is an unresolved
+    substitution, otherwise we could go ahead and collapse the list into a
+    single value.
+
+    Right now this is always a list of strings and ${} references, but in
+    the future should support a list of ConfigList. We may also support
+    concatenations of objects, but ConfigDelayedMerge should be used for
+    that since a concat of objects really will merge, not concatenate.
+
+    Attributes:
+
+        _pieces: List<AbstractConfigValue>
+    """
+
+    def __init__(self, origin, pieces):
+        """
+        :param origin: ConfigOrigin
+        :param pieces: List<AbstractConfigValue>
+        """
+        super(ConfigConcatenation, self).__init__(origin)
+        self._pieces = pieces
+
+        if len(pieces) < 2:
+            raise exceptions.BugOrBroken(
+                "Created concatenation with less than 2 items: "
+                + repr(self))
+
+        had_unmergeable = False
+        for p in pieces:
+            if isinstance(p, ConfigConcatenation):
+                raise exceptions.BugOrBroken(
+                    "ConfigConcatenation should never be nested: "
+                    + repr(self))
+            if isinstance(p, Unmergeable):
+                had_unmergeable = True
+
+        if not had_unmergeable:
+            raise exceptions.BugOrBroken(
+                "Created concatenation without an unmergeable in it: "
+                + repr(self))
+
+    def _not_resolved(self):
+        return exceptions.NotResolved(
+            "need to Config#resolve(), see the API docs for "
+            "Config#resolve(); substitution not resolved: " + repr(self))
+
+    def value_type(self):
+        raise self._not_resolved()
+
+    def unwrapped(self):
+        raise self._not_resolved()
+
+    def new_copy(self, origin):
+        return ConfigConcatenation(origin, self._pieces)
+
+    def ignores_fallbacks(self):
+        # we can never ignore fallbacks because if a child ConfigReference
+        # is self-referential we have to look lower in the merge stack
+        # for its value.
+        return False
+
+    def unmerged_values(self):
+        return [self]
+
+    def pieces(self):
+        """
+        :return: List<AbstractConfigValue> - what's concatenated, none of
+            them a concatenation
+        """
+        return self._pieces
+
+    @classmethod
+    def _join(cls, builder, orig_right):
+        """
+        Add left and right, or their merger, to builder.
+
+        :param builder: List<AbstractConfigValue>
+        :param orig_right: AbstractConfigValue
+        """
+        from . import DefaultTransformer
+
+        left = builder[-1]
+        right = orig_right
+
+        # check for an object which can be converted to a list
+        # (this will be an object with numeric keys, like foo.0, foo.1)
+        if isinstance(left, ConfigObject) \
+                and isinstance(right, SimpleConfigList):
+            left = DefaultTransformer.transform(left, ConfigValueType.list)
+        elif isinstance(left, SimpleConfigList) \
+                and isinstance(right, ConfigObject):
+            right = DefaultTransformer.transform(right, ConfigValueType.list)
+
+        # Since this depends on the type of two instances, I couldn't think
+        # of much alternative to an isinstance chain.
+        joined = None
+        if isinstance(left, ConfigObject) and isinstance(right, ConfigObject):
+            joined = right.with_fallback(left)
+        elif isinstance(left, SimpleConfigList) \
+                and isinstance(right, SimpleConfigList):
+            joined = left.concatenate(right)
+        elif isinstance(left, ConfigConcatenation) \
+                or isinstance(right, ConfigConcatenation):
+            raise exceptions.BugOrBroken("unflattened ConfigConcatenation")
+        elif isinstance(left, Unmergeable) or isinstance(right, Unmergeable):
+            # leave joined=None, cannot join
+            pass
+        else:
+            # handle primitive type or primitive type mixed with object or
+            # list
+            s1 = left.transform_to_string()
+            s2 = right.transform_to_string()
+            if s1 is None or s2 is None:
+                raise exceptions.WrongType(
+                    left.origin(),
+                    message="Cannot concatenate object or list with a "
+                    "non-object-or-list, " + repr(left) + " and "
+                    + repr(right) + " are not compatible")
+            else:
+                joined_origin = SimpleConfigOrigin.merge_origins(
+                    [left.origin(), right.origin()])
+                joined = ConfigString(joined_origin, s1 + s2)
+
+        if joined is None:
+            builder.append(right)
+        else:
+            builder[-1] = joined
+
+    @classmethod
+    def consolidate(cls, pieces):
+        """
+        :param pieces: List<AbstractConfigValue>
+        :return: List<AbstractConfigValue>
+        """
+        if len(pieces) < 2:
+            return pieces
+
+        flattened = []
+        for v in pieces:
+            if isinstance(v, ConfigConcatenation):
+                flattened.extend(v._pieces)
+            else:
+                flattened.append(v)
+
+        consolidated = []
+        for v in flattened:
+            if not consolidated:
+                consolidated.append(v)
+            else:
+                ConfigConcatenation._join(consolidated, v)
+
+        return consolidated
+
+    @classmethod
+    def concatenate(cls, pieces):
+        """
+        :param pieces: List<AbstractConfigValue>
+        :return: AbstractConfigValue - or None if there are no pieces
+        """
+        consolidated = ConfigConcatenation.consolidate(pieces)
+        if not consolidated:
+            return None
+        elif len(consolidated) == 1:
+            return consolidated[0]
+        else:
+            merged_origin = SimpleConfigOrigin.merge_origins(
+                [v.origin() for v in consolidated])
+            return ConfigConcatenation(merged_origin, consolidated)
+
+    def resolve_substitutions(self, context):
+        resolved = []
+        # to concat into a string we have to do a full resolve,
+        # so unrestrict the context
+        unrestricted = context.unrestricted()
+        for p in self._pieces:
+            r = unrestricted.resolve(p)
+            if r is not None:
+                resolved.append(r)
+            # else it was optional... omit
+
+        # now need to concat everything
+        joined = ConfigConcatenation.consolidate(resolved)
+        # if unresolved is allowed we can just become another
+        # ConfigConcatenation
+        if len(joined) > 1 and context.options().allow_unresolved:
+            return ConfigConcatenation(self.origin(), joined)
+        elif len(joined) != 1:
+            raise exceptions.BugOrBroken(
+                "Resolved list should always join to exactly one value, "
+                "not " + repr(joined))
+        else:
+            return joined[0]
+
+    def resolve_status(self):
+        return ResolveStatus.unresolved
+
+    def relativized(self, prefix):
+        """
+        When you graft a substitution into another object, you have to
+        prefix it with the location in that object where you grafted it.
+        """
+        return ConfigConcatenation(
+            self.origin(), [p.relativized(prefix) for p in self._pieces])
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        return isinstance(other, ConfigConcatenation) \
+            and self._pieces == other._pieces
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        return hash(tuple(self._pieces))
+
+    @classmethod
+    def values_from_pieces(cls, origin, pieces):
+        """
+        :param origin: ConfigOrigin
+        :param pieces: List<SubstitutionExpression or String>
+        :return: List<AbstractConfigValue>
+        """
+        values = []
+        for p in pieces:
+            if isinstance(p, SubstitutionExpression):
+                values.append(ConfigReference(origin, p))
+            elif isinstance(p, str):
+                values.append(ConfigString(origin, p))
+            else:
+                raise exceptions.BugOrBroken("Unexpected piece " + repr(p))
+        return values
@@ -0,0 +1,199 @@
+"""
+The issue here is that we want to first merge our stack of config files, and
+then we want to evaluate substitutions. But if two substitutions both expand
+to an object, we might need to merge those two objects. Thus, we can't ever
+"override" a substitution when we do a merge; instead we have to save the
+stack of values that should be merged, and resolve the merge when we
+evaluate substitutions.
+
+The functions here are shared with ConfigDelayedMergeObject.
+"""
+
+from .. import exceptions
+
+from .AbstractConfigValue import AbstractConfigValue, NotPossibleToResolve
+from .ReplaceableMergeStack import ReplaceableMergeStack
+from .ResolveReplacer import ResolveReplacer
+from .ResolveStatus import ResolveStatus
+from .Unmergeable import Unmergeable
+
+
+def check_stack(stack, what):
+    """
+    :param stack: List<AbstractConfigValue>
+    :param what: String - the kind of merge, for the error
+    """
+    if len(stack) == 0:
+        raise exceptions.BugOrBroken("creating empty delayed merge " + what)
+    for v in stack:
+        if isinstance(v, ReplaceableMergeStack):
+            raise exceptions.BugOrBroken(
+                "placed nested DelayedMerge in a " + what
+                + ", should have consolidated stack")
+
+
+def resolve_stack(replaceable, stack, context):
+    """
+    To resolve substitutions, we need to recursively resolve the stack of
+    stuff to merge, and merge the stack so we won't be a delayed merge
+    anymore. If restrict_to_child is set, we may remain a delayed merge
+    though.
+
+    :param replaceable: ReplaceableMergeStack
+    :param stack: List<AbstractConfigValue>
+    :param context: ResolveContext
+    :return: AbstractConfigValue - or None
+    :raise NotPossibleToResolve:
+    """
+    source = context.source()
+    merged = None
+    for count, v in enumerate(stack):
+        if isinstance(v, ReplaceableMergeStack):
+            raise exceptions.BugOrBroken(
+                "A delayed merge should not contain another one: "
+                + repr(replaceable))
+
+        replaced = False
+        # we only replace if we have a substitution, or value-concatenation
+        # containing one. The Unmergeable here isn't a delayed merge stack
+        # since we can't contain another stack (see assertion above).
+        if isinstance(v, Unmergeable):
+            # If, while resolving 'v' we come back to the same merge stack,
+            # we only want to look _below_ 'v' in the stack. So we arrange
+            # to replace the ConfigDelayedMerge with a value that is only
+            # the remainder of the stack below this one.
+            source.replace(replaceable, replaceable.make_replacer(count + 1))
+            replaced = True
+
+        try:
+            resolved = context.resolve(v)
+        finally:
+            if replaced:
+                source.unreplace(replaceable)
+
+        if resolved is not None:
+            if merged is None:
+                merged = resolved
+            else:
+                merged = merged.with_fallback(resolved)
+
+    return merged
+
+
+class _StackReplacer(ResolveReplacer):
+
+    def __init__(self, stack, skipping):
+        super(_StackReplacer, self).__init__()
+        self._stack = stack
+        self._skipping = skipping
+
+    def make_replacement(self, context):
+        return make_replacement(context, self._stack, self._skipping)
+
+
+def make_replacer(stack, skipping):
+    """
+    :param stack: List<AbstractConfigValue>
+    :param skipping: int
+    :return: ResolveReplacer
+    """
+    return _StackReplacer(stack, skipping)
+
+
+def make_replacement(context, stack, skipping):
+    """
+    :param context: ResolveContext
+    :param stack: List<AbstractConfigValue>
+    :param skipping: int
+    :return: AbstractConfigValue
+    :raise NotPossibleToResolve:
+    """
+    sub_stack = stack[skipping:]
+
+    if not sub_stack:
+        raise NotPossibleToResolve(context)
+
+    # generate a new merge stack from only the remaining items
+    merged = None
+    for v in sub_stack:
+        if merged is None:
+            merged = v
+        else:
+            merged = merged.with_fallback(v)
+    return merged
+
+
+def stack_ignores_fallbacks(stack):
+    """
+    :param stack: List<AbstractConfigValue>
+    :return: boolean
+    """
+    return stack[-1].ignores_fallbacks()
+
+
+class ConfigDelayedMerge(AbstractConfigValue, Unmergeable,
+                         ReplaceableMergeStack):
+    """
+    Attributes:
+
+        _stack: List<AbstractConfigValue> - earlier items in the stack win
+    """
+
+    def __init__(self, origin, stack):
+        """
+        :param origin: ConfigOrigin
+        :param stack: List<AbstractConfigValue>
+        """
+        super(ConfigDelayedMerge, self).__init__(origin)
+        self._stack = stack
+        check_stack(stack, "ConfigDelayedMerge")
+
+    def value_type(self):
+        raise exceptions.NotResolved(
+            "called value_type() on value with unresolved substitutions, "
+            "need to Config#resolve() first, see API docs")
+
+    def unwrapped(self):
+        raise exceptions.NotResolved(
+            "called unwrapped() on value with unresolved substitutions, "
+            "need to Config#resolve() first, see API docs")
+
+    def resolve_substitutions(self, context):
+        return resolve_stack(self, self._stack, context)
+
+    def make_replacer(self, skipping):
+        return make_replacer(self._stack, skipping)
+
+    def resolve_status(self):
+        return ResolveStatus.unresolved
+
+    def relativized(self, prefix):
+        return ConfigDelayedMerge(
+            self.origin(), [o.relativized(prefix) for o in self._stack])
+
+    def ignores_fallbacks(self):
+        return stack_ignores_fallbacks(self._stack)
+
+    def new_copy(self, origin):
+        return ConfigDelayedMerge(origin, self._stack)
+
+    def merged_with_the_unmergeable(self, fallback):
+        return self._merged_stack_with_the_unmergeable(self._stack, fallback)
+
+    def merged_with_object(self, fallback):
+        return self._merged_stack_with_object(self._stack, fallback)
+
+    def merged_with_non_object(self, fallback):
+        return self._merged_stack_with_non_object(self._stack, fallback)
+
+    def unmerged_values(self):
+        return self._stack
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        return isinstance(other, ConfigDelayedMerge) \
+            and self._stack == other._stack
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        return hash(tuple(self._stack))
@@ -0,0 +1,212 @@
+from .. import exceptions
+from ..ConfigList import ConfigList
+
+from . import ConfigDelayedMerge as delayed_merge
+from .AbstractConfigObject import AbstractConfigObject
+from .ReplaceableMergeStack import ReplaceableMergeStack
+from .ResolveStatus import ResolveStatus
+from .Unmergeable import Unmergeable
+
+
+def _not_resolved():
+    return exceptions.NotResolved(
+        "need to Config#resolve() before using this object, see the API "
+        "docs for Config#resolve()")
+
+
+class ConfigDelayedMergeObject(AbstractConfigObject, Unmergeable,
+                               ReplaceableMergeStack):
+    """
+    This is just like ConfigDelayedMerge except we know statically that it
+    will turn out to be an object.
+
+    Attributes:
+
+        _stack: List<AbstractConfigValue> - earlier items in the stack win
+    """
+
+    def __init__(self, origin, stack):
+        """
+        :param origin: ConfigOrigin
+        :param stack: List<AbstractConfigValue>
+        """
+        super(ConfigDelayedMergeObject, self).__init__(origin)
+        self._stack = stack
+
+        if stack and not isinstance(stack[0], AbstractConfigObject):
+            raise exceptions.BugOrBroken(
+                "created a delayed merge object not guaranteed to be an "
+                "object")
+        delayed_merge.check_stack(stack, "ConfigDelayedMergeObject")
+
+    def new_copy(self, status, origin, ignores_fallbacks=None):
+        if status != self.resolve_status():
+            raise exceptions.BugOrBroken(
+                "attempt to create resolved ConfigDelayedMergeObject")
+        return ConfigDelayedMergeObject(origin, self._stack)
+
+    def resolve_substitutions(self, context):
+        merged = delayed_merge.resolve_stack(self, self._stack, context)
+        if isinstance(merged, AbstractConfigObject):
+            return merged
+        else:
+            raise exceptions.BugOrBroken(
+                "somehow brokenly merged an object and didn't get an "
+                "object, got " + repr(merged))
+
+    def make_replacer(self, skipping):
+        return delayed_merge.make_replacer(self._stack, skipping)
+
+    def resolve_status(self):
+        return ResolveStatus.unresolved
+
+    def relativized(self, prefix):
+        return ConfigDelayedMergeObject(
+            self.origin(), [o.relativized(prefix) for o in self._stack])
+
+    def ignores_fallbacks(self):
+        return delayed_merge.stack_ignores_fallbacks(self._stack)
+
+    def merged_with_the_unmergeable(self, fallback):
+        self.require_not_ignoring_fallbacks()
+        return self._merged_stack_with_the_unmergeable(self._stack, fallback)
+
+    def merged_with_object(self, fallback):
+        return self.merged_with_non_object(fallback)
+
+    def merged_with_non_object(self, fallback):
+        self.require_not_ignoring_fallbacks()
+        return self._merged_stack_with_non_object(self._stack, fallback)
+
+    def with_only_key(self, key):
+        raise _not_resolved()
+
+    def without_key(self, key):
+        raise _not_resolved()
+
+    def with_only_path_or_none(self, path):
+        raise _not_resolved()
+
+    def with_only_path(self, path):
+        raise _not_resolved()
+
+    def without_path(self, path):
+        raise _not_resolved()
+
+    def with_value(self, key, value):
+        raise _not_resolved()
+
+    def unmerged_values(self):
+        return self._stack
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        return isinstance(other, ConfigDelayedMergeObject) \
+            and self._stack == other._stack
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        return hash(tuple(self._stack))
+
+    def unwrapped(self):
+        raise _not_resolved()
+
+    def get(self, key):
+        raise _not_resolved()
+
+    def items(self):
+        raise _not_resolved()
+
+    def keys(self):
+        raise _not_resolved()
+
+    def values(self):
+        raise _not_resolved()
+
+    def is_empty(self):
+        raise _not_resolved()
+
+    def __len__(self):
+        raise _not_resolved()
+
+    def __contains__(self, key):
+        raise _not_resolved()
+
+    def __iter__(self):
+        raise _not_resolved()
+
+    def attempt_peek_with_partial_resolve(self, key):
+        # a partial resolve of a ConfigDelayedMergeObject always results in
+        # a SimpleConfigObject because all the substitutions in the stack
+        # get resolved in order to look up the partial. So we know here
+        # that we have not been resolved at all even partially. Given
+        # that, all this code is probably gratuitous, since the app code is
+        # likely broken. But in general we only raise NotResolved if you
+        # try to touch the exact key that isn't resolved, so this is in
+        # that spirit.
+
+        # we'll be able to return a key if we have a value that ignores
+        # fallbacks, prior to any unmergeable values.
+        for layer in self._stack:
+            if isinstance(layer, AbstractConfigObject):
+                v = layer.attempt_peek_with_partial_resolve(key)
+
+                if v is not None:
+                    if v.ignores_fallbacks():
+                        # we know we won't need to merge anything in to
+                        # this value
+                        return v
+                    else:
+                        # we can't return this value because we know there
+                        # are unmergeable values later in the stack that
+                        # may contain values that need to be merged with
+                        # this value. we'll raise when we get to those
+                        # unmergeable values, so continue here.
+                        continue
+                elif isinstance(layer, Unmergeable):
+                    # an unmergeable object (which would be another
+                    # ConfigDelayedMergeObject) can't know that a key is
+                    # missing, so it can't return None; it can only return
+                    # a value or raise NotPossibleToResolve
+                    raise exceptions.BugOrBroken(
+                        "should not be reached: unmergeable object returned "
+                        "null value")
+                else:
+                    # a non-unmergeable AbstractConfigObject that returned
+                    # None for the key in question is not relevant, we can
+                    # keep looking for a value.
+                    continue
+            elif isinstance(layer, Unmergeable):
+                raise exceptions.NotResolved(
+                    "Key '" + key + "' is not available at '"
+                    + self.origin().description() + "' because value at '"
+                    + layer.origin().description()
+                    + "' has not been resolved and may turn out to contain "
+                    "or hide '" + key + "'. Be sure to Config#resolve() "
+                    "before using a config object.")
+            elif layer.resolve_status() == ResolveStatus.unresolved:
+                # if the layer is not an object, and not a substitution or
+                # merge, then it's something that's unresolved because it
+                # _contains_ an unresolved object... i.e. it's an array
+                if not isinstance(layer, ConfigList):
+                    raise exceptions.BugOrBroken(
+                        "Expecting a list here, not " + repr(layer))
+                # all later objects will be hidden so we can say we won't
+                # find the key
+                return None
+            else:
+                # non-object, but resolved, like an integer or something.
+                # has no children so the one we're after won't be in it.
+                # we would only have this in the stack in case something
+                # else "looks back" to it due to a cycle. anyway at this
+                # point we know we can't find the key anymore.
+                if not layer.ignores_fallbacks():
+                    raise exceptions.BugOrBroken(
+                        "resolved non-object should ignore fallbacks")
+                return None
+
+        # If we get here, then we never found anything unresolved which
+        # means the ConfigDelayedMergeObject should not have existed. some
+        # invariant was violated.
+        raise exceptions.BugOrBroken(
+            "Delayed merge stack does not contain any unmergeable values")
@@ -0,0 +1,48 @@
+import math
+
+from .ConfigNumber import ConfigNumber, LONG_MAX, LONG_MIN
+
+
+class ConfigDouble(ConfigNumber):
+
+    def __init__(self, origin, value, original_text):
+        """
+        :param origin: ConfigOrigin
+        :param value: float
+        :param original_text: String
+        """
+        super(ConfigDouble, self).__init__(origin, original_text)
+        self._value = value
+
+    def unwrapped(self):
+        """
+        :return: float
+        """
+        return self._value
+
+    def transform_to_string(self):
+        s = super(ConfigDouble, self).transform_to_string()
+        if s is None:
+            return repr(self._value)
+        else:
+            return s
+
+    def long_value(self):
+        # saturating, as Java's (long) cast is
+        if math.isnan(self._value):
+            return 0
+        elif self._value >= LONG_MAX:
+            return LONG_MAX
+        elif self._value <= LONG_MIN:
+            return LONG_MIN
+        return int(self._value)
+
+    def double_value(self):
+        return self._value
+
+    def _is_whole(self):
+        return self._value.is_integer() \
+            and LONG_MIN <= self._value <= LONG_MAX
+
+    def new_copy(self, origin):
+        return ConfigDouble(origin, self._value, self._original_text)
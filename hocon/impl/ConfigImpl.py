@@ -0,0 +1,339 @@
+"""
+This is public but is only supposed to be used by the "hocon" package.
+"""
+
+import os
+import sys
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+try:
+    long
+except NameError:
+    long = int
+
+try:
+    from collections.abc import Iterable, Mapping
+except ImportError:
+    from collections import Iterable, Mapping
+
+from .. import exceptions
+
+from .ConfigBoolean import ConfigBoolean
+from .ConfigDouble import ConfigDouble
+from .ConfigInt import ConfigInt
+from .ConfigLong import ConfigLong
+from .ConfigNull import ConfigNull
+from .ConfigNumber import INT_MAX, INT_MIN, LONG_MAX, LONG_MIN
+from .ConfigString import ConfigString
+from .FromMapMode import FromMapMode
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+def _file_name_source(name, parse_options):
+    """
+    The SimpleIncluder name source for files.
+
+    :param name: String
+    :param parse_options: ConfigParseOptions
+    :return: ConfigParseable
+    """
+    from . import Parseable
+    return Parseable.new_file(name, parse_options)
+
+
+def parse_path(path, options):
+    """
+    :param path: String - filesystem path
+    :param options: ConfigParseOptions
+    :return: ConfigObject
+    """
+    from . import Parseable
+    return Parseable.new_file(path, options).parse()
+
+
+def parse_path_any_syntax(path_basename, options):
+    """
+    :param path_basename: String - a filename with or without extension
+    :param options: ConfigParseOptions
+    :return: ConfigObject
+    """
+    from .SimpleIncluder import SimpleIncluder
+    return SimpleIncluder.from_basename(_file_name_source, path_basename,
+                                        options)
+
+
+def empty_object(origin_description):
+    """
+    :param origin_description: String - or None
+    :return: AbstractConfigObject
+    """
+    if origin_description is not None:
+        origin = SimpleConfigOrigin.new_simple(origin_description)
+    else:
+        origin = None
+    return _empty_object(origin)
+
+
+def empty_config(origin_description):
+    """
+    :param origin_description: String - or None
+    :return: SimpleConfig
+    """
+    return empty_object(origin_description).to_config()
+
+
+def empty(origin):
+    """
+    :param origin: ConfigOrigin
+    :return: AbstractConfigObject
+    """
+    return _empty_object(origin)
+
+
+# default origin for values created with from_any_ref and no origin specified
+_default_value_origin = SimpleConfigOrigin.new_simple("hardcoded value")
+_default_true_value = ConfigBoolean(_default_value_origin, True)
+_default_false_value = ConfigBoolean(_default_value_origin, False)
+_default_null_value = ConfigNull(_default_value_origin)
+_default_empty_list = SimpleConfigList(_default_value_origin, [])
+_default_empty_object = SimpleConfigObject.empty(_default_value_origin)
+
+
+def _empty_list(origin):
+    """
+    :param origin: ConfigOrigin
+    :return: SimpleConfigList
+    """
+    if origin is None or origin is _default_value_origin:
+        return _default_empty_list
+    else:
+        return SimpleConfigList(origin, [])
+
+
+def _empty_object(origin):
+    """
+    :param origin: ConfigOrigin
+    :return: AbstractConfigObject
+    """
+    # we want None origin to go to SimpleConfigObject.empty() to get the
+    # origin "empty config" rather than "hardcoded value"
+    if origin is _default_value_origin:
+        return _default_empty_object
+    else:
+        return SimpleConfigObject.empty(origin)
+
+
+def _value_origin(origin_description):
+    """
+    :param origin_description: String - or None
+    :return: ConfigOrigin
+    """
+    if origin_description is None:
+        return _default_value_origin
+    else:
+        return SimpleConfigOrigin.new_simple(origin_description)
+
+
+def from_any_ref(object, origin_description=None):
+    """
+    :param object: Object - None, a bool, number or string, a Mapping with
+        string keys, or another Iterable, of more of the same
+    :param origin_description: String - or None
+    :return: ConfigValue
+    """
+    origin = _value_origin(origin_description)
+    return from_any_ref_with_origin(object, origin, FromMapMode.keys_are_keys)
+
+
+def from_path_dict(path_dict, origin_description=None):
+    """
+    :param path_dict: Mapping<String, Object> - keyed by path expressions
+    :param origin_description: String - or None
+    :return: ConfigObject
+    """
+    origin = _value_origin(origin_description)
+    return from_any_ref_with_origin(path_dict, origin,
+                                    FromMapMode.keys_are_paths)
+
+
+def from_any_ref_with_origin(object, origin, map_mode):
+    """
+    :param object: Object
+    :param origin: ConfigOrigin
+    :param map_mode: FromMapMode
+    :return: AbstractConfigValue
+    """
+    if origin is None:
+        raise exceptions.BugOrBroken("origin not supposed to be null")
+
+    if object is None:
+        if origin is not _default_value_origin:
+            return ConfigNull(origin)
+        else:
+            return _default_null_value
+    elif isinstance(object, bool):
+        if origin is not _default_value_origin:
+            return ConfigBoolean(origin, object)
+        elif object:
+            return _default_true_value
+        else:
+            return _default_false_value
+    elif isinstance(object, string_types):
+        return ConfigString(origin, object)
+    elif isinstance(object, float):
+        # here we always keep the same type that was passed to us, rather
+        # than figuring out if a float has no fractional part, i.e.
+        # deliberately not using ConfigNumber.new_number().
+        return ConfigDouble(origin, object, None)
+    elif isinstance(object, (int, long)):
+        if INT_MIN <= object <= INT_MAX:
+            return ConfigInt(origin, object, None)
+        elif LONG_MIN <= object <= LONG_MAX:
+            return ConfigLong(origin, object, None)
+        else:
+            return ConfigDouble(origin, float(object), None)
+    elif isinstance(object, Mapping):
+        if len(object) == 0:
+            return _empty_object(origin)
+
+        if map_mode == FromMapMode.keys_are_keys:
+            values = {}
+            for key, value in object.items():
+                if not isinstance(key, string_types):
+                    raise exceptions.BugOrBroken(
+                        "bug in method caller: not valid to create "
+                        "ConfigObject from map with non-String key: "
+                        + repr(key))
+                values[key] = from_any_ref_with_origin(value, origin,
+                                                       map_mode)
+            return SimpleConfigObject(origin, values)
+        else:
+            from . import PropertiesParser
+            return PropertiesParser.from_path_dict(origin, object)
+    elif isinstance(object, Iterable):
+        values = [from_any_ref_with_origin(v, origin, map_mode)
+                  for v in object]
+        if not values:
+            return _empty_list(origin)
+        return SimpleConfigList(origin, values)
+    else:
+        raise exceptions.BugOrBroken(
+            "bug in method caller: not valid to create ConfigValue from: "
+            + repr(object))
+
+
+_default_includer = None
+
+
+def default_includer():
+    """
+    :return: ConfigIncluder
+    """
+    global _default_includer
+    if _default_includer is None:
+        from .SimpleIncluder import SimpleIncluder
+        _default_includer = SimpleIncluder(None)
+    return _default_includer
+
+
+def _load_env_variables():
+    """
+    :return: AbstractConfigObject
+    """
+    m = {}
+    for key, value in os.environ.items():
+        m[key] = ConfigString(
+            SimpleConfigOrigin.new_simple("env var " + key), value)
+    return SimpleConfigObject(SimpleConfigOrigin.new_simple("env variables"),
+                              m, ResolveStatus.resolved, False)
+
+
+_env_variables = None
+
+
+def env_variables_as_config_object():
+    """
+    The environment is read the first time this is called and kept after
+    that, as Java does.
+
+    :return: AbstractConfigObject
+    """
+    global _env_variables
+    if _env_variables is None:
+        _env_variables = _load_env_variables()
+    return _env_variables
+
+
+def env_variables_as_config():
+    """
+    :return: SimpleConfig
+    """
+    return env_variables_as_config_object().to_config()
+
+
+_LOADS = "loads"
+
+
+def _load_diagnostics():
+    """
+    People do HOCON_TRACE=foo,bar to enable tracing of different things;
+    Java reads the config.trace system property.
+
+    :return: Dict<String, boolean>
+    """
+    result = {_LOADS: False}
+    s = os.environ.get("HOCON_TRACE")
+    if s:
+        for k in s.split(","):
+            if k == _LOADS:
+                result[_LOADS] = True
+            else:
+                trace("HOCON_TRACE contains unknown trace topic '" + k + "'")
+    return result
+
+
+_trace_loads_enabled = None
+
+
+def trace_loads_enabled():
+    """
+    :return: boolean
+    """
+    global _trace_loads_enabled
+    if _trace_loads_enabled is None:
+        _trace_loads_enabled = _load_diagnostics()[_LOADS]
+    return _trace_loads_enabled
+
+
+def trace(message):
+    """
+    :param message: String
+    """
+    sys.stderr.write(message + "\n")
+
+
+def improve_not_resolved(what, original):
+    """
+    The basic idea here is to add the "what" and have a canonical toplevel
+    error message. The "original" exception may however have extra detail
+    about what happened. Call this if you have a better "what" than further
+    down on the stack.
+
+    :param what: Path
+    :param original: NotResolved
+    :return: NotResolved
+    """
+    new_message = str(what) \
+        + " has not been resolved, you need to call Config#resolve()," \
+        + " see API docs for Config#resolve()"
+    if new_message == str(original):
+        return original
+    else:
+        return exceptions.NotResolved(new_message, original)
@@ -0,0 +1,35 @@
+from .ConfigNumber import ConfigNumber
+
+
+class ConfigLong(ConfigNumber):
+
+    def __init__(self, origin, value, original_text):
+        """
+        :param origin: ConfigOrigin
+        :param value: int - 64-bit
+        :param original_text: String
+        """
+        super(ConfigLong, self).__init__(origin, original_text)
+        self._value = value
+
+    def unwrapped(self):
+        """
+        :return: int
+        """
+        return self._value
+
+    def transform_to_string(self):
+        s = super(ConfigLong, self).transform_to_string()
+        if s is None:
+            return str(self._value)
+        else:
+            return s
+
+    def long_value(self):
+        return self._value
+
+    def double_value(self):
+        return float(self._value)
+
+    def new_copy(self, origin):
+        return ConfigLong(origin, self._value, self._original_text)
@@ -0,0 +1,34 @@
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+
+
+class ConfigNull(AbstractConfigValue):
+    """
+    This exists because sometimes null is not the same as missing. Specifically,
+    if a value is set to null we can give a better error message (indicating
+    where it was set to null) in case someone asks for the value. Also, null
+    overrides values set "earlier" in the search path, while missing values do
+    not.
+    """
+
+    def __init__(self, origin):
+        """
+        :param origin: ConfigOrigin
+        """
+        super(ConfigNull, self).__init__(origin)
+
+    def value_type(self):
+        return ConfigValueType.null
+
+    def unwrapped(self):
+        """
+        :return: None
+        """
+        return None
+
+    def transform_to_string(self):
+        return "null"
+
+    def new_copy(self, origin):
+        return ConfigNull(origin)
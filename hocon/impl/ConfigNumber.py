@@ -0,0 +1,128 @@
+from .. import exceptions
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+
+
+INT_MIN = -2 ** 31
+INT_MAX = 2 ** 31 - 1
+LONG_MIN = -2 ** 63
+LONG_MAX = 2 ** 63 - 1
+
+# (ConfigDouble, ConfigInt, ConfigLong), imported on first use since they
+# import this module; new_number() is called for every number parsed
+_subclasses = None
+
+
+class ConfigNumber(AbstractConfigValue):
+    """
+    Attributes:
+
+        _original_text: String
+            This is so when we concatenate a number into a string (say it
+            appears in a sentence) we always have it exactly as the person
+            typed it into the config file. It's purely cosmetic; equality
+            doesn't consider this for example.
+    """
+
+    def __init__(self, origin, original_text):
+        """
+        :param origin: ConfigOrigin
+        :param original_text: String
+        """
+        super(ConfigNumber, self).__init__(origin)
+        self._original_text = original_text
+
+    def value_type(self):
+        return ConfigValueType.number
+
+    def unwrapped(self):
+        """
+        :return: int or float
+        """
+        raise NotImplementedError
+
+    def transform_to_string(self):
+        return self._original_text
+
+    def int_value_range_checked(self, path):
+        """
+        :param path: String
+        :return: int
+        """
+        l = self.long_value()
+        if l < INT_MIN or l > INT_MAX:
+            raise exceptions.WrongType(
+                self.origin(), path, expected="32-bit integer",
+                actual="out-of-range value " + str(l))
+        return l
+
+    def long_value(self):
+        """
+        :return: int
+        """
+        raise NotImplementedError
+
+    def double_value(self):
+        """
+        :return: float
+        """
+        raise NotImplementedError
+
+    def _is_whole(self):
+        """
+        :return: boolean
+        """
+        return True
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        if not isinstance(other, ConfigNumber):
+            return False
+        if self._is_whole():
+            return other._is_whole() \
+                and self.long_value() == other.long_value()
+        else:
+            return not other._is_whole() \
+                and self.double_value() == other.double_value()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        if self._is_whole():
+            return hash(self.long_value())
+        else:
+            return hash(self.double_value())
+
+    @classmethod
+    def new_number(cls, origin, value, original_text):
+        """
+        static ConfigNumber newNumber(ConfigOrigin origin, long number,
+            String originalText)
+        static ConfigNumber newNumber(ConfigOrigin origin, double number,
+            String originalText)
+
+        :param origin: ConfigOrigin
+        :param value: int or float
+        :param original_text: String
+        :return: ConfigNumber
+        """
+        global _subclasses
+        if _subclasses is None:
+            from .ConfigDouble import ConfigDouble
+            from .ConfigInt import ConfigInt
+            from .ConfigLong import ConfigLong
+            _subclasses = (ConfigDouble, ConfigInt, ConfigLong)
+        ConfigDouble, ConfigInt, ConfigLong = _subclasses
+
+        if isinstance(value, float):
+            if value.is_integer() and LONG_MIN <= value <= LONG_MAX:
+                value = int(value)
+            else:
+                return ConfigDouble(origin, value, original_text)
+        if INT_MIN <= value <= INT_MAX:
+            return ConfigInt(origin, value, original_text)
+        else:
+            return ConfigLong(origin, value, original_text)
@@ -0,0 +1,123 @@
+from .. import exceptions
+
+from . import ResolveReplacer
+from .AbstractConfigValue import AbstractConfigValue, NotPossibleToResolve
+from .ResolveStatus import ResolveStatus
+from .Unmergeable import Unmergeable
+
+
+class ConfigReference(AbstractConfigValue, Unmergeable):
+    """
+    ConfigReference represents the ${} substitution syntax. It can resolve
+    to any kind of value.
+
+    Attributes:
+
+        _expr: SubstitutionExpression
+
+        _prefix_length: int - the length of any prefixes added with
+            relativized()
+    """
+
+    def __init__(self, origin, expr, prefix_length=0):
+        """
+        :param origin: ConfigOrigin
+        :param expr: SubstitutionExpression
+        :param prefix_length: int
+        """
+        super(ConfigReference, self).__init__(origin)
+        self._expr = expr
+        self._prefix_length = prefix_length
+
+    def _not_resolved(self):
+        return exceptions.NotResolved(
+            "need to Config#resolve(), see the API docs for "
+            "Config#resolve(); substitution not resolved: " + repr(self))
+
+    def value_type(self):
+        raise self._not_resolved()
+
+    def unwrapped(self):
+        raise self._not_resolved()
+
+    def new_copy(self, origin):
+        return ConfigReference(origin, self._expr, self._prefix_length)
+
+    def ignores_fallbacks(self):
+        return False
+
+    def unmerged_values(self):
+        return [self]
+
+    def resolve_substitutions(self, context):
+        """
+        ConfigReference should be a firewall against NotPossibleToResolve
+        going further up the stack; it should convert everything to
+        ConfigException. This way it's impossible for NotPossibleToResolve
+        to "escape" since any failure to resolve has to start with a
+        ConfigReference.
+        """
+        source = context.source()
+        source.replace(self, ResolveReplacer.cycle_resolve_replacer)
+        try:
+            try:
+                v = source.lookup_subst(context, self._expr,
+                                        self._prefix_length)
+            except NotPossibleToResolve as e:
+                if self._expr.optional():
+                    v = None
+                else:
+                    raise exceptions.UnresolvedSubstitution(
+                        self.origin(),
+                        str(self._expr)
+                        + " was part of a cycle of substitutions involving "
+                        + e.trace_string(), e)
+
+            if v is None and not self._expr.optional():
+                if context.options().allow_unresolved:
+                    return self
+                else:
+                    raise exceptions.UnresolvedSubstitution(
+                        self.origin(), str(self._expr))
+            else:
+                return v
+        finally:
+            source.unreplace(self)
+
+    def resolve_status(self):
+        return ResolveStatus.unresolved
+
+    def relativized(self, prefix):
+        """
+        When you graft a substitution into another object, you have to
+        prefix it with the location in that object where you grafted it;
+        but save prefix_length so environment variable lookups don't get
+        broken.
+        """
+        new_expr = self._expr.change_path(self._expr.path().prepend(prefix))
+        return ConfigReference(self.origin(), new_expr,
+                               self._prefix_length + prefix.length())
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        return isinstance(other, ConfigReference) \
+            and self._expr == other._expr
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        return hash(self._expr)
+
+    def __repr__(self):
+        return "ConfigReference(" + str(self._expr) + ")"
+
+    def expression(self):
+        """
+        :return: SubstitutionExpression
+        """
+        return self._expr
+
+    def prefix_length(self):
+        """
+        :return: int
+        """
+        return self._prefix_length
@@ -0,0 +1,275 @@
+import threading
+
+from . import Parseable
+from . import ResolveGraph
+from .Path import Path
+from .SimpleConfigObject import SimpleConfigObject
+
+
+class _LoadedFile(object):
+    """
+    Attributes:
+
+        path: String
+
+        object: AbstractConfigObject - the file as parsed, unresolved
+
+        dependencies: List<(String, float, int, String)>
+            From Parseable.file_dependencies(): the file and everything it
+            included. None if something changed while it was being parsed,
+            which forces a re-parse on the next reload.
+    """
+
+    def __init__(self, path, options):
+        """
+        :param path: String
+        :param options: ConfigParseOptions
+        """
+        self.path = path
+        with Parseable.recording_files() as files:
+            self.object = Parseable.new_file(path, options).parse()
+        self.dependencies = Parseable.file_dependencies(files)
+
+    def unchanged(self):
+        """
+        :return: boolean
+        """
+        return self.dependencies is not None \
+            and Parseable.dependencies_unchanged(self.dependencies)
+
+
+class ConfigReloader(object):
+    """
+    Keeps a resolved Config built from a list of files, the first file
+    taking priority as with parse_file(a).with_fallback(parse_file(b)), and
+    brings it up to date when the files change.
+
+    reload() only re-parses files whose content (or included content)
+    changed. It compares the old and new trees of each such file to find the
+    paths that changed, recomputes the merged value at just those paths and
+    splices it into the previous merged tree. Then, instead of resolving the
+    whole tree again, it starts from the previous resolved tree, puts back
+    the unresolved values at the changed paths and at every substitution
+    that depends on them, directly or through other substitutions, and
+    resolves that; everything else is already resolved and is left alone.
+
+    Attributes:
+
+        _files: List<_LoadedFile>
+
+        _merged: AbstractConfigObject - merge of every file, unresolved
+
+        _config: Config - _merged, resolved
+
+        changed_paths: List<Path>
+            What the last reload() spliced in; empty if nothing changed.
+    """
+
+    def __init__(self, paths, options, resolve_options):
+        """
+        :param paths: List<String> - highest priority first
+        :param options: ConfigParseOptions
+        :param resolve_options: ConfigResolveOptions
+        """
+        self._options = options
+        self._resolve_options = resolve_options
+        self._lock = threading.Lock()
+        self._files = [_LoadedFile(path, options) for path in paths]
+        self._merged = _merge([f.object for f in self._files])
+        self._config = self._merged.to_config().resolve(resolve_options)
+        self.changed_paths = []
+
+    def config(self):
+        """
+        :return: Config - as of the last reload
+        """
+        return self._config
+
+    def reload(self):
+        """
+        Nothing is kept from a reload that fails, say on a file saved half
+        edited, so the next one starts from the last good state again.
+
+        :return: Config - the same instance as before if nothing changed
+        """
+        with self._lock:
+            files = list(self._files)
+            changed = []
+            for i, old in enumerate(files):
+                if old.unchanged():
+                    continue
+                new = _LoadedFile(old.path, self._options)
+                files[i] = new
+                _diff(old.object, new.object, (), changed)
+
+            changed = _outermost(changed)
+            changed_paths = [Path.of_elements(*keys) for keys in changed]
+            if len(changed) == 0:
+                # no value or value origin changed; see _diff() for what
+                # the kept config may still hold from before
+                self._files = files
+                self.changed_paths = changed_paths
+                return self._config
+
+            objects = [f.object for f in files]
+            changed = _outermost([_splice_point(objects, keys)
+                                  for keys in changed])
+            merged = self._merged
+            resolved = self._config.root()
+            for keys in changed:
+                value = _merge_at(objects, keys)
+                merged = _with(merged, keys, value)
+                resolved = _with(resolved, keys, value)
+
+            # put back every substitution that could now resolve differently
+            dirty = list(changed)
+            sites = []
+            ResolveGraph.find_sites(merged, (), sites)
+            sites = [s for s in sites if not _under_any(s.keys, changed)]
+            progress = True
+            while progress:
+                progress = False
+                for site in list(sites):
+                    if any(_intersects(t.keys, d)
+                           for t in site.targets for d in dirty):
+                        resolved = _with(resolved, site.keys, site.value)
+                        dirty.append(site.keys)
+                        sites.remove(site)
+                        progress = True
+
+            config = resolved.to_config().resolve(self._resolve_options)
+            self._files = files
+            self._merged = merged
+            self._config = config
+            self.changed_paths = changed_paths
+            return config
+
+
+def _merge(objects):
+    """
+    :param objects: List<AbstractConfigValue> - highest priority first,
+        None for absent
+    :return: AbstractConfigValue - None if all are absent
+    """
+    merged = None
+    for o in objects:
+        if o is None:
+            continue
+        if merged is None:
+            merged = o
+        else:
+            merged = merged.with_fallback(o)
+    return merged
+
+
+def _peek(value, keys):
+    """
+    :param value: AbstractConfigValue
+    :param keys: tuple<String>
+    :return: AbstractConfigValue - None if missing
+    """
+    for key in keys:
+        if not isinstance(value, SimpleConfigObject):
+            return None
+        value = value.get(key)
+        if value is None:
+            return None
+    return value
+
+
+def _splice_point(objects, keys):
+    """
+    The merged value at keys only depends on the values at keys in each
+    file if every file has plain objects along the way; a file that has,
+    say, a string or a substitution at a.b hides or replaces what the
+    others have at a.b.c. Backs off to the top-level key in that case,
+    where the root objects are always plain objects.
+
+    :param objects: List<AbstractConfigObject>
+    :param keys: tuple<String>
+    :return: tuple<String>
+    """
+    for o in objects:
+        value = o
+        for key in keys[:-1]:
+            value = value.get(key)
+            if value is None:
+                break
+            if not isinstance(value, SimpleConfigObject) \
+                    or value.ignores_fallbacks():
+                return keys[:1]
+    return keys
+
+
+def _merge_at(objects, keys):
+    """
+    :param objects: List<AbstractConfigObject>
+    :param keys: tuple<String>
+    :return: AbstractConfigValue - None if no file has a value there
+    """
+    return _merge([_peek(o, keys) for o in objects])
+
+
+def _with(obj, keys, value):
+    """
+    :param obj: AbstractConfigObject
+    :param keys: tuple<String>
+    :param value: AbstractConfigValue - None to remove
+    :return: AbstractConfigObject
+    """
+    path = Path.of_elements(*keys)
+    if value is None:
+        return obj.without_path(path)
+    else:
+        return obj.with_value(path, value)
+
+
+def _diff(old, new, prefix, changed):
+    """
+    Appends the paths where two trees differ, descending into objects
+    present in both. A value that moved to another line counts as changed,
+    so error messages and origin() of leaf values stay current; only the
+    origins of objects, and comments, which origins don't compare, are
+    left as they were when nothing else under them changed.
+
+    :param old: AbstractConfigObject
+    :param new: AbstractConfigObject
+    :param prefix: tuple<String>
+    :param changed: List<tuple<String>>
+    """
+    for key in set(old.keys()) | set(new.keys()):
+        o = old.get(key)
+        n = new.get(key)
+        if isinstance(o, SimpleConfigObject) \
+                and isinstance(n, SimpleConfigObject):
+            _diff(o, n, prefix + (key,), changed)
+        elif o != n or o.origin() != n.origin():
+            changed.append(prefix + (key,))
+
+
+def _outermost(paths):
+    """
+    :param paths: List<tuple<String>>
+    :return: List<tuple<String>> - without the paths under another one
+    """
+    result = []
+    for keys in sorted(set(paths), key=len):
+        if not _under_any(keys, result):
+            result.append(keys)
+    return result
+
+
+def _under_any(keys, paths):
+    """
+    :return: boolean - whether keys is one of paths or below one
+    """
+    return any(keys[:len(p)] == p for p in paths)
+
+
+def _intersects(a, b):
+    """
+    :return: boolean - whether one path is a prefix of the other
+    """
+    n = min(len(a), len(b))
+    return a[:n] == b[:n]
+
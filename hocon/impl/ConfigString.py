@@ -0,0 +1,29 @@
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+
+
+class ConfigString(AbstractConfigValue):
+
+    def __init__(self, origin, value):
+        """
+        :param origin: ConfigOrigin
+        :param value: String
+        """
+        super(ConfigString, self).__init__(origin)
+        self._value = value
+
+    def value_type(self):
+        return ConfigValueType.string
+
+    def unwrapped(self):
+        """
+        :return: String
+        """
+        return self._value
+
+    def transform_to_string(self):
+        return self._value
+
+    def new_copy(self, origin):
+        return ConfigString(origin, self._value)
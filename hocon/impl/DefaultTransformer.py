@@ -0,0 +1,107 @@
+"""
+Default automatic type transformations.
+"""
+
+import re
+
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigObject import AbstractConfigObject
+from .ConfigBoolean import ConfigBoolean
+from .ConfigDouble import ConfigDouble
+from .ConfigLong import ConfigLong
+from .ConfigNull import ConfigNull
+from .ConfigNumber import ConfigNumber, INT_MAX, LONG_MAX, LONG_MIN
+from .ConfigString import ConfigString
+from .SimpleConfigList import SimpleConfigList
+
+
+# what Long.parseLong accepts; int() also takes whitespace and underscores
+_LONG = re.compile(r'[+-]?[0-9]+\Z')
+
+
+def _parse_number(value, s):
+    """
+    :param value: ConfigString
+    :param s: String
+    :return: ConfigNumber - or None if s isn't a number
+    """
+    if _LONG.match(s):
+        v = int(s)
+        if LONG_MIN <= v <= LONG_MAX:
+            return ConfigLong(value.origin(), v, s)
+        # too big for a long, so Java tries a double
+
+    if '_' not in s:
+        try:
+            return ConfigDouble(value.origin(), float(s), s)
+        except ValueError:
+            # oh well.
+            pass
+    return None
+
+
+def _list_from_object(value):
+    """
+    Attempt to convert an array-like (numeric indices) object to a list.
+    This would be used with .properties syntax for example:
+    -Dfoo.0=bar -Dfoo.1=baz
+
+    To ensure we still throw type errors for objects treated as lists in
+    most cases, we'll refuse to convert if the object does not contain any
+    numeric keys. This means we don't allow empty objects here though :-/
+
+    :param value: AbstractConfigObject
+    :return: SimpleConfigList - or None
+    """
+    values = {}
+    for key, v in value.items():
+        if not _LONG.match(key):
+            continue
+        i = int(key)
+        if i < 0 or i > INT_MAX:
+            continue
+        values[i] = v
+
+    if not values:
+        return None
+
+    # drop the indices (we allow gaps in the indices, for better or worse)
+    return SimpleConfigList(value.origin(),
+                            [values[i] for i in sorted(values)])
+
+
+def transform(value, requested):
+    """
+    :param value: AbstractConfigValue
+    :param requested: ConfigValueType
+    :return: AbstractConfigValue - value itself if it can't be transformed
+    """
+    if isinstance(value, ConfigString):
+        s = value.unwrapped()
+        if requested == ConfigValueType.number:
+            number = _parse_number(value, s)
+            if number is not None:
+                return number
+        elif requested == ConfigValueType.null:
+            if s == "null":
+                return ConfigNull(value.origin())
+        elif requested == ConfigValueType.boolean:
+            if s in ("true", "yes", "on"):
+                return ConfigBoolean(value.origin(), True)
+            elif s in ("false", "no", "off"):
+                return ConfigBoolean(value.origin(), False)
+        # can't go STRING to LIST or OBJECT automatically
+    elif requested == ConfigValueType.string:
+        # if we converted null to string here, then you wouldn't properly
+        # get a missing-value error if you tried to get a null value as a
+        # string.
+        if isinstance(value, (ConfigNumber, ConfigBoolean)):
+            return ConfigString(value.origin(), value.transform_to_string())
+    elif requested == ConfigValueType.list \
+            and isinstance(value, AbstractConfigObject):
+        converted = _list_from_object(value)
+        if converted is not None:
+            return converted
+
+    return value
@@ -0,0 +1,541 @@
+"""
+Reads a HOCON or JSON token stream as a sequence of ConfigEvents, without
+building any config values.
+
+This follows the grammar Parser implements, but keeps only a stack of the
+objects and lists currently open and a few events waiting to be handed
+out, so memory does not depend on the size of the input. Nothing is merged,
+resolved or included: duplicate keys come out once per occurrence, and
+substitutions and includes come out as events of their own. A value that
+concatenates several pieces on one line comes out as its pieces, in order,
+at the same path; scalars next to each other are joined into one string as
+they would be in the parsed tree.
+"""
+
+import collections
+
+from .. import exceptions
+from ..ConfigEvent import ConfigEvent
+from ..ConfigEventType import ConfigEventType
+from ..ConfigSyntax import ConfigSyntax
+from ..ConfigValueType import ConfigValueType
+
+from . import tokenizer
+from . import tokens
+from . import util
+from .Path import Path
+
+
+# what an open object or list is waiting for next
+_FIELD = 'field'  # a key, or the end of the object
+_FIRST_ELEMENT = 'first element'  # a value, or the end of the list
+_ELEMENT = 'element'  # a value after a comma, or the end of the list
+_VALUE = 'value'  # a value, possibly on a later line
+_MORE_VALUE = 'more value'  # more of a concatenation, on the same line
+_SEPARATOR = 'separator'  # a comma or newline, or the end
+
+
+class _Frame(object):
+    """
+    An object or list that is open.
+
+    Attributes:
+
+        is_object: boolean
+
+        path: Path - None for the root
+
+        had_open_curly: boolean - false for a root object without braces
+
+        state: String - one of the states above
+
+        value_path: Path - where a value read now belongs
+
+        after_comma: boolean
+    """
+
+    __slots__ = ('is_object', 'path', 'had_open_curly', 'state',
+                 'value_path', 'after_comma')
+
+    def __init__(self, is_object, path, had_open_curly=True):
+        self.is_object = is_object
+        self.path = path
+        self.had_open_curly = had_open_curly
+        self.state = _FIELD if is_object else _FIRST_ELEMENT
+        self.value_path = path
+        self.after_comma = False
+
+
+def _is_simple_value(t):
+    """
+    :param t: Token
+    :return: boolean
+    """
+    return tokens.is_value(t) or tokens.is_unquoted_text(t) \
+        or tokens.is_substitution(t)
+
+
+def _text(t):
+    """
+    :param t: Token - a value or unquoted text
+    :return: String - as it reads in a concatenation
+    """
+    if tokens.is_value(t):
+        return tokens.get_value(t).transform_to_string()
+    else:
+        return tokens.get_unquoted_text(t)
+
+
+def path_from_tokens(expression):
+    """
+    :param expression: List<Token> - values and unquoted text, as in a key
+        or a substitution
+    :return: Path
+    """
+    parts = []
+    for t in expression:
+        if tokens.is_value_with_type(t, ConfigValueType.string):
+            parts.append(util.render_json_string(
+                tokens.get_value(t).unwrapped()))
+        else:
+            parts.append(_text(t))
+    return Path.new_path(u''.join(parts).strip())
+
+
+def _is_unquoted_whitespace(t):
+    """
+    :param t: Token
+    :return: boolean
+    """
+    return tokens.is_unquoted_text(t) \
+        and all(util.is_whitespace(c) for c in tokens.get_unquoted_text(t))
+
+
+class EventReader(object):
+    """
+    Iterates over the ConfigEvents of a token stream.
+
+    Attributes:
+
+        line_number: int
+            The line being read, for the origins of events made from
+            punctuation, which has no origin of its own.
+
+        pending: Deque<ConfigEvent>
+            Events made by the last step and not handed out yet.
+    """
+
+    def __init__(self, origin, token_iterator, flavor):
+        """
+        :param origin: ConfigOrigin - of the whole input
+        :param token_iterator: Iterator<Token>
+        :param flavor: ConfigSyntax - json or conf
+        """
+        self.base_origin = origin
+        self.tokens = token_iterator
+        self.flavor = flavor
+        self.buffer = []
+        self.line_number = 1
+        self._origin_line = None
+        self._origin = None
+        self.pending = collections.deque()
+        self.stack = []
+
+    def line_origin(self):
+        """
+        :return: ConfigOrigin - of the current line
+        """
+        if self._origin_line != self.line_number:
+            self._origin = self.base_origin.set_line_number(self.line_number)
+            self._origin_line = self.line_number
+        return self._origin
+
+    def parse_error(self, message, cause=None):
+        """
+        :param message: String
+        :param cause: Throwable
+        :return: exceptions.Parse
+        """
+        return exceptions.Parse(message=message, origin=self.line_origin(),
+                                cause=cause)
+
+    def emit(self, event_type, path, value=None, origin=None):
+        if origin is None:
+            origin = self.line_origin()
+        self.pending.append(ConfigEvent(event_type, path, value, origin))
+
+    def next_token(self):
+        """
+        :return: Token - never a comment
+        """
+        if self.buffer:
+            return self.buffer.pop()
+        t = next(self.tokens)
+        while tokens.is_comment(t):
+            t = next(self.tokens)
+        if tokens.is_problem(t):
+            raise exceptions.Parse(message=tokens.get_problem_message(t),
+                                   origin=t.origin(),
+                                   cause=tokens.get_problem_cause(t))
+        if self.flavor == ConfigSyntax.json:
+            if tokens.is_unquoted_text(t):
+                raise self.parse_error(
+                    "Token not allowed in valid JSON: '"
+                    + tokens.get_unquoted_text(t) + "'")
+            elif tokens.is_substitution(t):
+                raise self.parse_error(
+                    "Substitutions (${} syntax) not allowed in JSON")
+        return t
+
+    def put_back(self, t):
+        self.buffer.append(t)
+
+    def next_token_ignoring_newline(self):
+        """
+        :return: Token
+        """
+        t = self.next_token()
+        while tokens.is_newline(t):
+            # newline tokens have the line they ended
+            self.line_number = t.line_number() + 1
+            t = self.next_token()
+        line_number = t.line_number()
+        if line_number >= 0:
+            self.line_number = line_number
+        return t
+
+    def check_element_separator(self):
+        """
+        Consumes a comma or any number of newlines (optionally followed by
+        a comma in HOCON).
+
+        :return: boolean - whether there was one
+        """
+        if self.flavor == ConfigSyntax.json:
+            t = self.next_token_ignoring_newline()
+            if t is tokens.COMMA:
+                return True
+            self.put_back(t)
+            return False
+
+        saw_separator_or_newline = False
+        while True:
+            t = self.next_token()
+            if tokens.is_newline(t):
+                self.line_number = t.line_number() + 1
+                saw_separator_or_newline = True
+            elif t is tokens.COMMA:
+                return True
+            else:
+                self.put_back(t)
+                return saw_separator_or_newline
+
+    def open(self, is_object, path, had_open_curly=True):
+        self.emit(ConfigEventType.start_object if is_object
+                  else ConfigEventType.start_list, path)
+        self.stack.append(_Frame(is_object, path, had_open_curly))
+
+    def close(self):
+        frame = self.stack.pop()
+        self.emit(ConfigEventType.end_object if frame.is_object
+                  else ConfigEventType.end_list, frame.path)
+
+    def read_key(self, t):
+        """
+        :param t: Token - the first token of the key
+        :return: Path - relative to the enclosing object
+        """
+        if self.flavor == ConfigSyntax.json:
+            if tokens.is_value_with_type(t, ConfigValueType.string):
+                return Path.new_key(tokens.get_value(t).unwrapped())
+            raise self.parse_error(
+                "Expecting close brace } or a field name here, got "
+                + str(t))
+
+        expression = []
+        while tokens.is_value(t) or tokens.is_unquoted_text(t):
+            expression.append(t)
+            t = self.next_token()  # a key doesn't cross a newline
+        if len(expression) == 0:
+            raise self.parse_error(
+                "expecting a close brace or a field name here, got "
+                + str(t))
+        self.put_back(t)
+        return path_from_tokens(expression)
+
+    def read_include(self, frame):
+        t = self.next_token_ignoring_newline()
+        while _is_unquoted_whitespace(t):
+            t = self.next_token_ignoring_newline()
+
+        if tokens.is_value_with_type(t, ConfigValueType.string):
+            self.emit(ConfigEventType.include, frame.path,
+                      (None, tokens.get_value(t).unwrapped()))
+            return
+        if not tokens.is_unquoted_text(t) or tokens.get_unquoted_text(t) \
+                not in ("url(", "file(", "classpath("):
+            raise self.parse_error(
+                "expecting include parameter to be quoted filename, "
+                "file(), classpath(), or url(). No spaces are allowed "
+                "before the open paren. Not expecting: " + str(t))
+        kind = tokens.get_unquoted_text(t)[:-1]
+
+        t = self.next_token_ignoring_newline()
+        while _is_unquoted_whitespace(t):
+            t = self.next_token_ignoring_newline()
+        if not tokens.is_value_with_type(t, ConfigValueType.string):
+            raise self.parse_error(
+                "expecting a quoted string inside file(), classpath(), or "
+                "url(), rather than: " + str(t))
+        name = tokens.get_value(t).unwrapped()
+
+        t = self.next_token_ignoring_newline()
+        while _is_unquoted_whitespace(t):
+            t = self.next_token_ignoring_newline()
+        if not tokens.is_unquoted_text(t) \
+                or tokens.get_unquoted_text(t) != ")":
+            raise self.parse_error(
+                "expecting a close parentheses ')' here, not: " + str(t))
+
+        self.emit(ConfigEventType.include, frame.path, (kind, name))
+
+    def emit_simple_values(self, path, run):
+        """
+        :param path: Path
+        :param run: List<Token> - adjacent values, unquoted text and
+            substitutions
+        """
+        i = 0
+        while i < len(run):
+            t = run[i]
+            if tokens.is_substitution(t):
+                expression = tokens.get_substitution_path_expression(t)
+                self.emit(ConfigEventType.substitution, path,
+                          (path_from_tokens(expression),
+                           tokens.get_substitution_optional(t)),
+                          t.origin())
+                i += 1
+                continue
+            j = i + 1
+            while j < len(run) and not tokens.is_substitution(run[j]):
+                j += 1
+            if j == i + 1:
+                if tokens.is_value(t):
+                    value = tokens.get_value(t).unwrapped()
+                else:
+                    value = tokens.get_unquoted_text(t)
+            else:
+                value = u''.join(_text(p) for p in run[i:j])
+            self.emit(ConfigEventType.value, path, value, t.origin())
+            i = j
+
+    def read_value(self, frame, first):
+        """
+        :param frame: _Frame - the object or list the value is in
+        :param first: boolean - false if this continues a concatenation
+        """
+        path = frame.value_path
+        if first:
+            t = self.next_token_ignoring_newline()
+        else:
+            t = self.next_token()
+        json = self.flavor == ConfigSyntax.json
+
+        run = []
+        while _is_simple_value(t) and not (json and run):
+            run.append(t)
+            t = self.next_token()
+        if run:
+            self.emit_simple_values(path, run)
+
+        if t is tokens.OPEN_CURLY or t is tokens.OPEN_SQUARE:
+            if run and json:
+                self.put_back(t)
+                frame.state = _SEPARATOR
+                return
+            # in HOCON more of a concatenation may follow on the same line
+            frame.state = _SEPARATOR if json else _MORE_VALUE
+            self.open(t is tokens.OPEN_CURLY, path)
+        elif first and not run:
+            raise self.parse_error(
+                "Expecting a value but got wrong token: " + str(t))
+        else:
+            self.put_back(t)
+            frame.state = _SEPARATOR
+
+    def read_field(self, frame):
+        t = self.next_token_ignoring_newline()
+        if t is tokens.CLOSE_CURLY:
+            if self.flavor == ConfigSyntax.json and frame.after_comma:
+                raise self.parse_error(
+                    "expecting a field name after a comma, got a close brace "
+                    "} instead")
+            elif not frame.had_open_curly:
+                raise self.parse_error(
+                    "unbalanced close brace '}' with no open brace")
+            self.close()
+            return
+        elif t is tokens.END and not frame.had_open_curly:
+            self.put_back(t)
+            self.close()
+            return
+        elif self.flavor != ConfigSyntax.json and tokens.is_unquoted_text(t) \
+                and tokens.get_unquoted_text(t) == "include":
+            self.read_include(frame)
+            frame.after_comma = False
+            frame.state = _SEPARATOR
+            return
+
+        key = self.read_key(t)
+        path = key if frame.path is None else key.prepend(frame.path)
+        after_key = self.next_token_ignoring_newline()
+        self.emit(ConfigEventType.key, path,
+                  after_key is tokens.PLUS_EQUALS)
+        frame.value_path = path
+        frame.after_comma = False
+
+        if self.flavor == ConfigSyntax.conf \
+                and after_key is tokens.OPEN_CURLY:
+            # can omit the ':' or '=' before an object value
+            frame.state = _SEPARATOR
+            self.open(True, path)
+        elif after_key is tokens.COLON or (
+                self.flavor != ConfigSyntax.json
+                and (after_key is tokens.EQUALS
+                     or after_key is tokens.PLUS_EQUALS)):
+            frame.state = _VALUE
+        else:
+            raise self.parse_error(
+                "Key '" + str(path) + "' may not be followed by token: "
+                + str(after_key))
+
+    def read_object_separator(self, frame):
+        if self.check_element_separator():
+            frame.after_comma = True
+            frame.state = _FIELD
+            return
+        t = self.next_token_ignoring_newline()
+        if t is tokens.CLOSE_CURLY:
+            if not frame.had_open_curly:
+                raise self.parse_error(
+                    "unbalanced close brace '}' with no open brace")
+            self.close()
+        elif frame.had_open_curly:
+            raise self.parse_error(
+                "Expecting close brace } or a comma, got " + str(t))
+        elif t is tokens.END:
+            self.put_back(t)
+            self.close()
+        else:
+            raise self.parse_error(
+                "Expecting end of input or a comma, got " + str(t))
+
+    def read_element(self, frame):
+        t = self.next_token_ignoring_newline()
+        if t is tokens.CLOSE_SQUARE and (frame.state == _FIRST_ELEMENT
+                                         or self.flavor != ConfigSyntax.json):
+            # HOCON allows one trailing comma
+            self.close()
+        else:
+            self.put_back(t)
+            frame.state = _VALUE
+
+    def read_list_separator(self, frame):
+        if self.check_element_separator():
+            frame.state = _ELEMENT
+            return
+        t = self.next_token_ignoring_newline()
+        if t is tokens.CLOSE_SQUARE:
+            self.close()
+        else:
+            raise self.parse_error(
+                "List should have ended with ] or had a comma, instead had "
+                "token: " + str(t))
+
+    def step(self):
+        frame = self.stack[-1]
+        state = frame.state
+        if state == _VALUE or state == _MORE_VALUE:
+            self.read_value(frame, state == _VALUE)
+        elif frame.is_object:
+            if state == _FIELD:
+                self.read_field(frame)
+            else:
+                self.read_object_separator(frame)
+        elif state == _SEPARATOR:
+            self.read_list_separator(frame)
+        else:
+            self.read_element(frame)
+
+    def start(self):
+        t = self.next_token_ignoring_newline()
+        if t is not tokens.START:
+            raise exceptions.BugOrBroken(
+                "token stream did not begin with START, had " + str(t))
+
+        t = self.next_token_ignoring_newline()
+        if t is tokens.OPEN_CURLY or t is tokens.OPEN_SQUARE:
+            self.open(t is tokens.OPEN_CURLY, None)
+        elif self.flavor == ConfigSyntax.json:
+            if t is tokens.END:
+                raise self.parse_error("Empty document")
+            raise self.parse_error(
+                "Document must have an object or array at root, unexpected "
+                "token: " + str(t))
+        else:
+            # the root object can omit the surrounding braces
+            self.put_back(t)
+            self.open(True, None, had_open_curly=False)
+
+    def finish(self):
+        t = self.next_token_ignoring_newline()
+        if t is not tokens.END:
+            raise self.parse_error(
+                "Document has trailing tokens after first object or array: "
+                + str(t))
+
+    def __iter__(self):
+        self.start()
+        while self.stack:
+            while self.pending:
+                yield self.pending.popleft()
+            self.step()
+        while self.pending:
+            yield self.pending.popleft()
+        self.finish()
+
+
+def read_events(parseable):
+    """
+    :param parseable: Parseable
+    :return: Iterator<ConfigEvent> - a generator; closing it, or dropping
+        it, closes the input
+    """
+    options = parseable.options()
+    origin = parseable.origin()
+    try:
+        reader = parseable.reader()
+    except (IOError, OSError) as e:
+        if not options.allow_missing:
+            raise exceptions.IO(
+                origin=origin,
+                message=type(e).__name__ + ": " + str(e),
+                cause=e)
+        # like parsing, a missing file is an empty object
+        yield ConfigEvent(ConfigEventType.start_object, None, None, origin)
+        yield ConfigEvent(ConfigEventType.end_object, None, None, origin)
+        return
+
+    try:
+        syntax = parseable.content_type() or options.syntax
+        if syntax == ConfigSyntax.properties:
+            raise exceptions.Generic(
+                "properties files can't be read as events: "
+                + origin.description())
+        # nothing in an event carries comments
+        token_iterator = tokenizer.tokenize(origin, reader, syntax,
+                                            drop_comments=True)
+        for event in EventReader(origin, token_iterator, syntax):
+            yield event
+    finally:
+        reader.close()
@@ -1,7 +1,9 @@
-from .. import ConfigIncluder, ConfigIncluderFile, ConfigIncluderURL, \
-    ConfigIncluderClasspath
+from ..ConfigIncluder import ConfigIncluder
+from ..ConfigIncluderClasspath import ConfigIncluderClasspath
+from ..ConfigIncluderFile import ConfigIncluderFile
+from ..ConfigIncluderURL import ConfigIncluderURL
 
 
 class FullIncluder(ConfigIncluder, ConfigIncluderFile, ConfigIncluderURL,
-            ConfigIncluderClasspath):
+                   ConfigIncluderClasspath):
     pass
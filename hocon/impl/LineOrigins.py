@@ -0,0 +1,47 @@
+class LineOrigins(object):
+    """
+    The origins of the lines of one input, built on demand.
+
+    Tokens that may never be asked for their origin (newlines, comments,
+    unquoted text, substitutions, problems) keep this and a line number
+    instead of a ConfigOrigin; the origin of a line is only made when one of
+    them, or a value on that line, needs it.
+
+    Only the most recent line's origin is kept, since that is nearly always
+    the one asked for next; an earlier line's origin is simply made again.
+    That keeps the memory used independent of the length of the input.
+
+    Attributes:
+
+        _base: ConfigOrigin - the origin of the whole input
+
+        _line: int - the line _origin is for
+
+        _origin: ConfigOrigin
+    """
+
+    __slots__ = ('_base', '_line', '_origin')
+
+    def __init__(self, base):
+        """
+        :param base: ConfigOrigin
+        """
+        self._base = base
+        self._line = None
+        self._origin = None
+
+    def base(self):
+        """
+        :return: ConfigOrigin
+        """
+        return self._base
+
+    def origin(self, line_number):
+        """
+        :param line_number: int
+        :return: ConfigOrigin
+        """
+        if line_number != self._line:
+            self._origin = self._base.set_line_number(line_number)
+            self._line = line_number
+        return self._origin
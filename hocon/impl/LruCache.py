@@ -0,0 +1,90 @@
+import collections
+import threading
+
+
+class CacheStats(collections.namedtuple(
+        'CacheStats', ('hits', 'misses', 'size', 'max_size'))):
+    """
+    A snapshot of an LruCache's counters.
+
+    :param hits: int
+    :param misses: int
+    :param size: int - entries currently held
+    :param max_size: int
+    """
+
+
+class LruCache(object):
+    """
+    A thread-safe dict bounded to max_size entries, evicting the least
+    recently used entry when full. Only meant for immutable values, since
+    every caller gets the same instance back.
+
+    Attributes:
+
+        _entries: OrderedDict - least recently used first
+        _lock: Lock
+        _hits: int
+        _misses: int
+    """
+
+    _missing = object()
+
+    def __init__(self, max_size):
+        """
+        :param max_size: int
+        """
+        self._max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, compute):
+        """
+        Returns the cached value for key, calling compute(key) to make it on
+        a miss. compute runs without the lock held, so two threads missing
+        the same key at once may both compute it; the first to finish wins
+        and both get its value. If compute raises, nothing is cached.
+
+        :param key: hashable
+        :param compute: function(key) -> value
+        :return: the value
+        """
+        with self._lock:
+            value = self._entries.pop(key, LruCache._missing)
+            if value is not LruCache._missing:
+                self._entries[key] = value
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        value = compute(key)
+
+        with self._lock:
+            existing = self._entries.pop(key, LruCache._missing)
+            if existing is not LruCache._missing:
+                value = existing
+                self._entries[key] = value
+            elif self._max_size > 0:
+                if len(self._entries) >= self._max_size:
+                    self._entries.popitem(last=False)
+                self._entries[key] = value
+        return value
+
+    def clear(self):
+        """
+        Drops all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self):
+        """
+        :return: CacheStats
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries),
+                              self._max_size)
@@ -1,25 +1,41 @@
-import collections
+class MemoKey(object):
+    """
+    The key used to memoize already-traversed nodes when resolving
+    substitutions.
 
+    The value is held rather than just its id(), so it can't be collected
+    and its id reused by another value while the key is in use; values are
+    compared by identity, as Java's IdentityHashMap would.
 
-class MemoKey(collections.namedtuple('MemoKey',
-        ('value_id', 'restrict_to_child_or_null'))):
-    """
-    The key used to memoize already-traversed nodes when resolving substitutions.
+    Attributes:
+
+        _value: AbstractConfigValue
 
-    :param value_id: id(AbstractConfigValue)
-    :param restrict_to_child_or_null: Path
+        _restrict_to_child: Path - or None
     """
 
-    def __new__(cls, value, restrict_to_child_or_null):
+    __slots__ = ('_value', '_restrict_to_child')
+
+    def __init__(self, value, restrict_to_child):
+        """
+        :param value: AbstractConfigValue
+        :param restrict_to_child: Path - or None
+        """
+        self._value = value
+        self._restrict_to_child = restrict_to_child
+
+    def __eq__(self, other):
+        return isinstance(other, MemoKey) \
+            and self._value is other._value \
+            and self._restrict_to_child == other._restrict_to_child
+
+    def __ne__(self, other):
+        return not self == other
 
-        if isinstance(value, AbstractConfigValue):
-            value_id = id(value)
-        elif isinstance(value, int):
-            value_id = value
-        else:
-            raise ValueError('Expected AbstractConfigValue or int, got ' + value)
+    def __hash__(self):
+        return hash((id(self._value), self._restrict_to_child))
 
-        return super(MemoKey, cls).__new__(
-            value_id,
-            restrict_to_child_or_null
-        )
+    def __repr__(self):
+        return "MemoKey(" + repr(self._value) + "@" \
+            + str(id(self._value)) + "," + repr(self._restrict_to_child) \
+            + ")"
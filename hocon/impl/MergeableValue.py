@@ -1,4 +1,4 @@
-from .. import ConfigMergeable
+from ..ConfigMergeable import ConfigMergeable
 
 
 class MergeableValue(ConfigMergeable):
@@ -0,0 +1,214 @@
+"""
+Merges objects for with_fallback, reusing whatever doesn't change.
+
+Java's mergedWithObject visits every key of both objects and fills a new
+map as it goes, even when the result turns out to be the object it started
+from. Here only the fallback's keys are visited, since a key the fallback
+lacks keeps its value, and a new object is made only once some key has
+actually changed; everything else, unchanged subtrees included, is shared
+by identity with the objects merged. A resolved value merged with itself,
+as happens when layers share subtrees taken from the same file, is itself,
+so it isn't walked at all.
+
+merge_all() merges a whole stack of values at once, as folding with_fallback
+over it would, but a key at a time down the stack instead of a layer at a
+time, so each object of the result is made once rather than once per layer.
+"""
+
+from .. import exceptions
+
+from .AbstractConfigObject import AbstractConfigObject
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+def _merged(first, second):
+    """
+    :param first: AbstractConfigValue
+    :param second: AbstractConfigValue
+    :return: AbstractConfigValue - first.with_fallback(second)
+    """
+    if first is second and first.resolve_status() == ResolveStatus.resolved:
+        # every key of it would be merged with itself, down to values that
+        # ignore their fallbacks
+        return first
+    return first.with_fallback(second)
+
+
+def merged_with_object(obj, fallback):
+    """
+    SimpleConfigObject.mergedWithObject(AbstractConfigObject fallback)
+
+    :param obj: SimpleConfigObject - not ignoring fallbacks
+    :param fallback: AbstractConfigObject
+    :return: SimpleConfigObject - obj itself if nothing changed
+    """
+    if not isinstance(fallback, SimpleConfigObject):
+        raise exceptions.BugOrBroken(
+            "should not be reached (merging non-SimpleConfigObject)")
+
+    changes = None
+    if fallback is not obj \
+            or obj.resolve_status() != ResolveStatus.resolved:
+        for key, second in fallback.items():
+            first = obj.get(key)
+            if first is None:
+                kept = second
+            else:
+                kept = _merged(first, second)
+                if kept is first:
+                    continue
+            if changes is None:
+                changes = {}
+            changes[key] = kept
+
+    new_ignores_fallbacks = fallback.ignores_fallbacks()
+
+    if changes is None:
+        if new_ignores_fallbacks != obj.ignores_fallbacks():
+            return obj.new_copy(obj.resolve_status(), obj.origin(),
+                                new_ignores_fallbacks)
+        return obj
+
+    merged = dict(obj.items())
+    merged.update(changes)
+    if obj.resolve_status() == ResolveStatus.resolved:
+        # the values kept from obj are resolved
+        new_resolve_status = ResolveStatus.from_values(changes.values())
+    else:
+        new_resolve_status = ResolveStatus.from_values(merged.values())
+    return SimpleConfigObject(
+        AbstractConfigObject.merge_origins([obj, fallback]), merged,
+        new_resolve_status, new_ignores_fallbacks)
+
+
+def _fold(values):
+    """
+    :param values: List<AbstractConfigValue> - highest priority first
+    :return: (AbstractConfigValue, List<boolean>) - what folding with_fallback
+        over values returns, and for each value whether merging it in made a
+        new value, never the first; or None for the list if none did
+    """
+    acc = values[0]
+    if acc.ignores_fallbacks():
+        # as resolved scalars do
+        return acc, None
+
+    # a resolved value merged in right after itself changes nothing, once
+    # everything before it is resolved too
+    kept = [0]
+    resolved = acc.resolve_status() == ResolveStatus.resolved
+    for i in range(1, len(values)):
+        value = values[i]
+        if value.resolve_status() != ResolveStatus.resolved:
+            resolved = False
+        elif resolved and value is values[i - 1]:
+            continue
+        kept.append(i)
+    if len(kept) == 1:
+        return acc, None
+
+    changed = [False] * len(values)
+    start = 1
+    if isinstance(acc, SimpleConfigObject):
+        # the objects at the top of the stack, down to the first that
+        # ignores its fallbacks, are merged key by key
+        while start < len(kept) \
+                and isinstance(values[kept[start]], SimpleConfigObject):
+            start += 1
+            if values[kept[start - 1]].ignores_fallbacks():
+                break
+        if start > 1:
+            acc, objects_changed = _merged_objects(
+                [values[i] for i in kept[:start]])
+            if objects_changed is not None:
+                for i, c in zip(kept[:start], objects_changed):
+                    changed[i] = c
+
+    # anything else, delayed merges of Unmergeable values included, is left
+    # to with_fallback
+    for i in kept[start:]:
+        if acc.ignores_fallbacks():
+            break
+        merged = _merged(acc, values[i])
+        changed[i] = merged is not acc
+        acc = merged
+    return acc, changed
+
+
+def _merged_objects(objects):
+    """
+    :param objects: List<SimpleConfigObject> - highest priority first, none
+        but the last ignoring fallbacks
+    :return: (SimpleConfigObject, List<boolean>) - as from _fold()
+    """
+    first = objects[0]
+
+    # each key's values, and the objects they come from
+    stacks = {}
+    for i, obj in enumerate(objects):
+        for key, value in obj.items():
+            stack = stacks.get(key)
+            if stack is None:
+                stacks[key] = ([i], [value])
+            else:
+                stack[0].append(i)
+                stack[1].append(value)
+
+    # which objects changed some key's value as they were merged in
+    values_changed = [False] * len(objects)
+    merged = {}
+    for key, (steps, values) in stacks.items():
+        if steps[0] > 0:
+            values_changed[steps[0]] = True
+        if len(values) == 1:
+            merged[key] = values[0]
+            continue
+        merged[key], value_changed = _fold(values)
+        if value_changed is not None:
+            for step, c in zip(steps, value_changed):
+                if c:
+                    values_changed[step] = True
+
+    ignores_fallbacks = objects[-1].ignores_fallbacks()
+    if not any(values_changed):
+        if ignores_fallbacks != first.ignores_fallbacks():
+            # with_fallback copies the object to set it
+            changed = [False] * len(objects)
+            changed[-1] = True
+            return first.new_copy(first.resolve_status(), first.origin(),
+                                  ignores_fallbacks), changed
+        return first, None
+
+    # origins don't merge associatively, so merge them as each step of the
+    # fold would have, leaving out the first object while it's resolved and
+    # empty as merge_origins() does
+    origin = first.origin()
+    skip = first.resolve_status() == ResolveStatus.resolved \
+        and first.is_empty()
+    for obj, c in zip(objects, values_changed):
+        if not c:
+            continue
+        if skip:
+            origin = obj.origin()
+            skip = False
+        else:
+            origin = SimpleConfigOrigin.merge_origins([origin, obj.origin()])
+
+    if ignores_fallbacks:
+        values_changed[-1] = True
+    return SimpleConfigObject(
+        origin, merged, ResolveStatus.from_values(merged.values()),
+        ignores_fallbacks), values_changed
+
+
+def merge_all(values):
+    """
+    :param values: List<AbstractConfigValue> - highest priority first
+    :return: AbstractConfigValue - the same as
+        values[0].with_fallback(values[1]).with_fallback(values[2])...
+    """
+    if not values:
+        raise exceptions.BugOrBroken("can't merge an empty list")
+    return _fold(values)[0]
@@ -0,0 +1,300 @@
+"""
+Parses JSON with the json module rather than the tokenizer and Parser,
+building the config values straight from what it decodes.
+
+Values either all share the origin of the document, which lets the C
+decoder do all the scanning, or each have the origin of the line they
+start on, in which case the document is scanned here, a value at a time,
+still with the C string scanner. Either way, anything that isn't a JSON
+object or array the way Parser would accept it, including a field given
+twice, raises NotNative, so the caller can hand the text to Parser to
+report the problem properly.
+"""
+
+import bisect
+import json
+import json.decoder
+import json.scanner
+import re
+
+from .AbstractConfigObject import AbstractConfigObject
+from .AbstractConfigValue import AbstractConfigValue
+from .ConfigBoolean import ConfigBoolean
+from .ConfigNull import ConfigNull
+from .ConfigNumber import ConfigNumber
+from .ConfigString import ConfigString
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigObject import SimpleConfigObject
+
+
+# the whitespace JSON allows between tokens
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_NUMBER = json.scanner.NUMBER_RE
+
+# the json module only rejects control characters below U+0020 in strings,
+# where the tokenizer rejects all of Java's ISO control characters; outside
+# strings they aren't JSON at all, so the whole document can be searched
+_C1_CONTROL = re.compile(u'[\x7f-\x9f]')
+
+_LITERALS = (
+    ('true', True),
+    ('false', False),
+    ('null', None),
+)
+
+
+class NotNative(Exception):
+    """
+    The text is something only Parser can deal with, or report on.
+    """
+
+
+def _reject(*args):
+    raise NotNative()
+
+
+def _new_long(origin, text):
+    """
+    :param origin: ConfigOrigin
+    :param text: String - an integer, as written
+    :return: ConfigNumber
+    :raises: NotNative if it's too large for Long, which the tokenizer
+        would read as unquoted text, and JSON doesn't allow
+    """
+    n = int(text)
+    if not -2 ** 63 <= n < 2 ** 63:
+        raise NotNative()
+    return ConfigNumber.new_number(origin=origin, value=n, original_text=text)
+
+
+def _new_number(origin, text, fraction, exponent):
+    """
+    :param origin: ConfigOrigin
+    :param text: String - as written
+    :param fraction: String - the part after the point, or None
+    :param exponent: String - the exponent, or None
+    :return: ConfigNumber
+    """
+    if fraction or exponent:
+        return ConfigNumber.new_number(
+            origin=origin, value=float(text), original_text=text)
+    return _new_long(origin, text)
+
+
+def _convert(value, origin):
+    """
+    Turns what the decoder left as plain Python into config values.
+
+    :param value: AbstractConfigValue, or a str, bool, None or list
+    :param origin: ConfigOrigin
+    :return: AbstractConfigValue
+    """
+    if isinstance(value, AbstractConfigValue):
+        # objects and numbers, made by the hooks
+        return value
+    elif value is True or value is False:
+        return ConfigBoolean(origin, value)
+    elif value is None:
+        return ConfigNull(origin)
+    elif isinstance(value, list):
+        return SimpleConfigList(origin, [_convert(v, origin) for v in value])
+    else:
+        return ConfigString(origin, value)
+
+
+def _parse_document(text, origin):
+    """
+    :param text: String
+    :param origin: ConfigOrigin
+    :return: AbstractConfigValue
+    """
+
+    def object_pairs(pairs):
+        values = {}
+        for key, value in pairs:
+            if key in values:
+                # JSON doesn't allow duplicate fields
+                raise NotNative()
+            values[key] = _convert(value, origin)
+        return SimpleConfigObject(origin, values)
+
+    decoder = json.JSONDecoder(
+        object_pairs_hook=object_pairs,
+        parse_int=lambda s: _new_long(origin, s),
+        parse_float=lambda s: ConfigNumber.new_number(
+            origin=origin, value=float(s), original_text=s),
+        parse_constant=_reject)
+    try:
+        value = decoder.decode(text)
+    except (ValueError, RuntimeError):
+        # not JSON, or nested too deeply to recurse; RecursionError is a
+        # RuntimeError
+        raise NotNative()
+    if not isinstance(value, (AbstractConfigObject, list)):
+        # not an object or array at the root
+        raise NotNative()
+    return _convert(value, origin)
+
+
+class _LineScanner(object):
+    """
+    A recursive descent over one document, giving each value the origin of
+    the line it starts on.
+
+    Attributes:
+
+        text: String
+
+        origin: ConfigOrigin
+
+        newlines: List<int> - where each line but the last ends
+
+        origins: Dict<int, ConfigOrigin> - by line number
+    """
+
+    def __init__(self, text, origin):
+        """
+        :param text: String
+        :param origin: ConfigOrigin
+        """
+        self.text = text
+        self.origin = origin
+        self.newlines = [m.start() for m in re.finditer('\n', text)]
+        self.origins = {}
+
+    def line_origin(self, index):
+        """
+        :param index: int - a position in text
+        :return: ConfigOrigin
+        """
+        line = bisect.bisect_left(self.newlines, index) + 1
+        origin = self.origins.get(line)
+        if origin is None:
+            origin = self.origins[line] = self.origin.set_line_number(line)
+        return origin
+
+    def skip_whitespace(self, index):
+        return _WHITESPACE.match(self.text, index).end()
+
+    def expect(self, index, c):
+        """
+        :return: int - index after c, and any whitespace after it
+        """
+        index = self.skip_whitespace(index)
+        if self.text[index:index + 1] != c:
+            raise NotNative()
+        return self.skip_whitespace(index + 1)
+
+    def string(self, index):
+        """
+        :param index: int - of the opening quote
+        :return: (String, int)
+        """
+        try:
+            return json.decoder.scanstring(self.text, index + 1)
+        except ValueError:
+            raise NotNative()
+
+    def value(self, index):
+        """
+        :param index: int - where the value starts
+        :return: (AbstractConfigValue, int) - the value, and where it ends
+        """
+        text = self.text
+        c = text[index:index + 1]
+        if c == '"':
+            s, end = self.string(index)
+            return ConfigString(self.line_origin(index), s), end
+        elif c == '{':
+            return self.object(index)
+        elif c == '[':
+            return self.list(index)
+
+        for literal, value in _LITERALS:
+            if text.startswith(literal, index):
+                return (_convert(value, self.line_origin(index)),
+                        index + len(literal))
+
+        m = _NUMBER.match(text, index)
+        if m is None:
+            raise NotNative()
+        fraction, exponent = m.group(2, 3)
+        return (_new_number(self.line_origin(index), m.group(), fraction,
+                            exponent),
+                m.end())
+
+    def object(self, start):
+        text = self.text
+        values = {}
+        index = self.skip_whitespace(start + 1)
+        if text[index:index + 1] == '}':
+            return SimpleConfigObject(self.line_origin(start), values), \
+                index + 1
+        while True:
+            if text[index:index + 1] != '"':
+                raise NotNative()
+            key, index = self.string(index)
+            if key in values:
+                raise NotNative()
+            index = self.expect(index, ':')
+            values[key], index = self.value(index)
+            index = self.skip_whitespace(index)
+            c = text[index:index + 1]
+            if c == '}':
+                return SimpleConfigObject(self.line_origin(start), values), \
+                    index + 1
+            elif c != ',':
+                raise NotNative()
+            index = self.skip_whitespace(index + 1)
+
+    def list(self, start):
+        text = self.text
+        values = []
+        index = self.skip_whitespace(start + 1)
+        if text[index:index + 1] == ']':
+            return SimpleConfigList(self.line_origin(start), values), \
+                index + 1
+        while True:
+            value, index = self.value(index)
+            values.append(value)
+            index = self.skip_whitespace(index)
+            c = text[index:index + 1]
+            if c == ']':
+                return SimpleConfigList(self.line_origin(start), values), \
+                    index + 1
+            elif c != ',':
+                raise NotNative()
+            index = self.skip_whitespace(index + 1)
+
+    def document(self):
+        """
+        :return: AbstractConfigValue
+        """
+        index = self.skip_whitespace(0)
+        if self.text[index:index + 1] not in ('{', '['):
+            raise NotNative()
+        try:
+            value, index = self.value(index)
+        except RuntimeError:
+            # nested too deeply to recurse
+            raise NotNative()
+        if self.skip_whitespace(index) != len(self.text):
+            raise NotNative()
+        return value
+
+
+def parse(text, origin, line_origins=False):
+    """
+    :param text: String - the whole document
+    :param origin: ConfigOrigin - of the document
+    :param line_origins: boolean - whether each value gets the origin of
+        its line, rather than all of them sharing origin
+    :return: AbstractConfigValue - an object or a list
+    :raises: NotNative if Parser should parse it instead
+    """
+    if _C1_CONTROL.search(text) is not None:
+        raise NotNative()
+    if line_origins:
+        return _LineScanner(text, origin).document()
+    return _parse_document(text, origin)
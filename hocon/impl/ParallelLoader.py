@@ -0,0 +1,351 @@
+"""
+Parses a file with a flexible extension, like
+ConfigImpl.parse_path_any_syntax, but with the files it includes parsed
+side by side in a pool of processes.
+
+The include graph is found first: each .conf file is read as events, just
+far enough to see its include statements, and each include is resolved to
+the files SimpleIncluder would open for it. Then the files are parsed
+leaves first, each as soon as everything it includes is done, with the
+parses of those handed to it through Parseable.preloaded_files(). The
+includes themselves are still carried out by Parser, in the order they
+appear, so the result is the one a serial parse gives; the preloaded parses
+only save reading the files again.
+
+Includes of URLs and classpath resources, files missing when the graph is
+found, files in include cycles and files that fail to parse aren't
+preloaded, and are parsed the usual way when they're included, which also
+reports any errors as a serial parse would.
+"""
+
+import os
+
+try:
+    import urlparse
+except ImportError:
+    # Python 3
+    from urllib import parse as urlparse
+
+from .. import exceptions
+from ..ConfigEventType import ConfigEventType
+from ..ConfigSyntax import ConfigSyntax
+
+from . import ConfigImpl
+from . import EventReader
+from . import Parseable
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+try:
+    from concurrent import futures
+except ImportError:
+    # the futures backport isn't installed; everything is parsed serially
+    futures = None
+
+
+# in the order they fall back to each other
+_EXTENSIONS = (
+    (".conf", ConfigSyntax.conf),
+    (".json", ConfigSyntax.json),
+    (".properties", ConfigSyntax.properties),
+)
+
+
+def _has_extension(name):
+    """
+    :param name: String
+    :return: boolean
+    """
+    return any(name.endswith(extension) for extension, syntax in _EXTENSIONS)
+
+
+def _is_url(name):
+    """
+    :param name: String
+    :return: boolean - whether an include of name is an include of a URL
+    """
+    # a single letter is a drive, not a scheme
+    return len(urlparse.urlparse(name).scheme) > 1
+
+
+def _include_options(options, syntax):
+    """
+    :param options: ConfigParseOptions - as given for the whole load
+    :param syntax: ConfigSyntax
+    :return: ConfigParseOptions - how an included file is parsed
+    """
+    # only the root file is filtered by only_paths
+    return options.set_syntax(syntax).set_origin_description(None) \
+        .set_allow_missing(False).set_only_paths(None)
+
+
+def _candidates(parent, kind, name):
+    """
+    The files an include could open, in the order they're merged, as
+    SimpleIncluder resolves them.
+
+    :param parent: String - path of the including file
+    :param kind: String - "file", or None for a plain quoted name
+    :param name: String
+    :return: List<(String, ConfigSyntax)> - path as it will be opened, and
+        the syntax it will be parsed with
+    """
+    if kind is None:
+        if _is_url(name):
+            return []
+
+        def source(n):
+            # ParseableFile.relative_to
+            if os.path.isabs(n):
+                return n
+            return Parseable.relative_to_file(parent, n)
+        # an included file's options carry the including file's syntax
+        explicit_syntax = ConfigSyntax.conf
+    elif kind == "file":
+        def source(n):
+            return n
+        explicit_syntax = None
+    else:
+        return []
+
+    if _has_extension(name):
+        path = source(name)
+        syntax = explicit_syntax or Parseable.syntax_from_extension(name)
+        found = [(path, syntax)]
+    else:
+        found = [(source(name + extension), syntax)
+                 for extension, syntax in _EXTENSIONS]
+    return [(path, syntax) for path, syntax in found
+            if path is not None and os.path.isfile(path)]
+
+
+def _scan_includes(path, options):
+    """
+    Runs in a worker.
+
+    :param path: String
+    :param options: ConfigParseOptions - with the syntax to read it with
+    :return: List<(String, ConfigSyntax)> - the files its includes open
+    """
+    if options.syntax != ConfigSyntax.conf:
+        return []
+    found = []
+    events = EventReader.read_events(Parseable.new_file(path, options))
+    try:
+        for event in events:
+            if event.event_type == ConfigEventType.include:
+                kind, name = event.value
+                found.extend(_candidates(path, kind, name))
+    except exceptions.ConfigException:
+        # our exceptions can't be unpickled, which would break the pool;
+        # the includes seen before the error are still parsed ahead
+        pass
+    return found
+
+
+def _parse_file(path, options, preloaded):
+    """
+    Runs in a worker.
+
+    :param path: String
+    :param options: ConfigParseOptions
+    :param preloaded: Dict<(String, ConfigSyntax), AbstractConfigObject> -
+        parses of the files it includes
+    :return: AbstractConfigObject
+    """
+    with Parseable.preloaded_files(preloaded):
+        parseable = Parseable.new_file(path, options)
+        return parseable.parse(parseable.options())
+
+
+def _try_parse_file(path, options, preloaded):
+    """
+    Runs in a worker.
+
+    :return: AbstractConfigObject - what _parse_file returns, or None if it
+        raised
+    """
+    try:
+        return _parse_file(path, options, preloaded)
+    except exceptions.ConfigException:
+        # can't be unpickled, as above; the error is raised again when the
+        # file is parsed serially
+        return None
+
+
+def _roots(path_basename, options):
+    """
+    :param path_basename: String
+    :param options: ConfigParseOptions
+    :return: List<(String, ConfigParseOptions)> - the files to merge, in
+        order, with the options to parse each with
+    """
+    if _has_extension(path_basename):
+        candidates = [(path_basename, options.syntax
+                       or Parseable.syntax_from_extension(path_basename))]
+    else:
+        candidates = [(path_basename + extension, syntax)
+                      for extension, syntax in _EXTENSIONS
+                      if options.syntax in (None, syntax)]
+    return [(path, options.set_syntax(syntax).set_allow_missing(False))
+            for path, syntax in candidates if os.path.isfile(path)]
+
+
+class ParallelLoader(object):
+    """
+    One load: the include graph found so far and the parses done so far.
+
+    Attributes:
+
+        pool: Executor
+
+        options: ConfigParseOptions
+            As given for the whole load.
+
+        includes: Dict<(String, ConfigSyntax), List<(String, ConfigSyntax)>>
+            The files each file includes, for every file found.
+
+        parsed: Dict<(String, ConfigSyntax), AbstractConfigObject>
+            The files parsed successfully so far.
+    """
+
+    def __init__(self, pool, options):
+        """
+        :param pool: Executor
+        :param options: ConfigParseOptions - as given for the whole load
+        """
+        self.pool = pool
+        self.options = options
+        self.includes = {}
+        self.parsed = {}
+
+    def discover(self, roots):
+        """
+        Finds every file reachable through includes from roots, a level at
+        a time, the files of each level being scanned at once.
+
+        :param roots: List<(String, ConfigParseOptions)>
+        :return: List<List<(String, ConfigSyntax)>> - the files each root
+            includes
+        """
+        scans = [self.pool.submit(_scan_includes, path, root_options)
+                 for path, root_options in roots]
+        root_includes = [self._result(scan, []) for scan in scans]
+
+        level = set(f for found in root_includes for f in found)
+        while level:
+            scans = dict((f, self.pool.submit(
+                _scan_includes, f[0], _include_options(self.options, f[1])))
+                for f in level)
+            level = set()
+            for f, scan in scans.items():
+                found = self.includes[f] = self._result(scan, [])
+                level.update(n for n in found if n not in self.includes)
+            level.difference_update(scans)
+        return root_includes
+
+    def parse_includes(self):
+        """
+        Parses every file found, each once all the files it includes have
+        been parsed or have failed. Files in a cycle are never ready.
+        """
+        waiting = dict((f, set(found)) for f, found in self.includes.items())
+        # the files including each file
+        included_by = {}
+        for f, found in waiting.items():
+            for n in found:
+                included_by.setdefault(n, []).append(f)
+        running = {}
+
+        def submit(f):
+            del waiting[f]
+            preloaded = dict((n, self.parsed[n]) for n in self.includes[f]
+                             if n in self.parsed)
+            running[self.pool.submit(
+                _try_parse_file, f[0], _include_options(self.options, f[1]),
+                preloaded)] = f
+
+        for f in [f for f, found in waiting.items() if not found]:
+            submit(f)
+        while running:
+            done, not_done = futures.wait(
+                running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                f = running.pop(future)
+                value = self._result(future, None)
+                if value is not None:
+                    self.parsed[f] = value
+                for parent in included_by.get(f, ()):
+                    found = waiting.get(parent)
+                    if found is not None:
+                        found.discard(f)
+                        if not found:
+                            submit(parent)
+
+    def parse_roots(self, roots, root_includes):
+        """
+        :param roots: List<(String, ConfigParseOptions)>
+        :param root_includes: List<List<(String, ConfigSyntax)>>
+        :return: List<AbstractConfigObject> - in the order of roots
+        """
+        parses = []
+        for (path, root_options), found in zip(roots, root_includes):
+            preloaded = dict((f, self.parsed[f]) for f in found
+                             if f in self.parsed)
+            parses.append((path, root_options, preloaded, self.pool.submit(
+                _try_parse_file, path, root_options, preloaded)))
+        values = []
+        for path, root_options, preloaded, future in parses:
+            value = self._result(future, None)
+            if value is None:
+                # parse it again here, to raise the error
+                value = _parse_file(path, root_options, preloaded)
+            values.append(value)
+        return values
+
+    @staticmethod
+    def _result(future, default):
+        """
+        :param future: Future
+        :param default: what to return if the task failed
+        """
+        try:
+            return future.result()
+        except Exception:
+            # whatever went wrong is reported when the file is parsed
+            # serially, or is included and parsed serially
+            return default
+
+
+def parse_path_any_syntax(path_basename, options, max_workers=None):
+    """
+    :param path_basename: String - a filename with or without extension
+    :param options: ConfigParseOptions
+    :param max_workers: int - size of the process pool, or None for the
+        number of processors
+    :return: AbstractConfigObject - what
+        ConfigImpl.parse_path_any_syntax(path_basename, options) returns
+    """
+    roots = _roots(path_basename, options)
+    if futures is None or options.includer is not None or not roots:
+        # a custom includer may resolve names differently; if nothing
+        # exists, the serial path raises or returns the empty object
+        return ConfigImpl.parse_path_any_syntax(path_basename, options)
+
+    with futures.ProcessPoolExecutor(max_workers) as pool:
+        loader = ParallelLoader(pool, options)
+        root_includes = loader.discover(roots)
+        loader.parse_includes()
+        values = loader.parse_roots(roots, root_includes)
+
+    # merged as SimpleIncluder.fromBasename merges the siblings
+    if _has_extension(path_basename):
+        return values[0]
+    if roots[0][1].syntax == ConfigSyntax.conf:
+        obj = values.pop(0)
+    else:
+        obj = SimpleConfigObject.empty(
+            SimpleConfigOrigin.new_simple(path_basename))
+    for value in values:
+        obj = obj.with_fallback(value)
+    return obj
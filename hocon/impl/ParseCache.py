@@ -0,0 +1,148 @@
+import hashlib
+import os
+import tempfile
+
+try:
+    import cPickle as pickle
+except ImportError:
+    # Python 3
+    import pickle
+
+from .. import exceptions
+
+from . import Parseable
+
+
+class ParseCache(object):
+    """
+    An on-disk cache of parsed (and optionally resolved) config files.
+
+    Each entry is keyed by the absolute path of the file that was asked for,
+    the parse options and, if the tree was resolved, the resolve options.
+    Alongside the pickled ConfigObject it stores the size, mtime and SHA-1
+    of every file that was opened while parsing, includes and missing files
+    included. An entry is only used if none of those files has changed: a
+    file whose size and mtime still match is trusted, otherwise its content
+    is hashed again, so touching a file without editing it keeps the entry.
+
+    Only parses using the default includer are cached, since a custom
+    includer may read things this cache knows nothing about. Nor are parses
+    that read a URL, since nothing here can tell when a URL changes.
+
+    Attributes:
+
+        directory: String
+            Where the entries are kept, created on first write.
+    """
+
+    # bump this whenever the pickled value classes change shape
+    VERSION = 1
+
+    def __init__(self, directory):
+        """
+        :param directory: String
+        """
+        self.directory = directory
+
+    def parse_file(self, path, options, resolve_options=None):
+        """
+        :param path: String - filesystem path
+        :param options: ConfigParseOptions
+        :param resolve_options: ConfigResolveOptions - resolve the tree with
+            these before caching it, or None to cache it unresolved
+        :return: ConfigObject
+        """
+        if options.includer is not None:
+            return self._parse(path, options, resolve_options)
+
+        entry = self._entry_path(path, options, resolve_options)
+        value = self._load(entry)
+        if value is not None:
+            return value
+
+        with Parseable.recording_files() as files:
+            value = self._parse(path, options, resolve_options)
+
+        dependencies = Parseable.file_dependencies(files)
+        if dependencies is None:
+            return value
+        self._store(entry, dependencies, value)
+        return value
+
+    def _parse(self, path, options, resolve_options):
+        value = Parseable.new_file(path, options).parse()
+        if resolve_options is not None:
+            value = value.to_config().resolve(resolve_options).root()
+        return value
+
+    def _entry_path(self, path, options, resolve_options):
+        """
+        :return: String - the entry's filename
+        """
+        key = [
+            ParseCache.VERSION,
+            os.path.abspath(path),
+            options.syntax.name if options.syntax is not None else None,
+            options.origin_description,
+            options.allow_missing,
+            options.drop_comments,
+            options.only_paths,
+            options.native_json,
+        ]
+        if resolve_options is not None:
+            key.append(resolve_options.allow_unresolved)
+            key.append(resolve_options.use_system_environment)
+            if resolve_options.use_system_environment:
+                # substitutions may have fallen back to these
+                key.append(sorted(os.environ.items()))
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + '.cache')
+
+    def _load(self, entry):
+        """
+        :param entry: String
+        :return: ConfigObject, or None if there's no valid entry
+        """
+        try:
+            with open(entry, 'rb') as f:
+                if pickle.load(f) != ParseCache.VERSION:
+                    return None
+                # the dependencies are pickled separately from the value so
+                # that a stale entry costs only this much to reject
+                if not Parseable.dependencies_unchanged(pickle.load(f)):
+                    return None
+                return pickle.load(f)
+        except Exception:
+            # unreadable, corrupt, or pickled from classes that have since
+            # changed; any of these is a miss
+            return None
+
+    def _store(self, entry, dependencies, value):
+        """
+        :param entry: String
+        :param dependencies: List<(String, float, int, String)>
+        :param value: ConfigObject
+        """
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(ParseCache.VERSION, f,
+                                pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(dependencies, f, pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+                # atomic, so concurrent workers never see half an entry
+                os.rename(tmp, entry)
+            except:
+                os.remove(tmp)
+                raise
+        except (IOError, OSError) as e:
+            # a cache that can't be written is just a cache miss next time
+            Parseable.trace("could not write parse cache entry " + entry
+                            + ": " + str(e))
+        except pickle.PicklingError as e:
+            raise exceptions.BugOrBroken(
+                "parsed config could not be pickled", cause=e)
+
@@ -0,0 +1,991 @@
+"""
+This is public but it's only for use by the config package; DO NOT TOUCH. The
+point of this class is to avoid "propagating" each overload on
+"thing which can be parsed" through multiple interfaces. Most interfaces can
+have just one overload that takes a Parseable. Also it's used as an abstract
+"resource handle" in the ConfigIncluder interface.
+"""
+
+import codecs
+import contextlib
+import hashlib
+import io
+import mmap
+import os
+import threading
+
+try:
+    import urlparse
+    from urllib import url2pathname
+    from urllib2 import urlopen
+except ImportError:
+    # Python 3, which AsyncLoader needs
+    from urllib import parse as urlparse
+    from urllib.request import url2pathname, urlopen
+
+from .. import exceptions
+from ..ConfigParseable import ConfigParseable
+from ..ConfigSyntax import ConfigSyntax
+
+from . import ConfigImpl
+from . import NativeJsonParser
+from . import Parser
+from . import PathFilter
+from . import PropertiesParser
+from . import tokenizer
+from .AbstractConfigObject import AbstractConfigObject
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+from .SimpleIncludeContext import SimpleIncludeContext
+from .SimpleIncluder import SimpleIncluder
+
+
+MAX_INCLUDE_DEPTH = 50
+
+# holds the stack of Parseables being parsed on each thread, innermost first
+_parse_stack = threading.local()
+
+
+def _get_parse_stack():
+    """
+    :return: List<Parseable>
+    """
+    stack = getattr(_parse_stack, 'stack', None)
+    if stack is None:
+        stack = _parse_stack.stack = []
+    return stack
+
+
+def file_state(path):
+    """
+    :param path: String
+    :return: (String, float, int) - absolute path, mtime and size; mtime and
+        size are None if the file doesn't exist
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except (IOError, OSError):
+        return (path, None, None)
+    return (path, st.st_mtime, st.st_size)
+
+
+def _record_file(path):
+    """
+    :param path: String
+    """
+    files = getattr(_parse_stack, 'files', None)
+    if files is not None:
+        files.append(file_state(path))
+
+
+def _record_url(url):
+    """
+    Records a URL read for recording_files(), as (url,): no file state can
+    tell whether it has changed.
+
+    :param url: String
+    """
+    files = getattr(_parse_stack, 'files', None)
+    if files is not None:
+        files.append((url,))
+
+
+@contextlib.contextmanager
+def recording_files():
+    """
+    Collects the file_state() of every file a ParseableFile tries to open on
+    this thread while the block runs, including includes and files that
+    turn out to be missing. The state is taken just before the file is
+    opened. Every URL read is collected too, as (url,).
+
+    :return: List<(String, float, int)> - filled in as files are opened,
+        with a (String,) for each URL
+    """
+    outer = getattr(_parse_stack, 'files', None)
+    files = _parse_stack.files = []
+    try:
+        yield files
+    finally:
+        _parse_stack.files = outer
+        if outer is not None:
+            outer.extend(files)
+
+
+@contextlib.contextmanager
+def preloaded_files(values):
+    """
+    While the block runs, included files on this thread whose parse is in
+    values return it instead of being read. Only what an include would do is
+    replaced: the file is looked up by the path it's opened with and the
+    syntax it's parsed with, and only when no origin description is forced.
+
+    :param values: Dict<(String, ConfigSyntax), AbstractConfigObject>
+    """
+    outer = getattr(_parse_stack, 'preloaded', None)
+    _parse_stack.preloaded = values
+    try:
+        yield
+    finally:
+        _parse_stack.preloaded = outer
+
+
+@contextlib.contextmanager
+def prefetched_inputs(contents):
+    """
+    While the block runs, files and URLs on this thread whose text is in
+    contents are read from there instead of being opened.
+
+    :param contents: Dict<String, (String, String)> - keyed by path or URL,
+        the text and, for a URL, its Content-Type (None for a file)
+    """
+    outer = getattr(_parse_stack, 'prefetched', None)
+    _parse_stack.prefetched = contents
+    try:
+        yield
+    finally:
+        _parse_stack.prefetched = outer
+
+
+def _prefetched(input):
+    """
+    :param input: String - path or URL
+    :return: (String, String) - from prefetched_inputs(), or None
+    """
+    contents = getattr(_parse_stack, 'prefetched', None)
+    if not contents:
+        return None
+    return contents.get(input)
+
+
+def content_hash(path):
+    """
+    :param path: String
+    :return: String - hex SHA-1 of the file's bytes, None if unreadable
+    """
+    h = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(64 * 1024)
+                if not block:
+                    break
+                h.update(block)
+    except (IOError, OSError):
+        return None
+    return h.hexdigest()
+
+
+def file_dependencies(files):
+    """
+    Turns what recording_files() collected into a list that
+    dependencies_unchanged() can check later.
+
+    :param files: List<(String, float, int)> - from recording_files()
+    :return: List<(String, float, int, String)> - each file once, with the
+        SHA-1 of its content (None for missing files); None if some file
+        changed after it was opened, since we can't tell which version
+        was parsed, or if a URL was read, since we can't tell when it
+        changes
+    """
+    dependencies = []
+    seen = set()
+    for state in files:
+        if len(state) == 1:
+            return None
+        if state[0] in seen:
+            continue
+        seen.add(state[0])
+        if file_state(state[0]) != state:
+            return None
+        if state[1] is not None:
+            digest = content_hash(state[0])
+            if file_state(state[0]) != state:
+                return None
+        else:
+            digest = None
+        dependencies.append(state + (digest,))
+    return dependencies
+
+
+def file_unchanged(path, mtime, size, digest):
+    """
+    A file whose size and mtime still match is trusted, otherwise its
+    content is hashed again, so touching a file without editing it doesn't
+    count as a change.
+
+    :return: boolean
+    """
+    state = file_state(path)
+    if state == (path, mtime, size):
+        return True
+    if state[1] is None or mtime is None or state[2] != size:
+        # appeared, disappeared or changed length
+        return False
+    return content_hash(path) == digest
+
+
+def dependencies_unchanged(dependencies):
+    """
+    :param dependencies: List<(String, float, int, String)> - from
+        file_dependencies()
+    :return: boolean
+    """
+    for (path, mtime, size, digest) in dependencies:
+        if not file_unchanged(path, mtime, size, digest):
+            return False
+    return True
+
+
+def trace(message):
+    """
+    :param message: String
+    """
+    if ConfigImpl.trace_loads_enabled():
+        ConfigImpl.trace(message)
+
+
+class Parseable(ConfigParseable):
+
+    def __init__(self):
+        self._include_context = None  # ConfigIncludeContext
+        self._initial_options = None  # ConfigParseOptions
+        self._initial_origin = None  # ConfigOrigin
+
+    def _fixup_options(self, base_options):
+        """
+        :param base_options: ConfigParseOptions
+        :return: ConfigParseOptions
+        """
+        syntax = base_options.syntax
+        if syntax is None:
+            syntax = self.guess_syntax()
+        if syntax is None:
+            syntax = ConfigSyntax.conf
+        modified = base_options.set_syntax(syntax)
+
+        # make sure the app-provided includer falls back to default
+        modified = modified.append_includer(ConfigImpl.default_includer())
+        # make sure the app-provided includer is complete
+        modified = modified.set_includer(
+            SimpleIncluder.make_full(modified.includer))
+
+        return modified
+
+    def post_construct(self, base_options):
+        """
+        :param base_options: ConfigParseOptions
+        """
+        self._initial_options = self._fixup_options(base_options)
+
+        self._include_context = SimpleIncludeContext(self)
+
+        if self._initial_options.origin_description is not None:
+            self._initial_origin = SimpleConfigOrigin.new_simple(
+                self._initial_options.origin_description)
+        else:
+            self._initial_origin = self.create_origin()
+
+    def reader(self):
+        """
+        The general idea is that any work should be in here, not in the
+        constructor, so that exceptions are thrown from the public parse()
+        function and not from the creation of the Parseable.
+        Essentially this is a lazy field. The parser should close the
+        reader when it's done with it.
+        ALSO, IMPORTANT: if the file or URL is not found, this must throw.
+        to support the "allow missing" feature.
+
+        :return: Reader - anything with read(size) and close()
+        """
+        raise NotImplementedError
+
+    def guess_syntax(self):
+        """
+        :return: ConfigSyntax
+        """
+        return None
+
+    def content_type(self):
+        """
+        :return: ConfigSyntax
+        """
+        return None
+
+    def relative_to(self, filename):
+        """
+        Java falls back to a classpath resource here; there is no classpath
+        to fall back to, so there is no relative name.
+
+        :param filename: String
+        :return: ConfigParseable
+        """
+        return None
+
+    def include_context(self):
+        """
+        :return: ConfigIncludeContext
+        """
+        return self._include_context
+
+    @classmethod
+    def force_parsed_to_object(cls, value):
+        """
+        :param value: ConfigValue
+        :return: AbstractConfigObject
+        """
+        if isinstance(value, AbstractConfigObject):
+            return value
+        else:
+            raise exceptions.WrongType(
+                origin=value.origin(), path="",
+                expected="object at file root",
+                actual=value.value_type().name)
+
+    def parse(self, base_options=None):
+        """
+        :param base_options: ConfigParseOptions - defaults to options()
+        :return: ConfigObject
+        """
+        if base_options is None:
+            base_options = self.options()
+
+        stack = _get_parse_stack()
+        if len(stack) >= MAX_INCLUDE_DEPTH:
+            raise exceptions.Parse(
+                origin=self._initial_origin,
+                message="include statements nested more than "
+                + str(MAX_INCLUDE_DEPTH)
+                + " times, you probably have a cycle in your includes. "
+                "Trace: " + repr(stack))
+
+        if not stack:
+            # a new load; what it includes is parsed once for all of it
+            _parse_stack.includes = {}
+            try:
+                return self._parse_on_stack(stack, base_options)
+            finally:
+                _parse_stack.includes = None
+
+        includes = getattr(_parse_stack, 'includes', None)
+        key = self._include_key(self._fixup_options(base_options))
+        if includes is None or key is None:
+            return self._parse_on_stack(stack, base_options)
+
+        # files read for the parse, if something wants to know
+        recording = getattr(_parse_stack, 'files', None) is not None
+        found = includes.get(key)
+        if found is not None and (found[1] is not None or not recording):
+            value, files = found
+            if recording:
+                with recording_files() as recorded:
+                    recorded.extend(files)
+            return value
+
+        if recording:
+            with recording_files() as files:
+                value = self._parse_on_stack(stack, base_options)
+        else:
+            files = None
+            value = self._parse_on_stack(stack, base_options)
+        includes[key] = (value, files)
+        return value
+
+    def _parse_on_stack(self, stack, base_options):
+        """
+        :param stack: List<Parseable> - from _get_parse_stack()
+        :param base_options: ConfigParseOptions
+        :return: ConfigObject
+        """
+        stack.insert(0, self)
+        try:
+            return Parseable.force_parsed_to_object(
+                self.parse_value(base_options))
+        finally:
+            stack.pop(0)
+
+    def _include_key(self, options):
+        """
+        What identifies the parse of an include within a load, so that
+        including the same thing the same way again reuses it.
+
+        :param options: ConfigParseOptions - fixed up
+        :return: tuple - or None if it's parsed every time
+        """
+        return None
+
+    def parse_value(self, base_options=None):
+        """
+        :param base_options: ConfigParseOptions - defaults to options()
+        :return: AbstractConfigValue
+        """
+        if base_options is None:
+            base_options = self.options()
+
+        # note that we are NOT using our "initial_options",
+        # but using the ones from the passed-in options. The idea is that
+        # callers can get our original options and then parse with different
+        # ones if they want.
+        options = self._fixup_options(base_options)
+
+        # passed-in options can override origin
+        if options.origin_description is not None:
+            origin = SimpleConfigOrigin.new_simple(options.origin_description)
+        else:
+            origin = self._initial_origin
+        return self._parse_value(origin, options)
+
+    def _parse_value(self, origin, final_options):
+        """
+        :param origin: ConfigOrigin
+        :param final_options: ConfigParseOptions
+        :return: AbstractConfigValue
+        """
+        try:
+            return self.raw_parse_value(origin, final_options)
+        except (IOError, OSError) as e:
+            if final_options.allow_missing:
+                return SimpleConfigObject.empty_missing(origin)
+            else:
+                trace("exception loading " + origin.description() + ": "
+                      + type(e).__name__ + ": " + str(e))
+                raise exceptions.IO(
+                    origin=origin,
+                    message=type(e).__name__ + ": " + str(e),
+                    cause=e)
+
+    def raw_parse_value(self, origin, final_options):
+        """
+        This is parse_value without post-processing the IOError or handling
+        options.allow_missing.
+
+        :param origin: ConfigOrigin
+        :param final_options: ConfigParseOptions
+        :return: AbstractConfigValue
+        """
+        reader = self.reader()
+
+        # after reader() we will have loaded the Content-Type.
+        content_type = self.content_type()
+
+        if content_type is not None:
+            if ConfigImpl.trace_loads_enabled() \
+                    and final_options.syntax is not None:
+                trace("Overriding syntax " + final_options.syntax.name
+                      + " with Content-Type which specified "
+                      + content_type.name)
+
+            options_with_content_type = final_options.set_syntax(content_type)
+        else:
+            options_with_content_type = final_options
+
+        try:
+            return self.raw_parse_value_from_reader(
+                reader, origin, options_with_content_type)
+        finally:
+            reader.close()
+
+    def raw_parse_value_from_reader(self, reader, origin, final_options):
+        """
+        :param reader: Reader
+        :param origin: ConfigOrigin
+        :param final_options: ConfigParseOptions
+        :return: AbstractConfigValue
+        """
+        if final_options.syntax == ConfigSyntax.properties:
+            return PropertiesParser.parse(reader, origin)
+
+        # the parse stack holds more than this file while including
+        if len(_get_parse_stack()) <= 1:
+            only_paths = final_options.only_paths
+        else:
+            only_paths = None
+
+        if final_options.syntax == ConfigSyntax.json \
+                and final_options.native_json is not None \
+                and only_paths is None:
+            text = reader.read()
+            try:
+                return NativeJsonParser.parse(
+                    text, origin, final_options.native_json == "line")
+            except NativeJsonParser.NotNative:
+                # for the parser to report what's wrong with it
+                reader = io.StringIO(text)
+
+        tokens = tokenizer.tokenize(origin, reader, final_options.syntax,
+                                    final_options.drop_comments)
+        if only_paths is None:
+            return Parser.parse(tokens, origin, final_options,
+                                self.include_context())
+        tokens = PathFilter.filter_tokens(
+            tokens, only_paths, final_options.syntax)
+        return PathFilter.prune(
+            Parser.parse(tokens, origin, final_options,
+                         self.include_context()),
+            only_paths)
+
+    def origin(self):
+        """
+        :return: ConfigOrigin
+        """
+        return self._initial_origin
+
+    def create_origin(self):
+        """
+        :return: ConfigOrigin
+        """
+        raise NotImplementedError
+
+    def options(self):
+        """
+        :return: ConfigParseOptions
+        """
+        return self._initial_options
+
+    def __repr__(self):
+        return type(self).__name__
+
+
+def _include_key(kind, location, options):
+    """
+    :param kind: String
+    :param location: String - absolute path or URL
+    :param options: ConfigParseOptions - fixed up
+    :return: tuple
+    """
+    # only_paths doesn't apply to includes; the includer is included since
+    # a custom one may resolve what this includes differently
+    return (kind, location, options.syntax, options.origin_description,
+            options.allow_missing, options.includer, options.drop_comments,
+            options.native_json)
+
+
+def syntax_from_extension(name):
+    """
+    :param name: String
+    :return: ConfigSyntax
+    """
+    if name.endswith(".json"):
+        return ConfigSyntax.json
+    elif name.endswith(".conf"):
+        return ConfigSyntax.conf
+    elif name.endswith(".properties"):
+        return ConfigSyntax.properties
+    else:
+        return None
+
+
+def reader_from_stream(input, encoding='utf-8'):
+    """
+    Well, this is messed up. If we aren't going to close
+    the passed-in stream then we have no way to
+    close these readers. So maybe we should not have a
+    stream version, only a Reader version.
+
+    :param input: a binary filelike object
+    :param encoding: String
+    :return: Reader
+    """
+    return codecs.getreader(encoding)(input)
+
+
+class MappedFileReader(object):
+    """
+    A UTF-8 Reader over a memory-mapped file. Each read() decodes straight
+    out of the mapping through a memoryview, so the only copy made is the
+    decoded block, and the whole file never exists as one Python string or
+    bytes object.
+    """
+
+    def __init__(self, input):
+        """
+        :param input: a binary file object, closed along with the reader
+        """
+        self._input = input
+        self._map = mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._offset = 0
+
+    def read(self, size=-1):
+        """
+        :param size: int - the most characters to return, or -1 for all
+        :return: String - empty only at end of file
+        """
+        length = len(self._map)
+        if size < 0:
+            end = length
+        else:
+            # at most size bytes, which is at most size characters
+            end = min(self._offset + size, length)
+        while self._offset < length:
+            # a multi-byte sequence cut off at end is left for the next read
+            s, consumed = codecs.utf_8_decode(
+                self._view[self._offset:end], 'strict', end == length)
+            if consumed > 0:
+                self._offset += consumed
+                return s
+            # the block was too short for even one character
+            end = min(end + 3, length)
+        return u''
+
+    def close(self):
+        # the mapping can't be closed while a view of it is alive
+        self._view.release()
+        self._map.close()
+        self._input.close()
+
+
+class _DoNotClose(object):
+    """
+    Wraps a Reader so that closing it leaves the underlying reader open.
+    """
+
+    def __init__(self, input):
+        self._input = input
+
+    def read(self, size=-1):
+        return self._input.read(size)
+
+    def close(self):
+        # NOTHING.
+        pass
+
+
+def relative_to_url(url, filename):
+    """
+    :param url: String
+    :param filename: String
+    :return: String - URL, or None
+    """
+    # I'm guessing this completely fails on Windows, help wanted
+    if os.path.isabs(filename):
+        return None
+
+    # this seems wrong, but the last element of the path in url gets
+    # stripped out, so to get something in the same directory as url we
+    # just join.
+    return urlparse.urljoin(url, filename)
+
+
+def relative_to_file(file, filename):
+    """
+    :param file: String - path
+    :param filename: String
+    :return: String - path, or None
+    """
+    if os.path.isabs(filename):
+        return None
+
+    parent = os.path.dirname(file)
+
+    if not parent:
+        return None
+    else:
+        return os.path.join(parent, filename)
+
+
+class ParseableNotFound(Parseable):
+    """
+    This is a parseable that doesn't exist and just throws when you try to
+    parse it.
+    """
+
+    def __init__(self, what, message, options):
+        """
+        :param what: String
+        :param message: String
+        :param options: ConfigParseOptions
+        """
+        super(ParseableNotFound, self).__init__()
+        self._what = what
+        self._message = message
+        self.post_construct(options)
+
+    def reader(self):
+        raise IOError(self._message)
+
+    def create_origin(self):
+        return SimpleConfigOrigin.new_simple(self._what)
+
+
+def new_not_found(what_not_found, message, options):
+    """
+    :param what_not_found: String
+    :param message: String
+    :param options: ConfigParseOptions
+    :return: Parseable
+    """
+    return ParseableNotFound(what_not_found, message, options)
+
+
+class ParseableReader(Parseable):
+
+    def __init__(self, reader, options):
+        """
+        :param reader: Reader
+        :param options: ConfigParseOptions
+        """
+        super(ParseableReader, self).__init__()
+        self._reader = reader
+        self.post_construct(options)
+
+    def reader(self):
+        if ConfigImpl.trace_loads_enabled():
+            trace("Loading config from reader " + repr(self._reader))
+        return self._reader
+
+    def create_origin(self):
+        return SimpleConfigOrigin.new_simple("Reader")
+
+
+def new_reader(reader, options):
+    """
+    Note that we will never close this reader; you have to do it when parsing
+    is complete.
+
+    :param reader: Reader
+    :param options: ConfigParseOptions
+    :return: Parseable
+    """
+    return ParseableReader(_DoNotClose(reader), options)
+
+
+class ParseableString(Parseable):
+
+    def __init__(self, input, options):
+        """
+        :param input: String
+        :param options: ConfigParseOptions
+        """
+        super(ParseableString, self).__init__()
+        self._input = input
+        self.post_construct(options)
+
+    def reader(self):
+        if ConfigImpl.trace_loads_enabled():
+            trace("Loading config from a String " + self._input)
+        return io.StringIO(self._input)
+
+    def create_origin(self):
+        return SimpleConfigOrigin.new_simple("String")
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + self._input + ")"
+
+
+def new_string(input, options):
+    """
+    :param input: String
+    :param options: ConfigParseOptions
+    :return: Parseable
+    """
+    return ParseableString(input, options)
+
+
+class ParseableURL(Parseable):
+
+    def __init__(self, input, options):
+        """
+        :param input: String - URL
+        :param options: ConfigParseOptions
+        """
+        super(ParseableURL, self).__init__()
+        self._input = input
+        self._content_type = None
+        self.post_construct(options)
+
+    def url(self):
+        """
+        :return: String
+        """
+        return self._input
+
+    def reader(self):
+        if ConfigImpl.trace_loads_enabled():
+            trace("Loading config from a URL: " + self._input)
+        _record_url(self._input)
+        prefetched = _prefetched(self._input)
+        if prefetched is not None:
+            text, self._content_type = prefetched
+            return io.StringIO(text)
+
+        # save content type for later
+        connection, self._content_type = open_url(
+            self._input, self.options().url_cache)
+        return reader_from_stream(connection)
+
+    def _parse_value(self, origin, final_options):
+        url_cache = final_options.url_cache
+        if url_cache is None or not url_cache.handles(self._input):
+            return super(ParseableURL, self)._parse_value(
+                origin, final_options)
+
+        if len(_get_parse_stack()) <= 1:
+            only_paths = final_options.only_paths
+        else:
+            only_paths = None
+        key = (self._input, final_options.origin_description,
+               final_options.syntax, final_options.allow_missing,
+               final_options.includer, final_options.drop_comments,
+               final_options.native_json, only_paths)
+        return url_cache.parse_value(
+            self._input, key, lambda: super(ParseableURL, self)._parse_value(
+                origin, final_options))
+
+    def guess_syntax(self):
+        return syntax_from_extension(urlparse.urlparse(self._input).path)
+
+    def content_type(self):
+        if self._content_type is not None:
+            if self._content_type == "application/json":
+                return ConfigSyntax.json
+            elif self._content_type == "text/x-java-properties":
+                return ConfigSyntax.properties
+            elif self._content_type == "application/hocon":
+                return ConfigSyntax.conf
+            else:
+                if ConfigImpl.trace_loads_enabled():
+                    trace("'" + self._content_type
+                          + "' isn't a known content type")
+                return None
+        else:
+            return None
+
+    def _include_key(self, options):
+        url_cache = options.url_cache
+        if url_cache is not None and url_cache.handles(self._input):
+            # the URL cache keeps its own parses, and needs to see every one
+            return None
+        return _include_key('url', self._input, options)
+
+    def relative_to(self, filename):
+        url = relative_to_url(self._input, filename)
+        if url is None:
+            return None
+        return new_url(url, self.options().set_origin_description(None))
+
+    def create_origin(self):
+        return SimpleConfigOrigin.new_url(self._input)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + self._input + ")"
+
+
+def open_url(url, url_cache=None):
+    """
+    :param url: String
+    :param url_cache: UrlCache - to fetch it through if it handles url
+    :return: (file-like, String) - the response, and its Content-Type
+        without parameters, or None if it has none
+    """
+    if url_cache is not None and url_cache.handles(url):
+        body, content_type = url_cache.open(url)
+        return io.BytesIO(body), content_type
+    connection = urlopen(url)
+    content_type = connection.info().get('Content-Type')
+    if content_type is not None:
+        if ConfigImpl.trace_loads_enabled():
+            trace("URL sets Content-Type: '" + content_type + "'")
+        content_type = content_type.split(';', 1)[0].strip()
+    return connection, content_type
+
+
+def new_url(input, options):
+    """
+    :param input: String - URL
+    :param options: ConfigParseOptions
+    :return: Parseable
+    """
+    # we want file: URLs and files to always behave the same, so switch
+    # to a file if it's a file: URL
+    parsed = urlparse.urlparse(input)
+    if parsed.scheme == 'file':
+        return new_file(url2pathname(parsed.path), options)
+    else:
+        return ParseableURL(input, options)
+
+
+class ParseableFile(Parseable):
+
+    def __init__(self, input, options):
+        """
+        :param input: String - path
+        :param options: ConfigParseOptions
+        """
+        super(ParseableFile, self).__init__()
+        self._input = input
+        self.post_construct(options)
+
+    def path(self):
+        """
+        :return: String - as given, not made absolute
+        """
+        return self._input
+
+    def reader(self):
+        if ConfigImpl.trace_loads_enabled():
+            trace("Loading config from a file: " + self._input)
+        _record_file(self._input)
+        prefetched = _prefetched(self._input)
+        if prefetched is not None:
+            return io.StringIO(prefetched[0])
+        stream = io.open(self._input, 'rb')
+        options = self.options()
+        # the json module needs the whole text as one string, so there's
+        # nothing to gain from mapping the file for it; and an empty file
+        # can't be mapped
+        if options.use_mmap and not (options.native_json is not None
+                                     and options.syntax == ConfigSyntax.json) \
+                and os.fstat(stream.fileno()).st_size > 0:
+            try:
+                return MappedFileReader(stream)
+            except:
+                stream.close()
+                raise
+        return reader_from_stream(stream)
+
+    def guess_syntax(self):
+        return syntax_from_extension(os.path.basename(self._input))
+
+    def _parse_value(self, origin, final_options):
+        preloaded = getattr(_parse_stack, 'preloaded', None)
+        if preloaded and final_options.origin_description is None:
+            value = preloaded.get((self._input, final_options.syntax))
+            if value is not None:
+                _record_file(self._input)
+                return value
+        return super(ParseableFile, self)._parse_value(origin, final_options)
+
+    def _include_key(self, options):
+        return _include_key('file', os.path.abspath(self._input), options)
+
+    def relative_to(self, filename):
+        if os.path.isabs(filename):
+            sibling = filename
+        else:
+            # this may return None
+            sibling = relative_to_file(self._input, filename)
+        if sibling is None:
+            return None
+        if os.path.exists(sibling):
+            return new_file(sibling, self.options().set_origin_description(None))
+        else:
+            # the include would find the sibling once it's created, so a
+            # cached parse depends on it staying missing
+            _record_file(sibling)
+            return super(ParseableFile, self).relative_to(filename)
+
+    def create_origin(self):
+        return SimpleConfigOrigin.new_file(self._input)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + self._input + ")"
+
+
+def new_file(input, options):
+    """
+    :param input: String - path
+    :param options: ConfigParseOptions
+    :return: Parseable
+    """
+    return ParseableFile(input, options)
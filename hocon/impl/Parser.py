@@ -0,0 +1,1227 @@
+import io
+
+from .. import exceptions
+from ..ConfigSyntax import ConfigSyntax
+from ..ConfigValueType import ConfigValueType
+
+from . import tokenizer
+from . import tokens as Tokens
+from . import util
+from .ConfigConcatenation import ConfigConcatenation
+from .ConfigReference import ConfigReference
+from .ConfigString import ConfigString
+from .Path import Path
+from .PathBuilder import PathBuilder
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+from .SimpleIncluder import SimpleIncluder
+from .SubstitutionExpression import SubstitutionExpression
+
+
+def parse(tokens, origin, options, include_context):
+    """
+    :param tokens: Iterator<Token>
+    :param origin: ConfigOrigin
+    :param options: ConfigParseOptions
+    :param include_context: ConfigIncludeContext
+    :return: AbstractConfigValue
+    """
+    context = _ParseContext(options.syntax, origin, tokens,
+                            SimpleIncluder.make_full(options.includer),
+                            include_context)
+    return context.parse()
+
+
+class _TokenWithComments(object):
+    """
+    Attributes:
+
+        token: Token
+
+        comments: List<Token>
+    """
+
+    __slots__ = ('token', 'comments')
+
+    def __init__(self, token, comments=()):
+        """
+        :param token: Token
+        :param comments: List<Token>
+        """
+        self.token = token
+        self.comments = comments
+        if Tokens.is_comment(token):
+            raise exceptions.BugOrBroken(
+                "tried to annotate a comment with a comment")
+
+    def remove_all(self):
+        """
+        :return: _TokenWithComments
+        """
+        if not self.comments:
+            return self
+        else:
+            return _TokenWithComments(self.token)
+
+    def prepend(self, earlier):
+        """
+        :param earlier: List<Token>
+        :return: _TokenWithComments
+        """
+        if not earlier:
+            return self
+        else:
+            return _TokenWithComments(self.token,
+                                      list(earlier) + list(self.comments))
+
+    def add(self, after):
+        """
+        :param after: Token
+        :return: _TokenWithComments
+        """
+        return _TokenWithComments(self.token, list(self.comments) + [after])
+
+    def _comment_texts(self):
+        """
+        :return: List<String>
+        """
+        return [Tokens.get_comment_text(c) for c in self.comments]
+
+    def prepend_comments(self, origin):
+        """
+        :param origin: SimpleConfigOrigin
+        :return: SimpleConfigOrigin
+        """
+        if not self.comments:
+            return origin
+        else:
+            return origin.prepend_comments(self._comment_texts())
+
+    def append_comments(self, origin):
+        """
+        :param origin: SimpleConfigOrigin
+        :return: SimpleConfigOrigin
+        """
+        if not self.comments:
+            return origin
+        else:
+            return origin.append_comments(self._comment_texts())
+
+    def __str__(self):
+        # this ends up in user-visible error messages, so we don't want the
+        # comments
+        return str(self.token)
+
+    def __repr__(self):
+        return str(self)
+
+
+class _ParseContext(object):
+    """
+    Attributes:
+
+        _line_number: int
+
+        _buffer: List<_TokenWithComments> - a stack, top at the end
+
+        _tokens: Iterator<Token>
+
+        _includer: FullIncluder
+
+        _include_context: ConfigIncludeContext
+
+        _flavor: ConfigSyntax
+
+        _base_origin: ConfigOrigin
+
+        _path_stack: List<Path> - a stack, top at the end
+
+        _equals_count: int
+            The number of "equals" we are inside, used to modify the error
+            message to reflect that someone may think this is .properties
+            format.
+
+        _array_count: int
+            The number of lists we are inside; this is used to detect the
+            "cannot generate a reference to a list element" problem, and once
+            we fix that problem we should be able to get rid of this
+            variable.
+    """
+
+    def __init__(self, flavor, origin, tokens, includer, include_context):
+        """
+        :param flavor: ConfigSyntax
+        :param origin: ConfigOrigin
+        :param tokens: Iterator<Token>
+        :param includer: FullIncluder
+        :param include_context: ConfigIncludeContext
+        """
+        self._line_number = 1
+        self._buffer = []
+        self._tokens = tokens
+        self._flavor = flavor
+        self._base_origin = origin
+        self._includer = includer
+        self._include_context = include_context
+        self._path_stack = []
+        self._equals_count = 0
+        self._array_count = 0
+
+    @staticmethod
+    def _attracts_trailing_comments(token):
+        """
+        END can't have a trailing comment; START, OPEN_CURLY, and
+        OPEN_SQUARE followed by a comment should behave as if the comment
+        went with the following field or element. Associating a comment
+        with a newline would mess up all the logic for comment tracking, so
+        don't do that either.
+
+        :param token: Token
+        :return: boolean
+        """
+        return not (Tokens.is_newline(token)
+                    or token is Tokens.START
+                    or token is Tokens.OPEN_CURLY
+                    or token is Tokens.OPEN_SQUARE
+                    or token is Tokens.END)
+
+    @staticmethod
+    def _attracts_leading_comments(token):
+        """
+        A comment just before a close } generally doesn't go with the value
+        before it, unless it's on the same line as that value.
+
+        :param token: Token
+        :return: boolean
+        """
+        return not (Tokens.is_newline(token)
+                    or token is Tokens.START
+                    or token is Tokens.CLOSE_CURLY
+                    or token is Tokens.CLOSE_SQUARE
+                    or token is Tokens.END)
+
+    def _consolidate_comment_block(self, comment_token):
+        """
+        :param comment_token: Token
+        """
+        # a comment block "goes with" the following token unless it's
+        # separated from it by a blank line. we want to build a list of
+        # newline tokens followed by a non-newline non-comment token; with
+        # all comments associated with that final non-newline non-comment
+        # token.
+        # a comment AFTER a token, without an intervening newline, also
+        # goes with that token, but isn't handled in this method, instead we
+        # handle it later by peeking ahead.
+        newlines = []
+        comments = []
+
+        previous = None
+        next = comment_token
+        while True:
+            if Tokens.is_newline(next):
+                if previous is not None and Tokens.is_newline(previous):
+                    # blank line; drop all comments to this point and start
+                    # a new comment block
+                    comments = []
+                newlines.append(next)
+            elif Tokens.is_comment(next):
+                comments.append(next)
+            else:
+                # a non-newline non-comment token
+
+                # comments before a close brace or bracket just get dumped
+                if not _ParseContext._attracts_leading_comments(next):
+                    comments = []
+                break
+
+            previous = next
+            next = self._next_raw_token()
+
+        # put our concluding token in the queue with all the comments
+        # attached
+        self._buffer.append(_TokenWithComments(next, comments))
+
+        # now put all the newlines back in front of it
+        for newline in reversed(newlines):
+            self._buffer.append(_TokenWithComments(newline))
+
+    def _next_raw_token(self):
+        """
+        :return: Token
+        """
+        return next(self._tokens)
+
+    def _pop_token_without_trailing_comment(self):
+        """
+        :return: _TokenWithComments
+        """
+        if not self._buffer:
+            t = self._next_raw_token()
+            if Tokens.is_comment(t):
+                self._consolidate_comment_block(t)
+                return self._buffer.pop()
+            else:
+                return _TokenWithComments(t)
+        else:
+            return self._buffer.pop()
+
+    def _pop_token(self):
+        """
+        :return: _TokenWithComments
+        """
+        with_preceding_comments = self._pop_token_without_trailing_comment()
+        # handle a comment AFTER the other token, but before a newline. If
+        # the next token is not a comment, then any comment later on the
+        # line is irrelevant since it would end up going with that later
+        # token, not this token. Comments are supposed to be processed
+        # prior to adding stuff to the buffer, so they can only be found in
+        # "tokens" not in "buffer" in theory.
+        if not _ParseContext._attracts_trailing_comments(
+                with_preceding_comments.token):
+            return with_preceding_comments
+        elif not self._buffer:
+            after = self._next_raw_token()
+            if Tokens.is_comment(after):
+                return with_preceding_comments.add(after)
+            else:
+                self._buffer.append(_TokenWithComments(after))
+                return with_preceding_comments
+        else:
+            # comments are supposed to get attached to a token, not put
+            # back in the buffer. Assert this as an invariant.
+            if Tokens.is_comment(self._buffer[-1].token):
+                raise exceptions.BugOrBroken(
+                    "comment token should not have been in buffer: "
+                    + repr(self._buffer))
+            return with_preceding_comments
+
+    def _next_token(self):
+        """
+        :return: _TokenWithComments
+        """
+        with_comments = self._pop_token()
+        t = with_comments.token
+
+        if Tokens.is_problem(t):
+            origin = t.origin()
+            message = Tokens.get_problem_message(t)
+            cause = Tokens.get_problem_cause(t)
+            suggest_quotes = Tokens.get_problem_suggest_quotes(t)
+            if suggest_quotes:
+                message = self._add_quote_suggestion(str(t), message)
+            else:
+                message = self._add_key_name(message)
+            raise exceptions.Parse(origin=origin, message=message,
+                                   cause=cause)
+        else:
+            if self._flavor == ConfigSyntax.json:
+                if Tokens.is_unquoted_text(t):
+                    raise self._parse_error(self._add_key_name(
+                        "Token not allowed in valid JSON: '"
+                        + Tokens.get_unquoted_text(t) + "'"))
+                elif Tokens.is_substitution(t):
+                    raise self._parse_error(self._add_key_name(
+                        "Substitutions (${} syntax) not allowed in JSON"))
+
+            return with_comments
+
+    def _put_back(self, token):
+        """
+        :param token: _TokenWithComments
+        """
+        if Tokens.is_comment(token.token):
+            raise exceptions.BugOrBroken(
+                "comment token should have been stripped before it was "
+                "available to put back")
+        self._buffer.append(token)
+
+    def _next_token_ignoring_newline(self):
+        """
+        :return: _TokenWithComments
+        """
+        t = self._next_token()
+
+        while Tokens.is_newline(t.token):
+            # line number tokens have the line that was _ended_ by the
+            # newline, so we have to add one. We have to update line_number
+            # here and also below, because not all tokens store a line
+            # number, but newline tokens always do.
+            self._line_number = t.token.line_number() + 1
+
+            t = self._next_token()
+
+        # update line number again, iff we have one
+        new_number = t.token.line_number()
+        if new_number >= 0:
+            self._line_number = new_number
+
+        return t
+
+    def _add_any_comments_after_any_comma(self, v):
+        """
+        :param v: AbstractConfigValue
+        :return: AbstractConfigValue
+        """
+        # do NOT skip newlines, we only want same-line comments
+        t = self._next_token()
+        if t.token is Tokens.COMMA:
+            # steal the comments from after the comma
+            self._put_back(t.remove_all())
+            return v.with_origin(t.append_comments(v.origin()))
+        else:
+            self._put_back(t)
+            return v
+
+    def _check_element_separator(self):
+        """
+        In arrays and objects, comma can be omitted as long as there's at
+        least one newline instead. This skips any newlines in front of a
+        comma, skips the comma, and returns true if it found either a
+        newline or a comma. The iterator is left just after the comma or the
+        newline.
+
+        :return: boolean
+        """
+        if self._flavor == ConfigSyntax.json:
+            t = self._next_token_ignoring_newline()
+            if t.token is Tokens.COMMA:
+                return True
+            else:
+                self._put_back(t)
+                return False
+        else:
+            saw_separator_or_newline = False
+            t = self._next_token()
+            while True:
+                if Tokens.is_newline(t.token):
+                    # newline number is the line just ended, so add one
+                    self._line_number = t.token.line_number() + 1
+                    saw_separator_or_newline = True
+
+                    # we want to continue to also eat a comma if there is
+                    # one.
+                elif t.token is Tokens.COMMA:
+                    return True
+                else:
+                    # non-newline-or-comma
+                    self._put_back(t)
+                    return saw_separator_or_newline
+                t = self._next_token()
+
+    @staticmethod
+    def _token_to_substitution_expression(value_token):
+        """
+        :param value_token: Token
+        :return: SubstitutionExpression
+        """
+        expression = Tokens.get_substitution_path_expression(value_token)
+        path = _parse_path_expression(iter(expression), value_token.origin())
+        optional = Tokens.get_substitution_optional(value_token)
+
+        return SubstitutionExpression(path, optional)
+
+    def _consolidate_value_tokens(self):
+        """
+        Merge a bunch of adjacent values into one value; change unquoted
+        text into a string value.
+        """
+        # this trick is not done in JSON
+        if self._flavor == ConfigSyntax.json:
+            return
+
+        # create only if we have value tokens
+        values = None
+
+        # ignore a newline up front
+        t = self._next_token_ignoring_newline()
+        while True:
+            if Tokens.is_value(t.token) or Tokens.is_unquoted_text(t.token) \
+                    or Tokens.is_substitution(t.token) \
+                    or t.token is Tokens.OPEN_CURLY \
+                    or t.token is Tokens.OPEN_SQUARE:
+                # there may be newlines _within_ the objects and arrays
+                v = self._parse_value(t)
+            else:
+                break
+
+            if v is None:
+                raise exceptions.BugOrBroken("no value")
+
+            if values is None:
+                values = []
+            values.append(v)
+
+            # but don't consolidate across a newline
+            t = self._next_token()
+
+        # the last one wasn't a value token
+        self._put_back(t)
+
+        if values is None:
+            return
+
+        consolidated = ConfigConcatenation.concatenate(values)
+
+        self._put_back(_TokenWithComments(Tokens.new_value(consolidated)))
+
+    def _line_origin(self):
+        """
+        :return: SimpleConfigOrigin
+        """
+        return self._base_origin.set_line_number(self._line_number)
+
+    def _parse_error(self, message, cause=None):
+        """
+        :param message: String
+        :param cause: Exception
+        :return: ConfigException
+        """
+        return exceptions.Parse(origin=self._line_origin(), message=message,
+                                cause=cause)
+
+    def _previous_field_name(self, last_path=None):
+        """
+        :param last_path: Path
+        :return: String - or None
+        """
+        if last_path is not None:
+            return str(last_path)
+        elif not self._path_stack:
+            return None
+        else:
+            return str(self._path_stack[-1])
+
+    def _full_current_path(self):
+        """
+        :return: Path
+        """
+        if not self._path_stack:
+            raise exceptions.BugOrBroken(
+                "Bug in parser; tried to get current path when at root")
+        else:
+            return Path.of_paths(*self._path_stack)
+
+    def _add_key_name(self, message):
+        """
+        :param message: String
+        :return: String
+        """
+        previous_field_name = self._previous_field_name()
+        if previous_field_name is not None:
+            return "in value for key '" + previous_field_name + "': " \
+                + message
+        else:
+            return message
+
+    def _add_quote_suggestion(self, bad_token, message, last_path=None,
+                              inside_equals=None):
+        """
+        :param bad_token: String
+        :param message: String
+        :param last_path: Path
+        :param inside_equals: boolean - None if we're inside any equals
+        :return: String
+        """
+        if inside_equals is None:
+            inside_equals = self._equals_count > 0
+
+        previous_field_name = self._previous_field_name(last_path)
+
+        if bad_token == str(Tokens.END):
+            # EOF requires special handling for the error to make sense.
+            if previous_field_name is not None:
+                part = message + " (if you intended '" \
+                    + previous_field_name \
+                    + "' to be part of a value, instead of a key, " \
+                    + "try adding double quotes around the whole value"
+            else:
+                return message
+        else:
+            if previous_field_name is not None:
+                part = message + " (if you intended " + bad_token \
+                    + " to be part of the value for '" \
+                    + previous_field_name + "', " \
+                    + "try enclosing the value in double quotes"
+            else:
+                part = message + " (if you intended " + bad_token \
+                    + " to be part of a key or string value, " \
+                    + "try enclosing the key or value in double quotes"
+
+        if inside_equals:
+            return part + ", or you may be able to rename the file " \
+                ".properties rather than .conf)"
+        else:
+            return part + ")"
+
+    def _parse_value(self, t):
+        """
+        :param t: _TokenWithComments
+        :return: AbstractConfigValue
+        """
+        starting_array_count = self._array_count
+        starting_equals_count = self._equals_count
+
+        if Tokens.is_value(t.token):
+            # if we consolidate_value_tokens() multiple times then this
+            # value could be a concatenation, object, array, or
+            # substitution already.
+            v = Tokens.get_value(t.token)
+        elif Tokens.is_unquoted_text(t.token):
+            v = ConfigString(t.token.origin(),
+                             Tokens.get_unquoted_text(t.token))
+        elif Tokens.is_substitution(t.token):
+            v = ConfigReference(
+                t.token.origin(),
+                _ParseContext._token_to_substitution_expression(t.token))
+        elif t.token is Tokens.OPEN_CURLY:
+            v = self._parse_object(True)
+        elif t.token is Tokens.OPEN_SQUARE:
+            v = self._parse_array()
+        else:
+            raise self._parse_error(self._add_quote_suggestion(
+                str(t.token),
+                "Expecting a value but got wrong token: " + str(t.token)))
+
+        v = v.with_origin(t.prepend_comments(v.origin()))
+
+        if self._array_count != starting_array_count:
+            raise exceptions.BugOrBroken(
+                "Bug in config parser: unbalanced array count")
+        if self._equals_count != starting_equals_count:
+            raise exceptions.BugOrBroken(
+                "Bug in config parser: unbalanced equals count")
+
+        return v
+
+    @staticmethod
+    def _create_value_under_path(path, value):
+        """
+        :param path: Path
+        :param value: AbstractConfigValue
+        :return: AbstractConfigObject
+        """
+        # for path foo.bar, we are creating
+        # { "foo" : { "bar" : value } }
+        keys = path.keys()
+
+        # the set_comments(None) is to ensure comments are only on the exact
+        # leaf node they apply to. a comment before "foo.bar" applies to the
+        # full setting "foo.bar" not also to "foo"
+        origin = value.origin().set_comments(None)
+        o = SimpleConfigObject(origin, {keys[-1]: value})
+        for key in reversed(keys[:-1]):
+            o = SimpleConfigObject(origin, {key: o})
+
+        return o
+
+    def _parse_key(self, token):
+        """
+        :param token: _TokenWithComments
+        :return: Path
+        """
+        if self._flavor == ConfigSyntax.json:
+            if Tokens.is_value_with_type(token.token, ConfigValueType.string):
+                key = Tokens.get_value(token.token).unwrapped()
+                return Path.new_key(key)
+            else:
+                raise self._parse_error(self._add_key_name(
+                    "Expecting close brace } or a field name here, got "
+                    + str(token)))
+        else:
+            expression = []
+            t = token
+            while Tokens.is_value(t.token) \
+                    or Tokens.is_unquoted_text(t.token):
+                expression.append(t.token)
+                # note: don't cross a newline
+                t = self._next_token()
+
+            if not expression:
+                raise self._parse_error(self._add_key_name(
+                    "expecting a close brace or a field name here, got "
+                    + str(t)))
+
+            # put back the token we ended with
+            self._put_back(t)
+            return _parse_path_expression(iter(expression),
+                                          self._line_origin())
+
+    @staticmethod
+    def _is_include_keyword(t):
+        """
+        :param t: Token
+        :return: boolean
+        """
+        return Tokens.is_unquoted_text(t) \
+            and Tokens.get_unquoted_text(t) == "include"
+
+    @staticmethod
+    def _is_unquoted_whitespace(t):
+        """
+        :param t: Token
+        :return: boolean
+        """
+        if not Tokens.is_unquoted_text(t):
+            return False
+
+        return all(util.is_whitespace(c) for c in Tokens.get_unquoted_text(t))
+
+    def _next_token_ignoring_whitespace(self):
+        """
+        :return: _TokenWithComments - the next token that is neither a
+            newline nor unquoted whitespace
+        """
+        t = self._next_token_ignoring_newline()
+        while _ParseContext._is_unquoted_whitespace(t.token):
+            t = self._next_token_ignoring_newline()
+        return t
+
+    def _parse_include(self, values):
+        """
+        :param values: Dict<String, AbstractConfigValue> - the object being
+            built, which the included keys are merged into
+        """
+        t = self._next_token_ignoring_whitespace()
+
+        # we either have a quoted string or the "file()" syntax
+        if Tokens.is_unquoted_text(t.token):
+            # get foo(
+            kind = Tokens.get_unquoted_text(t.token)
+
+            if kind not in ("url(", "file(", "classpath("):
+                raise self._parse_error(
+                    "expecting include parameter to be quoted filename, "
+                    "file(), classpath(), or url(). No spaces are allowed "
+                    "before the open paren. Not expecting: " + str(t))
+
+            # skip space inside parens
+            t = self._next_token_ignoring_whitespace()
+
+            # quoted string
+            if Tokens.is_value_with_type(t.token, ConfigValueType.string):
+                name = Tokens.get_value(t.token).unwrapped()
+            else:
+                raise self._parse_error(
+                    "expecting a quoted string inside file(), classpath(), "
+                    "or url(), rather than: " + str(t))
+
+            # skip space after string, inside parens
+            t = self._next_token_ignoring_whitespace()
+
+            if Tokens.is_unquoted_text(t.token) \
+                    and Tokens.get_unquoted_text(t.token) == ")":
+                # OK, close paren
+                pass
+            else:
+                raise self._parse_error(
+                    "expecting a close parentheses ')' here, not: " + str(t))
+
+            if kind == "url(":
+                obj = self._includer.include_url(self._include_context, name)
+            elif kind == "file(":
+                obj = self._includer.include_file(self._include_context,
+                                                  name)
+            else:
+                obj = self._includer.include_resources(self._include_context,
+                                                       name)
+        elif Tokens.is_value_with_type(t.token, ConfigValueType.string):
+            name = Tokens.get_value(t.token).unwrapped()
+            obj = self._includer.include(self._include_context, name)
+        else:
+            raise self._parse_error(
+                "include keyword is not followed by a quoted string, but "
+                "by: " + str(t))
+
+        # we really should make this work, but for now throwing an exception
+        # is better than producing an incorrect result. See
+        # https://github.com/typesafehub/config/issues/160
+        if self._array_count > 0 \
+                and obj.resolve_status() != ResolveStatus.resolved:
+            raise self._parse_error(
+                "Due to current limitations of the config parser, when an "
+                "include statement is nested inside a list value, ${} "
+                "substitutions inside the included file cannot be resolved "
+                "correctly. Either move the include outside of the list "
+                "value or remove the ${} statements from the included file.")
+
+        if self._path_stack:
+            prefix = self._full_current_path()
+            obj = obj.relativized(prefix)
+
+        for key in obj.keys():
+            v = obj.get(key)
+            existing = values.get(key)
+            if existing is not None:
+                values[key] = v.with_fallback(existing)
+            else:
+                values[key] = v
+
+    def _is_key_value_separator_token(self, t):
+        """
+        :param t: Token
+        :return: boolean
+        """
+        if self._flavor == ConfigSyntax.json:
+            return t is Tokens.COLON
+        else:
+            return t is Tokens.COLON or t is Tokens.EQUALS \
+                or t is Tokens.PLUS_EQUALS
+
+    def _parse_object(self, had_open_curly):
+        """
+        Invoked just after the OPEN_CURLY (or START, if not had_open_curly).
+
+        :param had_open_curly: boolean
+        :return: AbstractConfigObject
+        """
+        values = {}
+        object_origin = self._line_origin()
+        after_comma = False
+        last_path = None
+        last_inside_equals = False
+
+        while True:
+            t = self._next_token_ignoring_newline()
+            if t.token is Tokens.CLOSE_CURLY:
+                if self._flavor == ConfigSyntax.json and after_comma:
+                    raise self._parse_error(self._add_quote_suggestion(
+                        str(t), "expecting a field name after a comma, got "
+                        "a close brace } instead"))
+                elif not had_open_curly:
+                    raise self._parse_error(self._add_quote_suggestion(
+                        str(t),
+                        "unbalanced close brace '}' with no open brace"))
+
+                object_origin = t.append_comments(object_origin)
+                break
+            elif t.token is Tokens.END and not had_open_curly:
+                self._put_back(t)
+                break
+            elif self._flavor != ConfigSyntax.json \
+                    and _ParseContext._is_include_keyword(t.token):
+                self._parse_include(values)
+
+                after_comma = False
+            else:
+                key_token = t
+                path = self._parse_key(key_token)
+                after_key = self._next_token_ignoring_newline()
+                inside_equals = False
+
+                # path must be on-stack while we parse the value
+                self._path_stack.append(path)
+
+                if after_key.token is Tokens.PLUS_EQUALS:
+                    # we really should make this work, but for now throwing
+                    # an exception is better than producing an incorrect
+                    # result. See
+                    # https://github.com/typesafehub/config/issues/160
+                    if self._array_count > 0:
+                        raise self._parse_error(
+                            "Due to current limitations of the config "
+                            "parser, += does not work nested inside a list. "
+                            "+= expands to a ${} substitution and the path "
+                            "in ${} cannot currently refer to list elements. "
+                            "You might be able to move the += outside of "
+                            "the list and then refer to it from inside the "
+                            "list with ${}.")
+
+                    # because we will put it in an array after the fact so
+                    # we want this to be incremented during the
+                    # _parse_value below in order to throw the above
+                    # exception.
+                    self._array_count += 1
+
+                if self._flavor == ConfigSyntax.conf \
+                        and after_key.token is Tokens.OPEN_CURLY:
+                    # can omit the ':' or '=' before an object value
+                    value_token = after_key
+                else:
+                    if not self._is_key_value_separator_token(
+                            after_key.token):
+                        raise self._parse_error(self._add_quote_suggestion(
+                            str(after_key),
+                            "Key '" + str(path)
+                            + "' may not be followed by token: "
+                            + str(after_key)))
+
+                    if after_key.token is Tokens.EQUALS:
+                        inside_equals = True
+                        self._equals_count += 1
+
+                    self._consolidate_value_tokens()
+                    value_token = self._next_token_ignoring_newline()
+
+                    # put comments from separator token on the value token
+                    value_token = value_token.prepend(after_key.comments)
+
+                # comments from the key token go to the value token
+                new_value = self._parse_value(
+                    value_token.prepend(key_token.comments))
+
+                if after_key.token is Tokens.PLUS_EQUALS:
+                    self._array_count -= 1
+
+                    previous_ref = ConfigReference(
+                        new_value.origin(),
+                        SubstitutionExpression(self._full_current_path(),
+                                               True))
+                    list = SimpleConfigList(new_value.origin(), [new_value])
+                    new_value = ConfigConcatenation.concatenate(
+                        [previous_ref, list])
+
+                new_value = self._add_any_comments_after_any_comma(new_value)
+
+                last_path = self._path_stack.pop()
+                if inside_equals:
+                    self._equals_count -= 1
+                last_inside_equals = inside_equals
+
+                key = path.first
+                remaining = path.remainder
+
+                if remaining is None:
+                    existing = values.get(key)
+                    if existing is not None:
+                        # In strict JSON, dups should be an error; while in
+                        # our custom config language, they should be merged
+                        # if the value is an object (or substitution that
+                        # could become an object).
+                        if self._flavor == ConfigSyntax.json:
+                            raise self._parse_error(
+                                "JSON does not allow duplicate fields: '"
+                                + key + "' was already seen at "
+                                + existing.origin().description())
+                        else:
+                            new_value = new_value.with_fallback(existing)
+                    values[key] = new_value
+                else:
+                    if self._flavor == ConfigSyntax.json:
+                        raise exceptions.BugOrBroken(
+                            "somehow got multi-element path in JSON mode")
+
+                    obj = _ParseContext._create_value_under_path(
+                        remaining, new_value)
+                    existing = values.get(key)
+                    if existing is not None:
+                        obj = obj.with_fallback(existing)
+                    values[key] = obj
+
+                after_comma = False
+
+            if self._check_element_separator():
+                # continue looping
+                after_comma = True
+            else:
+                t = self._next_token_ignoring_newline()
+                if t.token is Tokens.CLOSE_CURLY:
+                    if not had_open_curly:
+                        raise self._parse_error(self._add_quote_suggestion(
+                            str(t),
+                            "unbalanced close brace '}' with no open brace",
+                            last_path, last_inside_equals))
+
+                    object_origin = t.append_comments(object_origin)
+                    break
+                elif had_open_curly:
+                    raise self._parse_error(self._add_quote_suggestion(
+                        str(t),
+                        "Expecting close brace } or a comma, got " + str(t),
+                        last_path, last_inside_equals))
+                else:
+                    if t.token is Tokens.END:
+                        self._put_back(t)
+                        break
+                    else:
+                        raise self._parse_error(self._add_quote_suggestion(
+                            str(t),
+                            "Expecting end of input or a comma, got "
+                            + str(t), last_path, last_inside_equals))
+
+        return SimpleConfigObject(object_origin, values)
+
+    def _parse_array(self):
+        """
+        Invoked just after the OPEN_SQUARE.
+
+        :return: SimpleConfigList
+        """
+        self._array_count += 1
+
+        array_origin = self._line_origin()
+        values = []
+
+        self._consolidate_value_tokens()
+
+        t = self._next_token_ignoring_newline()
+
+        # special-case the first element
+        if t.token is Tokens.CLOSE_SQUARE:
+            self._array_count -= 1
+            return SimpleConfigList(t.append_comments(array_origin), [])
+        elif Tokens.is_value(t.token) or t.token is Tokens.OPEN_CURLY \
+                or t.token is Tokens.OPEN_SQUARE:
+            v = self._parse_value(t)
+            v = self._add_any_comments_after_any_comma(v)
+            values.append(v)
+        else:
+            raise self._parse_error(self._add_key_name(
+                "List should have ] or a first element after the open [, "
+                "instead had token: " + str(t) + " (if you want " + str(t)
+                + " to be part of a string value, then double-quote it)"))
+
+        # now remaining elements
+        while True:
+            # just after a value
+            if self._check_element_separator():
+                # comma (or newline equivalent) consumed
+                pass
+            else:
+                t = self._next_token_ignoring_newline()
+                if t.token is Tokens.CLOSE_SQUARE:
+                    self._array_count -= 1
+                    return SimpleConfigList(t.append_comments(array_origin),
+                                            values)
+                else:
+                    raise self._parse_error(self._add_key_name(
+                        "List should have ended with ] or had a comma, "
+                        "instead had token: " + str(t) + " (if you want "
+                        + str(t) + " to be part of a string value, then "
+                        "double-quote it)"))
+
+            # now just after a comma
+            self._consolidate_value_tokens()
+
+            t = self._next_token_ignoring_newline()
+            if Tokens.is_value(t.token) or t.token is Tokens.OPEN_CURLY \
+                    or t.token is Tokens.OPEN_SQUARE:
+                v = self._parse_value(t)
+                v = self._add_any_comments_after_any_comma(v)
+                values.append(v)
+            elif self._flavor != ConfigSyntax.json \
+                    and t.token is Tokens.CLOSE_SQUARE:
+                # we allow one trailing comma
+                self._put_back(t)
+            else:
+                raise self._parse_error(self._add_key_name(
+                    "List should have had new element after a comma, "
+                    "instead had token: " + str(t) + " (if you want the "
+                    "comma or " + str(t) + " to be part of a string value, "
+                    "then double-quote it)"))
+
+    def parse(self):
+        """
+        :return: AbstractConfigValue
+        """
+        t = self._next_token_ignoring_newline()
+        if t.token is not Tokens.START:
+            raise exceptions.BugOrBroken(
+                "token stream did not begin with START, had " + str(t))
+
+        t = self._next_token_ignoring_newline()
+        if t.token is Tokens.OPEN_CURLY or t.token is Tokens.OPEN_SQUARE:
+            result = self._parse_value(t)
+        else:
+            if self._flavor == ConfigSyntax.json:
+                if t.token is Tokens.END:
+                    raise self._parse_error("Empty document")
+                else:
+                    raise self._parse_error(
+                        "Document must have an object or array at root, "
+                        "unexpected token: " + str(t))
+            else:
+                # the root object can omit the surrounding braces. this
+                # token should be the first field's key, or part of it, so
+                # put it back.
+                self._put_back(t)
+                result = self._parse_object(False)
+                # in this case we don't try to use comments since they
+                # would all presumably apply to fields not the root object
+
+        t = self._next_token_ignoring_newline()
+        if t.token is Tokens.END:
+            return result
+        else:
+            raise self._parse_error(
+                "Document has trailing tokens after first object or array: "
+                + str(t))
+
+
+class _Element(object):
+    """
+    Attributes:
+
+        sb: List<String> - the text of the element so far
+
+        can_be_empty: boolean - an element can be empty if it has a quoted
+            empty string "" in it
+    """
+
+    def __init__(self, initial, can_be_empty):
+        """
+        :param initial: String
+        :param can_be_empty: boolean
+        """
+        self.can_be_empty = can_be_empty
+        self.sb = [initial]
+
+    def text(self):
+        """
+        :return: String
+        """
+        return ''.join(self.sb)
+
+    def __repr__(self):
+        return "Element(" + self.text() + "," + str(self.can_be_empty) + ")"
+
+
+def _add_path_text(buf, was_quoted, new_text):
+    """
+    :param buf: List<_Element>
+    :param was_quoted: boolean
+    :param new_text: String
+    """
+    current = buf[-1]
+    if was_quoted:
+        # add to current path element
+        current.sb.append(new_text)
+
+        # any empty quoted string means this element can now be empty.
+        if not current.text():
+            current.can_be_empty = True
+        return
+
+    pieces = new_text.split('.')
+    # up to the first period goes on the current element, then each period
+    # starts a new element
+    current.sb.append(pieces[0])
+    for piece in pieces[1:]:
+        buf.append(_Element(piece, False))
+
+
+def _parse_path_expression(expression, origin, original_text=None):
+    """
+    :param expression: Iterator<Token>
+    :param origin: ConfigOrigin
+    :param original_text: String - may be None if not available
+    :return: Path
+    """
+    # each element in "buf" is an element in the path.
+    buf = [_Element("", False)]
+
+    saw_token = False
+    for t in expression:
+        saw_token = True
+        if Tokens.is_value_with_type(t, ConfigValueType.string):
+            v = Tokens.get_value(t)
+            # this is a quoted string; so any periods in here don't count
+            # as path separators
+            s = v.transform_to_string()
+
+            _add_path_text(buf, True, s)
+        elif t is Tokens.END:
+            # ignore this; when parsing a file, it should not happen since
+            # we're parsing a token list rather than the main token
+            # iterator, and when parsing a path expression from the API,
+            # it's expected to have an END.
+            pass
+        else:
+            # any periods outside of a quoted string count as separators
+            if Tokens.is_value(t):
+                # appending a number here may add a period, but we _do_
+                # count those as path separators, because we basically want
+                # "foo 3.0bar" to parse as a string even though there's a
+                # number in it. The fact that we tokenize non-string values
+                # is largely an implementation detail.
+                v = Tokens.get_value(t)
+                text = v.transform_to_string()
+            elif Tokens.is_unquoted_text(t):
+                text = Tokens.get_unquoted_text(t)
+            else:
+                raise exceptions.BadPath(
+                    origin=origin, path=original_text,
+                    message="Token not allowed in path expression: "
+                    + str(t) + " (you can double-quote this token if you "
+                    "really want it here)")
+
+            _add_path_text(buf, False, text)
+
+    if not saw_token:
+        raise exceptions.BadPath(
+            origin=origin, path=original_text,
+            message="Expecting a field name or path here, but got nothing")
+
+    pb = PathBuilder()
+    for e in buf:
+        text = e.text()
+        if not text and not e.can_be_empty:
+            raise exceptions.BadPath(
+                origin=origin, path=original_text,
+                message="path has a leading, trailing, or two adjacent "
+                "period '.' (use quoted \"\" empty string if you want an "
+                "empty element)")
+        else:
+            pb.append_key(text)
+
+    return pb.result()
+
+
+_api_origin = SimpleConfigOrigin.new_simple("path parameter")
+
+
+def parse_path(path):
+    """
+    :param path: String - a path expression
+    :return: Path
+    """
+    speculated = _speculative_fast_parse_path(path)
+    if speculated is not None:
+        return speculated
+
+    reader = io.StringIO(path)
+    try:
+        tokens = tokenizer.tokenize(_api_origin, reader, ConfigSyntax.conf)
+        # drop START
+        next(tokens)
+        return _parse_path_expression(tokens, _api_origin, path)
+    finally:
+        reader.close()
+
+
+def _has_unsafe_chars(s):
+    """
+    The idea is to see if the string has any chars that might require the
+    full parser to deal with.
+
+    :param s: String
+    :return: boolean
+    """
+    for c in s:
+        if not (c.isalpha() or c == '.'):
+            return True
+    return False
+
+
+def _speculative_fast_parse_path(path):
+    """
+    Do something much faster than the full parser if we just have something
+    like "foo" or "foo.bar".
+
+    :param path: String
+    :return: Path - or None to use the full parser
+    """
+    s = util.unicode_trim(path)
+    if not s:
+        return None
+    if _has_unsafe_chars(s):
+        return None
+    if s.startswith(".") or s.endswith(".") or ".." in s:
+        # let the full parser throw the error
+        return None
+
+    pb = PathBuilder()
+    for key in s.split('.'):
+        pb.append_key(key)
+    return pb.result()
@@ -1,31 +1,107 @@
-import collections
-
 from .. import exceptions
 
 from . import util
+from .LruCache import LruCache
+
+
+# path expressions used by an application are usually a few hundred
+# distinct strings looked up over and over
+PATH_CACHE_SIZE = 1024
+
+_path_cache = LruCache(PATH_CACHE_SIZE)
+
+# keys seen in paths, so that equal keys share one string; config files
+# have a bounded vocabulary of keys, but streaming through a huge generated
+# file could still see any number of them, so past this many distinct keys
+# new ones are no longer added
+MAX_INTERNED_KEYS = 64 * 1024
+
+_interned_keys = {}
+
+# what render_key() makes of each key, bounded the same way
+_rendered_keys = {}
+
+
+def _intern(key):
+    """
+    :param key: String
+    :return: String - an equal string shared by every path using this key,
+        if there's room to keep it
+    """
+    interned = _interned_keys.get(key)
+    if interned is None:
+        if len(_interned_keys) < MAX_INTERNED_KEYS:
+            _interned_keys[key] = key
+        interned = key
+    return interned
 
 
-class Path(collections.namedtuple('Path', ('first', 'remainder'))):
+class Path(object):
     """
-    :param first: String
+    A non-empty sequence of keys; the empty path is represented by None.
+
+    The keys live in a tuple that a path may share with others: a path is a
+    window [_start, _end) onto it, so length(), last(), parent(),
+    remainder, sub_path() and remove_from_front() are all O(1) and allocate
+    nothing but the new window. Only prepend() and of_paths() copy keys.
+
+    Attributes:
 
-    :param remainder: Path
-        Path minus the first element or None if no more elements.
+        _keys: tuple<String> - interned keys, possibly shared
+        _start: int
+        _end: int
+        _hash: int - computed on first use
+        _rendered: String - computed on first use
     """
 
+    __slots__ = ('_keys', '_start', '_end', '_hash', '_rendered')
+
+    def __init__(self, first, remainder=None):
+        """
+        :param first: String
+        :param remainder: Path - the rest of the path, or None
+        """
+        keys = (_intern(first),)
+        if remainder is not None:
+            keys += remainder.keys()
+        self._keys = keys
+        self._start = 0
+        self._end = len(keys)
+        self._hash = None
+        self._rendered = None
+
+    @classmethod
+    def _window(cls, keys, start, end):
+        """
+        :param keys: tuple<String> - already interned
+        :param start: int
+        :param end: int - greater than start
+        :return: Path
+        """
+        p = object.__new__(cls)
+        p._keys = keys
+        p._start = start
+        p._end = end
+        p._hash = None
+        p._rendered = None
+        return p
+
+    @classmethod
+    def _of_keys(cls, keys):
+        """
+        :param keys: Iterable<String>
+        :return: Path - None if there are no keys
+        """
+        keys = tuple(_intern(k) for k in keys)
+        if len(keys) == 0:
+            return None
+        return Path._window(keys, 0, len(keys))
+
     @classmethod
     def of_elements(cls, *elements):
         if len(elements) == 0:
             raise exceptions.BugOrBroken("empty path")
-        first = elements[0]
-        if len(elements) > 1:
-            pb = PathBuilder()
-            for el in elements:
-                pb.append_key(el)
-            remainder = pb.result()
-        else:
-            remainder = None
-        return Path(first, remainder)
+        return Path._of_keys(elements)
 
     @classmethod
     def of_paths(cls, *paths):
@@ -39,60 +115,63 @@ class Path(collections.namedtuple('Path', ('first', 'remainder'))):
         if len(paths) == 0:
             raise exceptions.BugOrBroken("empty path")
 
-        pb = PathBuilder()
-        if paths[0].remainder is not None:
-            pb.append_path(paths[0].remainder)
+        keys = ()
+        for p in paths:
+            keys += p.keys()
+        return Path._window(keys, 0, len(keys))
 
-        for p in paths[1:]:
-            pb.append_path(p)
+    def keys(self):
+        """
+        :return: tuple<String>
+        """
+        if self._start == 0 and self._end == len(self._keys):
+            return self._keys
+        return self._keys[self._start:self._end]
 
-        return Path(paths[0].first, pb.result())
+    @property
+    def first(self):
+        """
+        :return: String
+        """
+        return self._keys[self._start]
+
+    @property
+    def remainder(self):
+        """
+        :return: Path - path minus the first element or None if no more
+            elements
+        """
+        if self._end - self._start == 1:
+            return None
+        return Path._window(self._keys, self._start + 1, self._end)
 
     def parent(self):
         """
         :return: Path
             path minus the last element or None if we have just one element
         """
-
-        if self.remainder is None:
+        if self._end - self._start == 1:
             return None
-
-        pb = PathBuilder()
-        p = self
-        while p.remainder is not None:
-            pb.append_key(p.first)
-            p = p.remainder
-        return pb.result()
+        return Path._window(self._keys, self._start, self._end - 1)
 
     def last(self):
         """
         :return: String - last element in the path
         """
-        p = self
-        while p.remainder is not None:
-            p = p.remainder
-        return p.first
+        return self._keys[self._end - 1]
 
     def prepend(self, to_prepend):
         """
         :param to_prepend: Path
         :return: Path
         """
-        pb = PathBuilder()
-        pb.append_path(to_prepend)
-        pb.append_path(self)
-        return pb.result()
+        return Path.of_paths(to_prepend, self)
 
     def length(self):
         """
         :return: int
         """
-        count = 1
-        p = self.remainder
-        while p is not None:
-            count += 1
-            p = p.remainder
-        return count
+        return self._end - self._start
 
     def remove_from_front(self, remove_from_front):
         """
@@ -101,13 +180,10 @@ class Path(collections.namedtuple('Path', ('first', 'remainder'))):
         :param remove_from_front: int
         :return: Path
         """
-        count = remove_from_front
-        p = self
-        while p is not None and count > 0:
-            count -= 1
-            p = p.remainder
-        return p
-
+        start = self._start + max(remove_from_front, 0)
+        if start >= self._end:
+            return None
+        return Path._window(self._keys, start, self._end)
 
     def sub_path(self, first_index, last_index):
         """
@@ -119,18 +195,13 @@ class Path(collections.namedtuple('Path', ('first', 'remainder'))):
         """
         if last_index < first_index:
             raise exceptions.BugOrBroken("bad call to subPath")
-
-        from_path = self.remove_from_front(first_index)
-        pb = PathBuilder()
-        count = last_index - first_index
-        while count > 0:
-            count -= 1
-            pb.append_key(from_path.first)
-            from_path = from_path.remainder
-            if from_path is None:
-                raise exceptions.BugOrBroken(
-                    "subPath lastIndex out of range " + last_index)
-        return pb.result()
+        if last_index > self.length():
+            raise exceptions.BugOrBroken(
+                "subPath lastIndex out of range " + str(last_index))
+        if last_index == first_index:
+            return None
+        return Path._window(self._keys, self._start + first_index,
+                            self._start + last_index)
 
     @classmethod
     def has_funky_chars(cls, s):
@@ -161,25 +232,59 @@ class Path(collections.namedtuple('Path', ('first', 'remainder'))):
                 return True
         return False
 
+    @classmethod
+    def render_key(cls, key):
+        """
+        :param key: String
+        :return: String - key as one element of a path expression
+        """
+        rendered = _rendered_keys.get(key)
+        if rendered is None:
+            if Path.has_funky_chars(key) or len(key) == 0:
+                rendered = util.render_json_string(key)
+            else:
+                rendered = key
+            if len(_rendered_keys) < MAX_INTERNED_KEYS:
+                _rendered_keys[key] = rendered
+        return rendered
+
+    def __eq__(self, other):
+        if not isinstance(other, Path):
+            return False
+        if self._keys is other._keys and self._start == other._start \
+                and self._end == other._end:
+            return True
+        return self.length() == other.length() \
+            and self.keys() == other.keys()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self.keys())
+        return h
+
+    def __reduce__(self):
+        # the window would pickle the whole shared tuple
+        return (_from_keys, (self.keys(),))
+
     def __repr__(self):
         """
         public String toString()
         """
-        return "Path(" + unicode(self) + ")"
+        return "Path(" + str(self) + ")"
 
-    def __unicode__(self):
+    def __str__(self):
         """
         String render()
         """
-        if Path.has_funky_chars(self.first) or len(self.first) == 0:
-            s = util.render_json_string(self.first)
-        else:
-            s = self.first
-
-        if remainder is not None:
-            s += "." + unicode(self.remainder)
-
-        return s
+        rendered = self._rendered
+        if rendered is None:
+            rendered = self._rendered = u".".join(
+                Path.render_key(k) for k in self.keys())
+        return rendered
 
     @classmethod
     def new_key(cls, key):
@@ -192,7 +297,43 @@ class Path(collections.namedtuple('Path', ('first', 'remainder'))):
     @classmethod
     def new_path(cls, path):
         """
+        Parsed paths are kept in a process-wide LRU cache, so the same
+        expression yields the same Path instance while it stays cached.
+
         :param path: String
         :return: Path
         """
-        return Parser.parse_path(path)
+        return _path_cache.get(path, _parse_path)
+
+    @classmethod
+    def path_cache_stats(cls):
+        """
+        :return: CacheStats - hit and miss counts of new_path's cache
+        """
+        return _path_cache.stats()
+
+    @classmethod
+    def clear_path_cache(cls):
+        """
+        Empties new_path's cache and resets its counters.
+        """
+        _path_cache.clear()
+
+
+def _parse_path(path):
+    """
+    Parses a path expression on a miss in new_path's cache; Parser builds
+    Paths, so it's only imported here.
+
+    :param path: String
+    :return: Path
+    """
+    from . import Parser
+    return Parser.parse_path(path)
+
+
+def _from_keys(keys):
+    """
+    Unpickles a Path.
+    """
+    return Path._of_keys(keys)
@@ -1,11 +1,13 @@
 from .. import exceptions
 
+from .Path import Path
+
+
 class PathBuilder(object):
     """
     Attributes:
 
-        _keys: Stack<String> -
-            the keys are kept "backward" (top of stack is end of path)
+        _keys: List<String>
 
         _result: Path
     """
@@ -32,17 +34,8 @@ class PathBuilder(object):
         :param path: Path
         :return: None
         """
-        self.checkCanAppend()
-
-        first = path.first  # String
-        remainder = path.remainder  # path
-        while True:
-            self._keys.append(first)
-            if remainder is not None:
-                first = remainder.first
-                remainder = remainder.remainder
-            else:
-                break
+        self._check_can_append()
+        self._keys.extend(path.keys())
 
     def result(self):
         """
@@ -52,9 +45,5 @@ class PathBuilder(object):
         # note: if keys is empty, we want to return null, which is a valid
         # empty path
         if self._result is None:
-            remainder = None  # Path
-            while len(self._keys) != 0:
-                key = self._keys.pop()  # String
-                remainder = Path(key, remainder)
-            self._result = remainder
+            self._result = Path._of_keys(self._keys)
         return self._result
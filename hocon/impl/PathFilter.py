@@ -0,0 +1,348 @@
+"""
+Drops the fields of a HOCON or JSON token stream that are outside a set of
+paths, before the stream reaches Parser, so no values are built for them.
+
+Each field of the root object is looked at in turn. A field inside one of
+the paths is passed through whole. A field on the way to one of them (akka
+when asking for akka.actor) whose value is an object is passed through with
+the same treatment applied to the fields of that object. Any other value of
+such a field is passed through whole too: a scalar there still replaces the
+objects set before it, and a substitution may be part of an object merge.
+Everything else is dropped, along with the comments before it and the
+separator after it.
+
+Includes are passed through, and the included files are parsed whole.
+
+What's parsed from the filtered stream is then cut down by prune(), which
+leaves what Config.with_only_path would for each of the paths, merged.
+"""
+
+from .. import exceptions
+from ..ConfigSyntax import ConfigSyntax
+
+from . import tokens
+from .ConfigDelayedMergeObject import ConfigDelayedMergeObject
+from .EventReader import path_from_tokens
+from .Path import Path
+from .SimpleConfigObject import SimpleConfigObject
+
+
+# what to do with a field, given its path
+_KEEP = 'keep'
+_DESCEND = 'descend'
+_DROP = 'drop'
+
+
+def _classify(keys, prefixes):
+    """
+    :param keys: tuple<String>
+    :param prefixes: List<tuple<String>>
+    :return: String - _KEEP, _DESCEND or _DROP
+    """
+    descend = False
+    for prefix in prefixes:
+        n = len(prefix)
+        if keys[:n] == prefix:
+            return _KEEP
+        if prefix[:len(keys)] == keys:
+            descend = True
+    return _DESCEND if descend else _DROP
+
+
+def _ends_value(t):
+    """
+    :param t: Token
+    :return: boolean - whether t ends a value when outside any brackets
+    """
+    return tokens.is_newline(t) or t is tokens.COMMA \
+        or t is tokens.CLOSE_CURLY or t is tokens.CLOSE_SQUARE \
+        or t is tokens.END
+
+
+class PathFilter(object):
+    """
+    Iterates over the tokens of token_iterator, minus the fields outside
+    the paths.
+    """
+
+    def __init__(self, token_iterator, paths, flavor):
+        """
+        :param token_iterator: Iterator<Token>
+        :param paths: Iterable<String> - path expressions
+        :param flavor: ConfigSyntax - json or conf
+        """
+        self.tokens = token_iterator
+        self.prefixes = [Path.new_path(p).keys() for p in paths]
+        self.flavor = flavor
+        self.buffer = []
+
+    def next_token(self):
+        if self.buffer:
+            return self.buffer.pop()
+        return next(self.tokens)
+
+    def put_back(self, t):
+        self.buffer.append(t)
+
+    def rest_of_value(self, keep, skip_leading_newlines):
+        """
+        Reads up to the end of the current value: the next newline, comma
+        or close bracket outside any brackets opened along the way.
+
+        :param keep: boolean - whether to yield the tokens read
+        :param skip_leading_newlines: boolean - whether the value may start
+            on a later line
+        :return: Iterator<Token>
+        """
+        depth = 0
+        if skip_leading_newlines:
+            t = self.next_token()
+            while tokens.is_newline(t) or tokens.is_comment(t):
+                if keep:
+                    yield t
+                t = self.next_token()
+            self.put_back(t)
+        while True:
+            t = self.next_token()
+            if depth == 0 and _ends_value(t) or t is tokens.END:
+                self.put_back(t)
+                return
+            if t is tokens.OPEN_CURLY or t is tokens.OPEN_SQUARE:
+                depth += 1
+            elif t is tokens.CLOSE_CURLY or t is tokens.CLOSE_SQUARE:
+                depth -= 1
+            # errors from the tokenizer are left for the parser to report
+            if keep or tokens.is_problem(t):
+                yield t
+
+    def field(self, t, keys, keep):
+        """
+        Reads the rest of a field whose key has been read, up to where its
+        value ends.
+
+        :param t: Token - the token after the key
+        :param keys: tuple<String> - path of the field
+        :param keep: String - _KEEP, _DESCEND or _DROP
+        :return: Iterator<Token>
+        """
+        passing = keep != _DROP
+        while tokens.is_newline(t) or tokens.is_comment(t):
+            if passing:
+                yield t
+            t = self.next_token()
+
+        if t is tokens.OPEN_CURLY and keep == _DESCEND:
+            # key { ... } with no separator
+            yield t
+            for u in self.object(keys):
+                yield u
+        elif t is tokens.COLON or t is tokens.EQUALS \
+                or t is tokens.PLUS_EQUALS:
+            if passing:
+                yield t
+            if keep == _DESCEND and t is not tokens.PLUS_EQUALS:
+                t = self.next_token()
+                while tokens.is_newline(t) or tokens.is_comment(t):
+                    yield t
+                    t = self.next_token()
+                if t is tokens.OPEN_CURLY:
+                    yield t
+                    for u in self.object(keys):
+                        yield u
+                else:
+                    self.put_back(t)
+                # what follows on the line is part of the same value
+                for u in self.rest_of_value(True, False):
+                    yield u
+            else:
+                for u in self.rest_of_value(passing, True):
+                    yield u
+        else:
+            # key { ... } that isn't descended into, or something the
+            # parser will report as an error
+            self.put_back(t)
+            for u in self.rest_of_value(passing, False):
+                yield u
+
+    def object(self, keys):
+        """
+        Filters the fields of an object, after its open brace if it has
+        one, up to and including its close brace.
+
+        :param keys: tuple<String> - path of the object
+        :return: Iterator<Token>
+        """
+        # newlines, comments and commas since the last field, held back
+        # until it's known whether the next field is kept
+        pending = []
+        emitted_field = False
+        while True:
+            t = self.next_token()
+            if tokens.is_newline(t) or tokens.is_comment(t) \
+                    or t is tokens.COMMA:
+                pending.append(t)
+                continue
+
+            if t is tokens.CLOSE_CURLY or t is tokens.END:
+                # a comma here was after a dropped field
+                for p in pending:
+                    if p is not tokens.COMMA:
+                        yield p
+                if t is tokens.END:
+                    self.put_back(t)
+                else:
+                    yield t
+                return
+
+            if self.flavor != ConfigSyntax.json \
+                    and tokens.is_unquoted_text(t) \
+                    and tokens.get_unquoted_text(t) == "include":
+                key = [t]
+                keep = _KEEP
+                after_key = self.next_token()
+                field_keys = keys
+            else:
+                key = []
+                while tokens.is_value(t) or tokens.is_unquoted_text(t):
+                    key.append(t)
+                    t = self.next_token()  # a key doesn't cross a newline
+                after_key = t
+                if key:
+                    try:
+                        field_keys = keys + path_from_tokens(key).keys()
+                    except exceptions.ConfigException:
+                        # a bad key; keep it for the parser to report
+                        field_keys = keys
+                        keep = _KEEP
+                    else:
+                        keep = _classify(field_keys, self.prefixes)
+                else:
+                    # not a field at all; keep it for the parser to report
+                    field_keys = keys
+                    keep = _KEEP
+
+            if keep == _DROP:
+                pending = [p for p in pending if not tokens.is_comment(p)]
+                for u in self.field(after_key, field_keys, keep):
+                    yield u
+                continue
+
+            # at most one comma, and only if a field came before
+            comma = emitted_field
+            for p in pending:
+                if p is not tokens.COMMA:
+                    yield p
+                elif comma:
+                    yield p
+                    comma = False
+            pending = []
+            emitted_field = True
+            for u in key:
+                yield u
+            if not key:
+                self.put_back(after_key)
+                for u in self.rest_of_value(True, False):
+                    yield u
+            else:
+                for u in self.field(after_key, field_keys, keep):
+                    yield u
+
+    def __iter__(self):
+        t = self.next_token()
+        yield t  # START
+        leading = []
+        t = self.next_token()
+        while tokens.is_newline(t) or tokens.is_comment(t):
+            leading.append(t)
+            t = self.next_token()
+
+        if t is tokens.OPEN_CURLY:
+            for u in leading:
+                yield u
+            yield t
+            for u in self.object(()):
+                yield u
+        elif t is not tokens.OPEN_SQUARE:
+            # the root object can omit the surrounding braces, in which case
+            # the comments so far belong to the first field
+            self.put_back(t)
+            for u in reversed(leading):
+                self.put_back(u)
+            for u in self.object(()):
+                yield u
+        else:
+            for u in leading:
+                yield u
+            self.put_back(t)
+
+        # whatever is left, including END
+        while True:
+            t = self.next_token()
+            yield t
+            if t is tokens.END:
+                return
+
+
+def filter_tokens(token_iterator, paths, flavor):
+    """
+    :param token_iterator: Iterator<Token>
+    :param paths: Iterable<String> - path expressions
+    :param flavor: ConfigSyntax - json or conf
+    :return: Iterator<Token>
+    """
+    return iter(PathFilter(token_iterator, paths, flavor))
+
+
+def _prune(obj, keys, prefixes):
+    """
+    :param obj: SimpleConfigObject
+    :param keys: tuple<String> - path of obj
+    :param prefixes: List<tuple<String>>
+    :return: SimpleConfigObject - or None if nothing in it is kept
+    """
+    kept = {}
+    changed = False
+    for key, value in obj.items():
+        field_keys = keys + (key,)
+        keep = _classify(field_keys, prefixes)
+        if keep == _DESCEND:
+            if isinstance(value, SimpleConfigObject):
+                pruned = _prune(value, field_keys, prefixes)
+            elif isinstance(value, ConfigDelayedMergeObject):
+                pruned = value
+            else:
+                # the rest of the path doesn't exist
+                pruned = None
+        elif keep == _DROP:
+            pruned = None
+        else:
+            pruned = value
+        if pruned is not None:
+            kept[key] = pruned
+        changed = changed or pruned is not value
+    if not kept:
+        return None
+    if not changed:
+        return obj
+    return SimpleConfigObject(obj.origin(), kept, None,
+                              obj.ignores_fallbacks())
+
+
+def prune(root, paths):
+    """
+    Cuts a parsed root object down to what Config.with_only_path would
+    leave for each of the paths, merged. A delayed merge object on the way
+    to one of them, which with_only_path can't look into before it's
+    resolved, is kept whole.
+
+    :param root: AbstractConfigValue - as parsed from filter_tokens()
+    :param paths: Iterable<String> - path expressions
+    :return: AbstractConfigValue
+    """
+    if not isinstance(root, SimpleConfigObject):
+        return root
+    pruned = _prune(root, (), [Path.new_path(p).keys() for p in paths])
+    if pruned is None:
+        return SimpleConfigObject(root.origin(), {}, None,
+                                  root.ignores_fallbacks())
+    return pruned
@@ -0,0 +1,267 @@
+import re
+
+from .. import exceptions
+
+from . import ConfigImpl
+from .ConfigString import ConfigString
+from .FromMapMode import FromMapMode
+from .Path import Path
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigObject import SimpleConfigObject
+
+
+_whitespace = ' \t\f'
+
+_escapes = {'t': '\t', 'n': '\n', 'r': '\r', 'f': '\f'}
+
+_unicode_escape = re.compile('[0-9a-fA-F]{4}')
+
+
+def parse(reader, origin):
+    """
+    :param reader: Reader
+    :param origin: ConfigOrigin
+    :return: AbstractConfigObject
+    :raise IOError:
+    """
+    return from_properties(origin, load(reader))
+
+
+def _logical_lines(text):
+    """
+    Java's Properties.load() splits the input this way: a line ending in an
+    odd number of backslashes continues on the next one, whose leading
+    whitespace is dropped; comment and blank lines are skipped.
+
+    :param text: String
+    :return: Iterator<String>
+    """
+    continued = None
+    for line in text.splitlines():
+        line = line.lstrip(_whitespace)
+        if continued is None:
+            if not line or line[0] in '#!':
+                continue
+        else:
+            line = continued + line
+            continued = None
+
+        trailing = len(line) - len(line.rstrip('\\'))
+        if trailing % 2 == 1:
+            continued = line[:-1]
+        else:
+            yield line
+
+    if continued is not None:
+        yield continued
+
+
+def _unescape(s):
+    """
+    :param s: String
+    :return: String
+    """
+    if '\\' not in s:
+        return s
+    sb = []
+    i = 0
+    while i < len(s):
+        c = s[i]
+        i += 1
+        if c != '\\' or i == len(s):
+            sb.append(c)
+            continue
+        c = s[i]
+        i += 1
+        if c == 'u':
+            if not _unicode_escape.match(s, i):
+                raise exceptions.BugOrBroken(
+                    "Malformed \\uxxxx encoding in properties: " + s)
+            sb.append(_unichr(int(s[i:i + 4], 16)))
+            i += 4
+        else:
+            sb.append(_escapes.get(c, c))
+    return ''.join(sb)
+
+
+try:
+    _unichr = unichr
+except NameError:
+    _unichr = chr
+
+
+def _split_key_value(line):
+    """
+    :param line: String - a logical line
+    :return: (String, String) - still escaped
+    """
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c in '=:' or c in _whitespace:
+            break
+        i += 1
+    key = line[:i]
+
+    rest = line[i:].lstrip(_whitespace)
+    if rest and rest[0] in '=:':
+        rest = rest[1:].lstrip(_whitespace)
+    return key, rest
+
+
+def load(reader):
+    """
+    Reads a .properties file the way java.util.Properties.load() does.
+
+    :param reader: Reader
+    :return: Dict<String, String>
+    :raise IOError:
+    """
+    props = {}
+    for line in _logical_lines(reader.read()):
+        key, value = _split_key_value(line)
+        props[_unescape(key)] = _unescape(value)
+    return props
+
+
+def _last_element(path):
+    """
+    :param path: String
+    :return: String
+    """
+    i = path.rfind('.')
+    if i < 0:
+        return path
+    else:
+        return path[i + 1:]
+
+
+def _except_last_element(path):
+    """
+    :param path: String
+    :return: String - or None
+    """
+    i = path.rfind('.')
+    if i < 0:
+        return None
+    else:
+        return path[:i]
+
+
+def path_from_property_key(key):
+    """
+    :param key: String
+    :return: Path
+    """
+    last = _last_element(key)
+    except_last = _except_last_element(key)
+    path = Path(last, None)
+    while except_last is not None:
+        last = _last_element(except_last)
+        except_last = _except_last_element(except_last)
+        path = Path(last, path)
+    return path
+
+
+def from_properties(origin, props):
+    """
+    :param origin: ConfigOrigin
+    :param props: Dict<String, Object>
+    :return: AbstractConfigObject
+    """
+    path_map = {}
+    for key, value in props.items():
+        if isinstance(key, ConfigImpl.string_types):
+            path_map[path_from_property_key(key)] = value
+    return _from_path_map(origin, path_map, True)
+
+
+def from_path_dict(origin, path_expression_map):
+    """
+    :param origin: ConfigOrigin
+    :param path_expression_map: Mapping<String, Object>
+    :return: AbstractConfigObject
+    """
+    path_map = {}
+    for key, value in path_expression_map.items():
+        if not isinstance(key, ConfigImpl.string_types):
+            raise exceptions.BugOrBroken(
+                "Map has a non-string as a key, expecting a path expression "
+                "as a String")
+        path_map[Path.new_path(key)] = value
+    return _from_path_map(origin, path_map, False)
+
+
+def _from_path_map(origin, path_map, converted_from_properties):
+    """
+    :param origin: ConfigOrigin
+    :param path_map: Dict<Path, Object>
+    :param converted_from_properties: boolean
+    :return: AbstractConfigObject
+    """
+    # First, build a list of paths that will have values, either string or
+    # object values.
+    scope_paths = set()
+    value_paths = set()
+    for path in path_map:
+        # add value's path
+        value_paths.add(path)
+
+        # all parent paths are objects
+        next = path.parent()
+        while next is not None:
+            scope_paths.add(next)
+            next = next.parent()
+
+    if converted_from_properties:
+        # If any string values are also objects containing other values,
+        # drop those string values - objects "win".
+        value_paths -= scope_paths
+    else:
+        # If we didn't start out as properties, then this is an error.
+        for path in value_paths:
+            if path in scope_paths:
+                raise exceptions.BugOrBroken(
+                    "In the map, path '" + str(path)
+                    + "' occurs as both the parent object of a value and as "
+                    "a value. Because Map has no defined ordering, this is a "
+                    "broken situation.")
+
+    # Create maps for the object-valued values.
+    root = {}
+    scopes = dict((path, {}) for path in scope_paths)
+
+    # Store string values in the associated scope maps
+    for path in value_paths:
+        parent_path = path.parent()
+        parent = scopes[parent_path] if parent_path is not None else root
+
+        last = path.last()
+        raw_value = path_map[path]
+        if converted_from_properties:
+            if isinstance(raw_value, ConfigImpl.string_types):
+                value = ConfigString(origin, raw_value)
+            else:
+                # silently ignore non-string values in Properties
+                value = None
+        else:
+            value = ConfigImpl.from_any_ref_with_origin(
+                raw_value, origin, FromMapMode.keys_are_paths)
+        if value is not None:
+            parent[last] = value
+
+    # Create ConfigObject for each scope map, working from children to
+    # parents to avoid modifying any already-created ConfigObject. This is
+    # why the scope paths are sorted from longest to shortest.
+    for scope_path in sorted(scope_paths, key=lambda p: -p.length()):
+        scope = scopes[scope_path]
+        parent_path = scope_path.parent()
+        parent = scopes[parent_path] if parent_path is not None else root
+        o = SimpleConfigObject(origin, scope, ResolveStatus.resolved, False)
+        parent[scope_path.last()] = o
+
+    # return root config object
+    return SimpleConfigObject(origin, root, ResolveStatus.resolved, False)
@@ -0,0 +1,417 @@
+"""
+Renders config values into a stream a piece at a time, rather than building
+the whole text in memory first. As with serialization, all of the rendering
+is here instead of in a render() method on each value class.
+
+The text is the one Java's render() makes. Java appends a separator after
+every element and chops it off the last one afterwards, which a stream can't
+do, so here the separator is written before every element but the first.
+
+render() with concise options hands a resolved tree to the json module's
+encoder instead, which makes the same text.
+"""
+
+import codecs
+import collections
+import io
+import json
+import operator
+import sys
+
+from . import util
+from .AbstractConfigObject import AbstractConfigObject
+from .ConfigBoolean import ConfigBoolean
+from .ConfigConcatenation import ConfigConcatenation
+from .ConfigDelayedMerge import ConfigDelayedMerge
+from .ConfigDelayedMergeObject import ConfigDelayedMergeObject
+from .ConfigNull import ConfigNull
+from .ConfigNumber import ConfigNumber
+from .ConfigReference import ConfigReference
+from .ConfigString import ConfigString
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+
+
+# pieces held before they're written to the stream
+FLUSH_PIECES = 4096
+
+_INDENT = u"    "
+
+# what util.render_json_string() and the concise separators make; no
+# sort_keys, since Python 2 only uses the C encoder without it, so objects
+# are handed over with their keys in order instead
+_CONCISE_ENCODER = json.JSONEncoder(separators=(',', ':'), allow_nan=False)
+
+# dicts keep the order keys are added in from Python 3.7 on
+if sys.version_info >= (3, 7):
+    _ordered = dict
+else:
+    _ordered = collections.OrderedDict
+
+
+class _Writer(object):
+    """
+    Collects pieces of text and writes them to the stream in batches, so
+    neither the whole rendering nor a write per piece is needed.
+
+    Attributes:
+
+        append: function(String)
+            Adds a piece.
+
+        pieces: List<String>
+            Collected since the last flush.
+    """
+
+    def __init__(self, write, encoding):
+        """
+        :param write: function(String) - or function(bytes) given an encoding
+        :param encoding: String - what to encode the text with, or None to
+            write it as text
+        """
+        self._write = write
+        if encoding is None:
+            self._encode = None
+        else:
+            # one encoder for the whole text, so a byte order mark or other
+            # state isn't started over with every batch
+            self._encode = codecs.getincrementalencoder(encoding)().encode
+        self.pieces = []
+        self.append = self.pieces.append
+
+    def spill(self):
+        """
+        Writes the pieces out if enough have been collected; called between
+        the elements of objects and lists.
+        """
+        if len(self.pieces) >= FLUSH_PIECES:
+            self.flush()
+
+    def flush(self, final=False):
+        """
+        :param final: boolean - whether this is the end of the text
+        """
+        text = u"".join(self.pieces)
+        del self.pieces[:]
+        if self._encode is not None:
+            text = self._encode(text, final)
+        if text:
+            self._write(text)
+
+
+def _is_binary(stream):
+    """
+    :param stream: a writable stream
+    :return: boolean - whether it takes bytes rather than text
+    """
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if not hasattr(stream, 'write'):
+        # a socket
+        return True
+    # built-in files and socket.makefile()
+    return 'b' in getattr(stream, 'mode', '')
+
+
+def _indent(w, indent, options):
+    if options.formatted and indent > 0:
+        w.append(_INDENT * indent)
+
+
+def _render_key(w, value, key, options):
+    """
+    :param w: _Writer
+    :param value: AbstractConfigValue - the value at key
+    :param key: String
+    :param options: ConfigRenderOptions
+    """
+    if options.json:
+        w.append(util.render_json_string(key))
+        w.append(u" : " if options.formatted else u":")
+    else:
+        w.append(util.render_string_unquoted_if_possible(key))
+        # in non-JSON we can omit the colon or equals before an object
+        if isinstance(value, AbstractConfigObject):
+            if options.formatted:
+                w.append(u" ")
+        else:
+            w.append(u"=")
+
+
+def _render_at_key(w, value, indent, at_root, at_key, options):
+    """
+    AbstractConfigValue.render(sb, indent, atRoot, atKey, options)
+
+    :param w: _Writer
+    :param value: AbstractConfigValue
+    :param indent: int
+    :param at_root: boolean
+    :param at_key: String - the key the value is rendered at, or None
+    :param options: ConfigRenderOptions
+    """
+    if isinstance(value, (ConfigDelayedMerge, ConfigDelayedMergeObject)):
+        # renders the key with each merged value
+        _render_merge(w, value.unmerged_values(), indent, at_root, at_key,
+                      options)
+        return
+    if at_key is not None:
+        _render_key(w, value, at_key, options)
+    _render(w, value, indent, at_root, options)
+
+
+def _render(w, value, indent, at_root, options):
+    """
+    AbstractConfigValue.render(sb, indent, atRoot, options)
+    """
+    if isinstance(value, ConfigString):
+        if options.json:
+            w.append(util.render_json_string(value.unwrapped()))
+        else:
+            w.append(util.render_string_unquoted_if_possible(
+                value.unwrapped()))
+    elif isinstance(value, ConfigNumber):
+        u = value.unwrapped()
+        # repr, since str rounds floats on Python 2
+        w.append(repr(u) if isinstance(u, float) else str(u))
+    elif isinstance(value, ConfigBoolean):
+        w.append(u"true" if value.unwrapped() else u"false")
+    elif isinstance(value, ConfigNull):
+        w.append(u"null")
+    elif isinstance(value, (ConfigDelayedMerge, ConfigDelayedMergeObject)):
+        _render_merge(w, value.unmerged_values(), indent, at_root, None,
+                      options)
+    elif isinstance(value, AbstractConfigObject):
+        _render_object(w, value, indent, at_root, options)
+    elif isinstance(value, SimpleConfigList):
+        _render_list(w, value, indent, at_root, options)
+    elif isinstance(value, ConfigConcatenation):
+        for piece in value.pieces():
+            _render(w, piece, indent, at_root, options)
+    elif isinstance(value, ConfigReference):
+        expression = value.expression()
+        w.append(u"${" + (u"?" if expression.optional() else u"")
+                 + str(expression.path()) + u"}")
+    else:
+        w.append(str(value.unwrapped()))
+
+
+def _render_comments(w, value, indent, options, space):
+    """
+    :param space: boolean - whether to put a space after # even if the
+        comment starts with one, as lists do
+    """
+    origin = value.origin()
+    if options.origin_comments:
+        _indent(w, indent, options)
+        w.append(u"# ")
+        w.append(origin.description())
+        w.append(u"\n")
+    if options.comments:
+        for comment in origin.comments():
+            _indent(w, indent, options)
+            w.append(u"# " if space or not comment.startswith(u" ")
+                     else u"#")
+            w.append(comment)
+            w.append(u"\n")
+
+
+def _render_object(w, obj, indent, at_root, options):
+    """
+    SimpleConfigObject.render(sb, indent, atRoot, options)
+    """
+    if len(obj) == 0:
+        w.append(u"{}")
+    else:
+        outer_braces = options.json or not at_root
+
+        if outer_braces:
+            inner_indent = indent + 1
+            w.append(u"{")
+            if options.formatted:
+                w.append(u"\n")
+        else:
+            inner_indent = indent
+
+        if options.formatted:
+            separator = u",\n" if options.json else u"\n"
+        else:
+            separator = u","
+
+        first = True
+        for k, v in sorted(obj.items(), key=operator.itemgetter(0)):
+            if first:
+                first = False
+            else:
+                w.append(separator)
+            _render_comments(w, v, inner_indent, options, False)
+            _indent(w, inner_indent, options)
+            _render_at_key(w, v, inner_indent, False, k, options)
+            w.spill()
+
+        if outer_braces:
+            if options.formatted:
+                w.append(u"\n")
+                _indent(w, indent, options)
+            w.append(u"}")
+    if at_root and options.formatted:
+        w.append(u"\n")
+
+
+def _render_list(w, values, indent, at_root, options):
+    """
+    SimpleConfigList.render(sb, indent, atRoot, options)
+    """
+    if len(values) == 0:
+        w.append(u"[]")
+        return
+
+    w.append(u"[")
+    if options.formatted:
+        w.append(u"\n")
+    separator = u",\n" if options.formatted else u","
+    first = True
+    for v in values:
+        if first:
+            first = False
+        else:
+            w.append(separator)
+        _render_comments(w, v, indent + 1, options, True)
+        _indent(w, indent + 1, options)
+        _render(w, v, indent + 1, at_root, options)
+        w.spill()
+    if options.formatted:
+        w.append(u"\n")
+        _indent(w, indent, options)
+    w.append(u"]")
+
+
+def _render_merge(w, stack, indent, at_root, at_key, options):
+    """
+    ConfigDelayedMerge.render(stack, sb, indent, atRoot, atKey, options)
+
+    :param stack: List<AbstractConfigValue> - highest priority first
+    """
+    comment_merge = options.comments
+    if comment_merge:
+        w.append(u"# unresolved merge of " + str(len(stack))
+                 + u" values follows (\n")
+        if at_key is None:
+            _indent(w, indent, options)
+            w.append(u"# this unresolved merge will not be parseable "
+                     u"because it's at the root of the object\n")
+            _indent(w, indent, options)
+            w.append(u"# the HOCON format has no way to list multiple root "
+                     u"objects in a single file\n")
+
+    separator = u",\n" if options.formatted else u","
+    for i, v in enumerate(reversed(stack)):
+        if i > 0:
+            w.append(separator)
+        if comment_merge:
+            _indent(w, indent, options)
+            if at_key is not None:
+                w.append(u"#     unmerged value " + str(i)
+                         + u" for key " + util.render_json_string(at_key)
+                         + u" from ")
+            else:
+                w.append(u"#     unmerged value " + str(i) + u" from ")
+            w.append(v.origin().description())
+            w.append(u"\n")
+            for comment in v.origin().comments():
+                _indent(w, indent, options)
+                w.append(u"# ")
+                w.append(comment)
+                w.append(u"\n")
+        _indent(w, indent, options)
+
+        if at_key is not None:
+            w.append(util.render_json_string(at_key))
+            w.append(u" : " if options.formatted else u":")
+        _render(w, v, indent, at_root, options)
+    if options.formatted:
+        w.append(u"\n")
+    if comment_merge:
+        _indent(w, indent, options)
+        w.append(u"# ) end of unresolved merge\n")
+
+
+def _is_concise(options):
+    """
+    :param options: ConfigRenderOptions
+    :return: boolean - whether the rendering is plain JSON
+    """
+    return options.json and not (options.formatted or options.comments
+                                 or options.origin_comments)
+
+
+def _plain(value):
+    """
+    :param value: AbstractConfigValue - resolved
+    :return: dict with its keys in order, list, or whatever a scalar
+        unwraps to
+    """
+    if isinstance(value, AbstractConfigObject):
+        return _ordered(
+            (k, _plain(v))
+            for k, v in sorted(value.items(), key=operator.itemgetter(0)))
+    elif isinstance(value, SimpleConfigList):
+        return [_plain(v) for v in value]
+    else:
+        return value.unwrapped()
+
+
+def _render_concise(value):
+    """
+    :param value: AbstractConfigValue
+    :return: String - the concise rendering, or None if the encoder can't
+        make it
+    """
+    if value.resolve_status() != ResolveStatus.resolved:
+        # the encoder knows nothing of references, concatenations and
+        # merges
+        return None
+    try:
+        return str(_CONCISE_ENCODER.encode(_plain(value)))
+    except ValueError:
+        # NaN or infinity, which the encoder would spell differently
+        return None
+
+
+def render_to(value, stream, options, encoding=None):
+    """
+    :param value: AbstractConfigValue
+    :param stream: a writable text or binary stream, or a socket
+    :param options: ConfigRenderOptions
+    :param encoding: String - to write bytes in this encoding whatever
+        the stream is; by default text streams get text and anything else
+        gets UTF-8
+    """
+    if encoding is None and _is_binary(stream):
+        encoding = 'utf-8'
+    write = getattr(stream, 'write', None)
+    if write is None:
+        write = stream.sendall
+    w = _Writer(write, encoding)
+    _render_at_key(w, value, 0, True, None, options)
+    w.flush(True)
+
+
+def render(value, options):
+    """
+    AbstractConfigValue.render(options)
+
+    :param value: AbstractConfigValue
+    :param options: ConfigRenderOptions
+    :return: String
+    """
+    if _is_concise(options):
+        rendered = _render_concise(value)
+        if rendered is not None:
+            return rendered
+    chunks = []
+    w = _Writer(chunks.append, None)
+    _render_at_key(w, value, 0, True, None, options)
+    w.flush()
+    return u"".join(chunks)
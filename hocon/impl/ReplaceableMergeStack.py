@@ -0,0 +1,16 @@
+class ReplaceableMergeStack(object):
+    """
+    Implemented by a merge stack (ConfigDelayedMerge,
+    ConfigDelayedMergeObject) that replaces itself during substitution
+    resolution in order to implement "look backwards only" semantics.
+    """
+
+    def make_replacer(self, skipping):
+        """
+        Make a replacer for this object, skipping the given number of items
+        in the stack.
+
+        :param skipping: int
+        :return: ResolveReplacer
+        """
+        raise NotImplementedError
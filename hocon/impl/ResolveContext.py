@@ -0,0 +1,179 @@
+from .. import exceptions
+
+from .AbstractConfigValue import NotPossibleToResolve
+from .MemoKey import MemoKey
+from .ResolveMemos import ResolveMemos
+from .ResolveSource import ResolveSource
+from .ResolveStatus import ResolveStatus
+
+
+class ResolveContext(object):
+    """
+    Attributes:
+
+        _source: ResolveSource - mutable, so should only be shared among
+            ResolveContexts in the same traversal
+
+        _memos: ResolveMemos - likewise
+
+        _options: ConfigResolveOptions
+
+        _restrict_to_child: Path - the current path restriction, used to
+            ensure lazy resolution and avoid gratuitous cycles; without
+            this, any sibling of an object we're traversing could cause a
+            cycle "by side effect". None for a full resolve.
+
+        _expression_trace: List<SubstitutionExpression> - another mutable
+            unfortunate, used to make nice error messages when resolution
+            fails
+    """
+
+    def __init__(self, source, memos, options, restrict_to_child,
+                 expression_trace):
+        """
+        :param source: ResolveSource
+        :param memos: ResolveMemos
+        :param options: ConfigResolveOptions
+        :param restrict_to_child: Path
+        :param expression_trace: List<SubstitutionExpression>
+        """
+        self._source = source
+        self._memos = memos
+        self._options = options
+        self._restrict_to_child = restrict_to_child
+        self._expression_trace = expression_trace
+
+    @classmethod
+    def new_context(cls, root, options, restrict_to_child):
+        """
+        :param root: AbstractConfigObject
+        :param options: ConfigResolveOptions
+        :param restrict_to_child: Path
+        :return: ResolveContext
+        """
+        return ResolveContext(ResolveSource(root), ResolveMemos(), options,
+                              restrict_to_child, [])
+
+    def source(self):
+        """
+        :return: ResolveSource
+        """
+        return self._source
+
+    def options(self):
+        """
+        :return: ConfigResolveOptions
+        """
+        return self._options
+
+    def is_restricted_to_child(self):
+        """
+        :return: boolean
+        """
+        return self._restrict_to_child is not None
+
+    def restrict_to_child(self):
+        """
+        :return: Path
+        """
+        return self._restrict_to_child
+
+    def restrict(self, restrict_to):
+        """
+        :param restrict_to: Path - None for no restriction
+        :return: ResolveContext
+        """
+        if restrict_to is self._restrict_to_child:
+            return self
+        else:
+            return ResolveContext(self._source, self._memos, self._options,
+                                  restrict_to, self._expression_trace)
+
+    def unrestricted(self):
+        """
+        :return: ResolveContext
+        """
+        return self.restrict(None)
+
+    def trace(self, expr):
+        """
+        :param expr: SubstitutionExpression
+        """
+        self._expression_trace.append(expr)
+
+    def untrace(self):
+        self._expression_trace.pop()
+
+    def trace_string(self):
+        """
+        :return: String
+        """
+        return ", ".join(str(expr) for expr in self._expression_trace)
+
+    def resolve(self, original):
+        """
+        :param original: AbstractConfigValue
+        :return: AbstractConfigValue - None for an optional substitution
+            with nothing to refer to
+        :raise NotPossibleToResolve:
+        """
+        # a fully-resolved (no restrict_to_child) object can satisfy a
+        # request for a restricted object, so always check that first.
+        full_key = MemoKey(original, None)
+        restricted_key = None
+
+        cached = self._memos.get(full_key)
+
+        # but if there was no fully-resolved object cached, we'll only
+        # compute the restrict_to_child object so use a more limited memo
+        # key
+        if cached is None and self.is_restricted_to_child():
+            restricted_key = MemoKey(original, self._restrict_to_child)
+            cached = self._memos.get(restricted_key)
+
+        if cached is not None:
+            return cached
+
+        resolved = self._source.resolve_checking_replacement(self, original)
+
+        if resolved is None \
+                or resolved.resolve_status() == ResolveStatus.resolved:
+            # if the resolved object is fully resolved by resolving only
+            # the restrict_to_child, then it can be cached under full_key
+            # since the child we were restricted to turned out to be the
+            # only unresolved thing.
+            self._memos.put(full_key, resolved)
+        else:
+            # if we have an unresolved object then either we did a partial
+            # resolve restricted to a certain child, or we are allowing
+            # incomplete resolution, or it's a bug.
+            if self.is_restricted_to_child():
+                if restricted_key is None:
+                    raise exceptions.BugOrBroken(
+                        "restrictedKey should not be null here")
+                self._memos.put(restricted_key, resolved)
+            elif self._options.allow_unresolved:
+                self._memos.put(full_key, resolved)
+            else:
+                raise exceptions.BugOrBroken(
+                    "resolveSubstitutions() did not give us a resolved "
+                    "object")
+
+        return resolved
+
+
+def resolve(value, root, options):
+    """
+    :param value: AbstractConfigValue
+    :param root: AbstractConfigObject
+    :param options: ConfigResolveOptions
+    :return: AbstractConfigValue - None for an optional substitution with
+        nothing to refer to
+    """
+    context = ResolveContext.new_context(root, options, None)
+    try:
+        return context.resolve(value)
+    except NotPossibleToResolve as e:
+        # ConfigReference was supposed to catch NotPossibleToResolve
+        raise exceptions.BugOrBroken(
+            "NotPossibleToResolve was thrown from an outermost resolve", e)
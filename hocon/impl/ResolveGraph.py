@@ -0,0 +1,303 @@
+"""
+Resolves a tree by first working out which substitutions depend on which,
+then resolving each value that holds substitutions exactly once, after
+everything it refers to.
+
+The nodes of the graph are "sites": the outermost values in the tree that
+hold substitutions (a ConfigReference, a concatenation, a delayed merge, or a
+list containing any of those), found by walking the plain objects above them.
+Site s depends on site t when a substitution in s refers to t's path, to
+something inside t, or to an object containing t.
+
+Strongly connected components of the graph come out of Tarjan's algorithm
+dependencies first, which is the order they are resolved in. Each site is
+resolved with ResolveContext against the tree as it stands, so the lookups it
+makes land on values that are already resolved. Components that don't depend
+on each other, directly or not, are resolved against the same tree, and what
+they resolve to is put into it in one pass.
+
+A substitution that can't be resolved fails as the site holding it is
+resolved, with the error ResolveContext raises for it; nothing is resolved
+again. Where several would fail, that's the first in dependency order, which
+need not be the first in ResolveContext's walk. A site whose substitutions
+lead back into itself (a.x = ${a}) fails as a cycle the same way, with the
+substitutions that led back to it.
+
+Limitation: only a tree whose components are all single sites is resolved
+this way, so cycles between sites are not reported up front. Sites that
+depend on each other in a circle aren't necessarily a cycle (${a.x} where
+a = ${b} only needs part of b, and a substitution in a delayed merge can
+fall back to the value it overrides), and what they come to depends on the
+order ResolveContext meets them in. Telling those apart from real cycles
+would mean redoing ResolveContext's lookups here, so a tree with such a
+component is resolved by ResolveContext alone, exactly as before, visiting
+sites as often as its walk does.
+"""
+
+import collections
+
+from . import ResolveContext
+from .AbstractConfigObject import AbstractConfigObject
+from .ConfigConcatenation import ConfigConcatenation
+from .ConfigReference import ConfigReference
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigObject import SimpleConfigObject
+from .Unmergeable import Unmergeable
+
+
+class Target(collections.namedtuple('Target', ('keys', 'reference'))):
+    """
+    A path a substitution may look up.
+
+    :param keys: tuple<String>
+    :param reference: ConfigReference
+    """
+
+    def optional(self):
+        """
+        :return: boolean
+        """
+        return self.reference.expression().optional()
+
+
+class Site(collections.namedtuple('Site', ('keys', 'value', 'targets'))):
+    """
+    :param keys: tuple<String> - where value is in the tree
+    :param value: AbstractConfigValue - unresolved
+    :param targets: List<Target>
+    """
+
+
+def find_sites(value, prefix, sites):
+    """
+    Collects the outermost values in the tree that hold substitutions,
+    along with the paths those substitutions refer to.
+
+    :param value: AbstractConfigValue
+    :param prefix: tuple<String>
+    :param sites: List<Site>
+    """
+    if value.resolve_status() == ResolveStatus.resolved:
+        return
+    if isinstance(value, SimpleConfigObject):
+        for key, child in value.items():
+            find_sites(child, prefix + (key,), sites)
+    else:
+        targets = []
+        substitution_targets(value, targets)
+        sites.append(Site(prefix, value, targets))
+
+
+def substitution_targets(value, targets):
+    """
+    :param value: AbstractConfigValue
+    :param targets: List<Target> - paths the substitutions in value may look
+        up
+    """
+    if isinstance(value, ConfigReference):
+        keys = value.expression().path().keys()
+        targets.append(Target(keys, value))
+        # a substitution from an included file is looked up relative to
+        # where it was included first, then from the root
+        prefix_length = value.prefix_length()
+        if 0 < prefix_length < len(keys):
+            targets.append(Target(keys[prefix_length:], value))
+    elif isinstance(value, ConfigConcatenation):
+        for v in value.pieces():
+            substitution_targets(v, targets)
+    elif isinstance(value, Unmergeable):
+        for v in value.unmerged_values():
+            substitution_targets(v, targets)
+    elif isinstance(value, AbstractConfigObject):
+        for v in value.values():
+            substitution_targets(v, targets)
+    elif isinstance(value, SimpleConfigList):
+        for v in value:
+            substitution_targets(v, targets)
+
+
+def _dependencies(sites):
+    """
+    :param sites: List<Site>
+    :return: List<List<(int, Target)>> - for each site, the index of each
+        other site it depends on, and the target that makes it depend on it
+    """
+    exact = {}
+    below = collections.defaultdict(list)
+    for i, site in enumerate(sites):
+        exact[site.keys] = i
+        for n in range(len(site.keys)):
+            below[site.keys[:n]].append(i)
+
+    edges = []
+    for i, site in enumerate(sites):
+        deps = []
+        seen = set()
+        for target in site.targets:
+            found = []
+            # the site itself, or a site whose value contains the target
+            for n in range(len(target.keys), -1, -1):
+                j = exact.get(target.keys[:n])
+                if j is not None:
+                    found.append(j)
+            # sites inside the target
+            found.extend(below.get(target.keys, ()))
+            for j in found:
+                # a site referring into itself looks at what it overrides,
+                # which ResolveContext handles
+                if j != i and (j, target) not in seen:
+                    seen.add((j, target))
+                    deps.append((j, target))
+        edges.append(deps)
+    return edges
+
+
+def _components(count, edges):
+    """
+    Tarjan's algorithm, without recursion since substitution chains can be
+    deeper than the interpreter's stack.
+
+    :param count: int - number of nodes
+    :param edges: List<List<(int, Target)>>
+    :return: List<List<int>> - strongly connected components, each one
+        after every component it depends on
+    """
+    index = [None] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] is not None:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, e = work.pop()
+            if e == 0:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            recurse = False
+            while e < len(edges[v]):
+                w = edges[v][e][0]
+                e += 1
+                if index[w] is None:
+                    work.append((v, e))
+                    work.append((w, 0))
+                    recurse = True
+                    break
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+            if recurse:
+                continue
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+    return components
+
+
+def _levels(components, edges):
+    """
+    :param components: List<List<int>> - from _components()
+    :param edges: List<List<(int, Target)>>
+    :return: List<List<List<int>>> - the components grouped so that those
+        in a group depend only on components in earlier groups
+    """
+    component_of = {}
+    for c, component in enumerate(components):
+        for i in component:
+            component_of[i] = c
+
+    depth = []
+    levels = []
+    for c, component in enumerate(components):
+        d = 0
+        for i in component:
+            for j, _ in edges[i]:
+                k = component_of[j]
+                if k != c:
+                    d = max(d, depth[k] + 1)
+        depth.append(d)
+        if d == len(levels):
+            levels.append([])
+        levels[d].append(component)
+    return levels
+
+
+def _with_values(obj, values):
+    """
+    :param obj: SimpleConfigObject
+    :param values: Dict<tuple<String>, AbstractConfigValue> - by path
+        relative to obj, None to remove what's there
+    :return: SimpleConfigObject - obj with every value put in place,
+        copying each object along the way once
+    """
+    here = {}
+    below = collections.defaultdict(dict)
+    for keys, value in values.items():
+        if len(keys) == 1:
+            here[keys[0]] = value
+        else:
+            below[keys[0]][keys[1:]] = value
+
+    updated = dict(obj.items())
+    for key, child_values in below.items():
+        updated[key] = _with_values(obj.get(key), child_values)
+    for key, value in here.items():
+        if value is None:
+            updated.pop(key, None)
+        else:
+            updated[key] = value
+    return SimpleConfigObject(obj.origin(), updated,
+                              ResolveStatus.from_values(updated.values()),
+                              obj.ignores_fallbacks())
+
+
+def resolve(root, options):
+    """
+    :param root: AbstractConfigObject
+    :param options: ConfigResolveOptions
+    :return: AbstractConfigObject - root with every substitution resolved
+    :raise UnresolvedSubstitution: on a cycle or a missing substitution
+    """
+    if root.resolve_status() == ResolveStatus.resolved:
+        return root
+    if not isinstance(root, SimpleConfigObject):
+        # the root itself is a merge waiting on substitutions
+        return ResolveContext.resolve(root, root, options)
+
+    sites = []
+    find_sites(root, (), sites)
+    edges = _dependencies(sites)
+    components = _components(len(sites), edges)
+    if any(len(component) > 1 for component in components):
+        # sites that depend on each other in a circle resolve, or fail as a
+        # cycle, according to the order ResolveContext walks the tree in and
+        # what it looks back to in delayed merges, so let it walk the tree
+        return ResolveContext.resolve(root, root, options)
+
+    # the sites of a level don't depend on each other, so they're all
+    # resolved against the same tree and put into it in one pass; putting
+    # each into the tree as it's resolved would copy the objects above it
+    # every time
+    for level in _levels(components, edges):
+        values = {}
+        for (i,) in level:
+            # None for an optional substitution that had nothing to refer to
+            values[sites[i].keys] = ResolveContext.resolve(
+                sites[i].value, root, options)
+        root = _with_values(root, values)
+    return root
@@ -0,0 +1,44 @@
+from .AbstractConfigValue import NotPossibleToResolve
+
+
+class ResolveReplacer(object):
+    """
+    Callback that generates a replacement to use for resolving a
+    substitution.
+
+    Attributes:
+
+        _replacement: AbstractConfigValue - made on the first replace();
+            making it twice in a race is harmless, since this is only an
+            optimization and making the replacement has no side effects
+    """
+
+    def __init__(self):
+        self._replacement = None
+
+    def replace(self, context):
+        """
+        :param context: ResolveContext
+        :return: AbstractConfigValue
+        :raise NotPossibleToResolve:
+        """
+        if self._replacement is None:
+            self._replacement = self.make_replacement(context)
+        return self._replacement
+
+    def make_replacement(self, context):
+        """
+        :param context: ResolveContext
+        :return: AbstractConfigValue
+        :raise NotPossibleToResolve:
+        """
+        raise NotImplementedError
+
+
+class _CycleResolveReplacer(ResolveReplacer):
+
+    def make_replacement(self, context):
+        raise NotPossibleToResolve(context)
+
+
+cycle_resolve_replacer = _CycleResolveReplacer()
@@ -0,0 +1,131 @@
+from .. import exceptions
+
+
+class ResolveSource(object):
+    """
+    This class is the source for values for a substitution like ${foo}.
+
+    Attributes:
+
+        _root: AbstractConfigObject
+
+        _replacements: Dict<int, (AbstractConfigValue, ResolveReplacer)>
+            Conceptually, we transform the ResolveSource whenever we
+            traverse a substitution or delayed merge stack, in order to
+            remove the traversed node and therefore avoid circular
+            dependencies. We implement it with this somewhat hacky "patch a
+            replacement" mechanism instead of actually transforming the
+            tree. Keyed by id(), since values are replaced by identity;
+            the value is kept alongside so its id can't be reused.
+    """
+
+    def __init__(self, root):
+        """
+        :param root: AbstractConfigObject
+        """
+        self._root = root
+        self._replacements = {}
+
+    @classmethod
+    def _find_in_object(cls, obj, context, subst):
+        """
+        :param obj: AbstractConfigObject
+        :param context: ResolveContext
+        :param subst: SubstitutionExpression
+        :return: AbstractConfigValue
+        :raise NotPossibleToResolve:
+        """
+        return obj.peek_path(subst.path(), context)
+
+    def lookup_subst(self, context, subst, prefix_length):
+        """
+        :param context: ResolveContext
+        :param subst: SubstitutionExpression
+        :param prefix_length: int
+        :return: AbstractConfigValue - or None
+        :raise NotPossibleToResolve:
+        """
+        context.trace(subst)
+        try:
+            # First we look up the full path, which means relative to the
+            # included file if we were not a root file
+            result = ResolveSource._find_in_object(self._root, context, subst)
+
+            if result is None:
+                # Then we want to check relative to the root file. We don't
+                # want the prefix we were included at to be used when
+                # looking up env variables either.
+                unprefixed = subst.change_path(
+                    subst.path().remove_from_front(prefix_length))
+
+                # replace the debug trace path
+                context.untrace()
+                context.trace(unprefixed)
+
+                if prefix_length > 0:
+                    result = ResolveSource._find_in_object(
+                        self._root, context, unprefixed)
+
+                if result is None \
+                        and context.options().use_system_environment:
+                    from . import ConfigImpl
+                    result = ResolveSource._find_in_object(
+                        ConfigImpl.env_variables_as_config_object(), context,
+                        unprefixed)
+
+            if result is not None:
+                result = context.resolve(result)
+
+            return result
+        finally:
+            context.untrace()
+
+    def replace(self, value, replacer):
+        """
+        :param value: AbstractConfigValue
+        :param replacer: ResolveReplacer
+        """
+        if id(value) in self._replacements:
+            raise exceptions.BugOrBroken(
+                "should not have replaced the same value twice: "
+                + repr(value))
+        self._replacements[id(value)] = (value, replacer)
+
+    def unreplace(self, value):
+        """
+        :param value: AbstractConfigValue
+        """
+        if self._replacements.pop(id(value), None) is None:
+            raise exceptions.BugOrBroken(
+                "unreplace() without replace(): " + repr(value))
+
+    def _replacement(self, context, value):
+        """
+        :param context: ResolveContext
+        :param value: AbstractConfigValue
+        :return: AbstractConfigValue
+        :raise NotPossibleToResolve:
+        """
+        entry = self._replacements.get(id(value))
+        if entry is None:
+            return value
+        else:
+            return entry[1].replace(context)
+
+    def resolve_checking_replacement(self, context, original):
+        """
+        Conceptually, this is original.resolve_substitutions() but using
+        the replacement for original if any.
+
+        :param context: ResolveContext
+        :param original: AbstractConfigValue
+        :return: AbstractConfigValue
+        :raise NotPossibleToResolve:
+        """
+        replacement = self._replacement(context, original)
+
+        if replacement is not original:
+            # start over, checking if replacement was memoized
+            return context.resolve(replacement)
+        else:
+            return original.resolve_substitutions(context)
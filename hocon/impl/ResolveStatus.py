@@ -1,11 +1,16 @@
 from enum import Enum
 
 
-class ResolveStatus(Enum('ResolveStatus', ('unresolved', 'resolved'))):
+class ResolveStatus(Enum):
     """
     Status of substitution resolution.
     """
 
+    # numbered as the functional API would; Python 3 won't subclass an enum
+    # that already has members
+    unresolved = 1
+    resolved = 2
+
     @classmethod
     def from_values(cls, values):
         """
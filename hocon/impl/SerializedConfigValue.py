@@ -0,0 +1,538 @@
+"""
+Deliberately shoving all the serialization code into this module instead of
+doing it OO-style with each value class. Seems better to have it all in one
+place.
+
+The layout is the one Java's SerializedConfigValue writes: every value is a
+list of (field code, int32 length, payload) fields closed by an END_MARKER,
+origins are stored as a delta against the parent value's origin, and readers
+skip field codes they don't know. Two differences: the data starts with
+MAGIC and FORMAT_VERSION instead of being embedded in a Java object stream,
+and strings are an int32 byte length plus UTF-8 rather than Java's 64k-limited
+modified UTF-8, so the bytes are not interchangeable with Java's.
+
+Because every value is length-prefixed, deserialize_path() can hop over
+the subtrees it doesn't need without decoding them.
+"""
+
+import struct
+
+from .. import exceptions
+from ..Config import Config
+
+from .AbstractConfigObject import AbstractConfigObject
+from .ConfigBoolean import ConfigBoolean
+from .ConfigDouble import ConfigDouble
+from .ConfigInt import ConfigInt
+from .ConfigLong import ConfigLong
+from .ConfigNull import ConfigNull
+from .ConfigString import ConfigString
+from .OriginType import OriginType
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+MAGIC = b'HOCN'
+
+# bump this if the layout changes in a way old readers can't skip over
+FORMAT_VERSION = 1
+
+
+class SerializedField(object):
+    """
+    This is how we try to be extensible. The numbers are in the wire format,
+    caution.
+    """
+
+    # represents a field code we didn't recognize
+    unknown = 0
+
+    # end of a list of fields
+    end_marker = 1
+
+    # Fields at the root
+    root_value = 2
+    root_was_config = 3
+
+    # Fields that make up a value
+    value_data = 4
+    value_origin = 5
+
+    # Fields that make up an origin
+    origin_description = 6
+    origin_line_number = 7
+    origin_end_line_number = 8
+    origin_type = 9
+    origin_url = 10
+    origin_comments = 11
+    origin_null_url = 12
+    origin_null_comments = 13
+
+
+class SerializedValueType(object):
+    """
+    The numbers here are in the wire format, caution.
+    """
+    null = 0
+    boolean = 1
+    int = 2
+    long = 3
+    double = 4
+    string = 5
+    list = 6
+    object = 7
+
+
+_byte = struct.Struct('>B')
+_int = struct.Struct('>i')
+_long = struct.Struct('>q')
+_double = struct.Struct('>d')
+_field_header = struct.Struct('>Bi')
+
+# OriginType is written as its position in this list, like a Java ordinal
+_origin_types = list(OriginType)
+
+
+def serialize(value, origins=True):
+    """
+    :param value: ConfigValue or Config - must be resolved
+    :param origins: boolean - false to keep only the root's origin; every
+        other value then inherits it, which makes the output a good deal
+        smaller for large trees
+    :return: bytes
+    """
+    was_config = isinstance(value, Config)
+    if was_config:
+        value = value.root()
+    if value.resolve_status() != ResolveStatus.resolved:
+        raise exceptions.NotResolved(
+            "tried to serialize a value with unresolved substitutions, "
+            "need to Config#resolve() first, see API docs")
+
+    out = bytearray(MAGIC)
+    out += _byte.pack(FORMAT_VERSION)
+
+    field = _begin_field(out, SerializedField.root_value)
+    _write_value(out, value, None, origins)
+    _end_field(out, field)
+
+    field = _begin_field(out, SerializedField.root_was_config)
+    out += _byte.pack(was_config)
+    _end_field(out, field)
+
+    _write_end_marker(out)
+    return bytes(out)
+
+
+def deserialize(data):
+    """
+    :param data: bytes - as returned by serialize()
+    :return: ConfigValue or Config, whichever was serialized
+    """
+    value, was_config = _read_root(_Input(data), None)
+    if was_config:
+        return value.to_config()
+    else:
+        return value
+
+
+def deserialize_path(data, path):
+    """
+    Decodes only the value at path; sibling subtrees along the way are
+    skipped by their length without being decoded.
+
+    :param data: bytes - as returned by serialize()
+    :param path: Path
+    :return: AbstractConfigValue, or None if there's no value at path
+    """
+    value, was_config = _read_root(_Input(data), path)
+    return value
+
+
+def _begin_field(out, code):
+    """
+    Writes the field code and a placeholder length.
+
+    :return: int - where the field's payload starts
+    """
+    out += _field_header.pack(code, 0)
+    return len(out)
+
+
+def _end_field(out, start):
+    """
+    Patches the length of the field whose payload started at start.
+    """
+    _int.pack_into(out, start - _int.size, len(out) - start)
+
+
+def _write_end_marker(out):
+    out += _byte.pack(SerializedField.end_marker)
+
+
+def _write_string(out, s):
+    b = s.encode('utf-8')
+    out += _int.pack(len(b))
+    out += b
+
+
+def _write_origin_field(out, code, v):
+    """
+    This is a separate function to prevent bugs writing the wrong
+    representation of v.
+    """
+    if code == SerializedField.origin_description \
+            or code == SerializedField.origin_url:
+        _write_string(out, v)
+    elif code == SerializedField.origin_line_number \
+            or code == SerializedField.origin_end_line_number:
+        out += _int.pack(v)
+    elif code == SerializedField.origin_type:
+        out += _byte.pack(_origin_types.index(v))
+    elif code == SerializedField.origin_comments:
+        out += _int.pack(len(v))
+        for s in v:
+            _write_string(out, s)
+    elif code == SerializedField.origin_null_url \
+            or code == SerializedField.origin_null_comments:
+        # nothing to write out besides code and length
+        pass
+    else:
+        raise exceptions.BugOrBroken("Unhandled field from origin: "
+                                     + str(code))
+
+
+def write_origin(out, origin, base_origin):
+    """
+    Not private because we use it to serialize ConfigException.
+
+    :param out: bytearray
+    :param origin: SimpleConfigOrigin
+    :param base_origin: SimpleConfigOrigin
+    """
+    # to serialize a null origin, we write out no fields at all
+    if origin is not None:
+        m = origin.to_fields_delta(base_origin)
+    else:
+        m = {}
+    for code in sorted(m):
+        field = _begin_field(out, code)
+        _write_origin_field(out, code, m[code])
+        _end_field(out, field)
+    _write_end_marker(out)
+
+
+def _value_type_for(value):
+    """
+    :param value: AbstractConfigValue
+    :return: int - a SerializedValueType
+    """
+    if isinstance(value, ConfigInt):
+        return SerializedValueType.int
+    elif isinstance(value, ConfigLong):
+        return SerializedValueType.long
+    elif isinstance(value, ConfigDouble):
+        return SerializedValueType.double
+    elif isinstance(value, ConfigString):
+        return SerializedValueType.string
+    elif isinstance(value, ConfigBoolean):
+        return SerializedValueType.boolean
+    elif isinstance(value, ConfigNull):
+        return SerializedValueType.null
+    elif isinstance(value, SimpleConfigList):
+        return SerializedValueType.list
+    elif isinstance(value, AbstractConfigObject):
+        return SerializedValueType.object
+    raise exceptions.BugOrBroken("don't know how to serialize " + repr(value))
+
+
+def _write_value_data(out, value, origins):
+    st = _value_type_for(value)
+    out += _byte.pack(st)
+    if st == SerializedValueType.boolean:
+        out += _byte.pack(value.unwrapped())
+    elif st == SerializedValueType.null:
+        pass
+    elif st == SerializedValueType.int:
+        # saving numbers as both string and binary is redundant but easy
+        out += _int.pack(value.unwrapped())
+        _write_string(out, value.transform_to_string())
+    elif st == SerializedValueType.long:
+        out += _long.pack(value.unwrapped())
+        _write_string(out, value.transform_to_string())
+    elif st == SerializedValueType.double:
+        out += _double.pack(value.unwrapped())
+        _write_string(out, value.transform_to_string())
+    elif st == SerializedValueType.string:
+        _write_string(out, value.unwrapped())
+    elif st == SerializedValueType.list:
+        out += _int.pack(len(value))
+        for v in value:
+            _write_value(out, v, value.origin(), origins)
+    elif st == SerializedValueType.object:
+        out += _int.pack(len(value))
+        for k, v in value.items():
+            _write_string(out, k)
+            _write_value(out, v, value.origin(), origins)
+
+
+def _write_value(out, value, base_origin, origins):
+    field = _begin_field(out, SerializedField.value_origin)
+    if origins or base_origin is None:
+        write_origin(out, value.origin(), base_origin)
+    else:
+        # an empty delta inherits the parent's origin
+        _write_end_marker(out)
+    _end_field(out, field)
+
+    field = _begin_field(out, SerializedField.value_data)
+    _write_value_data(out, value, origins)
+    _end_field(out, field)
+
+    _write_end_marker(out)
+
+
+class _Input(object):
+    """
+    A position in a buffer of serialized data.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def _unpack(self, s):
+        try:
+            v = s.unpack_from(self.data, self.pos)[0]
+        except struct.error as e:
+            raise _corrupt("unexpected end of data", e)
+        self.pos += s.size
+        return v
+
+    def read_byte(self):
+        return self._unpack(_byte)
+
+    def read_int(self):
+        return self._unpack(_int)
+
+    def read_long(self):
+        return self._unpack(_long)
+
+    def read_double(self):
+        return self._unpack(_double)
+
+    def read_string(self):
+        n = self.read_int()
+        end = self.pos + n
+        if n < 0 or end > len(self.data):
+            raise _corrupt("unexpected end of data")
+        try:
+            s = self.data[self.pos:end].decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise _corrupt("string is not UTF-8", e)
+        self.pos = end
+        return s
+
+    def read_code(self):
+        c = self.read_byte()
+        if c == SerializedField.unknown:
+            raise _corrupt("field code " + str(c)
+                           + " is not supposed to be on the wire")
+        return c
+
+    def skip_field(self):
+        n = self.read_int()
+        if n < 0 or self.pos + n > len(self.data):
+            raise _corrupt("unexpected end of data")
+        self.pos += n
+
+    def skip_value(self):
+        """
+        Skips the fields of a value without decoding them.
+        """
+        while self.read_code() != SerializedField.end_marker:
+            self.skip_field()
+
+
+def _corrupt(message, cause=None):
+    return exceptions.IO(message="bad serialized config: " + message,
+                         origin=None, cause=cause)
+
+
+def _read_root(input, path):
+    """
+    :param input: _Input
+    :param path: Path - only decode the value at this path, or None for all
+    :return: (AbstractConfigValue, boolean) - the value and whether it was
+        serialized from a Config
+    """
+    if input.data[:len(MAGIC)] != MAGIC:
+        raise _corrupt("not serialized config data")
+    input.pos = len(MAGIC)
+    version = input.read_byte()
+    if version > FORMAT_VERSION:
+        raise _corrupt("format version " + str(version)
+                       + " is newer than this library understands ("
+                       + str(FORMAT_VERSION) + ")")
+
+    value = None
+    was_config = False
+    while True:
+        code = input.read_code()
+        if code == SerializedField.end_marker:
+            if value is None:
+                raise _corrupt("No root value found")
+            if was_config and not isinstance(value, AbstractConfigObject):
+                raise _corrupt("Config root is not an object")
+            return value, was_config
+        elif code == SerializedField.root_value:
+            input.read_int()  # discard length
+            value = _read_value(input, None, path)
+            if path is not None:
+                return value, was_config
+        elif code == SerializedField.root_was_config:
+            input.read_int()  # discard length
+            was_config = bool(input.read_byte())
+        else:
+            # ignore unknown field
+            input.skip_field()
+
+
+def read_origin(input, base_origin):
+    """
+    Not private because we use it to deserialize ConfigException.
+
+    :param input: _Input
+    :param base_origin: SimpleConfigOrigin
+    :return: SimpleConfigOrigin
+    """
+    m = {}
+    while True:
+        v = None
+        field = input.read_code()
+        if field == SerializedField.end_marker:
+            try:
+                return SimpleConfigOrigin.from_base(base_origin, m)
+            except (IOError, exceptions.BugOrBroken) as e:
+                # no origin type or description, here or in the base
+                raise _corrupt(str(e), e)
+        elif field == SerializedField.origin_description \
+                or field == SerializedField.origin_url:
+            input.read_int()  # discard length
+            v = input.read_string()
+        elif field == SerializedField.origin_line_number \
+                or field == SerializedField.origin_end_line_number:
+            input.read_int()  # discard length
+            v = input.read_int()
+        elif field == SerializedField.origin_type:
+            input.read_int()  # discard length
+            ordinal = input.read_byte()
+            if ordinal >= len(_origin_types):
+                raise _corrupt("Unknown origin type: " + str(ordinal))
+            v = _origin_types[ordinal]
+        elif field == SerializedField.origin_comments:
+            input.read_int()  # discard length
+            v = [input.read_string() for i in range(input.read_int())]
+        elif field == SerializedField.origin_null_url \
+                or field == SerializedField.origin_null_comments:
+            # nothing to read besides code and length
+            input.read_int()  # discard length
+            v = ""  # just something non-null to put in the map
+        elif field in (SerializedField.root_value,
+                       SerializedField.root_was_config,
+                       SerializedField.value_data,
+                       SerializedField.value_origin):
+            raise _corrupt("Not expecting this field here: " + str(field))
+        else:
+            # skip unknown field
+            input.skip_field()
+        if v is not None:
+            m[field] = v
+
+
+def _read_value_data(input, origin, path):
+    """
+    :param input: _Input
+    :param origin: SimpleConfigOrigin
+    :param path: Path - descend to this path, or None to decode everything
+    :return: AbstractConfigValue
+    """
+    st = input.read_byte()
+    if path is not None and st != SerializedValueType.object:
+        # path goes through something that isn't an object
+        return None
+
+    if st == SerializedValueType.boolean:
+        return ConfigBoolean(origin, bool(input.read_byte()))
+    elif st == SerializedValueType.null:
+        return ConfigNull(origin)
+    elif st == SerializedValueType.int:
+        vi = input.read_int()
+        si = input.read_string()
+        return ConfigInt(origin, vi, si)
+    elif st == SerializedValueType.long:
+        vl = input.read_long()
+        sl = input.read_string()
+        return ConfigLong(origin, vl, sl)
+    elif st == SerializedValueType.double:
+        vd = input.read_double()
+        sd = input.read_string()
+        return ConfigDouble(origin, vd, sd)
+    elif st == SerializedValueType.string:
+        return ConfigString(origin, input.read_string())
+    elif st == SerializedValueType.list:
+        size = input.read_int()
+        values = [_read_value(input, origin, None) for i in range(size)]
+        return SimpleConfigList(origin, values)
+    elif st == SerializedValueType.object:
+        size = input.read_int()
+        if path is not None:
+            for i in range(size):
+                key = input.read_string()
+                if key == path.first:
+                    return _read_value(input, origin, path.remainder)
+                input.skip_value()
+            return None
+        m = {}
+        for i in range(size):
+            key = input.read_string()
+            m[key] = _read_value(input, origin, None)
+        return SimpleConfigObject(origin, m)
+    raise _corrupt("Unknown serialized value type: " + str(st))
+
+
+def _read_value(input, base_origin, path):
+    """
+    :param input: _Input
+    :param base_origin: SimpleConfigOrigin
+    :param path: Path - descend to this path, or None to decode everything
+    :return: AbstractConfigValue
+    """
+    value = None
+    found = False
+    origin = None
+    while True:
+        code = input.read_code()
+        if code == SerializedField.end_marker:
+            if not found:
+                raise _corrupt(
+                    "No value data found in serialization of value")
+            return value
+        elif code == SerializedField.value_data:
+            if origin is None:
+                raise _corrupt("Origin must be stored before value data")
+            input.read_int()  # discard length
+            value = _read_value_data(input, origin, path)
+            found = True
+            if path is not None:
+                # we may have stopped partway through the data; nothing
+                # after this point is of interest
+                return value
+        elif code == SerializedField.value_origin:
+            input.read_int()  # discard length
+            origin = read_origin(input, base_origin)
+        else:
+            # ignore unknown field
+            input.skip_field()
@@ -0,0 +1,953 @@
+import re
+
+from .. import exceptions
+
+from ..Config import Config
+from ..ConfigResolveOptions import ConfigResolveOptions
+from ..ConfigValueType import ConfigValueType
+from ..TimeUnit import TimeUnit
+
+from . import ConfigImpl
+from . import DefaultTransformer
+from . import ResolveContext
+from . import ResolveGraph
+from . import util
+from .AbstractConfigObject import AbstractConfigObject
+from .ConfigNull import ConfigNull
+from .ConfigString import ConfigString
+from .MergeableValue import MergeableValue
+from .Path import Path
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigList import SimpleConfigList
+from .SimpleConfigObject import SimpleConfigObject
+
+
+class SimpleConfig(Config, MergeableValue):
+    """
+    One thing to keep in mind in the future: as Collection-like APIs are added
+    here, including iterators or size() or anything, they should be consistent
+    with a one-level dict from paths to non-null values. Null values are
+    not "in" the map.
+
+    Once the config is resolved, the getters look path expressions up in a
+    flat index from rendered path to value before walking the tree. The
+    index covers every value in the tree, objects and nulls included, and is
+    built on the first lookup. A path expression that isn't in the index
+    (written with unneeded quotes, say, or simply missing) takes the tree
+    walk, so errors are reported exactly as before.
+
+    Attributes:
+
+        _object: AbstractConfigObject
+
+        _index: dict<String, AbstractConfigValue>
+            None until built; a config that isn't resolved never builds one.
+    """
+
+    def __init__(self, object):
+        """
+        :param object: AbstractConfigObject
+        """
+        self._object = object
+        self._index = None
+
+    def root(self):
+        """
+        :return: AbstractConfigObject
+        """
+        return self._object
+
+    def origin(self):
+        """
+        :return: ConfigOrigin
+        """
+        return self._object.origin()
+
+    def resolve(self, options=None):
+        """
+        :param options: ConfigResolveOptions
+        :return: SimpleConfig
+        """
+        return self.resolve_with(self, options)
+
+    def resolve_with(self, source, options=None):
+        """
+        :param source: Config
+        :param options: ConfigResolveOptions
+        :return: SimpleConfig
+        """
+        if options is None:
+            options = ConfigResolveOptions.defaults()
+        if source is self:
+            # substitutions only refer into this tree, so they can be put
+            # in order up front
+            resolved = ResolveGraph.resolve(self._object, options)
+        else:
+            resolved = ResolveContext.resolve(self._object, source._object,
+                                              options)
+        if resolved is self._object:
+            return self
+        else:
+            return SimpleConfig(resolved)
+
+    def has_path(self, path_expression):
+        """
+        :param path_expression: String
+        :return: boolean
+        """
+        index = self._path_index()
+        if index is not None:
+            peeked = index.get(path_expression)
+            if peeked is not None:
+                return peeked.value_type() != ConfigValueType.null
+
+        path = Path.new_path(path_expression)
+        try:
+            peeked = self._object.peek_path(path)
+        except exceptions.NotResolved as e:
+            raise ConfigImpl.improve_not_resolved(path, e)
+        return peeked is not None \
+            and peeked.value_type() != ConfigValueType.null
+
+    def is_empty(self):
+        """
+        :return: boolean
+        """
+        return self._object.is_empty()
+
+    @classmethod
+    def _find_paths(cls, entries, parent, obj):
+        """
+        :param entries: Set<(String, ConfigValue)>
+        :param parent: Path
+        :param obj: AbstractConfigObject
+        """
+        for elem, v in obj.items():
+            path = Path.new_key(elem)
+            if parent is not None:
+                path = path.prepend(parent)
+            if isinstance(v, AbstractConfigObject):
+                SimpleConfig._find_paths(entries, path, v)
+            elif isinstance(v, ConfigNull):
+                # nothing; nulls are conceptually not in a Config
+                pass
+            else:
+                entries.add((str(path), v))
+
+    def entry_set(self):
+        """
+        :return: Set<(String, ConfigValue)>
+        """
+        entries = set()
+        SimpleConfig._find_paths(entries, None, self._object)
+        return entries
+
+    def _path_index(self):
+        """
+        :return: dict<String, AbstractConfigValue> - None if the config
+            isn't resolved, since a lookup then has to be able to fail with
+            NotResolved
+        """
+        index = self._index
+        if index is None:
+            if self._object.resolve_status() != ResolveStatus.resolved:
+                return None
+            index = {}
+            SimpleConfig._index_object(index, u"", self._object)
+            # building twice in a race is harmless; both builds are equal
+            self._index = index
+        return index
+
+    @classmethod
+    def _index_object(cls, index, prefix, obj):
+        """
+        :param index: dict<String, AbstractConfigValue>
+        :param prefix: String - rendered path of obj plus ".", or empty at
+            the root
+        :param obj: AbstractConfigObject
+        """
+        for key, v in obj.items():
+            rendered = prefix + Path.render_key(key)
+            index[rendered] = v
+            if isinstance(v, AbstractConfigObject):
+                SimpleConfig._index_object(index, rendered + u".", v)
+
+    @classmethod
+    def _check_found(cls, v, expected, original_path):
+        """
+        :param v: AbstractConfigValue - not None
+        :param expected: ConfigValueType
+        :param original_path: String - rendered path, for errors
+        :return: AbstractConfigValue
+        """
+        if expected is not None:
+            v = DefaultTransformer.transform(v, expected)
+
+        if v.value_type() == ConfigValueType.null:
+            raise exceptions.Null(
+                v.origin(), original_path,
+                expected.name if expected is not None else None)
+        elif expected is not None and v.value_type() != expected:
+            raise exceptions.WrongType(
+                v.origin(), original_path, expected=expected.name,
+                actual=v.value_type().name)
+        else:
+            return v
+
+    @classmethod
+    def _find_key(cls, self, key, expected, original_path):
+        """
+        :param self: AbstractConfigObject
+        :param key: String
+        :param expected: ConfigValueType
+        :param original_path: Path
+        :return: AbstractConfigValue
+        """
+        v = self.peek_assuming_resolved(key, original_path)
+        if v is None:
+            raise exceptions.Missing(path=str(original_path))
+        return SimpleConfig._check_found(v, expected, str(original_path))
+
+    @classmethod
+    def _find(cls, self, path, expected, original_path):
+        """
+        :param self: AbstractConfigObject
+        :param path: Path
+        :param expected: ConfigValueType
+        :param original_path: Path
+        :return: AbstractConfigValue
+        """
+        try:
+            key = path.first
+            next = path.remainder
+            if next is None:
+                return SimpleConfig._find_key(self, key, expected,
+                                              original_path)
+            else:
+                o = SimpleConfig._find_key(
+                    self, key, ConfigValueType.object,
+                    original_path.sub_path(
+                        0, original_path.length() - next.length()))
+                # missing was supposed to throw
+                assert o is not None
+                return SimpleConfig._find(o, next, expected, original_path)
+        except exceptions.NotResolved as e:
+            raise ConfigImpl.improve_not_resolved(path, e)
+
+    def find(self, path_expression, expected):
+        """
+        :param path_expression: String
+        :param expected: ConfigValueType
+        :return: AbstractConfigValue
+        """
+        index = self._path_index()
+        if index is not None:
+            v = index.get(path_expression)
+            if v is not None:
+                return SimpleConfig._check_found(v, expected,
+                                                 path_expression)
+
+        path = Path.new_path(path_expression)
+        return SimpleConfig._find(self._object, path, expected, path)
+
+    def get_value(self, path):
+        """
+        :param path: String
+        :return: AbstractConfigValue
+        """
+        return self.find(path, None)
+
+    def get_boolean(self, path):
+        """
+        :param path: String
+        :return: boolean
+        """
+        return self.find(path, ConfigValueType.boolean).unwrapped()
+
+    def _get_config_number(self, path):
+        """
+        :param path: String
+        :return: ConfigNumber
+        """
+        return self.find(path, ConfigValueType.number)
+
+    def get_number(self, path):
+        """
+        :param path: String
+        :return: int or float
+        """
+        return self._get_config_number(path).unwrapped()
+
+    def get_int(self, path):
+        """
+        :param path: String
+        :return: int
+        """
+        return self._get_config_number(path).int_value_range_checked(path)
+
+    def get_long(self, path):
+        """
+        :param path: String
+        :return: int
+        """
+        return int(self.get_number(path))
+
+    def get_double(self, path):
+        """
+        :param path: String
+        :return: float
+        """
+        return float(self.get_number(path))
+
+    def get_string(self, path):
+        """
+        :param path: String
+        :return: String
+        """
+        return self.find(path, ConfigValueType.string).unwrapped()
+
+    def get_list(self, path):
+        """
+        :param path: String
+        :return: ConfigList
+        """
+        return self.find(path, ConfigValueType.list)
+
+    def get_object(self, path):
+        """
+        :param path: String
+        :return: AbstractConfigObject
+        """
+        return self.find(path, ConfigValueType.object)
+
+    def get_config(self, path):
+        """
+        :param path: String
+        :return: SimpleConfig
+        """
+        return self.get_object(path).to_config()
+
+    def get_any_ref(self, path):
+        """
+        :param path: String
+        :return: Object
+        """
+        return self.find(path, None).unwrapped()
+
+    def get_bytes(self, path):
+        """
+        :param path: String
+        :return: int
+        """
+        try:
+            size = self.get_long(path)
+        except exceptions.WrongType:
+            v = self.find(path, ConfigValueType.string)
+            size = parse_bytes(v.unwrapped(), v.origin(), path)
+        return size
+
+    def get_milliseconds(self, path):
+        """
+        Deprecated, use get_duration.
+
+        :param path: String
+        :return: int
+        """
+        return self.get_duration(path, TimeUnit.milliseconds)
+
+    def get_nanoseconds(self, path):
+        """
+        Deprecated, use get_duration.
+
+        :param path: String
+        :return: int
+        """
+        return self.get_duration(path, TimeUnit.nanoseconds)
+
+    def get_duration(self, path, unit):
+        """
+        :param path: String
+        :param unit: TimeUnit
+        :return: int
+        """
+        v = self.find(path, ConfigValueType.string)
+        return unit.convert(parse_duration(v.unwrapped(), v.origin(), path),
+                            TimeUnit.nanoseconds)
+
+    def _get_homogeneous_wrapped_list(self, path, expected):
+        """
+        :param path: String
+        :param expected: ConfigValueType
+        :return: List<AbstractConfigValue>
+        """
+        l = []
+        for v in self.get_list(path):
+            if expected is not None:
+                v = DefaultTransformer.transform(v, expected)
+            if v.value_type() != expected:
+                raise exceptions.WrongType(
+                    v.origin(), path, expected="list of " + expected.name,
+                    actual="list of " + v.value_type().name)
+            l.append(v)
+        return l
+
+    def _get_homogeneous_unwrapped_list(self, path, expected):
+        """
+        :param path: String
+        :param expected: ConfigValueType
+        :return: List<Object>
+        """
+        return [v.unwrapped() for v in
+                self._get_homogeneous_wrapped_list(path, expected)]
+
+    def get_boolean_list(self, path):
+        """
+        :param path: String
+        :return: List<boolean>
+        """
+        return self._get_homogeneous_unwrapped_list(
+            path, ConfigValueType.boolean)
+
+    def get_number_list(self, path):
+        """
+        :param path: String
+        :return: List<int or float>
+        """
+        return self._get_homogeneous_unwrapped_list(
+            path, ConfigValueType.number)
+
+    def get_int_list(self, path):
+        """
+        :param path: String
+        :return: List<int>
+        """
+        return [v.int_value_range_checked(path) for v in
+                self._get_homogeneous_wrapped_list(
+                    path, ConfigValueType.number)]
+
+    def get_long_list(self, path):
+        """
+        :param path: String
+        :return: List<int>
+        """
+        return [int(n) for n in self.get_number_list(path)]
+
+    def get_double_list(self, path):
+        """
+        :param path: String
+        :return: List<float>
+        """
+        return [float(n) for n in self.get_number_list(path)]
+
+    def get_string_list(self, path):
+        """
+        :param path: String
+        :return: List<String>
+        """
+        return self._get_homogeneous_unwrapped_list(
+            path, ConfigValueType.string)
+
+    def get_object_list(self, path):
+        """
+        :param path: String
+        :return: List<ConfigObject>
+        """
+        return self._get_homogeneous_wrapped_list(
+            path, ConfigValueType.object)
+
+    def get_config_list(self, path):
+        """
+        :param path: String
+        :return: List<Config>
+        """
+        return [o.to_config() for o in self.get_object_list(path)]
+
+    def get_any_ref_list(self, path):
+        """
+        :param path: String
+        :return: List<Object>
+        """
+        return [v.unwrapped() for v in self.get_list(path)]
+
+    def get_bytes_list(self, path):
+        """
+        :param path: String
+        :return: List<int>
+        """
+        l = []
+        for v in self.get_list(path):
+            if v.value_type() == ConfigValueType.number:
+                l.append(int(v.unwrapped()))
+            elif v.value_type() == ConfigValueType.string:
+                l.append(parse_bytes(v.unwrapped(), v.origin(), path))
+            else:
+                raise exceptions.WrongType(
+                    v.origin(), path,
+                    expected="memory size string or number of bytes",
+                    actual=v.value_type().name)
+        return l
+
+    def get_duration_list(self, path, unit):
+        """
+        :param path: String
+        :param unit: TimeUnit
+        :return: List<int>
+        """
+        l = []
+        for v in self.get_list(path):
+            if v.value_type() == ConfigValueType.number:
+                l.append(unit.convert(int(v.unwrapped()),
+                                      TimeUnit.milliseconds))
+            elif v.value_type() == ConfigValueType.string:
+                l.append(unit.convert(
+                    parse_duration(v.unwrapped(), v.origin(), path),
+                    TimeUnit.nanoseconds))
+            else:
+                raise exceptions.WrongType(
+                    v.origin(), path,
+                    expected="duration string or number of milliseconds",
+                    actual=v.value_type().name)
+        return l
+
+    def get_milliseconds_list(self, path):
+        """
+        Deprecated, use get_duration_list.
+
+        :param path: String
+        :return: List<int>
+        """
+        return self.get_duration_list(path, TimeUnit.milliseconds)
+
+    def get_nanoseconds_list(self, path):
+        """
+        Deprecated, use get_duration_list.
+
+        :param path: String
+        :return: List<int>
+        """
+        return self.get_duration_list(path, TimeUnit.nanoseconds)
+
+    def to_fallback_value(self):
+        """
+        :return: AbstractConfigObject
+        """
+        return self._object
+
+    def with_fallback(self, other):
+        """
+        :param other: ConfigMergeable
+        :return: SimpleConfig
+        """
+        # this can return "self" if the with_fallback doesn't need a new
+        # ConfigObject
+        return self._object.with_fallback(other).to_config()
+
+    def __eq__(self, other):
+        return isinstance(other, SimpleConfig) \
+            and self._object == other._object
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        # we do the "41*" just so our hash code won't match that of the
+        # underlying object. there's no real reason it can't match, but
+        # making it not match might catch some kinds of bug.
+        return 41 * hash(self._object)
+
+    def __repr__(self):
+        return "Config(" + repr(self._object) + ")"
+
+    def __getstate__(self):
+        # the index is cheap to rebuild and would double the pickle
+        return {'_object': self._object}
+
+    def __setstate__(self, state):
+        self._object = state['_object']
+        self._index = None
+
+    def _peek_path(self, path):
+        """
+        :param path: Path
+        :return: AbstractConfigValue
+        """
+        return self.root().peek_path(path)
+
+    def is_resolved(self):
+        """
+        :return: boolean
+        """
+        return self.root().resolve_status() == ResolveStatus.resolved
+
+    def check_valid(self, reference, *restrict_to_paths):
+        """
+        :param reference: Config
+        :param restrict_to_paths: String
+        """
+        # unresolved reference config is a bug in the caller of check_valid
+        if reference.root().resolve_status() != ResolveStatus.resolved:
+            raise exceptions.BugOrBroken(
+                "do not call check_valid() with an unresolved reference "
+                "config, call Config#resolve(), see Config#resolve() API "
+                "docs")
+
+        # unresolved config under validation is a bug in something,
+        # NotResolved is a more specific subclass of BugOrBroken
+        if self.root().resolve_status() != ResolveStatus.resolved:
+            raise exceptions.NotResolved(
+                "need to Config#resolve() each config before using it, see "
+                "the API docs for Config#resolve()")
+
+        # Now we know that both reference and this config are resolved
+
+        problems = []
+
+        if len(restrict_to_paths) == 0:
+            _check_valid_object(None, reference.root(), self.root(),
+                                problems)
+        else:
+            for p in restrict_to_paths:
+                path = Path.new_path(p)
+                ref_value = reference._peek_path(path)
+                if ref_value is not None:
+                    child = self._peek_path(path)
+                    if child is not None:
+                        _check_valid(path, ref_value, child, problems)
+                    else:
+                        _add_missing(problems, ref_value, path,
+                                     self.origin())
+
+        if len(problems) != 0:
+            raise exceptions.ValidationFailed(problems)
+
+    def with_only_path(self, path_expression):
+        """
+        :param path_expression: String
+        :return: SimpleConfig
+        """
+        path = Path.new_path(path_expression)
+        return SimpleConfig(self.root().with_only_path(path))
+
+    def without_path(self, path_expression):
+        """
+        :param path_expression: String
+        :return: SimpleConfig
+        """
+        path = Path.new_path(path_expression)
+        return SimpleConfig(self.root().without_path(path))
+
+    def with_value(self, path_expression, v):
+        """
+        :param path_expression: String
+        :param v: ConfigValue
+        :return: SimpleConfig
+        """
+        path = Path.new_path(path_expression)
+        return SimpleConfig(self.root().with_value(path, v))
+
+    def at_key(self, key, origin=None):
+        """
+        :param key: String
+        :param origin: ConfigOrigin
+        :return: SimpleConfig
+        """
+        if origin is not None:
+            return self.root().at_key(key, origin)
+        return self.root().at_key(key)
+
+    def at_path(self, path):
+        """
+        :param path: String
+        :return: SimpleConfig
+        """
+        return self.root().at_path(path)
+
+
+def _get_units(s):
+    """
+    :param s: String
+    :return: String - the trailing letters of s
+    """
+    i = len(s) - 1
+    while i >= 0:
+        if not s[i].isalpha():
+            break
+        i -= 1
+    return s[i + 1:]
+
+
+_digits = re.compile(r'[0-9]+\Z')
+
+
+def parse_duration(input, origin_for_exception, path_for_exception):
+    """
+    Parses a duration string. If no units are specified in the string, it is
+    assumed to be in milliseconds. The returned duration is in nanoseconds.
+    The purpose of this function is to implement the duration-related methods
+    in the ConfigObject interface.
+
+    :param input: String - the string to parse
+    :param origin_for_exception: ConfigOrigin - origin of the value being
+        parsed
+    :param path_for_exception: String - path to include in exceptions
+    :return: int - duration in nanoseconds
+    :raise BadValue: if string is invalid
+    """
+    s = util.unicode_trim(input)
+    original_unit_string = _get_units(s)
+    unit_string = original_unit_string
+    number_string = util.unicode_trim(s[:len(s) - len(unit_string)])
+
+    # this would be caught later anyway, but the error message
+    # is more helpful if we check it here.
+    if len(number_string) == 0:
+        raise exceptions.BadValue(
+            path_for_exception,
+            "No number in duration value '" + input + "'",
+            origin=origin_for_exception)
+
+    if len(unit_string) > 2 and not unit_string.endswith("s"):
+        unit_string = unit_string + "s"
+
+    # note that this is deliberately case-sensitive
+    if unit_string in ("", "ms", "milliseconds"):
+        units = TimeUnit.milliseconds
+    elif unit_string in ("us", "microseconds"):
+        units = TimeUnit.microseconds
+    elif unit_string in ("ns", "nanoseconds"):
+        units = TimeUnit.nanoseconds
+    elif unit_string in ("d", "days"):
+        units = TimeUnit.days
+    elif unit_string in ("h", "hours"):
+        units = TimeUnit.hours
+    elif unit_string in ("s", "seconds"):
+        units = TimeUnit.seconds
+    elif unit_string in ("m", "minutes"):
+        units = TimeUnit.minutes
+    else:
+        raise exceptions.BadValue(
+            path_for_exception,
+            "Could not parse time unit '" + original_unit_string
+            + "' (try ns, us, ms, s, m, d)",
+            origin=origin_for_exception)
+
+    try:
+        # if the string is purely digits, parse as an integer to avoid
+        # possible precision loss;
+        # otherwise as a double.
+        if _digits.match(number_string):
+            return units.to_nanos(int(number_string))
+        else:
+            return int(float(number_string) * units.to_nanos(1))
+    except ValueError:
+        raise exceptions.BadValue(
+            path_for_exception,
+            "Could not parse duration number '" + number_string + "'",
+            origin=origin_for_exception)
+
+
+def _make_units_map():
+    """
+    :return: dict<String, int> - unit string to number of bytes
+    """
+    units = [("", 1024, 0)]
+    for power, (si, iec) in enumerate((
+            ("kilo", "kibi"), ("mega", "mebi"), ("giga", "gibi"),
+            ("tera", "tebi"), ("peta", "pebi"), ("exa", "exbi"),
+            ("zetta", "zebi"), ("yotta", "yobi"))):
+        units.append((si, 1000, power + 1))
+        units.append((iec, 1024, power + 1))
+
+    m = {}
+    for prefix, power_of, power in units:
+        bytes = power_of ** power
+        m[prefix + "byte"] = bytes
+        m[prefix + "bytes"] = bytes
+        if len(prefix) == 0:
+            m["b"] = bytes
+            m["B"] = bytes
+            m[""] = bytes  # no unit specified means bytes
+        else:
+            first = prefix[0]
+            first_upper = first.upper()
+            if power_of == 1024:
+                m[first] = bytes  # 512m
+                m[first_upper] = bytes  # 512M
+                m[first_upper + "i"] = bytes  # 512Mi
+                m[first_upper + "iB"] = bytes  # 512MiB
+            elif power == 1:
+                m[first + "B"] = bytes  # 512kB
+            else:
+                m[first_upper + "B"] = bytes  # 512MB
+    return m
+
+
+_memory_units = _make_units_map()
+
+
+def parse_bytes(input, origin_for_exception, path_for_exception):
+    """
+    Parses a size-in-bytes string. If no units are specified in the string,
+    it is assumed to be in bytes. The returned value is in bytes. The purpose
+    of this function is to implement the size-in-bytes-related methods in the
+    Config interface.
+
+    :param input: String - the string to parse
+    :param origin_for_exception: ConfigOrigin - origin of the value being
+        parsed
+    :param path_for_exception: String - path to include in exceptions
+    :return: int - size in bytes
+    :raise BadValue: if string is invalid
+    """
+    s = util.unicode_trim(input)
+    unit_string = _get_units(s)
+    number_string = util.unicode_trim(s[:len(s) - len(unit_string)])
+
+    # this would be caught later anyway, but the error message
+    # is more helpful if we check it here.
+    if len(number_string) == 0:
+        raise exceptions.BadValue(
+            path_for_exception,
+            "No number in size-in-bytes value '" + input + "'",
+            origin=origin_for_exception)
+
+    units = _memory_units.get(unit_string)
+
+    if units is None:
+        raise exceptions.BadValue(
+            path_for_exception,
+            "Could not parse size-in-bytes unit '" + unit_string
+            + "' (try k, K, kB, KiB, kilobytes, kibibytes)",
+            origin=origin_for_exception)
+
+    try:
+        # if the string is purely digits, parse as an integer to avoid
+        # possible precision loss; otherwise as a double.
+        if _digits.match(number_string):
+            return int(number_string) * units
+        else:
+            return int(float(number_string) * units)
+    except ValueError:
+        raise exceptions.BadValue(
+            path_for_exception,
+            "Could not parse size-in-bytes number '" + number_string + "'",
+            origin=origin_for_exception)
+
+
+def _add_problem(accumulator, path, origin, problem):
+    accumulator.append(
+        exceptions.ValidationProblem(str(path), origin, problem))
+
+
+def _get_desc(ref_value):
+    """
+    :param ref_value: ConfigValue
+    :return: String
+    """
+    if isinstance(ref_value, AbstractConfigObject):
+        if ref_value.is_empty():
+            return "object"
+        else:
+            return "object with keys " + repr(sorted(ref_value.keys()))
+    elif isinstance(ref_value, SimpleConfigList):
+        return "list"
+    else:
+        return ref_value.value_type().name.lower()
+
+
+def _add_missing(accumulator, ref_value, path, origin):
+    _add_problem(accumulator, path, origin,
+                 "No setting at '" + str(path) + "', expecting: "
+                 + _get_desc(ref_value))
+
+
+def _add_wrong_type(accumulator, ref_value, actual, path):
+    _add_problem(accumulator, path, actual.origin(),
+                 "Wrong value type at '" + str(path) + "', expecting: "
+                 + _get_desc(ref_value) + " but got: " + _get_desc(actual))
+
+
+def _could_be_null(v):
+    return DefaultTransformer.transform(v, ConfigValueType.null) \
+        .value_type() == ConfigValueType.null
+
+
+def _have_compatible_types(reference, value):
+    if _could_be_null(reference) or _could_be_null(value):
+        # we allow any setting to be null
+        return True
+    elif isinstance(reference, AbstractConfigObject):
+        return isinstance(value, AbstractConfigObject)
+    elif isinstance(reference, SimpleConfigList):
+        # objects may be convertible to lists if they have numeric keys
+        return isinstance(value, (SimpleConfigList, SimpleConfigObject))
+    elif isinstance(reference, ConfigString):
+        # assume a string could be gotten as any non-collection type;
+        # allows things like get_milliseconds including domain-specific
+        # interpretations of strings
+        return True
+    elif isinstance(value, ConfigString):
+        # assume a string could be gotten as any non-collection type
+        return True
+    else:
+        return reference.value_type() == value.value_type()
+
+
+def _check_valid_object(path, reference, value, accumulator):
+    """
+    path is None if we're at the root
+    """
+    for key, ref in reference.items():
+        if path is not None:
+            child_path = Path.new_key(key).prepend(path)
+        else:
+            child_path = Path.new_key(key)
+
+        v = value.get(key)
+        if v is None:
+            _add_missing(accumulator, ref, child_path, value.origin())
+        else:
+            _check_valid(child_path, ref, v, accumulator)
+
+
+def _check_list_compatibility(path, list_ref, list_value, accumulator):
+    if list_ref.is_empty() or list_value.is_empty():
+        # can't verify type, leave alone
+        pass
+    else:
+        ref_element = list_ref[0]
+        for e in list_value:
+            if not _have_compatible_types(ref_element, e):
+                _add_problem(
+                    accumulator, path, e.origin(),
+                    "List at '" + str(path)
+                    + "' contains wrong value type, expecting list of "
+                    + _get_desc(ref_element) + " but got element of type "
+                    + _get_desc(e))
+                # don't add a problem for every last array element
+                break
+
+
+def _check_valid(path, reference, value, accumulator):
+    # Unmergeable is supposed to be impossible to encounter in here
+    # because we check for resolve status up front.
+
+    if _have_compatible_types(reference, value):
+        if isinstance(reference, AbstractConfigObject) \
+                and isinstance(value, AbstractConfigObject):
+            _check_valid_object(path, reference, value, accumulator)
+        elif isinstance(reference, SimpleConfigList) \
+                and isinstance(value, SimpleConfigList):
+            _check_list_compatibility(path, reference, value, accumulator)
+        elif isinstance(reference, SimpleConfigList) \
+                and isinstance(value, SimpleConfigObject):
+            # attempt conversion of indexed object to list
+            list_value = DefaultTransformer.transform(value,
+                                                      ConfigValueType.list)
+            if isinstance(list_value, SimpleConfigList):
+                _check_list_compatibility(path, reference, list_value,
+                                          accumulator)
+            else:
+                _add_wrong_type(accumulator, reference, value, path)
+    else:
+        _add_wrong_type(accumulator, reference, value, path)
@@ -0,0 +1,128 @@
+from ..ConfigList import ConfigList
+from ..ConfigValueType import ConfigValueType
+
+from .AbstractConfigValue import AbstractConfigValue
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+class SimpleConfigList(AbstractConfigValue, ConfigList):
+    """
+    Attributes:
+
+        _value: List<AbstractConfigValue> - never modified
+
+        _resolved: boolean
+    """
+
+    def __init__(self, origin, value, status=None):
+        """
+        :param origin: ConfigOrigin
+        :param value: List<AbstractConfigValue>
+        :param status: ResolveStatus - from the values if None
+        """
+        super(SimpleConfigList, self).__init__(origin)
+        if status is None:
+            status = ResolveStatus.from_values(value)
+        self._value = value
+        self._resolved = status == ResolveStatus.resolved
+
+    def value_type(self):
+        return ConfigValueType.list
+
+    def unwrapped(self):
+        """
+        :return: List<Object>
+        """
+        return [v.unwrapped() for v in self._value]
+
+    def resolve_status(self):
+        return ResolveStatus.from_boolean(self._resolved)
+
+    def _modify(self, modifier, new_resolve_status):
+        """
+        :param modifier: function(AbstractConfigValue) ->
+            AbstractConfigValue - None drops the element
+        :param new_resolve_status: ResolveStatus
+        :return: SimpleConfigList - self if nothing changed
+        """
+        # lazy-create for optimization
+        changed = None
+        for i, v in enumerate(self._value):
+            modified = modifier(v)
+
+            # lazy-create the new list if required
+            if changed is None and modified is not v:
+                changed = list(self._value[:i])
+
+            # once the new list is created, all elements have to go in it.
+            # if the modifier returned None, we drop that element.
+            if changed is not None and modified is not None:
+                changed.append(modified)
+
+        if changed is not None:
+            return SimpleConfigList(self.origin(), changed,
+                                    new_resolve_status)
+        else:
+            return self
+
+    def resolve_substitutions(self, context):
+        if self._resolved:
+            return self
+
+        if context.is_restricted_to_child():
+            # if a list restricts to a child path, then it has no child
+            # paths, so nothing to do.
+            return self
+        else:
+            return self._modify(context.resolve, ResolveStatus.resolved)
+
+    def relativized(self, prefix):
+        return self._modify(lambda v: v.relativized(prefix),
+                            self.resolve_status())
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality
+        return isinstance(other, SimpleConfigList) \
+            and self._value == other._value
+
+    def __hash__(self):
+        # note that "origin" is deliberately NOT part of equality
+        return hash(tuple(self._value))
+
+    def __contains__(self, v):
+        return v in self._value
+
+    def __getitem__(self, index):
+        return self._value[index]
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __len__(self):
+        return len(self._value)
+
+    def index(self, v):
+        """
+        :param v: ConfigValue
+        :return: int
+        """
+        return self._value.index(v)
+
+    def is_empty(self):
+        """
+        :return: boolean
+        """
+        return len(self._value) == 0
+
+    def new_copy(self, origin):
+        return SimpleConfigList(origin, self._value, self.resolve_status())
+
+    def concatenate(self, other):
+        """
+        :param other: SimpleConfigList
+        :return: SimpleConfigList
+        """
+        combined_origin = SimpleConfigOrigin.merge_origins(
+            [self.origin(), other.origin()])
+        return SimpleConfigList(combined_origin, self._value + other._value)
@@ -0,0 +1,329 @@
+from .. import exceptions
+from ..ConfigObject import ConfigObject
+
+from .AbstractConfigObject import AbstractConfigObject
+from .Path import Path
+from .ResolveStatus import ResolveStatus
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+EMPTY_NAME = "empty config"
+
+
+class SimpleConfigObject(AbstractConfigObject):
+    """
+    Attributes:
+
+        _value: Dict<String, AbstractConfigValue> - never modified, assume
+            immutable
+
+        _resolved: boolean
+
+        _ignores_fallbacks: boolean
+    """
+
+    def __init__(self, origin, value, status=None, ignores_fallbacks=False):
+        """
+        Java checks status against the values in the constructor, which
+        makes it as expensive as working it out; here it's only worked out
+        when it isn't given.
+
+        :param origin: ConfigOrigin
+        :param value: Dict<String, AbstractConfigValue>
+        :param status: ResolveStatus - from the values if None
+        :param ignores_fallbacks: boolean
+        """
+        super(SimpleConfigObject, self).__init__(origin)
+        if value is None:
+            raise exceptions.BugOrBroken(
+                "creating config object with null map")
+        if status is None:
+            status = ResolveStatus.from_values(value.values())
+        self._value = value
+        self._resolved = status == ResolveStatus.resolved
+        self._ignores_fallbacks = ignores_fallbacks
+
+    def with_only_key(self, key):
+        return self.with_only_path(Path.new_key(key))
+
+    def without_key(self, key):
+        return self.without_path(Path.new_key(key))
+
+    def with_only_path_or_none(self, path):
+        """
+        Gets the object with only the path if the path exists, otherwise
+        None if it doesn't. This ensures that if we have { a : { b : 42 } }
+        and do with_only_path("a.b.c") that we don't keep an empty "a"
+        object.
+        """
+        key = path.first
+        next = path.remainder
+        v = self._value.get(key)
+
+        if next is not None:
+            if isinstance(v, AbstractConfigObject):
+                v = v.with_only_path_or_none(next)
+            else:
+                # if the path has more elements but we don't have an
+                # object, then the rest of the path does not exist.
+                v = None
+
+        if v is None:
+            return None
+        else:
+            return SimpleConfigObject(self.origin(), {key: v},
+                                      v.resolve_status(),
+                                      self._ignores_fallbacks)
+
+    def with_only_path(self, path):
+        o = self.with_only_path_or_none(path)
+        if o is None:
+            return SimpleConfigObject(self.origin(), {},
+                                      ResolveStatus.resolved,
+                                      self._ignores_fallbacks)
+        else:
+            return o
+
+    def without_path(self, path):
+        key = path.first
+        next = path.remainder
+        v = self._value.get(key)
+
+        if v is not None and next is not None \
+                and isinstance(v, AbstractConfigObject):
+            v = v.without_path(next)
+            updated = dict(self._value)
+            updated[key] = v
+            return SimpleConfigObject(
+                self.origin(), updated,
+                ResolveStatus.from_values(updated.values()),
+                self._ignores_fallbacks)
+        elif next is not None or v is None:
+            # can't descend, nothing to remove
+            return self
+        else:
+            smaller = dict(self._value)
+            del smaller[key]
+            return SimpleConfigObject(
+                self.origin(), smaller,
+                ResolveStatus.from_values(smaller.values()),
+                self._ignores_fallbacks)
+
+    def with_value(self, key, v):
+        """
+        :param key: String, or a Path to set the value deeper down
+        :param v: AbstractConfigValue
+        :return: SimpleConfigObject
+        """
+        if isinstance(key, Path):
+            return self._with_value_at_path(key, v)
+
+        if v is None:
+            raise exceptions.BugOrBroken(
+                "Trying to store null ConfigValue in a ConfigObject")
+
+        new_map = dict(self._value)
+        new_map[key] = v
+
+        return SimpleConfigObject(
+            self.origin(), new_map,
+            ResolveStatus.from_values(new_map.values()),
+            self._ignores_fallbacks)
+
+    def _with_value_at_path(self, path, v):
+        """
+        :param path: Path
+        :param v: AbstractConfigValue
+        :return: SimpleConfigObject
+        """
+        key = path.first
+        next = path.remainder
+
+        if next is None:
+            return self.with_value(key, v)
+        else:
+            child = self._value.get(key)
+            if isinstance(child, AbstractConfigObject):
+                # if we have an object, add to it
+                return self.with_value(key, child.with_value(next, v))
+            else:
+                # as soon as we have a non-object, replace it entirely
+                subtree = v.at_path(next, SimpleConfigOrigin.new_simple(
+                    "withValue(" + str(next) + ")"))
+                return self.with_value(key, subtree.root())
+
+    def attempt_peek_with_partial_resolve(self, key):
+        return self._value.get(key)
+
+    def new_copy(self, status, origin, ignores_fallbacks=None):
+        if ignores_fallbacks is None:
+            ignores_fallbacks = self._ignores_fallbacks
+        return SimpleConfigObject(origin, self._value, status,
+                                  ignores_fallbacks)
+
+    def with_fallbacks_ignored(self):
+        if self._ignores_fallbacks:
+            return self
+        else:
+            return self.new_copy(self.resolve_status(), self.origin(), True)
+
+    def resolve_status(self):
+        return ResolveStatus.from_boolean(self._resolved)
+
+    def ignores_fallbacks(self):
+        return self._ignores_fallbacks
+
+    def unwrapped(self):
+        """
+        :return: Dict<String, Object>
+        """
+        return dict((k, v.unwrapped()) for k, v in self._value.items())
+
+    def merged_with_object(self, fallback):
+        from . import Merger
+
+        self.require_not_ignoring_fallbacks()
+        return Merger.merged_with_object(self, fallback)
+
+    def _modify(self, modifier):
+        """
+        :param modifier: function(String, AbstractConfigValue) ->
+            AbstractConfigValue - None removes the child
+        :return: SimpleConfigObject - self if nothing changed
+        """
+        changes = None
+        for k, v in self._value.items():
+            modified = modifier(k, v)
+            if modified is not v:
+                if changes is None:
+                    changes = {}
+                changes[k] = modified
+
+        if changes is None:
+            return self
+
+        modified = {}
+        saw_unresolved = False
+        for k, v in self._value.items():
+            if k in changes:
+                v = changes[k]
+                if v is None:
+                    # remove this child; don't put it in the new map.
+                    continue
+            modified[k] = v
+            if v.resolve_status() == ResolveStatus.unresolved:
+                saw_unresolved = True
+
+        return SimpleConfigObject(
+            self.origin(), modified,
+            ResolveStatus.unresolved if saw_unresolved
+            else ResolveStatus.resolved,
+            self._ignores_fallbacks)
+
+    def resolve_substitutions(self, context):
+        if self._resolved:
+            return self
+
+        if context.is_restricted_to_child():
+            restrict = context.restrict_to_child()
+
+            def modifier(key, v):
+                if key == restrict.first:
+                    remainder = restrict.remainder
+                    if remainder is not None:
+                        return context.restrict(remainder).resolve(v)
+                    else:
+                        # we don't want to resolve the leaf child.
+                        return v
+                else:
+                    # not in the restrictToChild path
+                    return v
+        else:
+            unrestricted = context.unrestricted()
+
+            def modifier(key, v):
+                # no restrictToChild, resolve everything
+                return unrestricted.resolve(v)
+
+        return self._modify(modifier)
+
+    def relativized(self, prefix):
+        return self._modify(lambda key, v: v.relativized(prefix))
+
+    def get(self, key):
+        return self._value.get(key)
+
+    def items(self):
+        """
+        :return: Iterable<(String, AbstractConfigValue)>
+        """
+        return self._value.items()
+
+    def keys(self):
+        """
+        :return: Iterable<String>
+        """
+        return self._value.keys()
+
+    def values(self):
+        """
+        :return: Iterable<AbstractConfigValue>
+        """
+        return self._value.values()
+
+    def is_empty(self):
+        return len(self._value) == 0
+
+    def __len__(self):
+        return len(self._value)
+
+    def __contains__(self, key):
+        return key in self._value
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __eq__(self, other):
+        # note that "origin" is deliberately NOT part of equality.
+        # neither are other "extras" like ignoresFallbacks or resolve
+        # status.
+        if isinstance(other, SimpleConfigObject):
+            return self._value == other._value
+        elif isinstance(other, ConfigObject):
+            return set(self.keys()) == set(other.keys()) \
+                and all(v == other.get(k) for k, v in self.items())
+        else:
+            return False
+
+    def __hash__(self):
+        # the keys have to be sorted, otherwise we could be equal to
+        # another map but have a different hash.
+        keys = tuple(sorted(self._value.keys()))
+        values_hash = sum(hash(v) for v in self._value.values())
+        return hash((keys, values_hash))
+
+    @classmethod
+    def empty(cls, origin=None):
+        """
+        :param origin: ConfigOrigin
+        :return: SimpleConfigObject
+        """
+        if origin is None:
+            return _EMPTY_INSTANCE
+        else:
+            return SimpleConfigObject(origin, {})
+
+    @classmethod
+    def empty_missing(cls, base_origin):
+        """
+        :param base_origin: ConfigOrigin
+        :return: SimpleConfigObject
+        """
+        return SimpleConfigObject(
+            SimpleConfigOrigin.new_simple(
+                base_origin.description() + " (not found)"),
+            {})
+
+
+_EMPTY_INSTANCE = SimpleConfigObject(
+    SimpleConfigOrigin.new_simple(EMPTY_NAME), {})
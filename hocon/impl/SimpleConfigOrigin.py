@@ -0,0 +1,513 @@
+import os
+
+try:
+    import urlparse
+    from urllib import pathname2url, url2pathname
+except ImportError:
+    from urllib import parse as urlparse
+    from urllib.request import pathname2url, url2pathname
+
+from .. import exceptions
+from ..ConfigOrigin import ConfigOrigin
+
+from .OriginType import OriginType
+
+
+MERGE_OF_PREFIX = "merge of "
+
+
+class SimpleConfigOrigin(ConfigOrigin):
+    """
+    It would be cleaner to have a class hierarchy for various origin types,
+    but was hoping this would be enough simpler to be a little messy. eh.
+
+    Origins are immutable and every value has one, so they have no
+    instance dict.
+    """
+
+    __slots__ = ('_description', '_line_number', '_end_line_number',
+                 '_origin_type', '_url', '_comments')
+
+    def __init__(self, description, line_number, end_line_number,
+                 origin_type, url, comments):
+        """
+        :param description: String
+        :param line_number: int - -1 if none
+        :param end_line_number: int - -1 if none
+        :param origin_type: OriginType
+        :param url: String - or None
+        :param comments: List<String> - or None
+        """
+        if description is None:
+            raise exceptions.BugOrBroken("description may not be null")
+        self._description = description
+        self._line_number = line_number
+        self._end_line_number = end_line_number
+        self._origin_type = origin_type
+        self._url = url
+        self._comments = list(comments) if comments is not None else None
+
+    @classmethod
+    def new_simple(cls, description):
+        """
+        :param description: String
+        :return: SimpleConfigOrigin
+        """
+        return SimpleConfigOrigin(description, -1, -1, OriginType.generic,
+                                  None, None)
+
+    @classmethod
+    def new_file(cls, filename):
+        """
+        :param filename: String - path
+        :return: SimpleConfigOrigin
+        """
+        url = urlparse.urljoin(
+            'file:', pathname2url(os.path.abspath(filename)))
+        return SimpleConfigOrigin(filename, -1, -1, OriginType.file, url,
+                                  None)
+
+    @classmethod
+    def new_url(cls, url):
+        """
+        :param url: String
+        :return: SimpleConfigOrigin
+        """
+        return SimpleConfigOrigin(url, -1, -1, OriginType.url, url, None)
+
+    @classmethod
+    def new_resource(cls, resource, url=None):
+        """
+        :param resource: String
+        :param url: String
+        :return: SimpleConfigOrigin
+        """
+        return SimpleConfigOrigin(resource, -1, -1, OriginType.resource,
+                                  url, None)
+
+    def set_line_number(self, line_number):
+        """
+        :param line_number: int
+        :return: SimpleConfigOrigin
+        """
+        if line_number == self._line_number \
+                and line_number == self._end_line_number:
+            return self
+        else:
+            return SimpleConfigOrigin(
+                self._description, line_number, line_number,
+                self._origin_type, self._url, self._comments)
+
+    def add_url(self, url):
+        """
+        :param url: String
+        :return: SimpleConfigOrigin
+        """
+        return SimpleConfigOrigin(
+            self._description, self._line_number, self._end_line_number,
+            self._origin_type, url, self._comments)
+
+    def set_comments(self, comments):
+        """
+        :param comments: List<String>
+        :return: SimpleConfigOrigin
+        """
+        if comments == self._comments:
+            return self
+        else:
+            return SimpleConfigOrigin(
+                self._description, self._line_number, self._end_line_number,
+                self._origin_type, self._url, comments)
+
+    def prepend_comments(self, comments):
+        """
+        :param comments: List<String>
+        :return: SimpleConfigOrigin
+        """
+        if comments is None or comments == self._comments:
+            return self
+        elif self._comments is None:
+            return self.set_comments(comments)
+        else:
+            return self.set_comments(list(comments) + self._comments)
+
+    def append_comments(self, comments):
+        """
+        :param comments: List<String>
+        :return: SimpleConfigOrigin
+        """
+        if comments is None or comments == self._comments:
+            return self
+        elif self._comments is None:
+            return self.set_comments(comments)
+        else:
+            return self.set_comments(self._comments + list(comments))
+
+    def description(self):
+        # not putting the URL in here for files and resources, because
+        # people parsing "file: line" syntax would hit the ":" in the URL.
+        if self._line_number < 0:
+            return self._description
+        elif self._end_line_number == self._line_number:
+            return self._description + ": " + str(self._line_number)
+        else:
+            return self._description + ": " + str(self._line_number) \
+                + "-" + str(self._end_line_number)
+
+    def _key(self):
+        return (self._description, self._line_number, self._end_line_number,
+                self._origin_type, self._url)
+
+    def __eq__(self, other):
+        return isinstance(other, SimpleConfigOrigin) \
+            and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        # the url is only really useful on top of description for resources
+        if self._origin_type == OriginType.resource and self._url is not None:
+            return "ConfigOrigin(" + self._description + "," + self._url \
+                + ")"
+        else:
+            return "ConfigOrigin(" + self._description + ")"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def filename(self):
+        if self._origin_type == OriginType.file:
+            return self._description
+        elif self._url is not None:
+            parsed = urlparse.urlparse(self._url)
+            if parsed.scheme == 'file':
+                return url2pathname(parsed.path)
+            else:
+                return None
+        else:
+            return None
+
+    def url(self):
+        """
+        :return: String - or None
+        """
+        return self._url
+
+    def resource(self):
+        if self._origin_type == OriginType.resource:
+            return self._description
+        else:
+            return None
+
+    def line_number(self):
+        return self._line_number
+
+    def comments(self):
+        if self._comments is not None:
+            return list(self._comments)
+        else:
+            return []
+
+    @classmethod
+    def _merge_two(cls, a, b):
+        """
+        :param a: SimpleConfigOrigin
+        :param b: SimpleConfigOrigin
+        :return: SimpleConfigOrigin
+        """
+        if a._origin_type == b._origin_type:
+            merged_type = a._origin_type
+        else:
+            merged_type = OriginType.generic
+
+        # first use the "description" field which has no line numbers
+        # cluttering it.
+        a_desc = a._description
+        b_desc = b._description
+        if a_desc.startswith(MERGE_OF_PREFIX):
+            a_desc = a_desc[len(MERGE_OF_PREFIX):]
+        if b_desc.startswith(MERGE_OF_PREFIX):
+            b_desc = b_desc[len(MERGE_OF_PREFIX):]
+
+        if a_desc == b_desc:
+            merged_desc = a_desc
+
+            if a._line_number < 0:
+                merged_start_line = b._line_number
+            elif b._line_number < 0:
+                merged_start_line = a._line_number
+            else:
+                merged_start_line = min(a._line_number, b._line_number)
+
+            merged_end_line = max(a._end_line_number, b._end_line_number)
+        else:
+            # this whole merge song-and-dance was intended to avoid this
+            # case whenever possible, but we've lost. Now we have to lose
+            # some structured information and cram into a string.
+
+            # description() method includes line numbers, so use it
+            # instead of description field.
+            a_full = a.description()
+            b_full = b.description()
+            if a_full.startswith(MERGE_OF_PREFIX):
+                a_full = a_full[len(MERGE_OF_PREFIX):]
+            if b_full.startswith(MERGE_OF_PREFIX):
+                b_full = b_full[len(MERGE_OF_PREFIX):]
+
+            merged_desc = MERGE_OF_PREFIX + a_full + "," + b_full
+
+            merged_start_line = -1
+            merged_end_line = -1
+
+        if a._url == b._url:
+            merged_url = a._url
+        else:
+            merged_url = None
+
+        if a._comments == b._comments:
+            merged_comments = a._comments
+        else:
+            merged_comments = []
+            if a._comments is not None:
+                merged_comments.extend(a._comments)
+            if b._comments is not None:
+                merged_comments.extend(b._comments)
+
+        return SimpleConfigOrigin(merged_desc, merged_start_line,
+                                  merged_end_line, merged_type, merged_url,
+                                  merged_comments)
+
+    @classmethod
+    def _similarity(cls, a, b):
+        """
+        :return: int
+        """
+        count = 0
+
+        if a._origin_type == b._origin_type:
+            count += 1
+
+        if a._description == b._description:
+            count += 1
+
+            # only count these if the description field (which is the file
+            # or resource name) also matches.
+            if a._line_number == b._line_number:
+                count += 1
+            if a._end_line_number == b._end_line_number:
+                count += 1
+            if a._url == b._url:
+                count += 1
+
+        return count
+
+    @classmethod
+    def _merge_three(cls, a, b, c):
+        """
+        This picks the best pair to merge, because the pair has the most in
+        common. we want to merge two lines in the same file rather than
+        something else with one of the lines; because two lines in the same
+        file can be better consolidated.
+        """
+        merge_two = SimpleConfigOrigin._merge_two
+        similarity = SimpleConfigOrigin._similarity
+        if similarity(a, b) >= similarity(b, c):
+            return merge_two(merge_two(a, b), c)
+        else:
+            return merge_two(a, merge_two(b, c))
+
+    @classmethod
+    def merge_origins(cls, stack):
+        """
+        :param stack: List<ConfigOrigin>
+        :return: ConfigOrigin
+        """
+        if len(stack) == 0:
+            raise exceptions.BugOrBroken("can't merge empty list of origins")
+        elif len(stack) == 1:
+            return stack[0]
+        elif len(stack) == 2:
+            return SimpleConfigOrigin._merge_two(stack[0], stack[1])
+        else:
+            remaining = list(stack)
+            while len(remaining) > 2:
+                c = remaining.pop()
+                b = remaining.pop()
+                a = remaining.pop()
+                remaining.append(SimpleConfigOrigin._merge_three(a, b, c))
+
+            # should be down to either 1 or 2
+            return SimpleConfigOrigin.merge_origins(remaining)
+
+    def to_fields(self):
+        """
+        :return: Dict<SerializedField, Object>
+        """
+        from .SerializedConfigValue import SerializedField
+
+        m = {SerializedField.origin_description: self._description}
+
+        if self._line_number >= 0:
+            m[SerializedField.origin_line_number] = self._line_number
+        if self._end_line_number >= 0:
+            m[SerializedField.origin_end_line_number] = self._end_line_number
+
+        m[SerializedField.origin_type] = self._origin_type
+
+        if self._url is not None:
+            m[SerializedField.origin_url] = self._url
+        if self._comments is not None:
+            m[SerializedField.origin_comments] = self._comments
+
+        return m
+
+    def to_fields_delta(self, base_origin):
+        """
+        :param base_origin: SimpleConfigOrigin
+        :return: Dict<SerializedField, Object>
+        """
+        if base_origin is not None:
+            base_fields = base_origin.to_fields()
+        else:
+            base_fields = {}
+        return fields_delta(base_fields, self.to_fields())
+
+    @classmethod
+    def from_fields(cls, m):
+        """
+        :param m: Dict<SerializedField, Object>
+        :return: SimpleConfigOrigin
+        :raises: IOError if there's no origin type
+        """
+        from .SerializedConfigValue import SerializedField
+
+        # we represent a null origin as one with no fields at all
+        if len(m) == 0:
+            return None
+
+        origin_type = m.get(SerializedField.origin_type)
+        if origin_type is None:
+            raise IOError("Missing ORIGIN_TYPE field")
+        return SimpleConfigOrigin(
+            m.get(SerializedField.origin_description),
+            m.get(SerializedField.origin_line_number, -1),
+            m.get(SerializedField.origin_end_line_number, -1),
+            origin_type,
+            m.get(SerializedField.origin_url),
+            m.get(SerializedField.origin_comments))
+
+    @classmethod
+    def from_base(cls, base_origin, delta):
+        """
+        :param base_origin: SimpleConfigOrigin
+        :param delta: Dict<SerializedField, Object>
+        :return: SimpleConfigOrigin
+        """
+        if base_origin is not None:
+            base_fields = base_origin.to_fields()
+        else:
+            base_fields = {}
+        return SimpleConfigOrigin.from_fields(
+            apply_fields_delta(base_fields, delta))
+
+
+def fields_delta(base, child):
+    """
+    Here we're trying to avoid serializing the same info over and over
+    in the common case that child objects have the same origin fields
+    as their parent objects. e.g. we don't need to store the source
+    filename with every single value.
+
+    :param base: Dict<SerializedField, Object>
+    :param child: Dict<SerializedField, Object>
+    :return: Dict<SerializedField, Object>
+    """
+    from .SerializedConfigValue import SerializedField
+
+    m = dict(child)
+
+    for f, base_value in base.items():
+        if f in m and base_value == m[f]:
+            # if field is unchanged, just remove it so we inherit
+            del m[f]
+        elif f not in m:
+            # if field has been removed, we have to add a deletion entry
+            if f == SerializedField.origin_description:
+                raise exceptions.BugOrBroken(
+                    "origin missing description field? " + repr(child))
+            elif f == SerializedField.origin_line_number:
+                m[SerializedField.origin_line_number] = -1
+            elif f == SerializedField.origin_end_line_number:
+                m[SerializedField.origin_end_line_number] = -1
+            elif f == SerializedField.origin_type:
+                raise exceptions.BugOrBroken(
+                    "should always be an ORIGIN_TYPE field")
+            elif f == SerializedField.origin_url:
+                m[SerializedField.origin_null_url] = ""
+            elif f == SerializedField.origin_comments:
+                m[SerializedField.origin_null_comments] = ""
+            elif f in (SerializedField.origin_null_url,
+                       SerializedField.origin_null_comments):
+                raise exceptions.BugOrBroken(
+                    "computing delta, base object should not contain "
+                    + str(f) + " " + repr(base))
+            else:
+                raise exceptions.BugOrBroken(
+                    "should not appear here: " + str(f))
+        else:
+            # field is in base and child, but differs, so leave it
+            pass
+
+    return m
+
+
+def apply_fields_delta(base, delta):
+    """
+    :param base: Dict<SerializedField, Object>
+    :param delta: Dict<SerializedField, Object>
+    :return: Dict<SerializedField, Object>
+    """
+    from .SerializedConfigValue import SerializedField
+
+    m = dict(delta)
+
+    for f, base_value in base.items():
+        if f in delta:
+            # delta overrides when keys are in both
+            # "m" should already contain the right thing
+            continue
+        # base has the key and delta does not.
+        # we inherit from base unless a "NULL" key blocks.
+        if f == SerializedField.origin_url:
+            if SerializedField.origin_null_url in delta:
+                del m[SerializedField.origin_null_url]
+            else:
+                m[f] = base_value
+        elif f == SerializedField.origin_comments:
+            if SerializedField.origin_null_comments in delta:
+                del m[SerializedField.origin_null_comments]
+            else:
+                m[f] = base_value
+        elif f in (SerializedField.origin_null_url,
+                   SerializedField.origin_null_comments):
+            # base objects shouldn't contain these, should just
+            # lack the field. these are only in deltas.
+            raise exceptions.BugOrBroken(
+                "applying fields, base object should not contain "
+                + str(f) + " " + repr(base))
+        elif f in (SerializedField.origin_description,
+                   SerializedField.origin_end_line_number,
+                   SerializedField.origin_line_number,
+                   SerializedField.origin_type):
+            m[f] = base_value
+        else:
+            raise exceptions.BugOrBroken("should not appear here: " + str(f))
+    return m
@@ -1,37 +0,0 @@
-/**
- *   Copyright (C) 2011-2012 Typesafe Inc. <http://typesafe.com>
- */
-package com.typesafe.config.impl;
-
-import com.typesafe.config.ConfigIncludeContext;
-import com.typesafe.config.ConfigParseOptions;
-import com.typesafe.config.ConfigParseable;
-
-class SimpleIncludeContext implements ConfigIncludeContext {
-
-    private final Parseable parseable;
-
-    SimpleIncludeContext(Parseable parseable) {
-        this.parseable = parseable;
-    }
-
-    SimpleIncludeContext withParseable(Parseable parseable) {
-        if (parseable == this.parseable)
-            return this;
-        else
-            return new SimpleIncludeContext(parseable);
-    }
-
-    @Override
-    public ConfigParseable relativeTo(String filename) {
-        if (parseable != null)
-            return parseable.relativeTo(filename);
-        else
-            return null;
-    }
-
-    @Override
-    public ConfigParseOptions parseOptions() {
-        return SimpleIncluder.clearForInclude(parseable.options());
-    }
-}
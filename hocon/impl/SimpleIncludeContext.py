@@ -0,0 +1,36 @@
+from ..ConfigIncludeContext import ConfigIncludeContext
+
+from .SimpleIncluder import SimpleIncluder
+
+
+class SimpleIncludeContext(ConfigIncludeContext):
+    """
+    Attributes:
+
+        _parseable: Parseable
+    """
+
+    def __init__(self, parseable):
+        """
+        :param parseable: Parseable
+        """
+        self._parseable = parseable
+
+    def with_parseable(self, parseable):
+        """
+        :param parseable: Parseable
+        :return: SimpleIncludeContext
+        """
+        if parseable is self._parseable:
+            return self
+        else:
+            return SimpleIncludeContext(parseable)
+
+    def relative_to(self, filename):
+        if self._parseable is not None:
+            return self._parseable.relative_to(filename)
+        else:
+            return None
+
+    def parse_options(self):
+        return SimpleIncluder.clear_for_include(self._parseable.options())
@@ -0,0 +1,319 @@
+try:
+    import urlparse
+except ImportError:
+    from urllib import parse as urlparse
+
+from .. import exceptions
+from ..ConfigIncluderClasspath import ConfigIncluderClasspath
+from ..ConfigIncluderFile import ConfigIncluderFile
+from ..ConfigIncluderURL import ConfigIncluderURL
+from ..ConfigSyntax import ConfigSyntax
+
+from .FullIncluder import FullIncluder
+from .SimpleConfigObject import SimpleConfigObject
+from .SimpleConfigOrigin import SimpleConfigOrigin
+
+
+def _is_url(name):
+    """
+    Java tries new URL(name); here anything with a scheme is a URL, except
+    a single letter, which is a Windows drive.
+
+    :param name: String
+    :return: boolean
+    """
+    return len(urlparse.urlparse(name).scheme) > 1
+
+
+class SimpleIncluder(FullIncluder):
+    """
+    Attributes:
+
+        _fallback: ConfigIncluder - or None
+    """
+
+    def __init__(self, fallback):
+        """
+        :param fallback: ConfigIncluder - or None
+        """
+        self._fallback = fallback
+
+    @staticmethod
+    def clear_for_include(options):
+        """
+        ConfigIncludeContext does this for us on its options.
+
+        :param options: ConfigParseOptions
+        :return: ConfigParseOptions
+        """
+        # the includer is inherited, but not this other stuff.
+        return options.set_syntax(None).set_origin_description(None) \
+            .set_allow_missing(True)
+
+    def include(self, context, name):
+        """
+        This is the heuristic includer.
+        """
+        obj = SimpleIncluder.include_without_fallback(context, name)
+
+        # now use the fallback includer if any and merge its result.
+        if self._fallback is not None:
+            return obj.with_fallback(self._fallback.include(context, name))
+        else:
+            return obj
+
+    @staticmethod
+    def include_without_fallback(context, name):
+        """
+        The heuristic includer in static form.
+
+        :param context: ConfigIncludeContext
+        :param name: String
+        :return: ConfigObject
+        """
+        # the heuristic is valid URL then URL, else relative to including
+        # file.
+        if _is_url(name):
+            return SimpleIncluder.include_url_without_fallback(context, name)
+        else:
+            source = _relative_name_source(context)
+            return SimpleIncluder.from_basename(source, name,
+                                                context.parse_options())
+
+    def include_url(self, context, url):
+        obj = SimpleIncluder.include_url_without_fallback(context, url)
+
+        # now use the fallback includer if any and merge its result.
+        if isinstance(self._fallback, ConfigIncluderURL):
+            return obj.with_fallback(
+                self._fallback.include_url(context, url))
+        else:
+            return obj
+
+    @staticmethod
+    def include_url_without_fallback(context, url):
+        """
+        :param context: ConfigIncludeContext
+        :param url: String
+        :return: ConfigObject
+        """
+        from . import Parseable
+        return Parseable.new_url(url, context.parse_options()).parse()
+
+    def include_file(self, context, file):
+        obj = SimpleIncluder.include_file_without_fallback(context, file)
+
+        # now use the fallback includer if any and merge its result.
+        if isinstance(self._fallback, ConfigIncluderFile):
+            return obj.with_fallback(
+                self._fallback.include_file(context, file))
+        else:
+            return obj
+
+    @staticmethod
+    def include_file_without_fallback(context, file):
+        """
+        :param context: ConfigIncludeContext
+        :param file: String - path
+        :return: ConfigObject
+        """
+        from . import ConfigImpl
+        return ConfigImpl.parse_path_any_syntax(file, context.parse_options())
+
+    def include_resources(self, context, resource):
+        obj = SimpleIncluder.include_resource_without_fallback(
+            context, resource)
+
+        # now use the fallback includer if any and merge its result.
+        if isinstance(self._fallback, ConfigIncluderClasspath):
+            return obj.with_fallback(
+                self._fallback.include_resources(context, resource))
+        else:
+            return obj
+
+    @staticmethod
+    def include_resource_without_fallback(context, resource):
+        """
+        There is no classpath, so a classpath() include is never found;
+        being missing is allowed for includes unless a custom includer
+        changes that.
+
+        :param context: ConfigIncludeContext
+        :param resource: String
+        :return: ConfigObject
+        """
+        from . import Parseable
+        return Parseable.new_not_found(
+            resource, "classpath resources are not supported: '"
+            + resource + "'", context.parse_options()).parse()
+
+    def with_fallback(self, fallback):
+        if self is fallback:
+            raise exceptions.BugOrBroken("trying to create includer cycle")
+        elif self._fallback is fallback:
+            return self
+        elif self._fallback is not None:
+            return SimpleIncluder(self._fallback.with_fallback(fallback))
+        else:
+            return SimpleIncluder(fallback)
+
+    @staticmethod
+    def from_basename(source, name, options):
+        """
+        This function is a little tricky because there are two places we're
+        trying to use it; for 'include "basename"' in a .conf file, and for
+        loading app.{conf,json,properties} from the filesystem.
+
+        :param source: function(String, ConfigParseOptions) ->
+            ConfigParseable - the name source, which turns a complete name
+            into something to parse
+        :param name: String
+        :param options: ConfigParseOptions
+        :return: ConfigObject
+        """
+        from . import ConfigImpl
+
+        if name.endswith(".conf") or name.endswith(".json") \
+                or name.endswith(".properties"):
+            p = source(name, options)
+            return p.parse(p.options().set_allow_missing(
+                options.allow_missing))
+
+        conf_handle = source(name + ".conf", options)
+        json_handle = source(name + ".json", options)
+        props_handle = source(name + ".properties", options)
+        got_something = False
+        fails = []
+
+        syntax = options.syntax
+
+        obj = SimpleConfigObject.empty(SimpleConfigOrigin.new_simple(name))
+        if syntax is None or syntax == ConfigSyntax.conf:
+            try:
+                obj = conf_handle.parse(conf_handle.options()
+                                        .set_allow_missing(False)
+                                        .set_syntax(ConfigSyntax.conf))
+                got_something = True
+            except exceptions.IO as e:
+                fails.append(e)
+
+        if syntax is None or syntax == ConfigSyntax.json:
+            try:
+                parsed = json_handle.parse(json_handle.options()
+                                           .set_allow_missing(False)
+                                           .set_syntax(ConfigSyntax.json))
+                obj = obj.with_fallback(parsed)
+                got_something = True
+            except exceptions.IO as e:
+                fails.append(e)
+
+        if syntax is None or syntax == ConfigSyntax.properties:
+            try:
+                parsed = props_handle.parse(
+                    props_handle.options().set_allow_missing(False)
+                    .set_syntax(ConfigSyntax.properties))
+                obj = obj.with_fallback(parsed)
+                got_something = True
+            except exceptions.IO as e:
+                fails.append(e)
+
+        if not options.allow_missing and not got_something:
+            if ConfigImpl.trace_loads_enabled():
+                # the individual exceptions should have been logged already
+                # with tracing enabled
+                ConfigImpl.trace(
+                    "Did not find '" + name
+                    + "' with any extension (.conf, .json, .properties); "
+                    "exceptions should have been logged above.")
+
+            if not fails:
+                # this should not happen
+                raise exceptions.BugOrBroken(
+                    "should not be reached: nothing found but no exceptions "
+                    "thrown")
+            else:
+                raise exceptions.IO(
+                    origin=SimpleConfigOrigin.new_simple(name),
+                    message=", ".join(str(t) for t in fails),
+                    cause=fails[0])
+        elif not got_something:
+            if ConfigImpl.trace_loads_enabled():
+                ConfigImpl.trace(
+                    "Did not find '" + name
+                    + "' with any extension (.conf, .json, .properties); but '"
+                    + name + "' is allowed to be missing. Exceptions from "
+                    "load attempts should have been logged above.")
+
+        return obj
+
+    @staticmethod
+    def make_full(includer):
+        """
+        :param includer: ConfigIncluder
+        :return: FullIncluder
+        """
+        if isinstance(includer, FullIncluder):
+            return includer
+        else:
+            return _Proxy(includer)
+
+
+def _relative_name_source(context):
+    """
+    :param context: ConfigIncludeContext
+    :return: function(String, ConfigParseOptions) -> ConfigParseable
+    """
+    def name_to_parseable(name, options):
+        p = context.relative_to(name)
+        if p is None:
+            # avoid returning None
+            from . import Parseable
+            return Parseable.new_not_found(
+                name, "include was not found: '" + name + "'", options)
+        else:
+            return p
+    return name_to_parseable
+
+
+class _Proxy(FullIncluder):
+    """
+    The Proxy is a proxy for an application-provided includer that uses our
+    default implementations when the application-provided includer doesn't
+    have an implementation.
+
+    Attributes:
+
+        _delegate: ConfigIncluder
+    """
+
+    def __init__(self, delegate):
+        """
+        :param delegate: ConfigIncluder
+        """
+        self._delegate = delegate
+
+    def with_fallback(self, fallback):
+        # we never fall back
+        return self
+
+    def include(self, context, what):
+        return self._delegate.include(context, what)
+
+    def include_resources(self, context, what):
+        if isinstance(self._delegate, ConfigIncluderClasspath):
+            return self._delegate.include_resources(context, what)
+        else:
+            return SimpleIncluder.include_resource_without_fallback(
+                context, what)
+
+    def include_url(self, context, what):
+        if isinstance(self._delegate, ConfigIncluderURL):
+            return self._delegate.include_url(context, what)
+        else:
+            return SimpleIncluder.include_url_without_fallback(context, what)
+
+    def include_file(self, context, what):
+        if isinstance(self._delegate, ConfigIncluderFile):
+            return self._delegate.include_file(context, what)
+        else:
+            return SimpleIncluder.include_file_without_fallback(context, what)
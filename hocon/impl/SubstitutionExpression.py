@@ -0,0 +1,58 @@
+class SubstitutionExpression(object):
+    """
+    The ${path} or ${?path} of a substitution.
+
+    Attributes:
+
+        _path: Path
+
+        _optional: boolean
+    """
+
+    def __init__(self, path, optional):
+        """
+        :param path: Path
+        :param optional: boolean
+        """
+        self._path = path
+        self._optional = optional
+
+    def path(self):
+        """
+        :return: Path
+        """
+        return self._path
+
+    def optional(self):
+        """
+        :return: boolean
+        """
+        return self._optional
+
+    def change_path(self, new_path):
+        """
+        :param new_path: Path
+        :return: SubstitutionExpression
+        """
+        if new_path is self._path:
+            return self
+        else:
+            return SubstitutionExpression(new_path, self._optional)
+
+    def __str__(self):
+        return "${" + ("?" if self._optional else "") + str(self._path) \
+            + "}"
+
+    def __repr__(self):
+        return "SubstitutionExpression(" + str(self) + ")"
+
+    def __eq__(self, other):
+        return isinstance(other, SubstitutionExpression) \
+            and other._path == self._path \
+            and other._optional == self._optional
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self._path, self._optional))
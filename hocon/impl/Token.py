@@ -1,18 +1,40 @@
-from .. import exceptions, ConfigOrigin
+from .. import exceptions
 
 
 class Token(object):
+    """
+    Tokens are immutable and there are a great many of them, so they have
+    no instance dict, and the hash is computed once and kept in _hash.
 
-    def __init__(self, token_type, origin=None, debug_string=None):
+    A token made by the tokenizer may hold a LineOrigins and a line number
+    rather than its origin, which is then only built if it's asked for.
+    """
+
+    __slots__ = ('_token_type', '_debug_string', '_origin', '_line', '_hash')
+
+    def __init__(self, token_type, origin=None, debug_string=None,
+                 line=None):
         """
         :param token_type: TokenType
             This is None for singleton tokens like COMMA or OPEN_CURLY.
-        :param origin: ConfigOrigin
+        :param origin: ConfigOrigin, or LineOrigins if line is given
         :param debug_string: String
+        :param line: int - the line number in origin
         """
         self._token_type = token_type
         self._debug_string = debug_string
         self._origin = origin
+        self._line = line
+        self._hash = None
+
+    @classmethod
+    def new_without_origin(cls, token_type, debug_string):
+        """
+        :param token_type: TokenType
+        :param debug_string: String
+        :return: Token
+        """
+        return Token(token_type, debug_string=debug_string)
 
     def token_type(self):
         return self._token_type
@@ -27,39 +49,46 @@ class Token(object):
         if self._origin is None:
             raise exceptions.BugOrBroken(
                 "tried to get origin from token that doesn't have one: "
-                + self)
+                + str(self))
+        if self._line is not None:
+            return self._origin.origin(self._line)
         return self._origin
 
     def line_number(self):
         """
         :return: int
         """
-        if self._origin is not None:
+        if self._line is not None:
+            return self._line
+        elif self._origin is not None:
             return self._origin.line_number()
         else:
             return -1
 
-    def __unicode__(self):
+    def __str__(self):
         if self._debug_string is not None:
             return self._debug_string
         else:
-            return self._token_type.name()
-
-    def __str__(self):
-        return unicode(self).encode('utf-8')
+            return self._token_type.name
 
     def __repr__(self):
-        return "Token(" + unicode(self) + ")"
+        return "Token(" + str(self) + ")"
 
     def _key(self):
         # origin is deliberately left out
         return (self._token_type,)
 
     def __eq__(self, other):
-        return isinstance(other, Token) and self._key() == other._key()
+        if self is other:
+            return True
+        return isinstance(other, Token) and type(self) is type(other) \
+            and hash(self) == hash(other) and self._key() == other._key()
 
-    def __neq__(self, other):
+    def __ne__(self, other):
         return not self == other
 
     def __hash__(self):
-        return hash(self._key())
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self._key())
+        return h
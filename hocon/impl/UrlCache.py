@@ -0,0 +1,395 @@
+import collections
+import contextlib
+import hashlib
+import os
+import socket
+import tempfile
+import threading
+
+try:
+    import cPickle as pickle
+    import httplib
+    import urlparse
+except ImportError:
+    # Python 3
+    import http.client as httplib
+    import pickle
+    from urllib import parse as urlparse
+
+from . import Parseable
+
+
+# what's kept of a response, in memory and on disk
+_Entry = collections.namedtuple('_Entry', (
+    'etag', 'last_modified', 'content_type', 'digest', 'body'))
+
+_REDIRECTS = (301, 302, 303, 307, 308)
+
+
+def _digest(body, content_type):
+    """
+    :param body: String - bytes
+    :param content_type: String
+    :return: String - changes if either does, since the Content-Type can
+        change the syntax the body is parsed with
+    """
+    h = hashlib.sha1(body)
+    if content_type is not None:
+        h.update(b'\0' + content_type.encode('utf-8'))
+    return h.hexdigest()
+
+
+class UrlCache(object):
+    """
+    Fetches http and https URLs for ParseableURL, for use through
+    ConfigParseOptions.set_url_cache().
+
+    Connections are kept alive and reused, up to max_idle_connections per
+    host. Each body is kept along with its ETag and Last-Modified, in memory
+    and, given a directory, on disk, so a URL fetched before, even by an
+    earlier process, is asked for with If-None-Match and If-Modified-Since
+    and costs a 304 if it hasn't changed.
+
+    The parse of each URL is kept too, along with the URLs and files read
+    while parsing it, includes and all. It's reused as long as none of those
+    has changed, which for the URLs takes one conditional request each.
+
+    Other schemes are opened as without a cache.
+
+    Attributes:
+
+        directory: String
+            Where the bodies are kept, created on first write; None to keep
+            them only in memory.
+
+        max_idle_connections: int
+            Per scheme, host and port.
+
+        timeout: float
+            In seconds, for connecting and for each read.
+
+        max_parses: int
+            How many parses are kept; the least recently used goes first.
+
+        _idle: Dict<(String, String), List<HTTPConnection>>
+            Idle connections by scheme and host.
+
+        _entries: Dict<String, _Entry>
+            Responses by URL.
+
+        _parsed: OrderedDict<tuple, (List<(String, String)>,
+                List<(String, float, int, String)>, AbstractConfigValue)>
+            Parses by URL and options, each with the URLs and their digests
+            and the file_dependencies() it was made from, least recently
+            used first.
+    """
+
+    # bump this whenever _Entry changes shape
+    VERSION = 1
+
+    MAX_REDIRECTS = 5
+
+    def __init__(self, directory=None, max_idle_connections=4, timeout=30,
+                 max_parses=256):
+        """
+        :param directory: String
+        :param max_idle_connections: int
+        :param timeout: float
+        :param max_parses: int
+        """
+        self.directory = directory
+        self.max_idle_connections = max_idle_connections
+        self.timeout = timeout
+        self.max_parses = max_parses
+        self._idle = {}
+        self._entries = {}
+        self._parsed = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # holds the URLs fetched on each thread while recording
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # connections and locks don't travel; a copy starts empty, apart
+        # from what's on disk
+        return (self.directory, self.max_idle_connections, self.timeout,
+                self.max_parses)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def handles(self, url):
+        """
+        :param url: String
+        :return: boolean - whether url is fetched through this cache
+        """
+        return urlparse.urlsplit(url).scheme in ('http', 'https')
+
+    def open(self, url):
+        """
+        :param url: String
+        :return: (String, String) - the body, and its Content-Type without
+            parameters, or None if it has none
+        """
+        entry = self._fetch(url)
+        self._record(url, entry.digest)
+        return entry.body, entry.content_type
+
+    def parse_value(self, url, key, parse):
+        """
+        Returns the parse made earlier for key if nothing it was made from
+        has changed, otherwise calls parse() and keeps what it returns.
+
+        :param url: String - the URL being parsed
+        :param key: tuple - the URL and the options the parse depends on
+        :param parse: function() -> AbstractConfigValue
+        :return: AbstractConfigValue
+        """
+        with self._lock:
+            kept = self._parsed.pop(key, None)
+            if kept is not None:
+                self._parsed[key] = kept
+        if kept is not None:
+            urls, files, value = kept
+            if self._unchanged(urls) and \
+                    Parseable.dependencies_unchanged(files):
+                # whatever is including this reads all of those too
+                for u, digest in urls:
+                    self._record(u, digest)
+                with Parseable.recording_files() as recorded:
+                    recorded.extend(f[:3] for f in files)
+                    recorded.extend((u,) for u, digest in urls)
+                return value
+
+        with self._recording() as urls, \
+                Parseable.recording_files() as recorded:
+            value = parse()
+        # the URLs fetched through here are checked by _unchanged()
+        files = Parseable.file_dependencies(
+            [f for f in recorded if len(f) > 1 or not self.handles(f[0])])
+        # a missing URL comes back empty without having been fetched
+        if files is not None and any(u == url for u, digest in urls):
+            with self._lock:
+                self._parsed.pop(key, None)
+                if len(self._parsed) >= self.max_parses:
+                    self._parsed.popitem(last=False)
+                self._parsed[key] = (urls, files, value)
+        return value
+
+    def close(self):
+        """
+        Closes the idle connections.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _unchanged(self, urls):
+        """
+        :param urls: List<(String, String)> - URLs and the digests of their
+            bodies
+        :return: boolean
+        """
+        for url, digest in set(urls):
+            try:
+                if self._fetch(url).digest != digest:
+                    return False
+            except IOError:
+                return False
+        return True
+
+    @contextlib.contextmanager
+    def _recording(self):
+        """
+        Like Parseable.recording_files(), for the URLs opened.
+
+        :return: List<(String, String)> - URLs and the digests of their
+            bodies, filled in as they're opened
+        """
+        outer = getattr(self._local, 'urls', None)
+        urls = self._local.urls = []
+        try:
+            yield urls
+        finally:
+            self._local.urls = outer
+            if outer is not None:
+                outer.extend(urls)
+
+    def _record(self, url, digest):
+        urls = getattr(self._local, 'urls', None)
+        if urls is not None:
+            urls.append((url, digest))
+
+    def _fetch(self, url):
+        """
+        :param url: String
+        :return: _Entry - up to date
+        """
+        entry = self._entry(url)
+        headers = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        status, response, body = self._get(url, headers)
+        if status == httplib.NOT_MODIFIED and entry is not None:
+            Parseable.trace("URL not modified: " + url)
+            return entry
+        if status != httplib.OK:
+            raise IOError("HTTP " + str(status) + " " + response.reason
+                          + " for " + url)
+
+        content_type = response.getheader('Content-Type')
+        if content_type is not None:
+            Parseable.trace("URL sets Content-Type: '" + content_type + "'")
+            content_type = content_type.split(';', 1)[0].strip()
+        entry = _Entry(
+            etag=response.getheader('ETag'),
+            last_modified=response.getheader('Last-Modified'),
+            content_type=content_type,
+            digest=_digest(body, content_type),
+            body=body)
+        with self._lock:
+            self._entries[url] = entry
+        if self.directory is not None and (entry.etag is not None
+                                           or entry.last_modified is not None):
+            self._store(url, entry)
+        return entry
+
+    def _entry(self, url):
+        """
+        :param url: String
+        :return: _Entry - from memory or disk, or None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None and self.directory is not None:
+            entry = self._load(url)
+            if entry is not None:
+                with self._lock:
+                    self._entries.setdefault(url, entry)
+        return entry
+
+    def _get(self, url, headers):
+        """
+        :param url: String
+        :param headers: Dict<String, String>
+        :return: (int, HTTPResponse, String) - status, response and body,
+            after following redirects
+        """
+        for i in range(UrlCache.MAX_REDIRECTS + 1):
+            status, response, body = self._request(url, headers)
+            location = response.getheader('Location')
+            if status not in _REDIRECTS or location is None:
+                return status, response, body
+            url = urlparse.urljoin(url, location)
+        raise IOError("more than " + str(UrlCache.MAX_REDIRECTS)
+                      + " redirects for " + url)
+
+    def _request(self, url, headers):
+        """
+        :param url: String
+        :param headers: Dict<String, String>
+        :return: (int, HTTPResponse, String) - status, response and body
+        """
+        parts = urlparse.urlsplit(url)
+        host = (parts.scheme, parts.netloc)
+        path = urlparse.urlunsplit(('', '', parts.path or '/', parts.query,
+                                    ''))
+        while True:
+            connection, reused = self._checkout(host)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (httplib.HTTPException, socket.error) as e:
+                connection.close()
+                if reused:
+                    # the server closed it while it was idle; try another
+                    continue
+                raise IOError(type(e).__name__ + ": " + str(e))
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(host, connection)
+            return response.status, response, body
+
+    def _checkout(self, host):
+        """
+        :param host: (String, String) - scheme and host
+        :return: (HTTPConnection, boolean) - a connection, and whether it
+            was idle in the pool
+        """
+        with self._lock:
+            idle = self._idle.get(host)
+            if idle:
+                return idle.pop(), True
+        scheme, netloc = host
+        if scheme == 'https':
+            return httplib.HTTPSConnection(netloc, timeout=self.timeout), \
+                False
+        return httplib.HTTPConnection(netloc, timeout=self.timeout), False
+
+    def _checkin(self, host, connection):
+        """
+        :param host: (String, String)
+        :param connection: HTTPConnection
+        """
+        with self._lock:
+            idle = self._idle.setdefault(host, [])
+            if len(idle) < self.max_idle_connections:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _entry_path(self, url):
+        """
+        :return: String - the entry's filename
+        """
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + '.url')
+
+    def _load(self, url):
+        """
+        :param url: String
+        :return: _Entry, or None if there's no valid entry
+        """
+        try:
+            with open(self._entry_path(url), 'rb') as f:
+                if pickle.load(f) != (UrlCache.VERSION, url):
+                    return None
+                return _Entry(*pickle.load(f))
+        except Exception:
+            # unreadable or corrupt, which unpickling can report as almost
+            # anything; either way it's a miss
+            return None
+
+    def _store(self, url, entry):
+        """
+        :param url: String
+        :param entry: _Entry
+        """
+        path = self._entry_path(url)
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((UrlCache.VERSION, url), f,
+                                pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(tuple(entry), f, pickle.HIGHEST_PROTOCOL)
+                # atomic, so concurrent processes never see half an entry
+                os.rename(tmp, path)
+            except:
+                os.remove(tmp)
+                raise
+        except (IOError, OSError) as e:
+            # a cache that can't be written just means a full download
+            # next time
+            Parseable.trace("could not write URL cache entry " + path
+                            + ": " + str(e))
+
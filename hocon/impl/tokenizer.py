@@ -1,4 +1,11 @@
-from .. import exceptions, ConfigOrigin, ConfigSyntax
+import collections
+import re
+
+from .. import exceptions
+from ..ConfigSyntax import ConfigSyntax
+
+from . import tokens
+from .LineOrigins import LineOrigins
 
 
 # this exception should not leave this file
@@ -11,6 +18,114 @@ class ProblemException(Exception):
         self.problem = problem
 
 
+# what next_char_raw() returns when the input is exhausted
+EOF = None
+
+# how many characters to request from the input per read
+BLOCK_SIZE = 64 * 1024
+
+# how many distinct strings a TokenIterator shares; past this, new strings
+# are not added, so that memory stays bounded on huge inputs while the keys,
+# which nearly always come early and repeat, are still shared
+MAX_INTERNED_STRINGS = 4096
+
+# how many already-consumed characters are kept around when the buffer is
+# refilled, so that put_back() keeps working across a block boundary
+LOOKBEHIND = 3
+
+# how many tokens queue_next_tokens() queues before it stops at the next
+# newline; the queue is drained before it's filled again
+QUEUE_SIZE = 256
+
+# chars JSON allows a number to start with
+first_number_chars = "0123456789-"
+# chars JSON allows to be part of a number
+number_chars = "0123456789eE+-."
+# chars that stop an unquoted string
+not_in_unquoted_text = "$\"{}[]:=,+#`^?!@*&\\"
+
+# Precompiled scanners. Each one matches a (possibly empty) run of
+# characters which never extends past a character it can't consume, so
+# a match ending before the end of the buffer is known to be complete.
+# See TokenIterator.scan().
+
+# whitespace other than newline, spelled out as util.is_whitespace has it:
+# regex's \s would also take in \x85, which Java doesn't count as whitespace
+_whitespace_not_newline = (u'\t\x0b\x0c\r\x1c-\x1f \xa0\u1680\u2000-\u200a'
+                           u'\u2028\u2029\u202f\u205f\u3000\ufeff')
+
+# one character in a quoted string that isn't a quote, a backslash or an
+# ISO control character
+_quoted_text_char = u'[^"\\\\\\x00-\\x1f\\x7f-\\x9f]'
+
+_unquoted_text_char = \
+    u'[^' + re.escape(not_in_unquoted_text) + _whitespace_not_newline + u'\n]'
+
+# same as above, but stops before a "//" comment
+_unquoted_text_char_allowing_comments = \
+    u'(?:[^' + re.escape(not_in_unquoted_text) + _whitespace_not_newline \
+    + u'\n/]|/(?!/))'
+
+
+def _token_start(unquoted_text_char, allow_comments):
+    """
+    Builds the scanner every token starts with: it consumes the whitespace
+    before the token, as its first group, and in the same match tells which
+    kind of token follows by the name of the group that matched, taking in
+    all of a run of unquoted text, a number, a comment or a quoted string
+    without escapes. It matches only the whitespace if what follows needs
+    pull_next_token() to look at it a character at a time.
+
+    :param unquoted_text_char: String - a regex for one character of
+        unquoted text
+    :param allow_comments: boolean
+    :return: RegexObject
+    """
+    return re.compile(
+        u'([' + _whitespace_not_newline + u']*)(?:'
+        u'(?P<number>[' + re.escape(first_number_chars) + u'][0-9eE+.\\-]*)'
+        u'|(?P<text>' + unquoted_text_char + u'+)'
+        u'|(?P<punctuation>[:,={}\\[\\]])'
+        u'|(?P<newline>\n)'
+        u'|"(?P<string>' + _quoted_text_char + u'+)"'
+        u'|(?P<quote>")'
+        + (u'|(?:#|//)(?P<comment>[^\n]*)' if allow_comments else u'')
+        + u')?',
+        re.UNICODE)
+
+
+_token_start_conf = _token_start(_unquoted_text_char_allowing_comments, True)
+
+_token_start_json = _token_start(_unquoted_text_char, False)
+
+_quoted_text_run = re.compile(_quoted_text_char + u'*')
+
+_quotes_run = re.compile(u'"*')
+
+_hex_digits = re.compile(u'[0-9a-fA-F]{4}$')
+
+_escapes = {
+    '"': u'"',
+    '\\': u'\\',
+    '/': u'/',
+    'b': u'\b',
+    'f': u'\f',
+    'n': u'\n',
+    'r': u'\r',
+    't': u'\t',
+}
+
+_punctuation = {
+    ':': tokens.COLON,
+    ',': tokens.COMMA,
+    '=': tokens.EQUALS,
+    '{': tokens.OPEN_CURLY,
+    '}': tokens.CLOSE_CURLY,
+    '[': tokens.OPEN_SQUARE,
+    ']': tokens.CLOSE_SQUARE,
+}
+
+
 def is_iso_control_character(c):
     """
     A character is considered to be an ISO control character if its code is in
@@ -30,7 +145,7 @@ def as_string(c):
         return "newline"
     elif c == '\t':
         return "tab"
-    elif c == u"\u0003":
+    elif c is EOF:
         return "end of file"
     elif is_iso_control_character(c):
         return "control character " + hex(ord(c))
@@ -38,7 +153,7 @@ def as_string(c):
         return c
 
 
-def tokenize(origin, input, flavor):
+def tokenize(origin, input, flavor, drop_comments=False):
     """
     Tokenizes a Reader. Does not close the reader; you have to arrange to do
     that after you're done with the returned iterator.
@@ -46,9 +161,15 @@ def tokenize(origin, input, flavor):
     :param origin: ConfigOrigin
     :param input: Reader
     :param flavor: ConfigSyntax
+    :param drop_comments: boolean - skip comments instead of making tokens
+        for them
     :return: Iterator<Token>
     """
-    return TokenIterator(origin, input, flavor != ConfigSyntax.json)
+    return TokenIterator(origin, input, flavor != ConfigSyntax.json,
+                         drop_comments)
+
+
+_simple_value_types = (tokens.UnquotedText, tokens.Value, tokens.Substitution)
 
 
 def is_simple_value(t):
@@ -56,8 +177,25 @@ def is_simple_value(t):
     :param t: Token
     :return: boolean
     """
-    return Tokens.is_substitution(t) or Tokens.is_unquoted_text(t) \
-        or Tokens.is_value(t)
+    return isinstance(t, _simple_value_types)
+
+
+def problem(origin, what, message, suggest_quotes=False, cause=None,
+            line=None):
+    """
+    :param origin: ConfigOrigin, or LineOrigins if line is given
+    :param what: String
+    :param message: String
+    :param suggest_quotes: boolean
+    :param cause: Throwable
+    :param line: int
+    :return: ProblemException
+    """
+    if what is None or message is None:
+        raise exceptions.BugOrBroken(
+            "internal error, creating bad ProblemException")
+    return ProblemException(tokens.new_problem(
+        origin, what, message, suggest_quotes, cause, line))
 
 
 class WhitespaceSaver(object):
@@ -79,15 +217,15 @@ class WhitespaceSaver(object):
         if self.last_token_was_simple_value:
             self.whitespace += c
 
-    def check(self, t, base_origin, line_number):
+    def check(self, t, new_text):
         """
         :param t: Token
-        :param base_origin: ConfigOrigin
-        :param line_number: int
+        :param new_text: function(String) -> Token - makes the unquoted
+            text token for saved whitespace
         :return: Token
         """
         if is_simple_value(t):
-            return self.next_is_a_simple_value(base_origin, line_number)
+            return self.next_is_a_simple_value(new_text)
         else:
             self.next_is_not_a_simple_value()
             return None
@@ -100,22 +238,19 @@ class WhitespaceSaver(object):
         self.last_token_was_simple_value = False
         self.whitespace = ''
 
-    def next_is_a_simple_value(self, base_origin, line_number):
+    def next_is_a_simple_value(self, new_text):
         """
         Called if the next token IS a simple value,
         so creates a whitespace token if the previous token also was.
 
-        :param base_origin: ConfigOrigin
-        :param line_number: int
+        :param new_text: function(String) -> Token
         :return: Token
         """
         if self.last_token_was_simple_value:
             # Need to save whitespace between the two so
             # the parser has the option to concatenate it.
             if len(self.whitespace) > 0:
-                t = Tokens.new_unquoted_text(
-                    line_origin(base_origin, line_number),
-                    unicode(self.whitespace))
+                t = new_text(str(self.whitespace))
                 self.whitespace = ''  # reset
                 return t
             else:
@@ -128,535 +263,596 @@ class WhitespaceSaver(object):
 
 
 class TokenIterator(object):
+    """
+    Reads the input in blocks of BLOCK_SIZE characters and scans the
+    buffered text by index, using the precompiled regexes above to consume
+    whole runs of whitespace, unquoted text, numbers, comments and string
+    contents at once rather than one character per call.
+
+    Attributes:
+
+        buffer: String
+            The current block of input, plus up to LOOKBEHIND characters
+            of the previous one.
+
+        pos: int
+            Index in buffer of the next character to read.
+
+        eof: boolean
+            True once the input has returned an empty read.
 
-    def __init__(self, origin, input, allow_comments):
+        line_origins: LineOrigins
+            Builds the origin of a line the first time something on it
+            needs one; tokens that might never need theirs keep this and
+            the line number instead.
+
+        strings: Dict<String, String>
+            String values and unquoted text seen so far, up to
+            MAX_INTERNED_STRINGS of them, so that repeated keys and values
+            share one string object.
+
+        line_texts: Dict<String, Token>
+            Unquoted text tokens on the current line by text; tokens are
+            immutable, so repeats on a line (mostly the whitespace between
+            simple values) are the same token.
+    """
+
+    def __init__(self, origin, input, allow_comments, drop_comments=False):
         """
         :param origin: ConfigOrigin
         :param input: Reader
         :param allow_comments: boolean
+        :param drop_comments: boolean
         """
 
         self.origin = origin  # SimpleConfigOrigin
         self.input = input
         self.allow_comments = allow_comments
-        self.buffer = []  # LinkedList<Integer>
+        self.drop_comments = drop_comments
+        self.buffer = u''
+        self.pos = 0
+        self.eof = False
         self.line_number = 1  # nonfinal
-        self.line_origin = origin.set_line_number(line_number)  # nonfinal
-        self.tokens = []  # Queue<Token>
-        self.tokens.add(Tokens.START)
+        self.line_origins = LineOrigins(origin)
+        self.strings = {}
+        self.line_texts = {}
+        self.tokens = collections.deque()  # Queue<Token>
+        self.tokens.append(tokens.START)
         self.whitespace_saver = WhitespaceSaver()
 
+        if allow_comments:
+            self.token_start = _token_start_conf
+        else:
+            self.token_start = _token_start_json
+
+    def fill_buffer(self):
+        """
+        Reads the next block of input onto the end of the buffer, dropping
+        consumed text other than the last LOOKBEHIND characters.
+
+        :return: boolean - false if there was no more input
+        """
+        if self.eof:
+            return False
+        try:
+            block = self.input.read(BLOCK_SIZE)
+        except Exception as e:
+            raise exceptions.IO(message="read error: " + str(e),
+                                origin=self.origin, cause=e)
+        if not block:
+            self.eof = True
+            return False
+        keep = max(0, self.pos - LOOKBEHIND)
+        self.buffer = self.buffer[keep:] + block
+        self.pos -= keep
+        return True
+
+    def set_line_number(self, line_number):
+        """
+        :param line_number: int
+        """
+        self.line_number = line_number
+        self.line_texts = {}
+
+    def line_origin(self):
+        """
+        :return: ConfigOrigin - of the current line
+        """
+        return self.line_origins.origin(self.line_number)
+
+    def intern(self, s):
+        """
+        :param s: String
+        :return: String - the first string equal to s seen by this
+            iterator, if it's still being kept
+        """
+        interned = self.strings.get(s)
+        if interned is None:
+            if len(self.strings) < MAX_INTERNED_STRINGS:
+                self.strings[s] = s
+            interned = s
+        return interned
+
+    def unquoted_text(self, s):
+        """
+        :param s: String
+        :return: Token - unquoted text on the current line
+        """
+        t = self.line_texts.get(s)
+        if t is None:
+            t = tokens.new_unquoted_text(
+                self.line_origins, self.intern(s), self.line_number)
+            self.line_texts[s] = t
+        return t
+
+    def scan(self, pattern):
+        """
+        Consumes the longest run matched by pattern at the current position,
+        refilling the buffer whenever the match reaches its end so that runs
+        spanning a block boundary are not cut short.
+
+        :param pattern: RegexObject - must always match, possibly empty
+        :return: String - the consumed text
+        """
+        while True:
+            m = pattern.match(self.buffer, self.pos)
+            if m.end() < len(self.buffer) or not self.fill_buffer():
+                break
+        self.pos = m.end()
+        return m.group()
+
     def next_char_raw(self):
         """
-        This should ONLY be called from nextCharSkippingComments
-        or when inside a quoted string, or when parsing a sequence
-        like ${ or +=, everything else should use nextCharSkippingComments().
+        This should ONLY be called when inside a quoted string, or when
+        parsing a sequence like ${ or +=, everything else should start from
+        pull_next_token().
 
-        :return: int
+        :return: character, or EOF
         """
-        if len(self.buffer) == 0:
-            try:
-                return self.input.read()  # todo - this should read a character from the input
-            except Exception as e:
-                raise exceptions.IO(origin, "read error: " + e.message, e)
+        if self.pos >= len(self.buffer) and not self.fill_buffer():
+            return EOF
+        c = self.buffer[self.pos]
+        self.pos += 1
+        return c
+
+    def put_back(self, c):
+        """
+        Un-reads c, which must be the character most recently returned by
+        next_char_raw().
+
+        :param c: character, or EOF
+        """
+        if c is EOF:
+            # reading again will just hit the end of input again
+            return
+        if self.pos == 0:
+            raise exceptions.BugOrBroken(
+                "bug: put_back() before start of buffer, "
+                "undesirable look-ahead")
+        self.pos -= 1
+
+    def problem(self, what, message=None, suggest_quotes=False, cause=None):
+        """
+        problem(message) is also accepted, with an empty "what".
+
+        :param what: String
+        :param message: String
+        :param suggest_quotes: boolean
+        :param cause: Throwable
+        :return: ProblemException
+        """
+        if message is None:
+            what, message = "", what
+        return problem(self.line_origins, what, message, suggest_quotes,
+                       cause, self.line_number)
+
+    def pull_number(self, s):
+        """
+        :param s: String - a run of the characters a number may contain,
+            starting with one it may start with
+        :return: Token
+        """
+        contained_decimal_or_e = '.' in s or 'e' in s or 'E' in s
+        try:
+            if contained_decimal_or_e:
+                # force floating point representation
+                return tokens.new_double(self.line_origin(), float(s), s)
+            else:
+                n = int(s)
+                # match Java, where this throws if the integer is too large
+                # for Long
+                if not -2 ** 63 <= n < 2 ** 63:
+                    raise ValueError("out of range: " + s)
+                return tokens.new_long(self.line_origin(), n, s)
+        except ValueError:
+            # not a number after all, see if it's an unquoted string.
+            for u in s:
+                if u in not_in_unquoted_text:
+                    raise self.problem(
+                        as_string(u), "Reserved character '" + as_string(u)
+                        + "' is not allowed outside quotes",
+                        suggest_quotes=True)
+            # no evil chars so we just decide this was a string and
+            # not a number.
+            return self.unquoted_text(s)
+
+    def pull_escape_sequence(self, sb):
+        """
+        :param sb: List<String> - pieces of the string being built
+        """
+        escaped = self.next_char_raw()
+        if escaped is EOF:
+            raise self.problem(
+                "End of input but backslash in string had nothing after it")
+
+        if escaped in _escapes:
+            sb.append(_escapes[escaped])
+        elif escaped == 'u':
+            a = []
+            for i in range(4):
+                c = self.next_char_raw()
+                if c is EOF:
+                    raise self.problem(
+                        "End of input but expecting 4 hex digits for "
+                        "\\uXXXX escape")
+                a.append(c)
+            digits = u''.join(a)
+            if not _hex_digits.match(digits):
+                raise self.problem(
+                    digits,
+                    "Malformed hex digits after \\u escape in string: '%s'"
+                    % digits)
+            sb.append(chr(int(digits, 16)))
         else:
-            c = self.buffer.pop()
-            return c
-
-    private void putBack(int c) {
-        if (buffer.size() > 2) {
-            throw new ConfigException.BugOrBroken(
-                    "bug: putBack() three times, undesirable look-ahead");
-        }
-        buffer.push(c);
-    }
-
-    static boolean isWhitespace(int c) {
-        return ConfigImplUtil.isWhitespace(c);
-    }
-
-    static boolean isWhitespaceNotNewline(int c) {
-        return c != '\n' && ConfigImplUtil.isWhitespace(c);
-    }
-
-    private boolean startOfComment(int c) {
-        if (c == -1) {
-            return false;
-        } else {
-            if (allowComments) {
-                if (c == '#') {
-                    return true;
-                } else if (c == '/') {
-                    int maybeSecondSlash = nextCharRaw();
-                    // we want to predictably NOT consume any chars
-                    putBack(maybeSecondSlash);
-                    if (maybeSecondSlash == '/') {
-                        return true;
-                    } else {
-                        return false;
-                    }
-                } else {
-                    return false;
-                }
-            } else {
-                return false;
-            }
-        }
-    }
-
-    // get next char, skipping non-newline whitespace
-    private int nextCharAfterWhitespace(WhitespaceSaver saver) {
-        for (;;) {
-            int c = nextCharRaw();
-
-            if (c == -1) {
-                return -1;
-            } else {
-                if (isWhitespaceNotNewline(c)) {
-                    saver.add(c);
-                    continue;
-                } else {
-                    return c;
-                }
-            }
-        }
-    }
-
-    private ProblemException problem(String message) {
-        return problem("", message, null);
-    }
-
-    private ProblemException problem(String what, String message) {
-        return problem(what, message, null);
-    }
-
-    private ProblemException problem(String what, String message, boolean suggestQuotes) {
-        return problem(what, message, suggestQuotes, null);
-    }
-
-    private ProblemException problem(String what, String message, Throwable cause) {
-        return problem(lineOrigin, what, message, cause);
-    }
-
-    private ProblemException problem(String what, String message, boolean suggestQuotes,
-            Throwable cause) {
-        return problem(lineOrigin, what, message, suggestQuotes, cause);
-    }
-
-    private static ProblemException problem(ConfigOrigin origin, String what,
-            String message,
-            Throwable cause) {
-        return problem(origin, what, message, false, cause);
-    }
-
-    private static ProblemException problem(ConfigOrigin origin, String what, String message,
-            boolean suggestQuotes, Throwable cause) {
-        if (what == null || message == null)
-            throw new ConfigException.BugOrBroken(
-                    "internal error, creating bad ProblemException");
-        return new ProblemException(Tokens.newProblem(origin, what, message, suggestQuotes,
-                cause));
-    }
-
-    private static ProblemException problem(ConfigOrigin origin, String message) {
-        return problem(origin, "", message, null);
-    }
-
-    private static ConfigOrigin lineOrigin(ConfigOrigin baseOrigin,
-            int lineNumber) {
-        return ((SimpleConfigOrigin) baseOrigin).setLineNumber(lineNumber);
-    }
-
-    // ONE char has always been consumed, either the # or the first /, but
-    // not both slashes
-    private Token pullComment(int firstChar) {
-        if (firstChar == '/') {
-            int discard = nextCharRaw();
-            if (discard != '/')
-                throw new ConfigException.BugOrBroken("called pullComment but // not seen");
-        }
-
-        StringBuilder sb = new StringBuilder();
-        for (;;) {
-            int c = nextCharRaw();
-            if (c == -1 || c == '\n') {
-                putBack(c);
-                return Tokens.newComment(lineOrigin, sb.toString());
-            } else {
-                sb.appendCodePoint(c);
-            }
-        }
-    }
-
-    // chars JSON allows a number to start with
-    static final String firstNumberChars = "0123456789-";
-    // chars JSON allows to be part of a number
-    static final String numberChars = "0123456789eE+-.";
-    // chars that stop an unquoted string
-    static final String notInUnquotedText = "$\"{}[]:=,+#`^?!@*&\\";
-
-    // The rules here are intended to maximize convenience while
-    // avoiding confusion with real valid JSON. Basically anything
-    // that parses as JSON is treated the JSON way and otherwise
-    // we assume it's a string and let the parser sort it out.
-    private Token pullUnquotedText() {
-        ConfigOrigin origin = lineOrigin;
-        StringBuilder sb = new StringBuilder();
-        int c = nextCharRaw();
-        while (true) {
-            if (c == -1) {
-                break;
-            } else if (notInUnquotedText.indexOf(c) >= 0) {
-                break;
-            } else if (isWhitespace(c)) {
-                break;
-            } else if (startOfComment(c)) {
-                break;
-            } else {
-                sb.appendCodePoint(c);
-            }
-
-            // we parse true/false/null tokens as such no matter
-            // what is after them, as long as they are at the
-            // start of the unquoted token.
-            if (sb.length() == 4) {
-                String s = sb.toString();
-                if (s.equals("true"))
-                    return Tokens.newBoolean(origin, true);
-                else if (s.equals("null"))
-                    return Tokens.newNull(origin);
-            } else if (sb.length() == 5) {
-                String s = sb.toString();
-                if (s.equals("false"))
-                    return Tokens.newBoolean(origin, false);
-            }
-
-            c = nextCharRaw();
-        }
-
-        // put back the char that ended the unquoted text
-        putBack(c);
-
-        String s = sb.toString();
-        return Tokens.newUnquotedText(origin, s);
-    }
-
-    private Token pullNumber(int firstChar) throws ProblemException {
-        StringBuilder sb = new StringBuilder();
-        sb.appendCodePoint(firstChar);
-        boolean containedDecimalOrE = false;
-        int c = nextCharRaw();
-        while (c != -1 && numberChars.indexOf(c) >= 0) {
-            if (c == '.' || c == 'e' || c == 'E')
-                containedDecimalOrE = true;
-            sb.appendCodePoint(c);
-            c = nextCharRaw();
-        }
-        // the last character we looked at wasn't part of the number, put it
-        // back
-        putBack(c);
-        String s = sb.toString();
-        try {
-            if (containedDecimalOrE) {
-                // force floating point representation
-                return Tokens.newDouble(lineOrigin, Double.parseDouble(s), s);
-            } else {
-                // this should throw if the integer is too large for Long
-                return Tokens.newLong(lineOrigin, Long.parseLong(s), s);
-            }
-        } catch (NumberFormatException e) {
-            // not a number after all, see if it's an unquoted string.
-            for (char u : s.toCharArray()) {
-                if (notInUnquotedText.indexOf(u) >= 0)
-                    throw problem(asString(u), "Reserved character '" + asString(u)
-                                  + "' is not allowed outside quotes", true /* suggestQuotes */);
-            }
-            // no evil chars so we just decide this was a string and
-            // not a number.
-            return Tokens.newUnquotedText(lineOrigin, s);
-        }
-    }
-
-    private void pullEscapeSequence(StringBuilder sb) throws ProblemException {
-        int escaped = nextCharRaw();
-        if (escaped == -1)
-            throw problem("End of input but backslash in string had nothing after it");
-
-        switch (escaped) {
-        case '"':
-            sb.append('"');
-            break;
-        case '\\':
-            sb.append('\\');
-            break;
-        case '/':
-            sb.append('/');
-            break;
-        case 'b':
-            sb.append('\b');
-            break;
-        case 'f':
-            sb.append('\f');
-            break;
-        case 'n':
-            sb.append('\n');
-            break;
-        case 'r':
-            sb.append('\r');
-            break;
-        case 't':
-            sb.append('\t');
-            break;
-        case 'u': {
-            // kind of absurdly slow, but screw it for now
-            char[] a = new char[4];
-            for (int i = 0; i < 4; ++i) {
-                int c = nextCharRaw();
-                if (c == -1)
-                    throw problem("End of input but expecting 4 hex digits for \\uXXXX escape");
-                a[i] = (char) c;
-            }
-            String digits = new String(a);
-            try {
-                sb.appendCodePoint(Integer.parseInt(digits, 16));
-            } catch (NumberFormatException e) {
-                throw problem(digits, String.format(
-                        "Malformed hex digits after \\u escape in string: '%s'", digits), e);
-            }
-        }
-            break;
-        default:
-            throw problem(
-                    asString(escaped),
-                    String.format(
-                            "backslash followed by '%s', this is not a valid escape sequence (quoted strings use JSON escaping, so use double-backslash \\\\ for literal backslash)",
-                            asString(escaped)));
-        }
-    }
-
-    private void appendTripleQuotedString(StringBuilder sb) throws ProblemException {
-        // we are after the opening triple quote and need to consume the
-        // close triple
-        int consecutiveQuotes = 0;
-        for (;;) {
-            int c = nextCharRaw();
-
-            if (c == '"') {
-                consecutiveQuotes += 1;
-            } else if (consecutiveQuotes >= 3) {
-                // the last three quotes end the string and the others are
-                // kept.
-                sb.setLength(sb.length() - 3);
-                putBack(c);
-                break;
-            } else {
-                consecutiveQuotes = 0;
-                if (c == -1)
-                    throw problem("End of input but triple-quoted string was still open");
-                else if (c == '\n') {
-                    // keep the line number accurate
-                    lineNumber += 1;
-                    lineOrigin = origin.setLineNumber(lineNumber);
-                }
-            }
-
-            sb.appendCodePoint(c);
-        }
-    }
-
-    private Token pullQuotedString() throws ProblemException {
-        // the open quote has already been consumed
-        StringBuilder sb = new StringBuilder();
-        int c = '\0'; // value doesn't get used
-        do {
-            c = nextCharRaw();
-            if (c == -1)
-                throw problem("End of input but string quote was still open");
-
-            if (c == '\\') {
-                pullEscapeSequence(sb);
-            } else if (c == '"') {
-                // end the loop, done!
-            } else if (Character.isISOControl(c)) {
-                throw problem(asString(c), "JSON does not allow unescaped " + asString(c)
-                        + " in quoted strings, use a backslash escape");
-            } else {
-                sb.appendCodePoint(c);
-            }
-        } while (c != '"');
-
-        // maybe switch to triple-quoted string, sort of hacky...
-        if (sb.length() == 0) {
-            int third = nextCharRaw();
-            if (third == '"') {
-                appendTripleQuotedString(sb);
-            } else {
-                putBack(third);
-            }
-        }
-
-        return Tokens.newString(lineOrigin, sb.toString());
-    }
-
-    private Token pullPlusEquals() throws ProblemException {
-        // the initial '+' has already been consumed
-        int c = nextCharRaw();
-        if (c != '=') {
-            throw problem(asString(c), "'+' not followed by =, '" + asString(c)
-                    + "' not allowed after '+'", true /* suggestQuotes */);
-        }
-        return Tokens.PLUS_EQUALS;
-    }
-
-    private Token pullSubstitution() throws ProblemException {
-        // the initial '$' has already been consumed
-        ConfigOrigin origin = lineOrigin;
-        int c = nextCharRaw();
-        if (c != '{') {
-            throw problem(asString(c), "'$' not followed by {, '" + asString(c)
-                    + "' not allowed after '$'", true /* suggestQuotes */);
-        }
-
-        boolean optional = false;
-        c = nextCharRaw();
-        if (c == '?') {
-            optional = true;
-        } else {
-            putBack(c);
-        }
-
-        WhitespaceSaver saver = new WhitespaceSaver();
-        List<Token> expression = new ArrayList<Token>();
-
-        Token t;
-        do {
-            t = pullNextToken(saver);
-
-            // note that we avoid validating the allowed tokens inside
-            // the substitution here; we even allow nested substitutions
-            // in the tokenizer. The parser sorts it out.
-            if (t == Tokens.CLOSE_CURLY) {
-                // end the loop, done!
-                break;
-            } else if (t == Tokens.END) {
-                throw problem(origin,
-                        "Substitution ${ was not closed with a }");
-            } else {
-                Token whitespace = saver.check(t, origin, lineNumber);
-                if (whitespace != null)
-                    expression.add(whitespace);
-                expression.add(t);
-            }
-        } while (true);
-
-        return Tokens.newSubstitution(origin, optional, expression);
-    }
-
-    private Token pullNextToken(WhitespaceSaver saver) throws ProblemException {
-        int c = nextCharAfterWhitespace(saver);
-        if (c == -1) {
-            return Tokens.END;
-        } else if (c == '\n') {
-            // newline tokens have the just-ended line number
-            Token line = Tokens.newLine(lineOrigin);
-            lineNumber += 1;
-            lineOrigin = origin.setLineNumber(lineNumber);
-            return line;
-        } else {
-            Token t;
-            if (startOfComment(c)) {
-                t = pullComment(c);
-            } else {
-                switch (c) {
-                case '"':
-                    t = pullQuotedString();
-                    break;
-                case '$':
-                    t = pullSubstitution();
-                    break;
-                case ':':
-                    t = Tokens.COLON;
-                    break;
-                case ',':
-                    t = Tokens.COMMA;
-                    break;
-                case '=':
-                    t = Tokens.EQUALS;
-                    break;
-                case '{':
-                    t = Tokens.OPEN_CURLY;
-                    break;
-                case '}':
-                    t = Tokens.CLOSE_CURLY;
-                    break;
-                case '[':
-                    t = Tokens.OPEN_SQUARE;
-                    break;
-                case ']':
-                    t = Tokens.CLOSE_SQUARE;
-                    break;
-                case '+':
-                    t = pullPlusEquals();
-                    break;
-                default:
-                    t = null;
-                    break;
-                }
-
-                if (t == null) {
-                    if (firstNumberChars.indexOf(c) >= 0) {
-                        t = pullNumber(c);
-                    } else if (notInUnquotedText.indexOf(c) >= 0) {
-                        throw problem(asString(c), "Reserved character '" + asString(c)
-                                + "' is not allowed outside quotes", true /* suggestQuotes */);
-                    } else {
-                        putBack(c);
-                        t = pullUnquotedText();
-                    }
-                }
-            }
-
-            if (t == null)
-                throw new ConfigException.BugOrBroken(
-                        "bug: failed to generate next token");
-
-            return t;
-        }
-    }
-
-    private void queueNextToken() throws ProblemException {
-        Token t = pullNextToken(whitespaceSaver);
-        Token whitespace = whitespaceSaver.check(t, origin, lineNumber);
-        if (whitespace != null)
-            tokens.add(whitespace);
-
-        tokens.add(t);
-    }
-
-    @Override
-    public boolean hasNext() {
-        return !tokens.isEmpty();
-    }
-
-    @Override
-    public Token next() {
-        Token t = tokens.remove();
-        if (tokens.isEmpty() && t != Tokens.END) {
-            try {
-                queueNextToken();
-            } catch (ProblemException e) {
-                tokens.add(e.problem());
-            }
-            if (tokens.isEmpty())
-                throw new ConfigException.BugOrBroken(
-                        "bug: tokens queue should not be empty here");
-        }
-        return t;
-    }
-
-    @Override
-    public void remove() {
-        throw new UnsupportedOperationException(
-                "Does not make sense to remove items from token stream");
-    }
-}
+            raise self.problem(
+                as_string(escaped),
+                "backslash followed by '%s', this is not a valid escape "
+                "sequence (quoted strings use JSON escaping, so use "
+                "double-backslash \\\\ for literal backslash)"
+                % as_string(escaped))
+
+    def append_triple_quoted_string(self, sb):
+        """
+        We are after the opening triple quote and need to consume the
+        close triple.
+
+        :param sb: List<String> - pieces of the string being built
+        """
+        parts = []
+        while True:
+            i = self.buffer.find(u'"""', self.pos)
+            if i >= 0:
+                parts.append(self.buffer[self.pos:i])
+                self.pos = i
+                break
+            # keep two chars in case they begin a close triple that
+            # straddles the block boundary
+            end = max(self.pos, len(self.buffer) - 2)
+            parts.append(self.buffer[self.pos:end])
+            self.pos = end
+            if not self.fill_buffer():
+                # like reading a character at a time, this gives up at the
+                # end of input, on the last line
+                rest = self.buffer[self.pos:]
+                self.pos = len(self.buffer)
+                self.set_line_number(self.line_number
+                                     + u''.join(parts).count('\n')
+                                     + rest.count('\n'))
+                raise self.problem(
+                    "End of input but triple-quoted string was still open")
+
+        # the last three quotes end the string and the others are kept.
+        quotes = self.scan(_quotes_run)
+        parts.append(quotes[:-3])
+
+        s = u''.join(parts)
+        newlines = s.count('\n')
+        if newlines > 0:
+            # keep the line number accurate
+            self.set_line_number(self.line_number + newlines)
+        sb.append(s)
+
+    def pull_quoted_string(self):
+        """
+        :return: Token
+        """
+        # the open quote has already been consumed
+        sb = []
+        while True:
+            sb.append(self.scan(_quoted_text_run))
+            c = self.next_char_raw()
+            if c is EOF:
+                raise self.problem(
+                    "End of input but string quote was still open")
+
+            if c == '\\':
+                self.pull_escape_sequence(sb)
+            elif c == '"':
+                # end the loop, done!
+                break
+            else:
+                # the only other thing that stops _quoted_text_run
+                raise self.problem(
+                    as_string(c), "JSON does not allow unescaped "
+                    + as_string(c) + " in quoted strings, use a backslash "
+                    "escape")
+
+        s = u''.join(sb)
+
+        # maybe switch to triple-quoted string, sort of hacky...
+        if len(s) == 0:
+            third = self.next_char_raw()
+            if third == '"':
+                self.append_triple_quoted_string(sb)
+                s = u''.join(sb)
+            else:
+                self.put_back(third)
+
+        return tokens.new_string(self.line_origin(), self.intern(s))
+
+    def pull_plus_equals(self):
+        """
+        :return: Token
+        """
+        # the initial '+' has already been consumed
+        c = self.next_char_raw()
+        if c != '=':
+            raise self.problem(
+                as_string(c), "'+' not followed by =, '" + as_string(c)
+                + "' not allowed after '+'", suggest_quotes=True)
+        return tokens.PLUS_EQUALS
+
+    def pull_substitution(self):
+        """
+        :return: Token
+        """
+        # the initial '$' has already been consumed
+        line = self.line_number
+        c = self.next_char_raw()
+        if c != '{':
+            raise self.problem(
+                as_string(c), "'$' not followed by {, '" + as_string(c)
+                + "' not allowed after '$'", suggest_quotes=True)
+
+        optional = False
+        c = self.next_char_raw()
+        if c == '?':
+            optional = True
+        else:
+            self.put_back(c)
+
+        saver = WhitespaceSaver()
+        expression = []
+
+        while True:
+            t = self.pull_next_token(saver)
+
+            # note that we avoid validating the allowed tokens inside
+            # the substitution here; we even allow nested substitutions
+            # in the tokenizer. The parser sorts it out.
+            if t is tokens.CLOSE_CURLY:
+                # end the loop, done!
+                break
+            elif t is tokens.END:
+                raise problem(self.line_origins, "",
+                              "Substitution ${ was not closed with a }",
+                              line=line)
+            else:
+                whitespace = saver.check(t, self.unquoted_text)
+                if whitespace is not None:
+                    expression.append(whitespace)
+                expression.append(t)
+
+        return tokens.new_substitution(
+            self.line_origins, optional, expression, line)
+
+    def pull_next_token(self, saver):
+        """
+        :param saver: WhitespaceSaver
+        :return: Token
+        """
+        while True:
+            while True:
+                m = self.token_start.match(self.buffer, self.pos)
+                # a match reaching the end of the buffer may have been cut
+                # short
+                if m.end() < len(self.buffer) or not self.fill_buffer():
+                    break
+
+            kind = m.lastgroup
+            # saver only keeps whitespace that follows a simple value
+            if m.end(1) > self.pos and saver.last_token_was_simple_value:
+                saver.add(m.group(1))
+            self.pos = m.end()
+
+            if kind == 'text':
+                s = m.group(kind)
+                # we parse true/false/null tokens as such no matter
+                # what is after them, as long as they are at the
+                # start of the unquoted token.
+                first = s[0]
+                if first == 't' and s[:4] == 'true':
+                    self.pos -= len(s) - 4
+                    return tokens.new_boolean(self.line_origin(), True)
+                elif first == 'n' and s[:4] == 'null':
+                    self.pos -= len(s) - 4
+                    return tokens.new_null(self.line_origin())
+                elif first == 'f' and s[:5] == 'false':
+                    self.pos -= len(s) - 5
+                    return tokens.new_boolean(self.line_origin(), False)
+                return self.unquoted_text(s)
+            elif kind == 'punctuation':
+                return _punctuation[m.group(kind)]
+            elif kind == 'newline':
+                # newline tokens have the just-ended line number
+                line = tokens.Line(self.line_origins, self.line_number)
+                self.set_line_number(self.line_number + 1)
+                return line
+            elif kind == 'comment':
+                # the newline (if any) is left for the next token
+                if not self.drop_comments:
+                    return tokens.new_comment(
+                        self.line_origins, m.group(kind), self.line_number)
+                # what follows is a newline or the end of input
+                continue
+            elif kind == 'string':
+                return tokens.new_string(self.line_origin(),
+                                         self.intern(m.group(kind)))
+            elif kind == 'number':
+                return self.pull_number(m.group(kind))
+            elif kind == 'quote':
+                return self.pull_quoted_string()
+            break
+
+        c = self.next_char_raw()
+        if c is EOF:
+            return tokens.END
+        elif c == '$':
+            return self.pull_substitution()
+        elif c == '+':
+            return self.pull_plus_equals()
+        else:
+            # everything else stops unquoted text
+            raise self.problem(
+                as_string(c), "Reserved character '" + as_string(c)
+                + "' is not allowed outside quotes", suggest_quotes=True)
+
+    def queue_next_tokens(self):
+        """
+        Queues the tokens up to the end of a line, once at least QUEUE_SIZE
+        tokens are queued or the buffer runs out, so that next() only has to
+        call this every few lines.
+
+        The line's unquoted text, numbers, quoted strings without escapes,
+        punctuation and comments are made here straight from the matches
+        of token_start, with the saver's state in locals, so that most
+        tokens cost no call of their own. Anything else, and any match
+        that reaches the end of the buffer and so may have been cut short,
+        goes through pull_next_token().
+        """
+        saver = self.whitespace_saver
+        queue = self.tokens
+        append = queue.append
+        match = self.token_start.match
+        line_texts = self.line_texts
+        buffer = self.buffer
+        size = len(buffer)
+        pos = self.pos
+        # saver.last_token_was_simple_value and saver.whitespace
+        simple = saver.last_token_was_simple_value
+        whitespace = saver.whitespace
+        while True:
+            m = match(buffer, pos)
+            end = m.end()
+            kind = m.lastgroup
+            if end < size and kind is not None and kind != 'quote':
+                # saver only keeps whitespace that follows a simple value
+                if simple and m.end(1) > pos:
+                    whitespace += m.group(1)
+                pos = end
+
+                if kind == 'punctuation':
+                    t = _punctuation[m.group(kind)]
+                elif kind == 'text':
+                    s = m.group(kind)
+                    first = s[0]
+                    if first == 't' and s[:4] == 'true':
+                        pos -= len(s) - 4
+                        t = tokens.new_boolean(self.line_origin(), True)
+                    elif first == 'n' and s[:4] == 'null':
+                        pos -= len(s) - 4
+                        t = tokens.new_null(self.line_origin())
+                    elif first == 'f' and s[:5] == 'false':
+                        pos -= len(s) - 5
+                        t = tokens.new_boolean(self.line_origin(), False)
+                    else:
+                        # self.unquoted_text(s)
+                        t = line_texts.get(s)
+                        if t is None:
+                            t = line_texts[s] = tokens.UnquotedText(
+                                self.line_origins, self.intern(s),
+                                self.line_number)
+                elif kind == 'string':
+                    t = tokens.new_string(self.line_origin(),
+                                          self.intern(m.group(kind)))
+                elif kind == 'newline':
+                    if simple:
+                        simple = False
+                        whitespace = ''
+                    # newline tokens have the just-ended line number
+                    append(tokens.Line(self.line_origins, self.line_number))
+                    self.set_line_number(self.line_number + 1)
+                    if len(queue) < QUEUE_SIZE:
+                        line_texts = self.line_texts
+                        continue
+                    self.pos = pos
+                    saver.last_token_was_simple_value = simple
+                    saver.whitespace = whitespace
+                    return
+                elif kind == 'comment':
+                    if self.drop_comments:
+                        # what follows is a newline or the end of input
+                        continue
+                    t = tokens.Comment(self.line_origins, m.group(kind),
+                                       self.line_number)
+                else:
+                    # a number, or a problem if it's not one after all
+                    self.pos = pos
+                    saver.last_token_was_simple_value = simple
+                    saver.whitespace = whitespace
+                    t = self.pull_number(m.group(kind))
+            else:
+                self.pos = pos
+                saver.last_token_was_simple_value = simple
+                saver.whitespace = whitespace
+                t = self.pull_next_token(saver)
+                buffer = self.buffer
+                size = len(buffer)
+                pos = self.pos
+                line_texts = self.line_texts
+                simple = saver.last_token_was_simple_value
+                whitespace = saver.whitespace
+                if t is tokens.END or type(t) is tokens.Line:
+                    saver.next_is_not_a_simple_value()
+                    append(t)
+                    return
+
+            # saver.check(t, self.unquoted_text), spelled out since it runs
+            # for every token; only whitespace after a simple value needs
+            # resetting
+            if isinstance(t, _simple_value_types):
+                if simple:
+                    if whitespace:
+                        append(self.unquoted_text(whitespace))
+                        whitespace = ''
+                else:
+                    simple = True
+                    whitespace = ''
+            elif simple:
+                simple = False
+                whitespace = ''
+            append(t)
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        """
+        :return: Token
+        """
+        queue = self.tokens
+        if not queue:
+            raise StopIteration
+
+        t = queue.popleft()
+        if not queue and t is not tokens.END:
+            try:
+                self.queue_next_tokens()
+            except ProblemException as e:
+                queue.append(e.problem)
+            if not queue:
+                raise exceptions.BugOrBroken(
+                    "bug: tokens queue should not be empty here")
+        return t
+
+    __next__ = next
@@ -3,23 +3,36 @@ FIXME the way the subclasses of Token are private with static isFoo and
 accessors is kind of ridiculous.
 """
 
-from .. import exceptions, ConfigOrigin, ConfigValueType
+from .. import exceptions
 
+from .ConfigBoolean import ConfigBoolean
+from .ConfigNull import ConfigNull
+from .ConfigNumber import ConfigNumber
+from .ConfigString import ConfigString
 from .ResolveStatus import ResolveStatus
 from .Token import Token
 from .TokenType import TokenType
 
 
+# looking up an enum member costs an attribute lookup through the enum
+# machinery, and a token is made for every few characters of input
+_VALUE = TokenType.value
+_NEWLINE = TokenType.newline
+_UNQUOTED_TEXT = TokenType.unquoted_text
+_PROBLEM = TokenType.problem
+_COMMENT = TokenType.comment
+_SUBSTITUTION = TokenType.substitution
+
+
 class Value(Token):
 
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         """
         :param value: AbstractConfigValue
         """
-        super(Value, self).__init__(
-            token_type=TokenType.value,
-            origin=value.origin(),
-        )
+        super(Value, self).__init__(_VALUE, value.origin())
         self._value = value
 
     def value(self):
@@ -28,15 +41,16 @@ class Value(Token):
         """
         return self._value
 
-    def __unicode__(self):
+    def __str__(self):
         v = self.value()
         if v.resolve_status() == ResolveStatus.resolved:
-            return "'" + v.unwrapped() + "' (" + v.value_type().name() + ")"
+            return "'" + str(v.unwrapped()) + "' (" + v.value_type().name \
+                + ")"
         else:
-            return "'<unresolved value>' (" + v.value_type().name() + ")"
+            return "'<unresolved value>' (" + v.value_type().name + ")"
 
     def __repr__(self):
-        return "Value(" + unicode(self) + ")"
+        return "Value(" + str(self) + ")"
 
     def _key(self):
         return super(Value, self)._key() + (self.value(),)
@@ -44,20 +58,20 @@ class Value(Token):
 
 class Line(Token):
 
-    def __init__(self, origin):
+    __slots__ = ()
+
+    def __init__(self, origin, line=None):
         """
-        :param origin: ConfigOrigin
+        :param origin: ConfigOrigin, or LineOrigins if line is given
+        :param line: int
         """
-        super(Line, self).__init__(
-            token_type=TokenType.newline,
-            origin=origin,
-        )
+        super(Line, self).__init__(_NEWLINE, origin, None, line)
 
-    def __unicode__(self):
-        return "'\\n'@" + self.line_number()
+    def __str__(self):
+        return "'\\n'@" + str(self.line_number())
 
     def __repr__(self):
-        return "Line(" + unicode(self) + ")"
+        return "Line(" + str(self) + ")"
 
     def _key(self):
         return super(Line, self)._key() + (self.line_number(),)
@@ -68,15 +82,15 @@ class UnquotedText(Token):
     This is not a Value, because it requires special processing.
     """
 
-    def __init__(self, origin, s):
+    __slots__ = ('_value',)
+
+    def __init__(self, origin, s, line=None):
         """
-        :param origin: ConfigOrigin
+        :param origin: ConfigOrigin, or LineOrigins if line is given
         :param s: String
+        :param line: int
         """
-        super(UnquotedText, self).__init__(
-            token_type=TokenType.unquoted_text,
-            origin=origin,
-        )
+        super(UnquotedText, self).__init__(_UNQUOTED_TEXT, origin, None, line)
         self._value = s
 
     def value(self):
@@ -85,11 +99,11 @@ class UnquotedText(Token):
         """
         return self._value
 
-    def __unicode__(self):
+    def __str__(self):
         return "'" + self.value() + "'"
 
     def __repr__(self):
-        return "UnquotedText(" + unicode(self) + ")"
+        return "UnquotedText(" + str(self) + ")"
 
     def _key(self):
         return super(UnquotedText, self)._key() + (self.value(),)
@@ -97,18 +111,19 @@ class UnquotedText(Token):
 
 class Problem(Token):
 
-    def __init__(self, origin, what, message, suggest_quotes, cause):
+    __slots__ = ('_what', '_message', '_suggest_quotes', '_cause')
+
+    def __init__(self, origin, what, message, suggest_quotes, cause,
+                 line=None):
         """
-        :param origin: ConfigOrigin
+        :param origin: ConfigOrigin, or LineOrigins if line is given
         :param what: String
         :param message: String
         :param suggest_quotes: boolean
         :param cause: Throwable
+        :param line: int
         """
-        super(Problem, self).__init__(
-            token_type=TokenType.problem,
-            origin=origin,
-        )
+        super(Problem, self).__init__(_PROBLEM, origin, None, line)
         self._what = what
         self._message = message
         self._suggest_quotes = suggest_quotes
@@ -138,11 +153,11 @@ class Problem(Token):
         """
         return self._cause
 
-    def __unicode__(self):
+    def __str__(self):
         return '\'' + self.what() + '\'' + " (" + self.message() + ")"
 
     def __repr__(self):
-        return "Problem(" + unicode(self) + ")"
+        return "Problem(" + str(self) + ")"
 
     def _key(self):
         return super(Problem, self)._key() + (
@@ -155,15 +170,15 @@ class Problem(Token):
 
 class Comment(Token):
 
-    def __init__(self, origin, text):
+    __slots__ = ('_text',)
+
+    def __init__(self, origin, text, line=None):
         """
-        :param origin: ConfigOrigin
+        :param origin: ConfigOrigin, or LineOrigins if line is given
         :param text: String
+        :param line: int
         """
-        super(Comment, self).__init__(
-            token_type=TokenType.comment,
-            origin=origin,
-        )
+        super(Comment, self).__init__(_COMMENT, origin, None, line)
         self._text = text
 
     def text(self):
@@ -172,11 +187,11 @@ class Comment(Token):
         """
         return self._text
 
-    def __unicode__(self):
-        return "'#" + text + "' (COMMENT)"
+    def __str__(self):
+        return "'#" + self.text() + "' (COMMENT)"
 
     def __repr__(self):
-        return "Comment(" + unicode(self) + ")"
+        return "Comment(" + str(self) + ")"
 
     def _key(self):
         return super(Comment, self)._key() + (self.text(),)
@@ -187,16 +202,16 @@ class Substitution(Token):
     This is not a Value, because it requires special processing
     """
 
-    def __init__(self, origin, optional, expression):
+    __slots__ = ('_optional', '_value')
+
+    def __init__(self, origin, optional, expression, line=None):
         """
-        :param origin: ConfigOrigin
+        :param origin: ConfigOrigin, or LineOrigins if line is given
         :param optional: boolean
         :param expression: List<Token>
+        :param line: int
         """
-        super(Substitution, self).__init__(
-            token_type=TokenType.substitution,
-            origin=origin,
-        )
+        super(Substitution, self).__init__(_SUBSTITUTION, origin, None, line)
         self._optional = optional
         self._value = expression
 
@@ -212,14 +227,14 @@ class Substitution(Token):
         """
         return self._value
 
-    def __unicode__(self):
-        return "'${" + ''.join([map(unicode, self.value())]) + "}'"
+    def __str__(self):
+        return "'${" + ''.join(map(str, self.value())) + "}'"
 
     def __repr__(self):
-        return "Substitution(" + unicode(self) + ")"
+        return "Substitution(" + str(self) + ")"
 
     def _key(self):
-        return super(Substitution, self)._key() + (self.value(),)
+        return super(Substitution, self)._key() + (tuple(self.value()),)
 
 
 def is_value(token):
@@ -239,7 +254,7 @@ def get_value(token):
         return token.value()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get value of non-value token " + token)
+            "tried to get value of non-value token " + str(token))
 
 
 def is_value_with_type(t, value_type):
@@ -276,7 +291,7 @@ def get_problem_what(token):
         return token.what()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get problem what from " + token)
+            "tried to get problem what from " + str(token))
 
 
 def get_problem_message(token):
@@ -288,7 +303,7 @@ def get_problem_message(token):
         return token.message()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get problem message from " + token)
+            "tried to get problem message from " + str(token))
 
 
 def get_problem_suggest_quotes(token):
@@ -300,7 +315,7 @@ def get_problem_suggest_quotes(token):
         return token.suggest_quotes()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get problem suggestQuotes from " + token)
+            "tried to get problem suggestQuotes from " + str(token))
 
 
 def get_problem_cause(token):
@@ -312,7 +327,7 @@ def get_problem_cause(token):
         return token.cause()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get problem cause from " + token)
+            "tried to get problem cause from " + str(token))
 
 
 def is_comment(token):
@@ -332,7 +347,7 @@ def get_comment_text(token):
         return token.text()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get comment text from " + token)
+            "tried to get comment text from " + str(token))
 
 
 def is_unquoted_text(token):
@@ -352,7 +367,7 @@ def get_unquoted_text(token):
         return token.value()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get unquoted text from " + token)
+            "tried to get unquoted text from " + str(token))
 
 
 def is_substitution(token):
@@ -372,10 +387,10 @@ def get_substitution_path_expression(token):
         return token.value()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get substitution from " + token)
+            "tried to get substitution from " + str(token))
 
 
-def get_substitution_optinal(token):
+def get_substitution_optional(token):
     """
     :param token: Token
     :return: boolean
@@ -384,7 +399,7 @@ def get_substitution_optinal(token):
         return token.optional()
     else:
         raise exceptions.BugOrBroken(
-            "tried to get substitution optionality from " + token)
+            "tried to get substitution optionality from " + str(token))
 
 
 START = Token.new_without_origin(TokenType.start, "start of file")
@@ -399,54 +414,59 @@ CLOSE_SQUARE = Token.new_without_origin(TokenType.close_square, "']'")
 PLUS_EQUALS = Token.new_without_origin(TokenType.plus_equals, "'+='")
 
 
-def new_line(origin):
+def new_line(origin, line=None):
     """
-    :param origin: ConfigOrigin
+    :param origin: ConfigOrigin, or LineOrigins if line is given
+    :param line: int
     :return: Token
     """
-    return Line(origin)
+    return Line(origin, line)
 
 
-def new_problem(origin, what, message, suggest_quotes, cause):
+def new_problem(origin, what, message, suggest_quotes, cause, line=None):
     """
-    :param origin: ConfigOrigin
+    :param origin: ConfigOrigin, or LineOrigins if line is given
     :param what: String
     :param message: String
     :param suggest_quotes: boolean
     :param cause: Throwable
+    :param line: int
     :return: Token
     """
     return Problem(origin=origin, what=what, message=message,
-                   suggest_quotes=suggest_quotes, cause=cause)
+                   suggest_quotes=suggest_quotes, cause=cause, line=line)
 
 
-def new_comment(origin, text):
+def new_comment(origin, text, line=None):
     """
-    :param origin: ConfigOrigin
+    :param origin: ConfigOrigin, or LineOrigins if line is given
     :param text: String
+    :param line: int
     :return: Token
     """
-    return Comment(origin=origin, text=text)
+    return Comment(origin=origin, text=text, line=line)
 
 
-def new_unquoted_text(origin, s):
+def new_unquoted_text(origin, s, line=None):
     """
-    :param origin: ConfigOrigin
+    :param origin: ConfigOrigin, or LineOrigins if line is given
     :param s: String
+    :param line: int
     :return: Token
     """
-    return UnquotedText(origin=origin, s=s)
+    return UnquotedText(origin=origin, s=s, line=line)
 
 
-def new_substitution(origin, optional, expression):
+def new_substitution(origin, optional, expression, line=None):
     """
-    :param origin: ConfigOrigin
+    :param origin: ConfigOrigin, or LineOrigins if line is given
     :param optional: boolean
     :param expression: List<Token>
+    :param line: int
     :return: Token
     """
     return Substitution(origin=origin, optional=optional,
-                        expression=expression)
+                        expression=expression, line=line)
 
 
 def new_value(value):
@@ -463,7 +483,7 @@ def new_string(origin, value):
     :param value: String
     :return: Token
     """
-    return ConfigString(origin=origin, value=value)
+    return new_value(ConfigString(origin=origin, value=value))
 
 
 def new_int(origin, value, original_text):
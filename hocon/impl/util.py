@@ -11,10 +11,35 @@ def render_json_string(s):
     return json.dumps(s)
 
 
+# keys and other short strings rendered, to what they render to; a config
+# has a bounded vocabulary of keys, repeated many times over, but past this
+# many distinct strings new ones are no longer added
+MAX_RENDERED_STRINGS = 64 * 1024
+
+# longer strings are rare as keys, and are rendered afresh each time
+MAX_RENDERED_LENGTH = 64
+
+_rendered_strings = {}
+
+
 def render_string_unquoted_if_possible(s):
     """
     static String renderStringUnquotedIfPossible(String s)
     """
+    rendered = _rendered_strings.get(s)
+    if rendered is None:
+        rendered = _render_string_unquoted_if_possible(s)
+        if len(s) <= MAX_RENDERED_LENGTH \
+                and len(_rendered_strings) < MAX_RENDERED_STRINGS:
+            _rendered_strings[s] = rendered
+    return rendered
+
+
+def _render_string_unquoted_if_possible(s):
+    """
+    :param s: String
+    :return: String
+    """
 
     # this can quote unnecessarily as long as it never fails to quote when
     # necessary
@@ -50,7 +75,11 @@ def is_whitespace(c):
     # http://www.unicode.org/faq/utf_bom.html#BOM
     # we just accept it as a zero-width nonbreaking space.
 
-    return c in u' \n\u00A0\u2007\u202F\uFEFF' or c.isspace()
+    # isspace() also takes in u0085, which Java counts as a control
+    # character rather than whitespace.
+
+    return c in u' \n\u00A0\u2007\u202F\uFEFF' \
+        or (c.isspace() and c != u'\u0085')
 
 
 def unicode_trim(s):
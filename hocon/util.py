@@ -2,7 +2,12 @@
 Contains static utility methods.
 """
 
+from .Config import Config
+from .ConfigRenderOptions import ConfigRenderOptions
 from .impl import util as impl_util
+from .impl import Renderer
+from .impl import SerializedConfigValue
+from .impl.Path import Path
 
 
 def quote_string(s):
@@ -75,3 +80,49 @@ def split_path(path):
      *             if the path expression is invalid
     """
     return impl_util.split_path(path)
+
+
+def serialize(config, origins=True):
+    """
+    Writes a resolved Config or ConfigValue in a compact binary form that
+    hocon.config_factory.parse_serialized loads back.
+
+    :param config: Config or ConfigValue - must be resolved
+    :param origins: boolean - false to drop the origins of everything but
+        the root, which makes the output smaller; errors about values loaded
+        back will then only name the root's origin
+    :return: bytes
+    :raise NotResolved: if there are unresolved substitutions
+    """
+    return SerializedConfigValue.serialize(config, origins)
+
+
+def render_to(value, stream, options=None, encoding=None):
+    """
+    Renders a Config or ConfigValue as ConfigValue.render() does, but into
+    stream as it goes, so the whole text is never held in memory. The
+    stream is written to but neither flushed nor closed.
+
+    :param value: Config or ConfigValue - a Config renders its root object
+    :param stream: a writable stream, text or binary, or a socket
+    :param options: ConfigRenderOptions - defaults() if None
+    :param encoding: String - to write bytes in this encoding whatever the
+        stream is; by default text streams are written text and anything
+        else UTF-8
+    """
+    if options is None:
+        options = ConfigRenderOptions.defaults()
+    if isinstance(value, Config):
+        value = value.root()
+    Renderer.render_to(value, stream, options, encoding)
+
+
+def path_cache_stats():
+    """
+    Reports how well the cache of parsed path expressions is doing. Every
+    getter and has_path/with_value/without_path call that has to parse its
+    path expression goes through this cache.
+
+    :return: CacheStats - a namedtuple of hits, misses, size and max_size
+    """
+    return Path.path_cache_stats()
@@ -0,0 +1,462 @@
+"""
+A line by line port of Java's Tokenizer.TokenIterator, reading the input a
+character per call, kept to check and time the block-buffered tokenizer
+against; see test_tokenizer.py and the tokenize_per_character benchmark in
+profiling.py.
+
+Nothing here comes from hocon.impl.tokenizer: only the Token classes it
+makes are shared, so that the two token streams can be compared. Where
+the Python tokenizer deliberately differs from Java, so does this:
+quoted strings reject all of Java's ISO control characters, \\u escapes
+take exactly four hex digits, and a number too large for a long is
+unquoted text rather than a parse error in the making.
+"""
+
+import collections
+
+from hocon import exceptions
+from hocon.ConfigSyntax import ConfigSyntax
+from hocon.impl import tokens
+from hocon.impl import util
+
+
+# what next_char_raw() returns at the end of input, as Java's read() does
+EOF = -1
+
+# chars JSON allows a number to start with
+FIRST_NUMBER_CHARS = u"0123456789-"
+# chars JSON allows to be part of a number
+NUMBER_CHARS = u"0123456789eE+-."
+# chars that stop an unquoted string
+NOT_IN_UNQUOTED_TEXT = u"$\"{}[]:=,+#`^?!@*&\\"
+
+HEX_DIGITS = u"0123456789abcdefABCDEF"
+
+ESCAPES = {
+    u'"': u'"',
+    u'\\': u'\\',
+    u'/': u'/',
+    u'b': u'\b',
+    u'f': u'\f',
+    u'n': u'\n',
+    u'r': u'\r',
+    u't': u'\t',
+}
+
+
+def tokenize(origin, input, flavor):
+    """
+    :param origin: ConfigOrigin
+    :param input: Reader
+    :param flavor: ConfigSyntax
+    :return: Iterator<Token>
+    """
+    return PerCharacterTokenIterator(origin, input,
+                                     flavor != ConfigSyntax.json)
+
+
+class ProblemException(Exception):
+
+    def __init__(self, problem):
+        self.problem = problem
+
+
+def is_iso_control(c):
+    return c != EOF and (u'\x00' <= c <= u'\x1f' or u'\x7f' <= c <= u'\x9f')
+
+
+def as_string(c):
+    if c == u'\n':
+        return u"newline"
+    elif c == u'\t':
+        return u"tab"
+    elif c == EOF:
+        return u"end of file"
+    elif is_iso_control(c):
+        return u"control character 0x%x" % ord(c)
+    else:
+        return c
+
+
+def is_simple_value(t):
+    return tokens.is_substitution(t) or tokens.is_unquoted_text(t) \
+        or tokens.is_value(t)
+
+
+class WhitespaceSaver(object):
+
+    def __init__(self):
+        self.whitespace = []
+        self.last_token_was_simple_value = False
+
+    def add(self, c):
+        self.whitespace.append(c)
+
+    def check(self, t, base_origin, line_number):
+        if is_simple_value(t):
+            return self.next_is_a_simple_value(base_origin, line_number)
+        else:
+            self.next_is_not_a_simple_value()
+            return None
+
+    def next_is_not_a_simple_value(self):
+        self.last_token_was_simple_value = False
+        self.whitespace = []
+
+    def next_is_a_simple_value(self, base_origin, line_number):
+        t = None
+        if self.last_token_was_simple_value:
+            # need to save whitespace between the two so the parser has
+            # the option to concatenate it.
+            if self.whitespace:
+                t = tokens.new_unquoted_text(
+                    base_origin.set_line_number(line_number),
+                    u''.join(self.whitespace))
+        self.last_token_was_simple_value = True
+        self.whitespace = []
+        return t
+
+
+class PerCharacterTokenIterator(object):
+
+    def __init__(self, origin, input, allow_comments):
+        self.origin = origin
+        self.input = input
+        self.allow_comments = allow_comments
+        self.buffer = []
+        self.line_number = 1
+        self.line_origin = origin.set_line_number(self.line_number)
+        self.tokens = collections.deque([tokens.START])
+        self.whitespace_saver = WhitespaceSaver()
+
+    def next_char_raw(self):
+        if self.buffer:
+            return self.buffer.pop()
+        try:
+            c = self.input.read(1)
+        except Exception as e:
+            raise exceptions.IO(message="read error: " + str(e),
+                                origin=self.origin, cause=e)
+        return c if c else EOF
+
+    def put_back(self, c):
+        if len(self.buffer) > 2:
+            raise exceptions.BugOrBroken(
+                "bug: put_back() three times, undesirable look-ahead")
+        self.buffer.append(c)
+
+    def next_line(self):
+        self.line_number += 1
+        self.line_origin = self.origin.set_line_number(self.line_number)
+
+    def problem(self, what, message=None, suggest_quotes=False, origin=None):
+        if message is None:
+            what, message = u"", what
+        return ProblemException(tokens.new_problem(
+            origin if origin is not None else self.line_origin, what,
+            message, suggest_quotes, None))
+
+    def start_of_comment(self, c):
+        if c == EOF or not self.allow_comments:
+            return False
+        elif c == u'#':
+            return True
+        elif c == u'/':
+            maybe_second_slash = self.next_char_raw()
+            # we want to predictably NOT consume any chars
+            self.put_back(maybe_second_slash)
+            return maybe_second_slash == u'/'
+        else:
+            return False
+
+    def next_char_after_whitespace(self, saver):
+        while True:
+            c = self.next_char_raw()
+            if c == EOF:
+                return EOF
+            elif c != u'\n' and util.is_whitespace(c):
+                saver.add(c)
+            else:
+                return c
+
+    def pull_comment(self, first_char):
+        # one char has been consumed, the # or the first /
+        if first_char == u'/':
+            if self.next_char_raw() != u'/':
+                raise exceptions.BugOrBroken(
+                    "called pull_comment but // not seen")
+        sb = []
+        while True:
+            c = self.next_char_raw()
+            if c == EOF or c == u'\n':
+                self.put_back(c)
+                return tokens.new_comment(self.line_origin, u''.join(sb))
+            sb.append(c)
+
+    def pull_unquoted_text(self):
+        origin = self.line_origin
+        sb = []
+        c = self.next_char_raw()
+        while True:
+            if c == EOF or c in NOT_IN_UNQUOTED_TEXT \
+                    or util.is_whitespace(c) or self.start_of_comment(c):
+                break
+            sb.append(c)
+
+            # we parse true/false/null tokens as such no matter what is
+            # after them, as long as they are at the start of the unquoted
+            # token.
+            if len(sb) == 4:
+                s = u''.join(sb)
+                if s == u'true':
+                    return tokens.new_boolean(origin, True)
+                elif s == u'null':
+                    return tokens.new_null(origin)
+            elif len(sb) == 5:
+                if u''.join(sb) == u'false':
+                    return tokens.new_boolean(origin, False)
+
+            c = self.next_char_raw()
+
+        # put back the char that ended the unquoted text
+        self.put_back(c)
+        return tokens.new_unquoted_text(origin, u''.join(sb))
+
+    def pull_number(self, first_char):
+        sb = [first_char]
+        contained_decimal_or_e = False
+        c = self.next_char_raw()
+        while c != EOF and c in NUMBER_CHARS:
+            if c in u'.eE':
+                contained_decimal_or_e = True
+            sb.append(c)
+            c = self.next_char_raw()
+        # the last character we looked at wasn't part of the number
+        self.put_back(c)
+        s = u''.join(sb)
+        try:
+            if contained_decimal_or_e:
+                # force floating point representation
+                return tokens.new_double(self.line_origin, float(s), s)
+            else:
+                n = int(s)
+                # as Long.parseLong() throws
+                if n < -2 ** 63 or n > 2 ** 63 - 1:
+                    raise ValueError(s)
+                return tokens.new_long(self.line_origin, n, s)
+        except ValueError:
+            # not a number after all, see if it's an unquoted string.
+            for u in s:
+                if u in NOT_IN_UNQUOTED_TEXT:
+                    raise self.problem(
+                        as_string(u), u"Reserved character '" + as_string(u)
+                        + u"' is not allowed outside quotes",
+                        suggest_quotes=True)
+            # no evil chars so we just decide this was a string and not a
+            # number.
+            return tokens.new_unquoted_text(self.line_origin, s)
+
+    def pull_escape_sequence(self, sb):
+        escaped = self.next_char_raw()
+        if escaped == EOF:
+            raise self.problem(
+                u"End of input but backslash in string had nothing after it")
+
+        if escaped in ESCAPES:
+            sb.append(ESCAPES[escaped])
+        elif escaped == u'u':
+            a = []
+            for i in range(4):
+                c = self.next_char_raw()
+                if c == EOF:
+                    raise self.problem(
+                        u"End of input but expecting 4 hex digits for "
+                        u"\\uXXXX escape")
+                a.append(c)
+            digits = u''.join(a)
+            if not all(c in HEX_DIGITS for c in digits):
+                raise self.problem(
+                    digits,
+                    u"Malformed hex digits after \\u escape in string: '%s'"
+                    % digits)
+            sb.append(chr(int(digits, 16)))
+        else:
+            raise self.problem(
+                as_string(escaped),
+                u"backslash followed by '%s', this is not a valid escape "
+                u"sequence (quoted strings use JSON escaping, so use "
+                u"double-backslash \\\\ for literal backslash)"
+                % as_string(escaped))
+
+    def append_triple_quoted_string(self, sb):
+        # we are after the opening triple quote and need to consume the
+        # close triple
+        consecutive_quotes = 0
+        while True:
+            c = self.next_char_raw()
+            if c == u'"':
+                consecutive_quotes += 1
+            elif consecutive_quotes >= 3:
+                # the last three quotes end the string and the others are
+                # kept.
+                del sb[-3:]
+                self.put_back(c)
+                return
+            else:
+                consecutive_quotes = 0
+                if c == EOF:
+                    raise self.problem(
+                        u"End of input but triple-quoted string was still "
+                        u"open")
+                elif c == u'\n':
+                    # keep the line number accurate
+                    self.next_line()
+            sb.append(c)
+
+    def pull_quoted_string(self):
+        # the open quote has already been consumed
+        sb = []
+        while True:
+            c = self.next_char_raw()
+            if c == EOF:
+                raise self.problem(
+                    u"End of input but string quote was still open")
+
+            if c == u'\\':
+                self.pull_escape_sequence(sb)
+            elif c == u'"':
+                break
+            elif is_iso_control(c):
+                raise self.problem(
+                    as_string(c), u"JSON does not allow unescaped "
+                    + as_string(c) + u" in quoted strings, use a backslash "
+                    u"escape")
+            else:
+                sb.append(c)
+
+        # maybe switch to triple-quoted string, sort of hacky...
+        if not sb:
+            third = self.next_char_raw()
+            if third == u'"':
+                self.append_triple_quoted_string(sb)
+            else:
+                self.put_back(third)
+
+        return tokens.new_string(self.line_origin, u''.join(sb))
+
+    def pull_plus_equals(self):
+        # the initial '+' has already been consumed
+        c = self.next_char_raw()
+        if c != u'=':
+            raise self.problem(
+                as_string(c), u"'+' not followed by =, '" + as_string(c)
+                + u"' not allowed after '+'", suggest_quotes=True)
+        return tokens.PLUS_EQUALS
+
+    def pull_substitution(self):
+        # the initial '$' has already been consumed
+        origin = self.line_origin
+        c = self.next_char_raw()
+        if c != u'{':
+            raise self.problem(
+                as_string(c), u"'$' not followed by {, '" + as_string(c)
+                + u"' not allowed after '$'", suggest_quotes=True)
+
+        optional = False
+        c = self.next_char_raw()
+        if c == u'?':
+            optional = True
+        else:
+            self.put_back(c)
+
+        saver = WhitespaceSaver()
+        expression = []
+
+        while True:
+            t = self.pull_next_token(saver)
+
+            # note that we avoid validating the allowed tokens inside the
+            # substitution here; we even allow nested substitutions in the
+            # tokenizer. The parser sorts it out.
+            if t is tokens.CLOSE_CURLY:
+                break
+            elif t is tokens.END:
+                raise self.problem(
+                    u"Substitution ${ was not closed with a }",
+                    origin=origin)
+            else:
+                whitespace = saver.check(t, origin, self.line_number)
+                if whitespace is not None:
+                    expression.append(whitespace)
+                expression.append(t)
+
+        return tokens.new_substitution(origin, optional, expression)
+
+    def pull_next_token(self, saver):
+        c = self.next_char_after_whitespace(saver)
+        if c == EOF:
+            return tokens.END
+        elif c == u'\n':
+            # newline tokens have the just-ended line number
+            line = tokens.new_line(self.line_origin)
+            self.next_line()
+            return line
+
+        if self.start_of_comment(c):
+            return self.pull_comment(c)
+        elif c == u'"':
+            return self.pull_quoted_string()
+        elif c == u'$':
+            return self.pull_substitution()
+        elif c == u':':
+            return tokens.COLON
+        elif c == u',':
+            return tokens.COMMA
+        elif c == u'=':
+            return tokens.EQUALS
+        elif c == u'{':
+            return tokens.OPEN_CURLY
+        elif c == u'}':
+            return tokens.CLOSE_CURLY
+        elif c == u'[':
+            return tokens.OPEN_SQUARE
+        elif c == u']':
+            return tokens.CLOSE_SQUARE
+        elif c == u'+':
+            return self.pull_plus_equals()
+        elif c in FIRST_NUMBER_CHARS:
+            return self.pull_number(c)
+        elif c in NOT_IN_UNQUOTED_TEXT:
+            raise self.problem(
+                as_string(c), u"Reserved character '" + as_string(c)
+                + u"' is not allowed outside quotes", suggest_quotes=True)
+        else:
+            self.put_back(c)
+            return self.pull_unquoted_text()
+
+    def queue_next_token(self):
+        t = self.pull_next_token(self.whitespace_saver)
+        whitespace = self.whitespace_saver.check(t, self.origin,
+                                                 self.line_number)
+        if whitespace is not None:
+            self.tokens.append(whitespace)
+        self.tokens.append(t)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.tokens:
+            raise StopIteration
+        t = self.tokens.popleft()
+        if not self.tokens and t is not tokens.END:
+            try:
+                self.queue_next_token()
+            except ProblemException as e:
+                self.tokens.append(e.problem)
+            if not self.tokens:
+                raise exceptions.BugOrBroken(
+                    "bug: tokens queue should not be empty here")
+        return t
+
+    next = __next__
@@ -0,0 +1,821 @@
+"""
+Timing harnesses over the files in test/resources, ported from
+test/scala/Profiling.scala and extended to the rest of the pipeline.
+
+    python test/python/profiling.py                  # every benchmark
+    python test/python/profiling.py resolve getters  # just these
+    python test/python/profiling.py resolve -loop    # run forever, for
+                                                     # attaching a profiler
+    python test/python/profiling.py --json           # machine-readable
+
+Each benchmark is warmed up, then timed for several rounds of a fixed number
+of iterations; the reported times are per iteration. With --json the results
+go to stdout as one JSON object, tagged with the interpreter and the git
+commit, so runs can be compared across commits.
+"""
+
+from __future__ import print_function
+
+import argparse
+import atexit
+import collections
+import glob
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+RESOURCES = os.path.join(ROOT, 'test', 'resources')
+
+sys.path.insert(0, ROOT)
+
+from hocon import config_factory, util
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.ConfigRenderOptions import ConfigRenderOptions
+from hocon.ConfigSyntax import ConfigSyntax
+from hocon.impl import Parseable, tokenizer
+from hocon.impl import util as impl_util
+from hocon.impl.Path import Path
+from hocon.impl.SimpleConfig import SimpleConfig
+
+import per_character_tokenizer
+
+
+def resource(name):
+    return os.path.join(RESOURCES, name)
+
+
+# fixtures for parse errors, which every parse of them ends in
+BROKEN = ('cycle.conf', 'include-from-list.conf')
+
+
+def corpus():
+    """
+    :return: List<String> - the files in test/resources but BROKEN; a
+        benchmark that can't parse one of them fails rather than timing less
+        work
+    """
+    files = sorted(path for path in glob.glob(os.path.join(RESOURCES, '*.*'))
+                   if os.path.basename(path) not in BROKEN)
+    check(len(files) > 0, "corpus: no files in " + RESOURCES)
+    return files
+
+
+def check(ok, what):
+    if not ok:
+        raise Exception("broken " + what)
+
+
+# Each benchmark is a function doing the setup and returning the task to be
+# timed, along with how many iterations make up one round, and optionally
+# some measurements of its own to report alongside the times.
+
+Benchmark = collections.namedtuple('Benchmark',
+                                   ('task', 'iterations', 'metrics'))
+Benchmark.__new__.__defaults__ = (None,)
+
+MEGABYTE = 1024 * 1024
+
+
+def traced_memory(call):
+    """
+    Runs call with tracemalloc tracing allocations.
+
+    :param call: function() -> Object
+    :return: (int, int) - bytes still allocated when call returns, its result
+        included, and the peak; None where tracemalloc isn't available
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    tracemalloc.start()
+    try:
+        result = call()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return retained, peak
+
+
+def file_load():
+    def task():
+        conf = config_factory.parse_file(resource('test04.conf')).resolve()
+        check(conf.get_string("akka.version") == "2.0-SNAPSHOT",
+              "file load")
+    return Benchmark(task, 100)
+
+
+def resolve():
+    conf = config_factory.parse_file(resource('test02.conf'))
+
+    def task():
+        check(conf.resolve().get_int("103_a") == 103, "resolve")
+    return Benchmark(task, 1000)
+
+
+def _token_files():
+    # properties files never go through the tokenizer
+    return [path for path in corpus() if not path.endswith('.properties')]
+
+
+def _tokens(path, options, tokenize):
+    """
+    :param tokenize: function(ConfigOrigin, Reader, ConfigSyntax) ->
+        Iterator<Token>
+    :return: List<Token>
+    """
+    parseable = Parseable.new_file(path, options)
+    reader = parseable.reader()
+    try:
+        return list(tokenize(parseable.create_origin(), reader,
+                             Parseable.syntax_from_extension(path)))
+    finally:
+        reader.close()
+
+
+def _tokenize(options):
+    files = _token_files()
+
+    def task():
+        for path in files:
+            _tokens(path, options, tokenizer.tokenize)
+    return Benchmark(task, 100)
+
+
+def tokenize():
+    return _tokenize(ConfigParseOptions.defaults())
+
+
+def tokenize_mmap():
+    return _tokenize(ConfigParseOptions.defaults().set_use_mmap(True))
+
+
+def tokenize_per_character():
+    """
+    Tokenizes Akka's reference.conf with a port of Java's per-character
+    TokenIterator, once every file is seen to make the same tokens both
+    ways. The speedup is how many times as long this takes as the block
+    scanner does on the same file.
+    """
+    options = ConfigParseOptions.defaults()
+    for path in _token_files():
+        check(_tokens(path, options, per_character_tokenizer.tokenize)
+              == _tokens(path, options, tokenizer.tokenize),
+              "per-character tokenize of " + path)
+    path = resource('test04.conf')
+
+    def task():
+        _tokens(path, options, per_character_tokenizer.tokenize)
+
+    def block_task():
+        _tokens(path, options, tokenizer.tokenize)
+
+    metrics = collections.OrderedDict((
+        ('speedup', min(timeit.repeat(task, number=10, repeat=20))
+         / min(timeit.repeat(block_task, number=10, repeat=20))),
+    ))
+    return Benchmark(task, 10, metrics)
+
+
+def token_memory():
+    """
+    Tokenizes about a megabyte of HOCON made by repeating the .conf files,
+    and reports how many tokens it makes and how much memory they hold, per
+    megabyte of input. Allocations are only counted where tracemalloc is
+    available.
+    """
+    chunks = []
+    for path in corpus():
+        if path.endswith('.conf'):
+            with io.open(path, encoding='utf-8') as f:
+                chunks.append(f.read() + u'\n')
+    chunk = u''.join(chunks)
+    text = chunk * (MEGABYTE // len(chunk.encode('utf-8')) + 1)
+    megabytes = len(text.encode('utf-8')) / float(MEGABYTE)
+    origin = Parseable.new_string(
+        text, ConfigParseOptions.defaults()).create_origin()
+
+    def tokenize_all():
+        return list(tokenizer.tokenize(
+            origin, io.StringIO(text), ConfigSyntax.conf))
+
+    def task():
+        tokenize_all()
+
+    seen = set()
+    size = 0
+    result = tokenize_all()
+    for token in result:
+        if id(token) not in seen:
+            seen.add(id(token))
+            size += sys.getsizeof(token)
+    metrics = collections.OrderedDict((
+        ('input_mb', megabytes),
+        ('tokens_per_mb', len(result) / megabytes),
+        ('distinct_tokens_per_mb', len(seen) / megabytes),
+        ('token_bytes_per_mb', size / megabytes),
+    ))
+    del result
+
+    traced = traced_memory(tokenize_all)
+    if traced is not None:
+        retained, peak = traced
+        metrics['retained_bytes_per_mb'] = retained / megabytes
+        metrics['peak_bytes_per_mb'] = peak / megabytes
+    return Benchmark(task, 5, metrics)
+
+
+def parse():
+    files = corpus()
+
+    def task():
+        for path in files:
+            config_factory.parse_file(path)
+    return Benchmark(task, 100)
+
+
+def _parse_reference(options):
+    # test04.conf is Akka's reference.conf: over half of it is comments
+    path = resource('test04.conf')
+
+    def task():
+        conf = config_factory.parse_file(path, options)
+        check(conf.get_string("akka.version") == "2.0-SNAPSHOT",
+              "reference parse")
+    return Benchmark(task, 100)
+
+
+def parse_reference():
+    return _parse_reference(ConfigParseOptions.defaults())
+
+
+def parse_reference_drop_comments():
+    return _parse_reference(
+        ConfigParseOptions.defaults().set_drop_comments(True))
+
+
+def parse_reference_only_paths():
+    return _parse_reference(ConfigParseOptions.defaults().set_only_paths(
+        ['akka.version', 'akka.actor.deployment']))
+
+
+def _large_json():
+    """
+    :return: String - path of a generated JSON document of a few megabytes
+    """
+    def tree(depth):
+        if depth == 0:
+            return [1, 2.5, u"string", True, None]
+        return dict(('key%d' % i, tree(depth - 1)) for i in range(8))
+    directory = tempfile.mkdtemp(prefix='hocon-profiling-')
+    atexit.register(shutil.rmtree, directory, True)
+    path = os.path.join(directory, 'large.json')
+    # json.dumps makes str on Python 2, so write it encoded
+    with io.open(path, 'wb') as f:
+        f.write(json.dumps(tree(5), indent=2, sort_keys=True).encode('utf-8'))
+    return path
+
+
+def _large_conf():
+    """
+    :return: String - path of a generated .conf of about a megabyte,
+        test04.conf over and over under different keys
+    """
+    with io.open(resource('test04.conf'), encoding='utf-8') as f:
+        text = f.read()
+    directory = tempfile.mkdtemp(prefix='hocon-profiling-')
+    atexit.register(shutil.rmtree, directory, True)
+    path = os.path.join(directory, 'large.conf')
+    with io.open(path, 'w', encoding='utf-8') as f:
+        for i in range(MEGABYTE // len(text.encode('utf-8')) + 1):
+            f.write(u'copy%d {\n%s\n}\n' % (i, text))
+    return path
+
+
+# run by _peak_rss() in a new interpreter: parses a file and prints the
+# interpreter's peak RSS in bytes before and after. Linux's VmHWM starts
+# afresh with the new interpreter, where ru_maxrss carries over the RSS of
+# the process it was forked from.
+_PEAK_RSS_SCRIPT = u"""
+import sys
+sys.path.insert(0, sys.argv[1])
+from hocon import config_factory
+from hocon.ConfigParseOptions import ConfigParseOptions
+
+def peak():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except IOError:
+        pass
+    import resource
+    # kilobytes, but bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+before = peak()
+config_factory.parse_path(sys.argv[2], ConfigParseOptions.defaults()
+                          .set_use_mmap(sys.argv[3] == 'mmap'))
+print(before, peak())
+"""
+
+
+def _peak_rss(path, use_mmap):
+    """
+    Parses path in a new interpreter, so that no other benchmark's memory
+    counts.
+
+    :return: (float, float) - peak RSS in megabytes before and after the
+        parse, or None where there's neither /proc nor a resource module
+    """
+    try:
+        output = subprocess.check_output([
+            sys.executable, '-c', _PEAK_RSS_SCRIPT, ROOT, path,
+            'mmap' if use_mmap else 'read'])
+    except subprocess.CalledProcessError:
+        return None
+    return tuple(int(n) / float(MEGABYTE)
+                 for n in output.decode('ascii').split())
+
+
+def _parse_large(use_mmap):
+    """
+    Parses about a megabyte of HOCON with parse_path, and reports the peak
+    RSS of a fresh interpreter doing the same, and how much of it the parse
+    added.
+
+    :param use_mmap: boolean
+    """
+    path = _large_conf()
+    options = ConfigParseOptions.defaults().set_use_mmap(use_mmap)
+    check(config_factory.parse_path(path, options).root()
+          == config_factory.parse_path(path).root(), "mapped parse")
+
+    def task():
+        conf = config_factory.parse_path(path, options)
+        check(conf.has_path("copy0.akka.version"), "large parse")
+
+    metrics = collections.OrderedDict((
+        ('input_mb', os.path.getsize(path) / float(MEGABYTE)),
+    ))
+    rss = _peak_rss(path, use_mmap)
+    if rss is not None:
+        metrics['peak_rss_mb'] = rss[1]
+        metrics['parse_rss_mb'] = rss[1] - rss[0]
+    return Benchmark(task, 1, metrics)
+
+
+def parse_large():
+    return _parse_large(False)
+
+
+def parse_large_mmap():
+    return _parse_large(True)
+
+
+def _parse_json(options):
+    path = _large_json()
+
+    def task():
+        conf = config_factory.parse_file(path, options)
+        check(len(conf.get_list("key7.key7.key7.key7.key7")) == 5,
+              "JSON parse")
+    return Benchmark(task, 5)
+
+
+def parse_json():
+    return _parse_json(ConfigParseOptions.defaults())
+
+
+def parse_json_native():
+    return _parse_json(ConfigParseOptions.defaults().set_native_json("file"))
+
+
+def parse_json_native_lines():
+    return _parse_json(ConfigParseOptions.defaults().set_native_json("line"))
+
+
+def events():
+    path = resource('test04.conf')
+
+    def task():
+        for event in config_factory.parse_file_events(path):
+            pass
+    return Benchmark(task, 100)
+
+
+def parse_parallel():
+    # equiv03 is a tree of includes: siblings, nested and at the root
+    path = resource(os.path.join('equiv03', 'includes.conf'))
+    serial = config_factory.parse_path_any_syntax(path).root()
+    expected = config_factory.parse_file(
+        resource(os.path.join('equiv03', 'original.json'))).root()
+
+    def task():
+        root = config_factory.parse_path_parallel(path).root()
+        check(root == serial and root == expected, "parallel parse")
+    return Benchmark(task, 10)
+
+
+def parse_shared_includes():
+    # twenty files all including the same large one
+    directory = tempfile.mkdtemp(prefix='hocon-profiling-')
+    atexit.register(shutil.rmtree, directory, True)
+    shutil.copy(resource('test04.conf'),
+                os.path.join(directory, 'common.conf'))
+    with io.open(os.path.join(directory, 'root.conf'), 'w') as root:
+        for i in range(20):
+            name = 'part%d.conf' % i
+            with io.open(os.path.join(directory, name), 'w') as part:
+                part.write(u'include "common.conf"\npart = %d\n' % i)
+            root.write(u'p%d { include "%s" }\n' % (i, name))
+    path = os.path.join(directory, 'root.conf')
+
+    def task():
+        conf = config_factory.parse_file(path)
+        check(conf.get_string("p19.akka.version") == "2.0-SNAPSHOT",
+              "shared includes")
+    return Benchmark(task, 10)
+
+
+def parse_cached():
+    files = [path for path in corpus() if path.endswith('.conf')]
+    directory = tempfile.mkdtemp(prefix='hocon-profiling-')
+    atexit.register(shutil.rmtree, directory, True)
+
+    def task():
+        for path in files:
+            config_factory.parse_path_cached(path, directory)
+    # fill the cache; what's timed is the hit path
+    task()
+    return Benchmark(task, 100)
+
+
+def load_serialized():
+    conf = config_factory.parse_file(resource('test04.conf')).resolve()
+    data = util.serialize(conf)
+
+    def task():
+        loaded = config_factory.parse_serialized(data)
+        check(loaded.get_string("akka.version") == "2.0-SNAPSHOT",
+              "serialized load")
+    return Benchmark(task, 100)
+
+
+def merge():
+    configs = [config_factory.parse_file(path) for path in corpus()]
+
+    def task():
+        merged = configs[0]
+        for c in configs[1:]:
+            merged = merged.with_fallback(c)
+    return Benchmark(task, 1000)
+
+
+def _fold_layers(layers):
+    merged = layers[0]
+    for layer in layers[1:]:
+        merged = merged.with_fallback(layer)
+    return merged
+
+
+def _merge_layers(count, merge_layers):
+    """
+    Merges a stack of count layers, highest priority first, and reports the
+    memory the result holds and the peak memory taken by merging, where
+    tracemalloc is available. Each layer sets a few things of its own over
+    the same reference config, as layers loaded separately over a shared
+    reference.conf do.
+
+    :param count: int
+    :param merge_layers: function(List<Config>) -> Config
+    """
+    reference = config_factory.parse_file(resource('test04.conf')).resolve()
+    layers = [config_factory.parse_string(
+        u'akka.version = "%d"\nakka.layer%d.enabled = true\n' % (i, i))
+        .with_fallback(reference).resolve() for i in range(count)]
+
+    def merge_all():
+        return merge_layers(layers)
+
+    check(merge_all() == _fold_layers(layers), "merged as with_fallback does")
+
+    def task():
+        merged = merge_all()
+        check(merged.get_string("akka.version") == "0"
+              and merged.has_path("akka.layer%d" % (count - 1)),
+              "layered merge")
+
+    metrics = collections.OrderedDict()
+    traced = traced_memory(merge_all)
+    if traced is not None:
+        retained, peak = traced
+        metrics['retained_bytes'] = retained
+        metrics['peak_bytes'] = peak
+    return Benchmark(task, 1000 // count, metrics)
+
+
+def merge_layers_10():
+    return _merge_layers(10, _fold_layers)
+
+
+def merge_layers_50():
+    return _merge_layers(50, _fold_layers)
+
+
+def merge_layers_batch_10():
+    return _merge_layers(10, config_factory.merge)
+
+
+def merge_layers_batch_50():
+    return _merge_layers(50, config_factory.merge)
+
+
+def render():
+    roots = [config_factory.parse_file(path).root() for path in corpus()]
+
+    def task():
+        for root in roots:
+            root.render()
+    return Benchmark(task, 100)
+
+
+def _render_large(render_into, options):
+    """
+    Renders a resolved config of a few megabytes into a file, and reports
+    how big the output is and the peak memory taken by rendering it, where
+    tracemalloc is available.
+
+    :param render_into: function(ConfigObject, ConfigRenderOptions,
+        binary file)
+    :param options: ConfigRenderOptions
+    """
+    path = _large_json()
+    root = config_factory.parse_file(path).resolve().root()
+    out = os.path.join(os.path.dirname(path), 'rendered.conf')
+
+    def task():
+        with io.open(out, 'wb') as f:
+            render_into(root, options, f)
+
+    task()
+    # every way of rendering has to make the same text
+    streamed = io.StringIO()
+    util.render_to(root, streamed, options)
+    with io.open(out, encoding='utf-8') as f:
+        check(f.read() == streamed.getvalue(), "large render")
+    metrics = collections.OrderedDict((
+        ('output_mb', os.path.getsize(out) / float(MEGABYTE)),
+    ))
+    traced = traced_memory(task)
+    if traced is not None:
+        metrics['peak_bytes'] = traced[1]
+    return Benchmark(task, 5, metrics)
+
+
+def _render_whole(root, options, f):
+    f.write(root.render(options).encode('utf-8'))
+
+
+def _render_streamed(root, options, f):
+    util.render_to(root, f, options)
+
+
+def render_large():
+    return _render_large(_render_whole, ConfigRenderOptions.defaults())
+
+
+def render_large_streamed():
+    return _render_large(_render_streamed, ConfigRenderOptions.defaults())
+
+
+def render_large_concise():
+    # through the json module's encoder, where render_to walks the tree
+    return _render_large(_render_whole, ConfigRenderOptions.concise())
+
+
+def render_large_concise_streamed():
+    return _render_large(_render_streamed, ConfigRenderOptions.concise())
+
+
+def _render_many_keys(task):
+    """
+    :param task: function(Config) - renders the config
+    """
+    # a hundred thousand keys, with a hundred distinct names among them,
+    # as rendered through the whole tree and through every path
+    conf = config_factory.parse_dict(dict(
+        ('group%d' % i, dict(('key-%d' % j, j) for j in range(100)))
+        for i in range(1000)))
+    check(len(conf.entry_set()) == 100000, "many keys")
+    return Benchmark(lambda: task(conf), 5)
+
+
+def _render_keys(conf):
+    conf.root().render(ConfigRenderOptions.concise().set_json(False))
+    for path, value in conf.entry_set():
+        pass
+
+
+def render_many_keys():
+    return _render_many_keys(_render_keys)
+
+
+def render_many_keys_uncached():
+    # what rendering the keys cost before it was memoized
+    def render_key(key):
+        if Path.has_funky_chars(key) or len(key) == 0:
+            return impl_util.render_json_string(key)
+        return key
+
+    def task(conf):
+        saved = (impl_util.render_string_unquoted_if_possible,
+                 Path.__dict__['render_key'])
+        impl_util.render_string_unquoted_if_possible = \
+            impl_util._render_string_unquoted_if_possible
+        Path.render_key = staticmethod(render_key)
+        try:
+            _render_keys(conf)
+        finally:
+            (impl_util.render_string_unquoted_if_possible,
+             Path.render_key) = saved
+    return _render_many_keys(task)
+
+
+def getters():
+    conf = config_factory.parse_file(resource('test04.conf')).resolve()
+    paths = [path for path, value in conf.entry_set()]
+
+    def task():
+        for path in paths:
+            conf.get_value(path)
+        check(conf.get_string("akka.version") == "2.0-SNAPSHOT", "getters")
+    return Benchmark(task, 1000)
+
+
+def getters_unindexed():
+    # what the getters cost before the flat path index, walking the tree
+    conf = config_factory.parse_file(resource('test04.conf')).resolve()
+    paths = [path for path, value in conf.entry_set()]
+    for path in paths:
+        check(SimpleConfig._find(conf.root(), Path.new_path(path), None,
+                                 Path.new_path(path))
+              is conf.get_value(path), "unindexed getters")
+
+    def task():
+        for path in paths:
+            parsed = Path.new_path(path)
+            SimpleConfig._find(conf.root(), parsed, None, parsed)
+    return Benchmark(task, 1000)
+
+
+def path_parse():
+    conf = config_factory.parse_file(resource('test04.conf')).resolve()
+    expressions = [path for path, value in conf.entry_set()]
+
+    def task():
+        for expression in expressions:
+            Path.new_path(expression)
+    return Benchmark(task, 1000)
+
+
+def path_ops():
+    path = Path.of_elements(*("k%d" % i for i in range(20)))
+
+    def task():
+        p = path
+        while p is not None:
+            p.length()
+            p.last()
+            p = p.parent()
+        path.sub_path(5, 15).prepend(path)
+    return Benchmark(task, 10000)
+
+
+def reload_unchanged():
+    reloader = config_factory.parse_paths_reloadable(
+        [resource('test03.conf'), resource('test04.conf')])
+
+    def task():
+        reloader.reload()
+    return Benchmark(task, 1000)
+
+
+BENCHMARKS = collections.OrderedDict((f.__name__, f) for f in (
+    file_load, resolve, tokenize, tokenize_mmap, tokenize_per_character,
+    token_memory, parse, parse_large, parse_large_mmap,
+    parse_reference, parse_reference_drop_comments,
+    parse_reference_only_paths, parse_json, parse_json_native,
+    parse_json_native_lines, events, parse_parallel,
+    parse_shared_includes, parse_cached,
+    load_serialized, merge, merge_layers_10, merge_layers_50,
+    merge_layers_batch_10, merge_layers_batch_50, render, render_large,
+    render_large_streamed, render_large_concise,
+    render_large_concise_streamed, render_many_keys,
+    render_many_keys_uncached, getters, getters_unindexed, path_parse,
+    path_ops, reload_unchanged,
+))
+
+
+def time_rounds(benchmark, rounds, warmup):
+    """
+    :return: List<float> - seconds per iteration, one entry per round
+    """
+    for i in range(warmup):
+        benchmark.task()
+    results = []
+    for r in range(rounds):
+        start = timeit.default_timer()
+        for i in range(benchmark.iterations):
+            benchmark.task()
+        elapsed = timeit.default_timer() - start
+        results.append(elapsed / benchmark.iterations)
+    return results
+
+
+def summarize(seconds, iterations):
+    ordered = sorted(seconds)
+    return collections.OrderedDict((
+        ('iterations', iterations),
+        ('rounds', len(seconds)),
+        ('min_ms', ordered[0] * 1000),
+        ('median_ms', ordered[len(ordered) // 2] * 1000),
+        ('mean_ms', sum(ordered) / len(ordered) * 1000),
+    ))
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(
+        description="Time parts of the config pipeline.")
+    parser.add_argument('benchmarks', nargs='*', metavar='benchmark',
+                        help="any of: " + ", ".join(BENCHMARKS))
+    parser.add_argument('-loop', action='store_true',
+                        help="after timing, run the tasks forever")
+    parser.add_argument('--json', action='store_true',
+                        help="print results as JSON")
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=20,
+                        help="untimed runs before the first round")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="multiply every benchmark's iterations")
+    args = parser.parse_args(argv)
+
+    names = args.benchmarks or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error("unknown benchmark: " + name)
+
+    results = collections.OrderedDict()
+    tasks = []
+    for name in names:
+        benchmark = BENCHMARKS[name]()
+        benchmark = benchmark._replace(
+            iterations=max(1, int(benchmark.iterations * args.scale)))
+        tasks.append(benchmark.task)
+        results[name] = summarize(
+            time_rounds(benchmark, args.rounds, args.warmup),
+            benchmark.iterations)
+        if benchmark.metrics:
+            results[name].update(benchmark.metrics)
+        if not args.json:
+            print("%s: %.3fms" % (name.replace('_', ' '),
+                                  results[name]['median_ms']))
+            for metric, value in (benchmark.metrics or {}).items():
+                print("    %s: %.1f" % (metric.replace('_', ' '), value))
+
+    if args.json:
+        print(json.dumps(collections.OrderedDict((
+            ('commit', git_commit()),
+            ('python', platform.python_version()),
+            ('implementation', platform.python_implementation()),
+            ('results', results),
+        )), indent=2))
+
+    if args.loop:
+        print("looping; ctrl+C to escape", file=sys.stderr)
+        while True:
+            for task in tasks:
+                task()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,194 @@
+"""
+Tests for config_factory.parse_url_async() and parse_file_async(), and the
+AsyncLoader behind them, against a local HTTP server.
+
+    python -m pytest test/python/test_async_loader.py
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest("AsyncLoader needs Python 3")
+
+import asyncio
+import http.server
+
+from hocon import config_factory
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.impl import AsyncLoader
+from hocon.impl import Parseable
+from hocon.impl.UrlCache import UrlCache
+
+
+# root.conf includes a.conf and b.conf side by side; a.conf includes c.conf
+FILES = {
+    'root.conf': u'include "a.conf"\ninclude "b.conf"\nroot = 0\n',
+    'a.conf': u'include "c.conf"\na = 1\n',
+    'b.conf': u'b = 2\n',
+    'c.conf': u'c = 3\n',
+}
+
+
+class _Handler(http.server.SimpleHTTPRequestHandler):
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if 'If-Modified-Since' in self.headers:
+            self.server.conditional.append(self.path)
+        super(_Handler, self).do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(object):
+    """
+    Serves a directory on an ephemeral port, and lists the paths asked for.
+    """
+
+    def __init__(self, directory):
+        def handler(*args, **kwargs):
+            return _Handler(*args, directory=directory, **kwargs)
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                     handler)
+        self.httpd.requests = []
+        self.httpd.conditional = []
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def url(self, name):
+        return 'http://127.0.0.1:%d/%s' % (self.httpd.server_port, name)
+
+    def requests(self):
+        return self.httpd.requests
+
+    def conditional_requests(self):
+        return self.httpd.conditional
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+
+class _CountingIncluder(AsyncLoader.AsyncIncluder):
+    """
+    Reads URLs slowly, keeping track of how many are being read at once.
+    """
+
+    def __init__(self):
+        super(_CountingIncluder, self).__init__()
+        self.lock = threading.Lock()
+        self.reading = 0
+        self.most_reading = 0
+
+    def read_url(self, url, url_cache=None):
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self.executor, self._read_url, url,
+                                    url_cache)
+
+    def _read_url(self, url, url_cache):
+        with self.lock:
+            self.reading += 1
+            self.most_reading = max(self.most_reading, self.reading)
+        try:
+            time.sleep(0.1)
+            return AsyncLoader._read_url(url, url_cache)
+        finally:
+            with self.lock:
+                self.reading -= 1
+
+
+class AsyncLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        for name, text in FILES.items():
+            self.write(name, text)
+        self.server = _Server(self.directory)
+        self.addCleanup(self.server.close)
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def write(self, name, text):
+        with io.open(os.path.join(self.directory, name), 'w',
+                     encoding='utf-8') as f:
+            f.write(text)
+
+    def run_until_complete(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def fetch(self, name, includer=None,
+              options=ConfigParseOptions.defaults()):
+        loader = AsyncLoader.AsyncLoader(
+            includer or AsyncLoader.AsyncIncluder(), None)
+        parseable = Parseable.new_url(self.server.url(name), options)
+        self.run_until_complete(loader.fetch(parseable))
+        return loader
+
+    def test_fetches_include_tree(self):
+        loader = self.fetch('root.conf')
+        self.assertEqual(sorted(loader.contents),
+                         sorted(self.server.url(n) for n in FILES))
+        self.assertEqual(loader.contents[self.server.url('b.conf')][0],
+                         FILES['b.conf'])
+        # each file is asked for once
+        self.assertEqual(sorted(self.server.requests()),
+                         sorted('/' + n for n in FILES))
+
+    def test_includes_read_concurrently(self):
+        includer = _CountingIncluder()
+        self.fetch('root.conf', includer)
+        # a.conf and b.conf
+        self.assertEqual(includer.most_reading, 2)
+
+    def test_included_twice_read_once(self):
+        self.write('b.conf', u'include "c.conf"\nb = 2\n')
+        self.fetch('root.conf')
+        self.assertEqual(self.server.requests().count('/c.conf'), 1)
+
+    def test_missing_include_skipped(self):
+        self.write('b.conf', u'include "missing.conf"\nb = 2\n')
+        loader = self.fetch('root.conf')
+        self.assertNotIn(self.server.url('missing.conf'), loader.contents)
+        self.assertIn(self.server.url('c.conf'), loader.contents)
+
+    def test_url_cache(self):
+        cache = UrlCache()
+        self.addCleanup(cache.close)
+        options = ConfigParseOptions.defaults().set_url_cache(cache)
+        self.fetch('root.conf', options=options)
+        self.assertEqual(self.server.conditional_requests(), [])
+        loader = self.fetch('root.conf', options=options)
+        # the second load asks whether each file changed, through the cache
+        self.assertEqual(sorted(self.server.conditional_requests()),
+                         sorted('/' + n for n in FILES))
+        self.assertEqual(loader.contents[self.server.url('b.conf')][0],
+                         FILES['b.conf'])
+
+    def test_parse_url_async(self):
+        config = self.run_until_complete(
+            config_factory.parse_url_async(self.server.url('root.conf')))
+        self.assertEqual([config.get_int(k) for k in ('root', 'a', 'b', 'c')],
+                         [0, 1, 2, 3])
+
+    def test_parse_file_async(self):
+        config = self.run_until_complete(config_factory.parse_file_async(
+            os.path.join(self.directory, 'root.conf')))
+        self.assertEqual([config.get_int(k) for k in ('root', 'a', 'b', 'c')],
+                         [0, 1, 2, 3])
+        # everything was read from disk
+        self.assertEqual(self.server.requests(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
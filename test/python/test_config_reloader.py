@@ -0,0 +1,94 @@
+"""
+Tests for config_factory.parse_paths_reloadable() and ConfigReloader.
+
+    python -m pytest test/python/test_config_reloader.py
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from hocon import config_factory, exceptions
+
+
+class ConfigReloaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.app = os.path.join(self.directory, 'application.conf')
+        self.reference = os.path.join(self.directory, 'reference.conf')
+        self.write(self.app, u'a = 1\nb = ${a}\n')
+        self.write(self.reference, u'c = 3\nd = ${c}\n')
+        self.reloader = config_factory.parse_paths_reloadable(
+            [self.app, self.reference])
+
+    def write(self, path, text):
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # a file with the same size and mtime is trusted to be unchanged,
+        # and edits here come faster than some filesystems' mtimes tick
+        self.edits = getattr(self, 'edits', 0) + 1
+        mtime = os.stat(path).st_mtime + self.edits
+        os.utime(path, (mtime, mtime))
+
+    def test_unchanged(self):
+        config = self.reloader.config()
+        self.assertIs(self.reloader.reload(), config)
+        self.assertEqual(self.reloader.changed_paths, [])
+
+    def test_reload_changed(self):
+        self.write(self.app, u'a = 2\nb = ${a}\n')
+        config = self.reloader.reload()
+        self.assertEqual(config.get_int("b"), 2)
+        self.assertEqual(config.get_int("d"), 3)
+        self.assertEqual([p.keys() for p in self.reloader.changed_paths],
+                         [("a",)])
+
+    def test_reload_moved(self):
+        self.write(self.app, u'\na = 1\nb = ${a}\n')
+        config = self.reloader.reload()
+        self.assertEqual(config.get_value("a").origin().line_number(), 2)
+        self.assertEqual(
+            sorted(p.keys() for p in self.reloader.changed_paths),
+            [("a",), ("b",)])
+
+    def test_reload_broken_then_fixed(self):
+        before = self.reloader.config()
+        # a later file fails to parse after an earlier one was re-parsed
+        self.write(self.app, u'a = 2\nb = ${a}\n')
+        self.write(self.reference, u'c = {\n')
+        with self.assertRaises(exceptions.ConfigException):
+            self.reloader.reload()
+        self.assertIs(self.reloader.config(), before)
+
+        self.write(self.reference, u'c = 4\nd = ${c}\n')
+        config = self.reloader.reload()
+        self.assertEqual(config.get_int("b"), 2)
+        self.assertEqual(config.get_int("d"), 4)
+
+    def test_reload_unresolvable_then_fixed(self):
+        before = self.reloader.config()
+        self.write(self.app, u'a = 2\nb = ${missing}\n')
+        with self.assertRaises(exceptions.UnresolvedSubstitution):
+            self.reloader.reload()
+        self.assertIs(self.reloader.config(), before)
+
+        self.write(self.app, u'a = 5\nb = ${a}\n')
+        config = self.reloader.reload()
+        self.assertEqual(config.get_int("b"), 5)
+
+    def test_reload_missing_include_created(self):
+        self.write(self.app, u'a = 1\nb = ${a}\ninclude "extra"\n')
+        self.assertFalse(self.reloader.reload().has_path("e"))
+        self.write(os.path.join(self.directory, 'extra.json'), u'{"e": 5}')
+        config = self.reloader.reload()
+        self.assertEqual(config.get_int("e"), 5)
+        self.assertEqual([p.keys() for p in self.reloader.changed_paths],
+                         [("e",)])
+
+
+if __name__ == '__main__':
+    unittest.main()
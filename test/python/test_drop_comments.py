@@ -0,0 +1,108 @@
+"""
+Tests for ConfigParseOptions.drop_comments.
+
+    python -m pytest test/python/test_drop_comments.py
+"""
+
+import glob
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from hocon import config_factory
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.impl.SimpleConfigList import SimpleConfigList
+from hocon.impl.SimpleConfigObject import SimpleConfigObject
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+DROP = ConfigParseOptions.defaults().set_drop_comments(True)
+
+
+def comments(value):
+    """
+    :return: List<String> - the comments of value and everything in it
+    """
+    found = list(value.origin().comments())
+    if isinstance(value, SimpleConfigObject):
+        for key, child in sorted(value.items()):
+            found.extend(comments(child))
+    elif isinstance(value, SimpleConfigList):
+        for child in value:
+            found.extend(comments(child))
+    return found
+
+
+def lines(value):
+    """
+    :return: List<int> - the line numbers of value and everything in it
+    """
+    found = [value.origin().line_number()]
+    if isinstance(value, SimpleConfigObject):
+        for key, child in sorted(value.items()):
+            found.extend(lines(child))
+    elif isinstance(value, SimpleConfigList):
+        for child in value:
+            found.extend(lines(child))
+    return found
+
+
+class DropCommentsTest(unittest.TestCase):
+
+    def test_corpus(self):
+        kept_any = False
+        for path in sorted(glob.glob(os.path.join(RESOURCES, '*.conf'))):
+            if os.path.basename(path) in ('cycle.conf',
+                                          'include-from-list.conf'):
+                continue
+            kept = config_factory.parse_file(path).root()
+            dropped = config_factory.parse_file(path, DROP).root()
+            self.assertEqual(dropped, kept, path)
+            self.assertEqual(lines(dropped), lines(kept), path)
+            self.assertEqual(comments(dropped), [], path)
+            kept_any = kept_any or len(comments(kept)) > 0
+        self.assertTrue(kept_any)
+
+    def test_comment_like_text_kept(self):
+        text = (u'a = "// not # a comment"\n'
+                u'b = """also // not\n# a comment"""\n'
+                u'c = x/y # but this is\n'
+                u'd = 1 // and this\n')
+        kept = config_factory.parse_string(text)
+        dropped = config_factory.parse_string(text, DROP)
+        self.assertEqual(dropped.root(), kept.root())
+        self.assertEqual(dropped.get_string(u'a'), u'// not # a comment')
+        self.assertEqual(dropped.get_string(u'c'), u'x/y')
+        self.assertEqual(comments(dropped.root()), [])
+
+    def test_includes(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with io.open(os.path.join(directory, 'a.conf'), 'w',
+                     encoding='utf-8') as f:
+            f.write(u'# about a\na = 1\ninclude "b.conf"\n')
+        with io.open(os.path.join(directory, 'b.conf'), 'w',
+                     encoding='utf-8') as f:
+            f.write(u'# about b\nb = 2\n')
+        path = os.path.join(directory, 'a.conf')
+        self.assertEqual(len(comments(config_factory.parse_file(path)
+                                      .root())), 2)
+        dropped = config_factory.parse_file(path, DROP)
+        self.assertEqual(dropped.get_int(u'b'), 2)
+        self.assertEqual(comments(dropped.root()), [])
+
+        # a cached parse keeping comments isn't reused for one dropping them
+        cache = os.path.join(directory, 'cache')
+        config_factory.parse_path_cached(path, cache)
+        cached = config_factory.parse_path_cached(path, cache, DROP)
+        self.assertEqual(comments(cached.root()), [])
+        cached = config_factory.parse_path_cached(path, cache)
+        self.assertEqual(len(comments(cached.root())), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
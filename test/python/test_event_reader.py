@@ -0,0 +1,176 @@
+"""
+Tests for config_factory.parse_file_events() and parse_string_events(),
+against the trees Parser builds from the same text.
+
+    python -m pytest test/python/test_event_reader.py
+"""
+
+import glob
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from hocon import config_factory, exceptions
+from hocon.ConfigEventType import ConfigEventType
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.ConfigSyntax import ConfigSyntax
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+TEXT = u"""
+a { b = [1, {c = x y}, [true, null]], d = 2.5 }
+a.e = "quoted"   // repeated keys merge
+a { b = [3] }
+f = 1 2 3
+"g.h" : -7
+"""
+
+
+def build(events):
+    """
+    Rebuilds the unwrapped tree the events describe, merging repeated keys
+    as Parser does: an object set over an object is merged into it, and
+    anything else replaces what was there.
+
+    :param events: Iterable<ConfigEvent> - with no substitutions, includes
+        or +=
+    :return: Dict
+    """
+    root = None
+    # (container, keys of the path it's at)
+    stack = []
+    pending = None
+
+    def put(value):
+        if not stack:
+            return value
+        container, base = stack[-1]
+        if isinstance(container, list):
+            container.append(value)
+            return value
+        keys = pending.keys()[len(base):]
+        for key in keys[:-1]:
+            if not isinstance(container.get(key), dict):
+                container[key] = {}
+            container = container[key]
+        old = container.get(keys[-1])
+        if isinstance(value, dict) and isinstance(old, dict):
+            return old
+        container[keys[-1]] = value
+        return value
+
+    for event in events:
+        kind = event.event_type
+        base = event.path.keys() if event.path is not None else ()
+        if kind == ConfigEventType.key:
+            assert event.value is False
+            pending = event.path
+        elif kind in (ConfigEventType.start_object,
+                      ConfigEventType.start_list):
+            container = put({} if kind == ConfigEventType.start_object
+                            else [])
+            if root is None:
+                root = container
+            stack.append((container, base))
+        elif kind in (ConfigEventType.end_object, ConfigEventType.end_list):
+            stack.pop()
+        elif kind == ConfigEventType.value:
+            put(event.value)
+        else:
+            raise AssertionError("unexpected " + str(event))
+    assert not stack
+    return root
+
+
+class EventReaderTest(unittest.TestCase):
+
+    def test_same_tree_as_parser(self):
+        events = list(config_factory.parse_string_events(TEXT))
+        self.assertEqual(build(events),
+                         config_factory.parse_string(TEXT).root().unwrapped())
+
+    def test_corpus(self):
+        checked = 0
+        for path in sorted(glob.glob(os.path.join(RESOURCES, '*.*'))):
+            if path.endswith('.properties'):
+                continue
+            try:
+                events = list(config_factory.parse_file_events(path))
+            except exceptions.Parse:
+                with self.assertRaises(exceptions.ConfigException):
+                    config_factory.parse_file(path).resolve()
+                continue
+            if any(e.event_type in (ConfigEventType.substitution,
+                                    ConfigEventType.include)
+                   or e.event_type == ConfigEventType.key and e.value
+                   for e in events):
+                continue
+            self.assertEqual(
+                build(events),
+                config_factory.parse_file(path).root().unwrapped(), path)
+            checked += 1
+        self.assertGreater(checked, 3)
+
+    def test_origins(self):
+        conf = config_factory.parse_string(TEXT)
+        for event in config_factory.parse_string_events(TEXT):
+            if event.event_type == ConfigEventType.value \
+                    and str(event.path) in (u'a.d', u'"g.h"'):
+                self.assertEqual(
+                    event.origin.line_number(),
+                    conf.get_value(str(event.path)).origin().line_number())
+
+    def test_substitutions_and_includes(self):
+        events = [(e.event_type, str(e.path) if e.path else None, e.value)
+                  for e in config_factory.parse_string_events(
+                      u'include file("x.conf")\na = ${?b.c}\nd += 1\n')
+                  if e.event_type not in (ConfigEventType.start_object,
+                                          ConfigEventType.end_object)]
+        self.assertEqual([(t, p) for t, p, v in events], [
+            (ConfigEventType.include, None),
+            (ConfigEventType.key, u'a'),
+            (ConfigEventType.substitution, u'a'),
+            (ConfigEventType.key, u'd'),
+            (ConfigEventType.value, u'd'),
+        ])
+        self.assertEqual(events[0][2], (u'file', u'x.conf'))
+        self.assertEqual(events[2][2][1], True)
+        self.assertEqual(str(events[2][2][0]), u'b.c')
+        self.assertEqual(events[3][2], True)
+
+    def test_json(self):
+        options = ConfigParseOptions.defaults().set_syntax(ConfigSyntax.json)
+        text = u'{"a": [1, {"b": "c"}], "d": null}'
+        self.assertEqual(
+            build(config_factory.parse_string_events(text, options)),
+            config_factory.parse_string(text, options).root().unwrapped())
+        with self.assertRaises(exceptions.Parse):
+            list(config_factory.parse_string_events(u'a = 1', options))
+
+    def test_errors(self):
+        for text in (u'a = {', u'a = [1, 2', u'a = }', u'{ a = 1 } }',
+                     u'a = 1 = 2', u'"a" [1] = 2'):
+            with self.assertRaises(exceptions.Parse):
+                config_factory.parse_string(text)
+            with self.assertRaises(exceptions.Parse):
+                list(config_factory.parse_string_events(text))
+
+    def test_stop_early(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'big.conf')
+        with io.open(path, 'w', encoding='utf-8') as f:
+            for i in range(10000):
+                f.write(u'k%d = %d\n' % (i, i))
+        events = config_factory.parse_file_events(path)
+        first = [next(events) for i in range(3)]
+        self.assertEqual(first[2].value, 0)
+        events.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Tests for the parse of an include being reused when the same load
+includes it again, and for what that does to recording_files().
+
+    python -m pytest test/python/test_include_memo.py
+"""
+
+import collections
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from hocon import config_factory
+from hocon.ConfigIncluder import ConfigIncluder
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.impl import Parseable
+from hocon.impl.SimpleIncluder import SimpleIncluder
+from hocon.impl.UrlCache import UrlCache
+
+
+FILES = {
+    'shared.conf': u'x = 1\ny = ${?z}\n',
+    'app.conf': u'a { include "shared" }\n'
+                u'b { include "shared" }\n'
+                u'include "shared"\n'
+                u'z = 2\n'
+                u'b.z = 5\n',
+}
+
+
+class _RecordingIncluder(ConfigIncluder):
+    """
+    Includes as the default includer does, recording the files read for
+    the second include only.
+    """
+
+    def __init__(self):
+        self.recorded = None
+        self.count = 0
+
+    def with_fallback(self, fallback):
+        return self
+
+    def include(self, context, what):
+        self.count += 1
+        if self.count != 2:
+            return SimpleIncluder.include_without_fallback(context, what)
+        with Parseable.recording_files() as files:
+            obj = SimpleIncluder.include_without_fallback(context, what)
+        self.recorded = files
+        return obj
+
+
+class IncludeMemoTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        for name, text in FILES.items():
+            self.write(name, text)
+        self.app = os.path.join(self.directory, 'app.conf')
+        self.shared = os.path.join(self.directory, 'shared.conf')
+
+    def write(self, name, text):
+        with io.open(os.path.join(self.directory, name), 'w',
+                     encoding='utf-8') as f:
+            f.write(text)
+
+    def parse(self, options=None):
+        """
+        :return: (Config, Counter<String>) - the resolved config, and how
+            many times each file was read
+        """
+        reader = Parseable.ParseableFile.reader
+        with mock.patch.object(Parseable.ParseableFile, 'reader',
+                               autospec=True, side_effect=reader) as read:
+            conf = config_factory.parse_file(self.app, options).resolve()
+        return conf, collections.Counter(
+            os.path.basename(c[0][0]._input) for c in read.call_args_list)
+
+    def assert_values(self, conf):
+        # ${?z} is looked for under where it's included, then at the root
+        self.assertEqual(conf.root().unwrapped(), {
+            u'a': {u'x': 1, u'y': 2}, u'b': {u'x': 1, u'y': 5, u'z': 5},
+            u'x': 1, u'y': 2, u'z': 2})
+
+    def test_parsed_once_per_load(self):
+        conf, reads = self.parse()
+        self.assert_values(conf)
+        self.assertEqual(reads, {'app.conf': 1, 'shared.conf': 1})
+
+    def test_not_kept_between_loads(self):
+        self.parse()
+        self.write('shared.conf', u'x = 3\n')
+        conf, reads = self.parse()
+        self.assertEqual(conf.get_int(u'a.x'), 3)
+        self.assertEqual(reads['shared.conf'], 1)
+
+    def test_recording(self):
+        with Parseable.recording_files() as files:
+            conf, reads = self.parse()
+        self.assert_values(conf)
+        self.assertEqual(reads['shared.conf'], 1)
+        # a reused parse records the files the first one read
+        self.assertEqual([f[0] for f in files].count(self.shared), 3)
+        dependencies = Parseable.file_dependencies(files)
+        self.assertEqual(sorted(d[0] for d in dependencies
+                                if d[3] is not None),
+                         [self.app, self.shared])
+        self.assertTrue(Parseable.dependencies_unchanged(dependencies))
+
+    def test_recording_after_a_parse_not_recorded(self):
+        # the first parse of shared wasn't recorded, so recording the
+        # second one means reading it again
+        includer = _RecordingIncluder()
+        conf, reads = self.parse(
+            ConfigParseOptions.defaults().set_includer(includer))
+        self.assert_values(conf)
+        self.assertEqual(includer.count, 3)
+        self.assertEqual(reads['shared.conf'], 2)
+        self.assertIn(self.shared, [f[0] for f in includer.recorded])
+
+    def test_url_cache(self):
+        # the URL cache only keeps its own parses of the URLs it fetches,
+        # so file includes are still reused
+        conf, reads = self.parse(
+            ConfigParseOptions.defaults().set_url_cache(UrlCache()))
+        self.assert_values(conf)
+        self.assertEqual(reads['shared.conf'], 1)
+
+    def test_url_cache_urls_not_memoized(self):
+        options = ConfigParseOptions.defaults().set_url_cache(UrlCache())
+        handled = Parseable.new_url('http://example.com/a.conf', options)
+        other = Parseable.new_url('ftp://example.com/a.conf', options)
+        self.assertIsNone(handled._include_key(handled.options()))
+        self.assertIsNotNone(other._include_key(other.options()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for LineOrigins, the origins tokens build only when asked for them.
+
+    python -m pytest test/python/test_line_origins.py
+"""
+
+import io
+import unittest
+
+from hocon import config_factory, exceptions
+from hocon.ConfigSyntax import ConfigSyntax
+from hocon.impl import tokenizer, tokens
+from hocon.impl.LineOrigins import LineOrigins
+from hocon.impl.SimpleConfigOrigin import SimpleConfigOrigin
+
+
+ORIGIN = SimpleConfigOrigin.new_simple("test")
+
+TEXT = u"""a = 1 // one
+b = ${a} x
+c = \"\"\"three
+lines
+here\"\"\" # comment
+d = [
+  "e", f
+]
+"""
+
+
+class LineOriginsTest(unittest.TestCase):
+
+    def test_origin(self):
+        origins = LineOrigins(ORIGIN)
+        self.assertIs(origins.base(), ORIGIN)
+        third = origins.origin(3)
+        self.assertEqual(third, ORIGIN.set_line_number(3))
+        self.assertIs(origins.origin(3), third)
+        self.assertEqual(origins.origin(1), ORIGIN.set_line_number(1))
+        # only the latest line is kept
+        self.assertIsNot(origins.origin(3), third)
+        self.assertEqual(origins.origin(3), third)
+
+    def test_token_origins(self):
+        ts = list(tokenizer.tokenize(ORIGIN, io.StringIO(TEXT),
+                                     ConfigSyntax.conf))
+        lines = {}
+        for t in ts:
+            if t.token_type() in (tokens.TokenType.start,
+                                  tokens.TokenType.end) \
+                    or t in (tokens.EQUALS, tokens.OPEN_SQUARE,
+                             tokens.CLOSE_SQUARE, tokens.COMMA):
+                continue
+            self.assertEqual(t.origin(), ORIGIN.set_line_number(
+                t.line_number()), repr(t))
+            lines.setdefault(str(t), t.line_number())
+        self.assertEqual(lines["'1' (number)"], 1)
+        self.assertEqual(lines["'# one' (COMMENT)"], 1)
+        self.assertEqual(lines["'${'a'}'"], 2)
+        # as in Java, a string spanning lines has the line it ends on
+        self.assertEqual(lines["'three\nlines\nhere' (string)"], 5)
+        self.assertEqual(lines["'# comment' (COMMENT)"], 5)
+        self.assertEqual(lines["'f'"], 7)
+
+    def test_value_origins(self):
+        conf = config_factory.parse_string(TEXT).resolve()
+        for path, line in ((u'a', 1), (u'c', 5), (u'd', 6)):
+            self.assertEqual(conf.get_value(path).origin().line_number(),
+                             line, path)
+        self.assertEqual(
+            [v.origin().line_number() for v in conf.get_list(u'd')], [7, 7])
+
+    def test_problem_origin(self):
+        with self.assertRaises(exceptions.Parse) as cm:
+            config_factory.parse_string(u'a = 1\n\nb = @\n')
+        self.assertIn(u'3', str(cm.exception))
+        self.assertEqual(cm.exception.origin().line_number(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
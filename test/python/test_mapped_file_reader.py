@@ -0,0 +1,96 @@
+"""
+Tests for MappedFileReader, the reader behind ConfigParseOptions.use_mmap.
+
+    python -m pytest test/python/test_mapped_file_reader.py
+"""
+
+import glob
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from hocon import config_factory
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.impl import Parseable
+from hocon.impl.Parseable import MappedFileReader
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+
+class MappedFileReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='hocon-test-')
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with io.open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def read_all(self, path, size):
+        reader = MappedFileReader(io.open(path, 'rb'))
+        try:
+            pieces = []
+            while True:
+                s = reader.read(size)
+                if not s:
+                    return pieces
+                pieces.append(s)
+        finally:
+            reader.close()
+
+    def test_multi_byte_characters_across_reads(self):
+        text = u'aé€\U0001F600b' * 10
+        path = self.write('text.conf', text.encode('utf-8'))
+        for size in (1, 2, 3, 4, 5, 7, 1000, -1):
+            pieces = self.read_all(path, size)
+            self.assertEqual(u''.join(pieces), text, size)
+            if size > 0:
+                self.assertTrue(all(len(s) <= size for s in pieces), size)
+
+    def test_bad_utf8(self):
+        path = self.write('bad.conf', b'a = \xff\n')
+        with self.assertRaises(UnicodeDecodeError):
+            self.read_all(path, -1)
+
+    def test_parse_same_as_read(self):
+        mapped = ConfigParseOptions.defaults().set_use_mmap(True)
+        for path in sorted(glob.glob(os.path.join(RESOURCES, '*.conf'))):
+            if os.path.basename(path) in ('cycle.conf',
+                                          'include-from-list.conf'):
+                continue
+            self.assertEqual(
+                config_factory.parse_file(path, mapped).root(),
+                config_factory.parse_file(path).root(), path)
+
+    def test_empty_file(self):
+        path = self.write('empty.conf', b'')
+        options = ConfigParseOptions.defaults().set_use_mmap(True)
+        self.assertTrue(config_factory.parse_file(path, options).is_empty())
+
+    def test_native_json_not_mapped(self):
+        # the json module reads the whole text anyway
+        options = ConfigParseOptions.defaults().set_use_mmap(True)
+        for name, native_json, mapped in (('a.json', None, True),
+                                          ('a.json', "file", False),
+                                          ('a.conf', "file", True)):
+            path = self.write(name, b'{"a": 1}')
+            parseable = Parseable.new_file(
+                path, options.set_native_json(native_json))
+            reader = parseable.reader()
+            try:
+                self.assertEqual(isinstance(reader, MappedFileReader),
+                                 mapped, (name, native_json))
+            finally:
+                reader.close()
+            self.assertEqual(parseable.parse().unwrapped(), {u'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Tests for Merger: with_fallback on objects against a literal port of Java's
+mergedWithObject, and config_factory.merge() against folding with_fallback
+over the same stack.
+
+    python -m pytest test/python/test_merger.py
+"""
+
+import random
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from hocon import config_factory, exceptions
+from hocon.ConfigRenderOptions import ConfigRenderOptions
+from hocon.ConfigResolveOptions import ConfigResolveOptions
+from hocon.impl import Merger
+from hocon.impl.AbstractConfigObject import AbstractConfigObject
+from hocon.impl.ResolveStatus import ResolveStatus
+from hocon.impl.SimpleConfigObject import SimpleConfigObject
+
+
+RENDER = ConfigRenderOptions.defaults().set_json(False)
+
+RESOLVE = ConfigResolveOptions.defaults().set_use_system_environment(False)
+
+
+def java_merged_with_object(obj, fallback):
+    """
+    SimpleConfigObject.mergedWithObject, as Java has it.
+    """
+    if not isinstance(fallback, SimpleConfigObject):
+        raise exceptions.BugOrBroken(
+            "should not be reached (merging non-SimpleConfigObject)")
+    changed = False
+    all_resolved = True
+    merged = {}
+    # Java's HashMap order is arbitrary, but the order keys are resolved in
+    # can decide how a cycle is reported, so it's the order Merger keeps
+    keys = list(obj.keys()) + [k for k in fallback.keys() if k not in obj]
+    for key in keys:
+        first = obj.get(key)
+        second = fallback.get(key)
+        if first is None:
+            kept = second
+        elif second is None:
+            kept = first
+        else:
+            kept = first.with_fallback(second)
+        merged[key] = kept
+        if first is not kept:
+            changed = True
+        if kept.resolve_status() == ResolveStatus.unresolved:
+            all_resolved = False
+    new_resolve_status = ResolveStatus.resolved if all_resolved \
+        else ResolveStatus.unresolved
+    new_ignores_fallbacks = fallback.ignores_fallbacks()
+    if changed:
+        return SimpleConfigObject(
+            AbstractConfigObject.merge_origins([obj, fallback]), merged,
+            new_resolve_status, new_ignores_fallbacks)
+    elif new_resolve_status != obj.resolve_status() \
+            or new_ignores_fallbacks != obj.ignores_fallbacks():
+        return obj.new_copy(new_resolve_status, obj.origin(),
+                            new_ignores_fallbacks)
+    return obj
+
+
+def outcome(value):
+    """
+    :return: tuple - everything about value a merge decides: its rendering
+        with origins, resolve status, whether it ignores fallbacks, and what
+        it resolves to or the error
+    """
+    try:
+        resolved = config_factory.empty().with_fallback(value).resolve(
+            RESOLVE).root().render(RENDER)
+    except exceptions.ConfigException as e:
+        resolved = type(e).__name__
+    return (value.render(RENDER), value.origin().description(),
+            value.resolve_status(), value.ignores_fallbacks(), resolved)
+
+
+def fold(values):
+    acc = values[0]
+    for value in values[1:]:
+        acc = acc.with_fallback(value)
+    return acc
+
+
+def random_layers(r, n):
+    """
+    :return: List<AbstractConfigObject> - n parsed layers, some sharing
+        subtrees and some repeated
+    """
+    keys = (u'a', u'b', u'c', u'a.x', u'b.y', u'a.x.z')
+
+    def value(depth):
+        kind = r.randrange(7 if depth < 2 else 4)
+        if kind == 0:
+            return str(r.randrange(3))
+        elif kind == 1:
+            return u'${%s}' % r.choice(keys)
+        elif kind == 2:
+            return u'${?%s}' % r.choice(keys)
+        elif kind == 3:
+            return u'[%d]' % r.randrange(3)
+        elif kind == 4:
+            return u'${%s} {w = 1}' % r.choice(keys)
+        else:
+            return u'{%s}' % u', '.join(
+                u'%s = %s' % (r.choice(keys), value(depth + 1))
+                for i in range(r.randrange(3)))
+
+    layers = []
+    for i in range(n):
+        choice = r.randrange(6)
+        if choice == 0 and layers:
+            layers.append(r.choice(layers))
+        elif choice == 1 and layers:
+            # a subtree of an earlier layer
+            earlier = r.choice(layers)
+            subtrees = [v for v in earlier.values()
+                        if isinstance(v, SimpleConfigObject)]
+            layers.append(r.choice(subtrees) if subtrees else earlier)
+        else:
+            text = u'\n'.join(u'%s = %s' % (r.choice(keys), value(0))
+                              for j in range(r.randrange(4)))
+            conf = config_factory.parse_string(text)
+            if r.randrange(3) == 0:
+                try:
+                    conf = conf.resolve(RESOLVE)
+                except exceptions.ConfigException:
+                    pass
+            layers.append(conf.root())
+    return layers
+
+
+class MergerTest(unittest.TestCase):
+
+    def test_with_fallback_against_java(self):
+        r = random.Random(0)
+        for i in range(1000):
+            layers = random_layers(r, r.randrange(2, 5))
+            merged = fold(layers)
+            with mock.patch.object(Merger, 'merged_with_object',
+                                   java_merged_with_object):
+                expected = fold(layers)
+            self.assertEqual(outcome(merged), outcome(expected),
+                             [l.render(RENDER) for l in layers])
+
+    def test_shares_unchanged(self):
+        conf = config_factory.parse_string(
+            u'a { b { c = 1 } }, d = 2').resolve().root()
+        self.assertIs(conf.with_fallback(conf), conf)
+        self.assertIs(conf.with_fallback(
+            config_factory.parse_string(u'd = 3').root()), conf)
+        merged = conf.with_fallback(
+            config_factory.parse_string(u'e = 3').root())
+        self.assertEqual(merged.unwrapped(),
+                         {u'a': {u'b': {u'c': 1}}, u'd': 2, u'e': 3})
+        self.assertIs(merged.get(u'a'), conf.get(u'a'))
+        # only what changes is copied
+        other = config_factory.parse_string(u'a.f = 4').root()
+        merged = conf.with_fallback(other)
+        self.assertIsNot(merged.get(u'a'), conf.get(u'a'))
+        self.assertIs(merged.get(u'a').get(u'b'), conf.get(u'a').get(u'b'))
+
+    def test_merge_against_fold(self):
+        r = random.Random(1)
+        for i in range(1000):
+            layers = random_layers(r, r.randrange(1, 7))
+            text = [l.render(RENDER) for l in layers]
+            self.assertEqual(outcome(config_factory.merge(layers)),
+                             outcome(fold(layers)), text)
+            configs = [l.to_config() for l in layers]
+            merged = config_factory.merge(configs)
+            self.assertEqual(outcome(merged.root()),
+                             outcome(fold(configs).root()), text)
+
+    def test_merge_values(self):
+        values = [config_factory.parse_string(text).root().get(u'a')
+                  for text in (u'a = {b = 1}', u'a = [1]', u'a = {c = 2}',
+                               u'a = ${x}', u'a = 5')]
+        for i in range(len(values)):
+            for j in range(i + 1, len(values) + 1):
+                self.assertEqual(outcome(config_factory.merge(values[i:j])),
+                                 outcome(fold(values[i:j])))
+
+    def test_merge_one(self):
+        conf = config_factory.parse_string(u'a = 1')
+        self.assertIs(config_factory.merge([conf]), conf)
+
+    def test_merge_empty(self):
+        with self.assertRaises(ValueError):
+            config_factory.merge([])
+        with self.assertRaises(exceptions.BugOrBroken):
+            Merger.merge_all([])
+
+
+if __name__ == '__main__':
+    unittest.main()
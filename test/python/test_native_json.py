@@ -0,0 +1,56 @@
+"""
+Tests for NativeJsonParser, against what Parser makes of the same text.
+
+    python -m pytest test/python/test_native_json.py
+"""
+
+import unittest
+
+from hocon import config_factory, exceptions
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.ConfigSyntax import ConfigSyntax
+from hocon.impl import NativeJsonParser
+from hocon.impl.SimpleConfigOrigin import SimpleConfigOrigin
+
+
+ORIGIN = SimpleConfigOrigin.new_simple("test")
+
+
+def parse(text, native_json=None):
+    options = ConfigParseOptions.defaults().set_syntax(ConfigSyntax.json) \
+        .set_native_json(native_json)
+    return config_factory.parse_string(text, options)
+
+
+class NativeJsonParserTest(unittest.TestCase):
+
+    def test_same_as_parser(self):
+        text = u'{"a": [1, 2.5, "s\\u00e9", true, null], "b": {"c": {}}}'
+        expected = parse(text)
+        for native_json in ("file", "line"):
+            self.assertEqual(parse(text, native_json), expected)
+
+    def test_line_origins(self):
+        value = NativeJsonParser.parse(u'{\n"a": 1,\n"b": [\n2]}', ORIGIN,
+                                       line_origins=True)
+        self.assertEqual(value.get("a").origin().line_number(), 2)
+        self.assertEqual(value.get("b").origin().line_number(), 3)
+        self.assertEqual(value.get("b")[0].origin().line_number(), 4)
+
+    def test_not_native(self):
+        for text in (u'{"a": 1, "a": 2}', u'"a"',
+                     u'{"a": NaN}', u'{"a": 9223372036854775808}',
+                     u'{"a": "\x7f"}', u'{"a": "x\x85y"}', u'["\x9f"]'):
+            for line_origins in (False, True):
+                with self.assertRaises(NativeJsonParser.NotNative):
+                    NativeJsonParser.parse(text, ORIGIN, line_origins)
+
+    def test_control_character_reported_by_parser(self):
+        with self.assertRaises(exceptions.Parse):
+            parse(u'{"a": "x\x85y"}', "file")
+        self.assertEqual(parse(u'{"a": "x\\u0085y"}', "file").get_string("a"),
+                         u'x\x85y')
+
+
+if __name__ == '__main__':
+    unittest.main()
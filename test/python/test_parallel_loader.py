@@ -0,0 +1,109 @@
+"""
+Tests for config_factory.parse_path_parallel(), against
+parse_path_any_syntax() parsing the same files serially.
+
+    python -m pytest test/python/test_parallel_loader.py
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from hocon import config_factory, exceptions
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.ConfigSyntax import ConfigSyntax
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+FILES = {
+    # a diamond, siblings of several syntaxes and a missing include
+    'root.conf': u'include "a"\n'
+                 u'b { include "sub/b.conf" }\n'
+                 u'include "missing"\n'
+                 u'x = ${?a.v}\n',
+    'root.properties': u'p = 1\nx = 2\n',
+    'a.conf': u'a.v = 1\ninclude "sub/b.conf"\n',
+    'a.json': u'{"a": {"v": 0, "w": 2}}',
+    'sub/b.conf': u'b.v = 2\ninclude "c.conf"\n',
+    'sub/c.conf': u'c = 3\n',
+    # an include cycle
+    'cycle.conf': u'include "cycle2.conf"\nd = 4\n',
+    'cycle2.conf': u'include "cycle.conf"\ne = 5\n',
+    # an included file that doesn't parse
+    'broken.conf': u'include "bad.conf"\n',
+    'bad.conf': u'f = {\n',
+}
+
+
+class ParallelLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        for name, text in FILES.items():
+            path = os.path.join(self.directory, name)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with io.open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    def outcome(self, parse, basename, options):
+        """
+        :return: the unresolved and resolved roots, or the error
+        """
+        try:
+            conf = parse(basename, options)
+        except exceptions.ConfigException as e:
+            return type(e).__name__
+        return conf.root(), conf.resolve().root()
+
+    def compare(self, basename, options=None):
+        if options is None:
+            options = ConfigParseOptions.defaults()
+
+        def parallel(basename, options):
+            return config_factory.parse_path_parallel(basename, options, 2)
+        serial = self.outcome(config_factory.parse_path_any_syntax,
+                              basename, options)
+        self.assertEqual(self.outcome(parallel, basename, options), serial,
+                         basename)
+        return serial
+
+    def test_includes(self):
+        root, resolved = self.compare(os.path.join(self.directory, 'root'))
+        self.assertEqual(resolved.unwrapped(), {
+            u'a': {u'v': 1, u'w': 2},
+            u'b': {u'b': {u'v': 2}, u'c': 3, u'v': 2}, u'c': 3,
+            u'p': u'1', u'x': 1})
+        self.compare(os.path.join(self.directory, 'root.conf'))
+        self.compare(os.path.join(self.directory, 'a'))
+
+    def test_options(self):
+        basename = os.path.join(self.directory, 'root')
+        self.compare(basename, ConfigParseOptions.defaults()
+                     .set_only_paths([u'b.c', u'x']))
+        self.compare(basename, ConfigParseOptions.defaults()
+                     .set_drop_comments(True))
+        self.compare(basename, ConfigParseOptions.defaults()
+                     .set_syntax(ConfigSyntax.properties))
+
+    def test_errors(self):
+        self.assertEqual(
+            self.compare(os.path.join(self.directory, 'broken')), 'Parse')
+        self.compare(os.path.join(self.directory, 'cycle'))
+        self.compare(os.path.join(self.directory, 'nothing'))
+        self.assertEqual(self.compare(
+            os.path.join(self.directory, 'nothing'),
+            ConfigParseOptions.defaults().set_allow_missing(False)), 'IO')
+
+    def test_corpus(self):
+        for basename in ('test01', 'test03', 'equiv03/includes'):
+            self.compare(os.path.join(RESOURCES, basename))
+
+
+if __name__ == '__main__':
+    unittest.main()
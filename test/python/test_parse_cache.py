@@ -0,0 +1,105 @@
+"""
+Tests for config_factory.parse_path_cached() and ParseCache.
+
+    python -m pytest test/python/test_parse_cache.py
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from hocon import config_factory
+from hocon.impl.ParseCache import ParseCache
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache = os.path.join(self.directory, 'cache')
+        self.app = os.path.join(self.directory, 'application.conf')
+        self.write(self.app, u'a = 1\ninclude "extra"\n')
+
+    def write(self, path, text):
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # a file with the same size and mtime is trusted to be unchanged,
+        # and edits here come faster than some filesystems' mtimes tick
+        self.edits = getattr(self, 'edits', 0) + 1
+        mtime = os.stat(path).st_mtime + self.edits
+        os.utime(path, (mtime, mtime))
+
+    def parse(self):
+        """
+        :return: (Config, boolean) - the config, and whether it was parsed
+            rather than loaded from the cache
+        """
+        with mock.patch.object(ParseCache, '_parse',
+                               wraps=ParseCache(self.cache)._parse) as parse:
+            config = config_factory.parse_path_cached(self.app, self.cache)
+        return config, parse.called
+
+    def test_hit(self):
+        config, parsed = self.parse()
+        self.assertTrue(parsed)
+        cached, parsed = self.parse()
+        self.assertFalse(parsed)
+        self.assertEqual(cached.root(), config.root())
+
+    def test_miss_after_edit(self):
+        self.parse()
+        self.write(self.app, u'a = 2\ninclude "extra"\n')
+        config, parsed = self.parse()
+        self.assertTrue(parsed)
+        self.assertEqual(config.get_int("a"), 2)
+
+    def test_touch_without_edit(self):
+        self.parse()
+        st = os.stat(self.app)
+        os.utime(self.app, (st.st_atime, st.st_mtime + 100))
+        config, parsed = self.parse()
+        self.assertFalse(parsed)
+        self.assertEqual(config.get_int("a"), 1)
+
+    def test_missing_include_created_later(self):
+        config, parsed = self.parse()
+        self.assertFalse(config.has_path("b"))
+        for extension, text in (('.json', u'{"b": 2}'),
+                                ('.properties', u'c = 3'),
+                                ('.conf', u'd = 4')):
+            self.write(os.path.join(self.directory, 'extra' + extension),
+                       text)
+            config, parsed = self.parse()
+            self.assertTrue(parsed, extension)
+        self.assertEqual(config.get_int("b"), 2)
+        self.assertEqual(config.get_int("c"), 3)
+        self.assertEqual(config.get_int("d"), 4)
+
+    def test_missing_include_with_extension_created_later(self):
+        self.write(self.app, u'a = 1\ninclude "extra.conf"\n')
+        self.parse()
+        self.write(os.path.join(self.directory, 'extra.conf'), u'b = 2')
+        config, parsed = self.parse()
+        self.assertTrue(parsed)
+        self.assertEqual(config.get_int("b"), 2)
+
+    def test_edit_include(self):
+        extra = os.path.join(self.directory, 'extra.conf')
+        self.write(extra, u'b = 2')
+        self.parse()
+        self.write(extra, u'b = 3')
+        config, parsed = self.parse()
+        self.assertTrue(parsed)
+        self.assertEqual(config.get_int("b"), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for Path, a window onto a shared tuple of keys, against the same
+operations done on plain tuples.
+
+    python -m pytest test/python/test_path.py
+"""
+
+import pickle
+import unittest
+
+from hocon import exceptions
+from hocon.impl import Path as path_module
+from hocon.impl.Path import Path
+from hocon.impl.PathBuilder import PathBuilder
+
+
+KEYS = ('a', 'b.c', '', 'd', 'e f', '1')
+
+
+def windows():
+    """
+    :return: List<(Path, tuple<String>)> - every window onto KEYS, with the
+        keys it should hold
+    """
+    whole = Path.of_elements(*KEYS)
+    found = []
+    for start in range(len(KEYS)):
+        for end in range(start + 1, len(KEYS) + 1):
+            found.append((whole.sub_path(start, end), KEYS[start:end]))
+    return found
+
+
+class PathTest(unittest.TestCase):
+
+    def test_windows(self):
+        for path, keys in windows():
+            self.assertEqual(path.keys(), keys)
+            self.assertEqual(path.length(), len(keys))
+            self.assertEqual(path.first, keys[0])
+            self.assertEqual(path.last(), keys[-1])
+            if len(keys) == 1:
+                self.assertIsNone(path.parent())
+                self.assertIsNone(path.remainder)
+            else:
+                self.assertEqual(path.parent().keys(), keys[:-1])
+                self.assertEqual(path.remainder.keys(), keys[1:])
+            for n in range(-1, len(keys) + 2):
+                removed = path.remove_from_front(n)
+                if n >= len(keys):
+                    self.assertIsNone(removed)
+                else:
+                    self.assertEqual(removed.keys(), keys[max(n, 0):])
+
+    def test_sub_path(self):
+        for path, keys in windows():
+            for first in range(len(keys) + 1):
+                for last in range(first, len(keys) + 1):
+                    sub = path.sub_path(first, last)
+                    if first == last:
+                        self.assertIsNone(sub)
+                    else:
+                        self.assertEqual(sub.keys(), keys[first:last])
+            with self.assertRaises(exceptions.BugOrBroken):
+                path.sub_path(0, len(keys) + 1)
+            with self.assertRaises(exceptions.BugOrBroken):
+                path.sub_path(1, 0)
+
+    def test_equal_to_fresh_path(self):
+        for path, keys in windows():
+            fresh = Path.of_elements(*keys)
+            self.assertEqual(path, fresh)
+            self.assertEqual(hash(path), hash(fresh))
+            self.assertEqual(str(path), str(fresh))
+            self.assertEqual(Path.new_path(str(path)), path)
+            if keys != KEYS:
+                self.assertNotEqual(path, Path.of_elements(*KEYS))
+
+    def test_building(self):
+        self.assertEqual(Path.of_elements('a', 'b', 'c').keys(),
+                         ('a', 'b', 'c'))
+        self.assertEqual(Path('a', Path.of_elements('b', 'c')).keys(),
+                         ('a', 'b', 'c'))
+        self.assertEqual(
+            Path.of_elements('c').prepend(Path.of_elements('a', 'b')).keys(),
+            ('a', 'b', 'c'))
+        self.assertEqual(
+            Path.of_paths(Path.new_key('a'), Path.of_elements('b', 'c'),
+                          Path.new_key('d')).keys(), ('a', 'b', 'c', 'd'))
+        with self.assertRaises(exceptions.BugOrBroken):
+            Path.of_elements()
+        builder = PathBuilder()
+        builder.append_key('a')
+        builder.append_path(Path.of_elements('b', 'c'))
+        self.assertEqual(builder.result().keys(), ('a', 'b', 'c'))
+
+    def test_render(self):
+        self.assertEqual(str(Path.of_elements(*KEYS)),
+                         u'a."b.c"."".d."e f"."1"')
+
+    def test_pickle_window_only(self):
+        long_path = Path.of_elements(*('key%d' % i for i in range(1000)))
+        window = long_path.sub_path(10, 12)
+        data = pickle.dumps(window)
+        self.assertLess(len(data), len(pickle.dumps(long_path)) // 10)
+        self.assertEqual(pickle.loads(data), window)
+
+    def test_keys_interned(self):
+        a = Path.new_key(u''.join([u'inter', u'ned']))
+        b = Path.of_elements(u''.join([u'in', u'terned']))
+        self.assertIs(a.first, b.first)
+
+    def test_interning_bounded(self):
+        interned = dict(path_module._interned_keys)
+
+        def restore():
+            path_module._interned_keys.clear()
+            path_module._interned_keys.update(interned)
+        self.addCleanup(restore)
+        path_module._interned_keys.clear()
+        for i in range(path_module.MAX_INTERNED_KEYS + 10):
+            path_module._intern(str(i))
+        self.assertEqual(len(path_module._interned_keys),
+                         path_module.MAX_INTERNED_KEYS)
+        self.assertEqual(Path.new_key('not kept').first, 'not kept')
+
+
+if __name__ == '__main__':
+    unittest.main()
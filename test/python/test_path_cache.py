@@ -0,0 +1,68 @@
+"""
+Tests for the cache of parsed path expressions behind Path.new_path().
+
+    python -m pytest test/python/test_path_cache.py
+"""
+
+import unittest
+
+from hocon import config_factory, exceptions
+from hocon.impl.LruCache import LruCache
+from hocon.impl.Path import Path
+
+
+class PathCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        Path.clear_path_cache()
+        self.addCleanup(Path.clear_path_cache)
+
+    def test_new_path_cached(self):
+        first = Path.new_path(u'a.b.c')
+        self.assertEqual(first.keys(), ('a', 'b', 'c'))
+        self.assertIs(Path.new_path(u'a.b.c'), first)
+        stats = Path.path_cache_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+
+    def test_quoted_keys(self):
+        # these take the full parser rather than the fast path
+        self.assertEqual(Path.new_path(u'a."b.c"').keys(), ('a', 'b.c'))
+        self.assertEqual(Path.new_path(u'a-1.b_2').keys(), ('a-1', 'b_2'))
+        # as in Java, only whitespace around the whole expression is dropped
+        self.assertEqual(Path.new_path(u' a . b ').keys(), ('a ', ' b'))
+
+    def test_bad_path_not_cached(self):
+        for i in range(2):
+            with self.assertRaises(exceptions.BadPath):
+                Path.new_path(u'a..b')
+        stats = Path.path_cache_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (0, 2, 0))
+
+    def test_getters_use_cache(self):
+        conf = config_factory.parse_string(u'a { "b.c" = 1 }')
+        # a quoted key isn't in the flat index under this spelling, so the
+        # getter parses the expression
+        self.assertEqual(conf.get_int(u'"a"."b.c"'), 1)
+        self.assertEqual(conf.get_int(u'"a"."b.c"'), 1)
+        stats = Path.path_cache_stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    def test_least_recently_used_evicted(self):
+        cache = LruCache(2)
+        cache.get('a', Path.new_key)
+        cache.get('b', Path.new_key)
+        cache.get('a', Path.new_key)
+        cache.get('c', Path.new_key)
+        computed = []
+
+        def compute(key):
+            computed.append(key)
+            return Path.new_key(key)
+        cache.get('a', compute)
+        cache.get('b', compute)
+        self.assertEqual(computed, ['b'])
+        self.assertEqual(cache.stats().size, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Tests for ConfigParseOptions.only_paths, against Config.with_only_path on
+the whole parse.
+
+    python -m pytest test/python/test_path_filter.py
+"""
+
+import glob
+import os
+import unittest
+
+from hocon import config_factory, exceptions
+from hocon.ConfigParseOptions import ConfigParseOptions
+from hocon.impl.AbstractConfigObject import AbstractConfigObject
+from hocon.impl.Path import Path
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+
+def only(paths):
+    return ConfigParseOptions.defaults().set_only_paths(paths)
+
+
+def with_only_paths(root, paths):
+    """
+    :return: AbstractConfigObject - with_only_path for each of the paths,
+        merged
+    """
+    merged = None
+    for p in paths:
+        o = root.with_only_path(Path.new_path(p))
+        merged = o if merged is None else merged.with_fallback(o)
+    return merged
+
+
+def all_paths(value, prefix=u''):
+    """
+    :return: List<String> - the path of every value under value
+    """
+    found = []
+    if isinstance(value, AbstractConfigObject):
+        try:
+            items = sorted(value.items())
+        except exceptions.NotResolved:
+            return found
+        for key, child in items:
+            p = prefix + str(Path.new_key(key))
+            found.append(p)
+            found.extend(all_paths(child, p + u'.'))
+    return found
+
+
+class PathFilterTest(unittest.TestCase):
+
+    def check(self, parse, root, paths):
+        try:
+            expected = with_only_paths(root, paths)
+        except exceptions.NotResolved:
+            return False
+        self.assertEqual(parse(only(paths)).root(), expected, paths)
+        return True
+
+    def test_equiv_corpus(self):
+        checked = 0
+        for path in sorted(glob.glob(os.path.join(RESOURCES, 'equiv0*',
+                                                  '*.*'))):
+            def parse(options=ConfigParseOptions.defaults()):
+                return config_factory.parse_file(path, options)
+            root = parse().root()
+            paths = all_paths(root)
+            for p in paths + [u'nothing', u'nothing.here'] \
+                    + [p + u'.nothing' for p in paths[:1]]:
+                checked += self.check(parse, root, [p])
+            # merging overlapping unresolved values would stack the same
+            # substitution twice, so pairs are of paths that don't overlap
+            for first, second in zip(paths, paths[1:]):
+                if not second.startswith(first + u'.'):
+                    checked += self.check(parse, root, [first, second])
+        self.assertGreater(checked, 100)
+
+    def test_scalar_on_the_way(self):
+        for text, expected in (
+                (u'a = {b = 2}, a = 5', {}),
+                (u'a = 5, a = {b = 2}', {u'a': {u'b': 2}}),
+                (u'a = [1], a.b = 1', {u'a': {u'b': 1}}),
+                (u'a = {b = 2}, a = 5, a.c = 1', {}),
+                (u'a = ${x}, x = {b = 1}', {}),
+                (u'a {b = 1, c = 2}, d = 3', {u'a': {u'b': 1}})):
+            def parse(options=ConfigParseOptions.defaults()):
+                return config_factory.parse_string(text, options)
+            self.assertTrue(self.check(parse, parse().root(), [u'a.b']))
+            self.assertEqual(parse(only([u'a.b'])).root().unwrapped(),
+                             expected, text)
+
+    def test_delayed_merge_kept(self):
+        # with_only_path can't look into a.b before it's resolved, so the
+        # substitution is kept and what it refers to has to be asked for
+        conf = config_factory.parse_string(
+            u'x = {b = 1}, a = ${x}, a = {c = 3}, e = 4',
+            only([u'a.b', u'x'])).resolve()
+        self.assertEqual(conf.root().unwrapped(), {
+            u'x': {u'b': 1}, u'a': {u'b': 1}})
+
+
+if __name__ == '__main__':
+    unittest.main()
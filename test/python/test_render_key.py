@@ -0,0 +1,93 @@
+"""
+Tests for the memoized key rendering, Path.render_key() and
+util.render_string_unquoted_if_possible(), against rendering afresh.
+
+    python -m pytest test/python/test_render_key.py
+"""
+
+import random
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from hocon.impl import Path as path_module
+from hocon.impl import util
+from hocon.impl.Path import Path
+
+
+def render_key(key):
+    # as it was before it was memoized
+    if Path.has_funky_chars(key) or len(key) == 0:
+        return util.render_json_string(key)
+    return key
+
+
+def keys():
+    """
+    :return: List<String> - keys that render every which way
+    """
+    r = random.Random(0)
+    alphabet = u'ab-_.1 "\\\t\né /'
+    found = [u'', u'a', u'-a', u'1', u'true', u'trueish', u'null', u'nul',
+             u'include', u'a//b', u'a/b', u'x' * 64, u'x' * 65]
+    for i in range(2000):
+        found.append(u''.join(r.choice(alphabet)
+                              for j in range(r.randrange(1, 8))))
+    return found
+
+
+class RenderKeyTest(unittest.TestCase):
+
+    def setUp(self):
+        # each test starts from empty caches, and leaves them as they were
+        for module, name in ((path_module, '_rendered_keys'),
+                             (util, '_rendered_strings')):
+            patcher = mock.patch.object(module, name, {})
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_render_key(self):
+        for i in range(2):
+            for key in keys():
+                self.assertEqual(Path.render_key(key), render_key(key),
+                                 repr(key))
+
+    def test_render_string_unquoted_if_possible(self):
+        for i in range(2):
+            for key in keys():
+                self.assertEqual(
+                    util.render_string_unquoted_if_possible(key),
+                    util._render_string_unquoted_if_possible(key),
+                    repr(key))
+        # longer strings aren't kept
+        self.assertIn(u'x' * 64, util._rendered_strings)
+        self.assertNotIn(u'x' * 65, util._rendered_strings)
+
+    def test_bounded(self):
+        with mock.patch.object(path_module, 'MAX_INTERNED_KEYS', 10), \
+                mock.patch.object(util, 'MAX_RENDERED_STRINGS', 10):
+            for key in keys()[:100]:
+                self.assertEqual(Path.render_key(key), render_key(key))
+                self.assertEqual(
+                    util.render_string_unquoted_if_possible(key),
+                    util._render_string_unquoted_if_possible(key))
+        self.assertEqual(len(path_module._rendered_keys), 10)
+        self.assertEqual(len(util._rendered_strings), 10)
+
+    def test_path_rendered_once(self):
+        path = Path.of_elements(u'a', u'b.c', u'', u'd e')
+        rendered = str(path)
+        self.assertEqual(rendered, u'.'.join(render_key(k)
+                                             for k in path.keys()))
+        self.assertIs(str(path), rendered)
+        self.assertEqual(Path.new_path(rendered), path)
+        # windows render their own keys
+        self.assertEqual(str(path.sub_path(1, 3)), u'"b.c".""')
+        self.assertEqual(str(path.remainder), u'"b.c".""."d e"')
+
+
+if __name__ == '__main__':
+    unittest.main()
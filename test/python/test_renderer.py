@@ -0,0 +1,174 @@
+"""
+Tests for util.render_to(), against render(), and for render() with concise
+options, which goes through the json module's encoder, against the walk
+render_to() does.
+
+    python -m pytest test/python/test_renderer.py
+"""
+
+import glob
+import io
+import itertools
+import os
+import random
+import socket
+import threading
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from hocon import config_factory, config_value_factory, exceptions, util
+from hocon.ConfigRenderOptions import ConfigRenderOptions
+from hocon.impl import Renderer
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+CONCISE = ConfigRenderOptions.concise()
+
+
+def all_options():
+    """
+    :return: List<ConfigRenderOptions> - every combination of the flags
+    """
+    found = []
+    for comments, origin_comments, formatted, json in itertools.product(
+            (False, True), repeat=4):
+        found.append(ConfigRenderOptions.defaults()
+                     .set_comments(comments)
+                     .set_origin_comments(origin_comments)
+                     .set_formatted(formatted)
+                     .set_json(json))
+    return found
+
+
+def corpus():
+    """
+    :return: List<AbstractConfigValue> - the roots of the resources, both
+        unresolved and resolved
+    """
+    roots = []
+    for path in sorted(glob.glob(os.path.join(RESOURCES, '*.conf'))):
+        if os.path.basename(path) in ('cycle.conf',
+                                      'include-from-list.conf'):
+            continue
+        conf = config_factory.parse_file(path)
+        roots.append(conf.root())
+        try:
+            roots.append(conf.resolve().root())
+        except exceptions.UnresolvedSubstitution:
+            # only meant to be included
+            pass
+    return roots
+
+
+def streamed(value, options, encoding=None):
+    """
+    :return: String - what render_to() writes into a text stream, or
+        bytes given an encoding
+    """
+    stream = io.BytesIO() if encoding else io.StringIO()
+    util.render_to(value, stream, options, encoding)
+    return stream.getvalue()
+
+
+def random_value(r, depth=0):
+    """
+    :return: a plain value of the kinds from_any_ref() takes
+    """
+    kind = r.randrange(9 if depth < 3 else 6)
+    if kind == 0:
+        return r.choice((True, False, None))
+    elif kind == 1:
+        return r.choice((0, -1, 7, 2 ** 31, -2 ** 63, 2 ** 70))
+    elif kind == 2:
+        return r.choice((0.1, -2.5, 1e300, 1e-7, -0.0, 3.0, 1 / 3.0))
+    elif kind in (3, 4, 5):
+        return random_string(r)
+    elif kind in (6, 7):
+        return dict((random_string(r), random_value(r, depth + 1))
+                    for i in range(r.randrange(4)))
+    else:
+        return [random_value(r, depth + 1) for i in range(r.randrange(4))]
+
+
+def random_string(r):
+    alphabet = u'ab1 -."\\/\x00\x1f\x7f\t\n\xe9 \U0001f600'
+    return u''.join(r.choice(alphabet) for i in range(r.randrange(6)))
+
+
+class RendererTest(unittest.TestCase):
+
+    def test_render_to_corpus(self):
+        for root in corpus():
+            for options in all_options():
+                rendered = root.render(options)
+                self.assertEqual(streamed(root, options), rendered)
+                self.assertEqual(streamed(root, options, 'utf-8'),
+                                 rendered.encode('utf-8'))
+
+    def test_render_to_config(self):
+        conf = config_factory.parse_string(u'a { b = [1, "two"] }')
+        self.assertEqual(streamed(conf, None),
+                         conf.root().render(ConfigRenderOptions.defaults()))
+
+    def test_batches(self):
+        conf = config_factory.parse_string(u'\n'.join(
+            u'k%d { v = [%d, "\xe9"] }' % (i, i) for i in range(500))).root()
+        for encoding in ('utf-8', 'utf-16', 'utf-32'):
+            stream = io.BytesIO()
+            with mock.patch.object(Renderer, 'FLUSH_PIECES', 50), \
+                    mock.patch.object(stream, 'write',
+                                      wraps=stream.write) as write:
+                util.render_to(conf, stream, None, encoding)
+            self.assertGreater(write.call_count, 10)
+            # a byte order mark once, at the start
+            self.assertEqual(stream.getvalue().decode(encoding),
+                             conf.render(), encoding)
+
+    def test_socket(self):
+        conf = config_factory.parse_string(u'a { b = [1, "\xe9"] }')
+        sender, receiver = socket.socketpair()
+        self.addCleanup(sender.close)
+        self.addCleanup(receiver.close)
+        received = []
+
+        def receive():
+            while True:
+                data = receiver.recv(4096)
+                if not data:
+                    return
+                received.append(data)
+        thread = threading.Thread(target=receive)
+        thread.start()
+        util.render_to(conf, sender)
+        sender.shutdown(socket.SHUT_WR)
+        thread.join()
+        self.assertEqual(b''.join(received).decode('utf-8'),
+                         conf.root().render())
+
+    def test_concise_against_walk(self):
+        r = random.Random(0)
+        for i in range(1000):
+            value = config_value_factory.from_any_ref(
+                random_value(r), 'random')
+            rendered = value.render(CONCISE)
+            self.assertIsNotNone(Renderer._render_concise(value))
+            self.assertEqual(rendered, streamed(value, CONCISE),
+                             repr(value))
+
+    def test_concise_falls_back(self):
+        for value in (
+                config_factory.parse_string(u'a = ${b}, b = 1').root(),
+                config_value_factory.from_any_ref(
+                    {u'a': float('nan'), u'b': float('inf')})):
+            self.assertIsNone(Renderer._render_concise(value))
+            self.assertEqual(value.render(CONCISE), streamed(value, CONCISE))
+
+
+if __name__ == '__main__':
+    unittest.main()
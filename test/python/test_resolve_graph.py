@@ -0,0 +1,315 @@
+"""
+Tests for ResolveGraph, the resolver Config.resolve() uses, against
+ResolveContext walking the whole tree as it did before. The self-reference
+and delayed merge cases are ported from Java's ConfigSubstitutionTest.
+
+    python -m pytest test/python/test_resolve_graph.py
+"""
+
+import random
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from hocon import config_factory, exceptions
+from hocon.ConfigRenderOptions import ConfigRenderOptions
+from hocon.ConfigResolveOptions import ConfigResolveOptions
+from hocon.impl import ResolveContext, ResolveGraph
+
+
+OPTIONS = ConfigResolveOptions.defaults().set_use_system_environment(False)
+
+
+def outcome(resolve, text):
+    """
+    :return: String - the resolved tree rendered, or the error
+    """
+    root = config_factory.parse_string(text).root()
+    try:
+        return resolve(root).render(ConfigRenderOptions.concise())
+    except exceptions.ConfigException as e:
+        return type(e).__name__ + ": " + str(e)
+
+
+def by_graph(root):
+    return ResolveGraph.resolve(root, OPTIONS)
+
+
+def by_context(root):
+    return ResolveContext.resolve(root, root, OPTIONS)
+
+
+class ResolveGraphTest(unittest.TestCase):
+
+    def resolve(self, text):
+        """
+        :return: Config - resolved, after checking that ResolveContext
+            resolves it the same way
+        """
+        self.assertEqual(outcome(by_graph, text), outcome(by_context, text),
+                         text)
+        return config_factory.parse_string(text).resolve(OPTIONS)
+
+    def assert_cycle(self, text):
+        self.assertEqual(outcome(by_graph, text), outcome(by_context, text),
+                         text)
+        with self.assertRaises(exceptions.UnresolvedSubstitution) as cm:
+            config_factory.parse_string(text).resolve(OPTIONS)
+        self.assertIn("cycle", str(cm.exception))
+        return str(cm.exception)
+
+    def test_chain(self):
+        conf = self.resolve(u'a = ${b}, b = ${c.d}, c = { d = ${e} x }, '
+                            u'e = 1, f = [${a}, ${c}]')
+        self.assertEqual(conf.get_string(u'a'), u'1 x')
+        self.assertEqual(conf.get_list(u'f').unwrapped(),
+                         [u'1 x', {u'd': u'1 x'}])
+
+    def test_self_reference(self):
+        self.assertEqual(self.resolve(u'a=1, a=${a}').get_int(u'a'), 1)
+        self.assertEqual(
+            self.resolve(u'a.b=1, a.b=${a.b}').get_int(u'a.b'), 1)
+        self.assertEqual(
+            self.resolve(u'a.b.c=1, a.b.c=${a.b.c}').get_int(u'a.b.c'), 1)
+        self.assertEqual(
+            self.resolve(u'a={b=5}, a=${a}').get_int(u'a.b'), 5)
+        self.assertEqual(
+            self.resolve(u'a.b={c=5}, a.b=${a.b}').get_int(u'a.b.c'), 5)
+        self.assertEqual(
+            self.resolve(u'a=1, a=${a}foo').get_string(u'a'), u'1foo')
+
+    def test_self_reference_indirect(self):
+        self.assertEqual(
+            self.resolve(u'a=1, b=${a}, a=${b}').get_int(u'a'), 1)
+        self.assertEqual(
+            self.resolve(u'a=1, b=${c}, c=${a}, a=${b}').get_int(u'a'), 1)
+        self.assertEqual(
+            self.resolve(u'a=1, b=${a}foo, a=${b}').get_string(u'a'),
+            u'1foo')
+
+    def test_self_reference_indirect_stack_cycle(self):
+        conf = self.resolve(u'a=1, b={c=5}, b=${a}, a=${b}')
+        self.assertEqual(conf.get_int(u'a'), 1)
+        self.assertEqual(conf.get_int(u'b'), 1)
+
+    def test_self_reference_stacks(self):
+        self.assertEqual(
+            self.resolve(u'a=1, a=${a}, a=${a}, a=${a}').get_int(u'a'), 1)
+        self.assertEqual(
+            self.resolve(u'a=1, a=${a}x, a=${a}y, a=${a}z')
+            .get_string(u'a'), u'1xyz')
+        self.assertEqual(
+            self.resolve(u'a=1, a=${a}, a=2').get_int(u'a'), 2)
+        self.assertEqual(
+            self.resolve(u'a=1, a=${?a}, a=2').get_int(u'a'), 2)
+        self.assertEqual(
+            self.resolve(u'a=${a}, a=${a}, a=2').get_int(u'a'), 2)
+        self.assertEqual(
+            self.resolve(u'a=1, a=${?a}, a=${?a}').get_int(u'a'), 1)
+        conf = self.resolve(u'a={b=5}, a=${a}, a={c=6}')
+        self.assertEqual(conf.get_object(u'a').unwrapped(),
+                         {u'b': 5, u'c': 6})
+
+    def test_optional_self_reference(self):
+        self.assertFalse(self.resolve(u'a=${?a}').has_path(u'a'))
+        self.assertEqual(self.resolve(u'a=${?a}foo').get_string(u'a'),
+                         u'foo')
+        self.assertEqual(
+            self.resolve(u'a=${?b}foo, b=${?a}').get_string(u'a'), u'foo')
+        self.assertEqual(
+            self.resolve(u'a=${?a}foo${?a}').get_string(u'a'), u'foo')
+        self.assertEqual(
+            self.resolve(u'a=1, a=${?a}foo${?a}').get_string(u'a'),
+            u'1foo1')
+
+    def test_child_field_not_a_self_reference(self):
+        self.assertEqual(
+            self.resolve(u'bar : { foo : 42, baz : ${bar.foo} }')
+            .get_int(u'bar.baz'), 42)
+        self.assertEqual(
+            self.resolve(u'bar : { foo : 42, baz : ${bar.foo} }, '
+                         u'bar : { foo : 43 }').get_int(u'bar.baz'), 43)
+        self.assertEqual(
+            self.resolve(u'bar : { foo : 42, baz : ${bar.foo} }, '
+                         u'bar : { baz : 43 }').get_int(u'bar.baz'), 43)
+        self.assertEqual(
+            self.resolve(u'bar : { foo : 42, baz : ${?bar.foo} }, '
+                         u'bar : { baz : 43 }').get_int(u'bar.baz'), 43)
+        self.assertEqual(
+            self.resolve(u'bar : { foo : 42, baz : ${?bar.foo} }, '
+                         u'bar : { baz : ${?bar.foo} }')
+            .get_int(u'bar.baz'), 42)
+
+    def test_mutually_referring_not_a_self_reference(self):
+        conf = self.resolve(u"""
+            bar : { a : ${foo.d}, b : 1 }
+            bar.b = 3
+            foo : { c : ${bar.b}, d : 2 }
+            foo.d = 4
+            """)
+        self.assertEqual(conf.get_int(u'bar.a'), 4)
+        self.assertEqual(conf.get_int(u'foo.c'), 3)
+
+    def test_avoid_delayed_merge_object_resolve_problem1(self):
+        conf = self.resolve(u"""
+            defaults { a = 1, b = 2 }
+            item1 = ${defaults}
+            item1.b = 3
+            item2.b = ${item1.b}
+            """)
+        self.assertEqual(conf.get_int(u'item1.a'), 1)
+        self.assertEqual(conf.get_int(u'item1.b'), 3)
+        self.assertEqual(conf.get_int(u'item2.b'), 3)
+
+    def test_avoid_delayed_merge_object_resolve_problem2(self):
+        conf = self.resolve(u"""
+            defaults { a = 1, b = 2 }
+            item1 = ${defaults}
+            item1.b = 3
+            item2 = ${defaults}
+            item2.b = ${item1.b}
+            """)
+        self.assertEqual(conf.get_int(u'item2.a'), 1)
+        self.assertEqual(conf.get_int(u'item2.b'), 3)
+
+    def test_avoid_delayed_merge_object_resolve_problem3(self):
+        conf = self.resolve(u"""
+            item1.b.c = 100
+            defaults {
+              // we depend on item1.b.c
+              a = ${item1.b.c}
+              b = 2
+            }
+            // make item1 into a ConfigDelayedMergeObject
+            item1 = ${defaults}
+            // the ${item1.b.c} above in ${defaults} should ignore
+            // this because it only looks back
+            item1.b = { c : 43 }
+            // make item2 into a ConfigDelayedMergeObject
+            item2.b = ${item1.b}
+            """)
+        self.assertEqual(conf.get_int(u'defaults.a'), 100)
+        self.assertEqual(conf.get_int(u'item1.a'), 100)
+        self.assertEqual(conf.get_int(u'item1.b.c'), 43)
+        self.assertEqual(conf.get_int(u'item2.b.c'), 43)
+
+    def test_avoid_delayed_merge_object_resolve_problem5(self):
+        conf = self.resolve(u"""
+            defaults {
+              // tricky cycle - we won't see ${defaults}
+              // as we resolve this
+              a = ${item1.b}
+              b = 2
+            }
+            item1.b = 7
+            item1 = ${defaults}
+            """)
+        self.assertEqual(conf.get_int(u'item1.a'), 2)
+        self.assertEqual(conf.get_int(u'item1.b'), 2)
+
+    def test_avoid_delayed_merge_object_resolve_problem6(self):
+        conf = self.resolve(u"""
+            z = 15
+            defaults-defaults-defaults {
+              m = ${z}
+              n.o.p = ${z}
+            }
+            defaults-defaults { x = 10, y = 11, asdf = ${z} }
+            defaults { a = 1, b = 2 }
+            defaults-alias = ${defaults}
+            // make item1 into a ConfigDelayedMergeObject several layers
+            // deep that will NOT become resolved just because we resolve
+            // one path through it.
+            item1 = 345
+            item1 = ${?NONEXISTENT}
+            item1 = ${defaults-defaults-defaults}
+            item1 = {}
+            item1 = ${defaults-defaults}
+            item1 = ${defaults-alias}
+            item1 = ${defaults}
+            item1.b = { c : 43 }
+            item1.xyz = 101
+            // be sure we can resolve a substitution to a value in
+            // a delayed-merge object.
+            item2.b = ${item1.b}
+            """)
+        self.assertEqual(conf.get_int(u'item1.b.c'), 43)
+        self.assertEqual(conf.get_int(u'item2.b.c'), 43)
+        self.assertEqual(conf.get_int(u'item1.xyz'), 101)
+        self.assertEqual(conf.get_int(u'item1.m'), 15)
+        self.assertEqual(conf.get_int(u'item1.n.o.p'), 15)
+        self.assertEqual(conf.get_int(u'item1.asdf'), 15)
+
+    def test_cycles(self):
+        message = self.assert_cycle(u'a=${b}, b=${a}')
+        # each link once
+        self.assertTrue(message.endswith(u'involving ${b}, ${a}'), message)
+        self.assert_cycle(u'a=${a}')
+        # never looks back from inside a list
+        self.assert_cycle(u'a=1, a=[${a}, 2]')
+        self.assert_cycle(u'a=${b}, b=${c}, c=${a}')
+        self.assert_cycle(u'x=${y}, y={z:${x.w}, w:1}')
+
+    def test_missing(self):
+        self.assertEqual(outcome(by_graph, u'a = 1, b = ${c}, d = ${a}'),
+                         outcome(by_context, u'a = 1, b = ${c}, d = ${a}'))
+        with self.assertRaises(exceptions.UnresolvedSubstitution):
+            config_factory.parse_string(u'a = ${b}, b = ${c}').resolve()
+
+    def test_missing_resolves_each_site_once(self):
+        root = config_factory.parse_string(
+            u'a = ${b}, b = ${c} x, c = ${missing}, d = ${a}').root()
+        resolve = ResolveContext.resolve
+        with mock.patch.object(ResolveContext, 'resolve',
+                               side_effect=resolve) as m:
+            with self.assertRaises(exceptions.UnresolvedSubstitution) as cm:
+                by_graph(root)
+        self.assertIn(u'${missing}', str(cm.exception))
+        # c fails before anything that depends on it is tried, and the
+        # tree isn't walked again after
+        self.assertEqual(m.call_count, 1)
+
+    def test_against_resolve_context(self):
+        r = random.Random(0)
+        paths = (u'a', u'b', u'c', u'a.x', u'b.x', u'c.y', u'd', u'a.x.y')
+
+        def value(depth):
+            path = r.choice(paths)
+            kind = r.randrange(8 if depth < 2 else 5)
+            if kind == 0:
+                return str(r.randrange(10))
+            elif kind == 1:
+                return u'${%s}' % path
+            elif kind == 2:
+                return u'${?%s}' % path
+            elif kind == 3:
+                return u'${%s} z' % path
+            elif kind == 4:
+                return u'[${%s}, 1]' % path
+            elif kind == 5:
+                return u'{x = %s, w = 1}' % value(depth + 1)
+            elif kind == 6:
+                return u'${%s} {y = %s}' % (path, value(depth + 1))
+            else:
+                return u'{y = %s}' % value(depth + 1)
+
+        for i in range(300):
+            text = u'\n'.join(u'%s = %s' % (r.choice(paths), value(0))
+                              for j in range(r.randrange(1, 6)))
+            expected = outcome(by_context, text)
+            actual = outcome(by_graph, text)
+            if expected.startswith(u'UnresolvedSubstitution: '):
+                # of several failing substitutions, the graph reports the
+                # first one it comes to in dependency order
+                self.assertTrue(
+                    actual.startswith(u'UnresolvedSubstitution: '),
+                    text + u'\n' + actual)
+            else:
+                self.assertEqual(actual, expected, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
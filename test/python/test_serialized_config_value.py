@@ -0,0 +1,118 @@
+"""
+Tests for hocon.util.serialize() and config_factory.parse_serialized().
+
+    python -m pytest test/python/test_serialized_config_value.py
+"""
+
+import glob
+import os
+import random
+import unittest
+
+from hocon import config_factory, exceptions, util
+from hocon.impl import SerializedConfigValue
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+TEXT = u"""
+a {
+  b = 1, c = [1, 2.5, "three", null, true, {d = 4}], "quo.ted" { y = x }
+}
+e = 12345678901234
+f = ""
+"""
+
+
+class SerializedConfigValueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.config = config_factory.parse_string(TEXT).resolve()
+
+    def test_round_trip(self):
+        for origins in (True, False):
+            loaded = config_factory.parse_serialized(
+                util.serialize(self.config, origins))
+            self.assertEqual(loaded.root(), self.config.root())
+            # without origins everything has the root's
+            self.assertEqual(
+                loaded.get_value("a.b").origin().line_number(),
+                3 if origins else loaded.root().origin().line_number())
+
+    def test_round_trip_corpus(self):
+        for path in sorted(glob.glob(os.path.join(RESOURCES, 'test*.conf'))):
+            try:
+                config = config_factory.parse_file(path).resolve()
+            except exceptions.ConfigException:
+                continue
+            loaded = config_factory.parse_serialized(util.serialize(config))
+            self.assertEqual(loaded.root(), config.root(), path)
+            self.assertEqual(loaded.root().render(),
+                             config.root().render(), path)
+
+    def test_value_round_trip(self):
+        value = self.config.get_value("a.c")
+        loaded = SerializedConfigValue.deserialize(util.serialize(value))
+        self.assertEqual(loaded, value)
+
+    def test_list_and_scalar_round_trip(self):
+        for path in ("a.c", "a.b", "e", "f"):
+            value = self.config.get_value(path)
+            data = util.serialize(value)
+            self.assertEqual(SerializedConfigValue.deserialize(data), value,
+                             path)
+            # only an object can be loaded as a config
+            with self.assertRaises(exceptions.WrongType):
+                config_factory.parse_serialized(data)
+        data = util.serialize(config_factory.parse_string(u'a = [1, 2]')
+                              .get_value("a"))
+        with self.assertRaises(exceptions.WrongType):
+            config_factory.parse_serialized(data)
+
+    def test_path(self):
+        data = util.serialize(self.config)
+        self.assertEqual(config_factory.parse_serialized(data, "a").root(),
+                         self.config.get_config("a").root())
+        self.assertEqual(
+            config_factory.parse_serialized(data, 'a."quo.ted"').root(),
+            self.config.get_config('a."quo.ted"').root())
+        self.assertTrue(config_factory.parse_serialized(
+            data, "missing.path").is_empty())
+        with self.assertRaises(exceptions.WrongType):
+            config_factory.parse_serialized(data, "a.b")
+
+    def test_unresolved(self):
+        config = config_factory.parse_string(u'a = ${b}, b = 1')
+        with self.assertRaises(exceptions.NotResolved):
+            util.serialize(config)
+
+    def test_garbage(self):
+        for data in (b'', b'HOCN', b'not serialized at all',
+                     SerializedConfigValue.MAGIC + b'\x7f'):
+            with self.assertRaises(exceptions.IO):
+                config_factory.parse_serialized(data)
+
+    def test_truncated(self):
+        data = util.serialize(self.config)
+        for n in range(len(data)):
+            with self.assertRaises(exceptions.IO):
+                config_factory.parse_serialized(data[:n])
+
+    def test_corrupted(self):
+        # anything but a clean error is a bug
+        data = util.serialize(self.config)
+        r = random.Random(0)
+        for i in range(2000):
+            corrupted = bytearray(data)
+            for j in range(r.randrange(1, 4)):
+                corrupted[r.randrange(len(data))] = r.randrange(256)
+            for path in (None, "a"):
+                try:
+                    config_factory.parse_serialized(bytes(corrupted), path)
+                except (exceptions.IO, exceptions.WrongType):
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
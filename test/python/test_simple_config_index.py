@@ -0,0 +1,99 @@
+"""
+Tests for the path index SimpleConfig looks resolved paths up in, against
+the tree walk it stands in for.
+
+    python -m pytest test/python/test_simple_config_index.py
+"""
+
+import pickle
+import unittest
+
+from hocon import config_factory, config_value_factory, exceptions
+
+
+# keys that need quoting, or look like they might
+KEYS = (u'a', u'b.c', u'', u' ', u'a b', u' a', u'true', u'1', u'1.5', u'-',
+        u'$x', u'"', u'\xe9', u'a\nb', u'x/y', u'//', u'#', u'null', u'10e3',
+        u'a\\b', u'\t', u'${x}', u'﻿', u'\x85', u'a..b', u'.')
+
+# written other than the way the index renders them
+EXPRESSIONS = (u'a . a', u' a.a', u'a."a"', u'"a".a', u'"b.c"."b.c"',
+               u'b.c', u'b.c.b', u'"a"', u'true.1', u'1.5.1.5', u'"1.5"',
+               u'a.b.c', u'missing', u'a.missing', u'a.a.a', u'a.', u'.a',
+               u'a..a', u'', u'n', u'n.x', u's.x')
+
+
+def make_config():
+    values = dict((k, dict((k2, k + u'|' + k2) for k2 in KEYS))
+                  for k in KEYS)
+    values[u'n'] = None
+    values[u's'] = u'string'
+    values[u'i'] = 5
+    return config_value_factory.from_dict(values, u'test').to_config()
+
+
+def outcome(call):
+    try:
+        return call()
+    except exceptions.ConfigException as e:
+        return type(e), str(e)
+
+
+class SimpleConfigIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.indexed = make_config()
+        self.walked = make_config()
+        # never None, so never built, so every lookup walks the tree
+        self.walked._index = {}
+
+    def assert_same(self, name, expression, *args):
+        self.assertEqual(
+            outcome(lambda: getattr(self.indexed, name)(expression, *args)),
+            outcome(lambda: getattr(self.walked, name)(expression, *args)),
+            "%s(%r)" % (name, expression))
+
+    def test_every_indexed_path(self):
+        self.indexed.has_path(u'a')
+        expressions = list(self.indexed._index)
+        self.assertEqual(len(expressions), len(KEYS) * (len(KEYS) + 1) + 3)
+        for expression in expressions:
+            self.assert_same('get_value', expression)
+            self.assert_same('has_path', expression)
+
+    def test_non_canonical_expressions(self):
+        for expression in EXPRESSIONS:
+            self.assert_same('get_value', expression)
+            self.assert_same('has_path', expression)
+
+    def test_typed_getters(self):
+        for expression in (u'a.a', u'i', u's', u'n', u'a', u'missing'):
+            self.assert_same('get_string', expression)
+            self.assert_same('get_int', expression)
+            self.assert_same('get_object', expression)
+            self.assert_same('get_config', expression)
+
+    def test_null_is_not_a_path(self):
+        self.assertFalse(self.indexed.has_path(u'n'))
+        with self.assertRaises(exceptions.Null):
+            self.indexed.get_value(u'n')
+
+    def test_unresolved_has_no_index(self):
+        config = config_factory.parse_string(u'a = 1, b = ${a}')
+        with self.assertRaises(exceptions.NotResolved):
+            config.get_int(u'b')
+        self.assertIsNone(config._index)
+        config = config.resolve()
+        self.assertEqual(config.get_int(u'b'), 1)
+        self.assertIsNotNone(config._index)
+
+    def test_pickle_drops_index(self):
+        self.indexed.get_value(u'a.a')
+        loaded = pickle.loads(pickle.dumps(self.indexed))
+        self.assertIsNone(loaded._index)
+        self.assertEqual(loaded.get_value(u'a.a'),
+                         self.indexed.get_value(u'a.a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
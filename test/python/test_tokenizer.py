@@ -0,0 +1,133 @@
+"""
+Tests for the block-buffered tokenizer, against the per-character tokenizer
+it replaced.
+
+    python -m pytest test/python/test_tokenizer.py
+"""
+
+import glob
+import io
+import os
+import unittest
+
+from hocon.ConfigSyntax import ConfigSyntax
+from hocon.impl import tokenizer, util
+from hocon.impl.SimpleConfigOrigin import SimpleConfigOrigin
+
+import per_character_tokenizer
+
+
+RESOURCES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'resources')
+
+ORIGIN = SimpleConfigOrigin.new_simple("test")
+
+# inputs whose tokens straddle block boundaries once blocks are small
+TEXTS = (
+    u'a = 1\nb = "two"\nc = [3.5, -4e2, true, null, false]\n',
+    u'long-unquoted-key.with.dots = some unquoted text here\n',
+    u'truex = nullable, falsehood = trueish\n',
+    u'a = 12345678901234567890\nb = 1-2\n',
+    u'a = 9223372036854775807, b = 9223372036854775808\n'
+    u'c = -9223372036854775808, d = -9223372036854775809\n',
+    u'a = -, b = --1, c = 1e5x, d = .5, e = 1.e2, f = 0x1F\n',
+    u'a = "\\u00zz"\n',
+    u'a = "\\u+123"\n',
+    u'a = "\\u12"\n',
+    u'a = "\\q"\n',
+    u'a = "\x7f", b = "\x9f", c = "\xa0"\n',
+    u'a = """one\n"two"\nthree""""\nb = """"""\nc = ""\n',
+    u'a = 1 // a comment\nb = 2 # another\n// last',
+    u'a = b/c/d\nurl = "http://example.com"\n',
+    u'a = 1\r\nb = 2\r\n\r\nc = x\r\n',
+    u'a = ${b}, c = ${?d.e} f, g += 3\n',
+    u'a = "esc \\" \\\\ \\/ \\b \\f \\n \\r \\t \\u00e9"\n',
+    u'a = b\u2028c\u3000d\xa0e\ufeff f\n',
+    u'a = b\x85c\n',
+    u'a = @\n',
+    u'a = "unterminated\n',
+    u'a = "\x01"\n',
+    u'a = """never closed\n',
+    u'a = ${b\n',
+    u'a = +x\n',
+)
+
+
+def tokens_of(tokenize, text, syntax=ConfigSyntax.conf):
+    """
+    :return: List - each token with its line number
+    """
+    return [(t, t.line_number())
+            for t in tokenize(ORIGIN, io.StringIO(text), syntax)]
+
+
+class TokenizerTest(unittest.TestCase):
+
+    def setUp(self):
+        block_size = tokenizer.BLOCK_SIZE
+
+        def restore():
+            tokenizer.BLOCK_SIZE = block_size
+        self.addCleanup(restore)
+
+    def assert_same_tokens(self, text, syntax=ConfigSyntax.conf):
+        self.assertEqual(
+            tokens_of(tokenizer.tokenize, text, syntax),
+            tokens_of(per_character_tokenizer.tokenize, text, syntax),
+            "tokens of %r with BLOCK_SIZE %d"
+            % (text, tokenizer.BLOCK_SIZE))
+
+    def test_corpus(self):
+        for path in sorted(glob.glob(os.path.join(RESOURCES, '*'))):
+            if path.endswith('.properties') or os.path.isdir(path):
+                continue
+            with io.open(path, encoding='utf-8') as f:
+                text = f.read()
+            syntax = ConfigSyntax.json if path.endswith('.json') \
+                else ConfigSyntax.conf
+            for block_size in (64 * 1024, 7):
+                tokenizer.BLOCK_SIZE = block_size
+                self.assert_same_tokens(text, syntax)
+
+    def test_block_boundaries(self):
+        # every token gets split at every offset by some block size
+        for block_size in range(1, 12):
+            tokenizer.BLOCK_SIZE = block_size
+            for text in TEXTS:
+                self.assert_same_tokens(text)
+                self.assert_same_tokens(text, ConfigSyntax.json)
+
+    def test_boundary_past_lookbehind(self):
+        # the closing quotes and the comment slashes begin further into the
+        # input than LOOKBEHIND, at a block boundary
+        for offset in range(-tokenizer.LOOKBEHIND - 2, 3):
+            tokenizer.BLOCK_SIZE = 16
+            padding = u'x' * (16 - len(u'a = """') + offset)
+            self.assert_same_tokens(u'a = """' + padding + u'"""" b\n')
+            padding = u'x' * (16 - len(u'a = ') + offset)
+            self.assert_same_tokens(u'a = ' + padding + u'// c\nd = e\n')
+
+    def test_drop_comments(self):
+        text = u'a = 1 // one\n# two\nb = x y # three'
+        kept = [t for t, line in tokens_of(tokenizer.tokenize, text)
+                if not isinstance(t, tokenizer.tokens.Comment)]
+        for block_size in (64 * 1024, 1, 3):
+            tokenizer.BLOCK_SIZE = block_size
+            dropped = list(tokenizer.tokenize(
+                ORIGIN, io.StringIO(text), ConfigSyntax.conf,
+                drop_comments=True))
+            self.assertEqual(dropped, kept)
+
+    def test_whitespace_as_java_has_it(self):
+        # \x85 is a control character to Java, not whitespace
+        self.assertFalse(util.is_whitespace(u'\x85'))
+        for c in u' \t\n\r\x0b\x0c\x1c\xa0\u2007\u202f\u2028\u3000\ufeff':
+            self.assertTrue(util.is_whitespace(c), repr(c))
+        tokens = [t for t, line in tokens_of(tokenizer.tokenize,
+                                             u'a = b\x85c')]
+        self.assertEqual(tokenizer.tokens.get_unquoted_text(tokens[-2]),
+                         u'b\x85c')
+
+
+if __name__ == '__main__':
+    unittest.main()
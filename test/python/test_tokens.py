@@ -0,0 +1,96 @@
+"""
+Tests for the slotted Token classes and the strings and tokens the
+tokenizer shares between them.
+
+    python -m pytest test/python/test_tokens.py
+"""
+
+import io
+import unittest
+
+from hocon.ConfigSyntax import ConfigSyntax
+from hocon.impl import tokenizer, tokens
+from hocon.impl.SimpleConfigOrigin import SimpleConfigOrigin
+
+
+ORIGIN = SimpleConfigOrigin.new_simple("test")
+
+
+def tokenize(text):
+    return list(tokenizer.tokenize(ORIGIN, io.StringIO(text),
+                                   ConfigSyntax.conf))
+
+
+class TokensTest(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        for t in tokenize(u'a = "b" ${c} 1 // d\n') + [tokens.COMMA]:
+            self.assertFalse(hasattr(t, '__dict__'), repr(t))
+
+    def test_equality(self):
+        other = SimpleConfigOrigin.new_simple("other")
+        a = tokens.new_unquoted_text(ORIGIN, u'a')
+        self.assertEqual(a, tokens.new_unquoted_text(other, u'a'))
+        self.assertEqual(hash(a), hash(tokens.new_unquoted_text(other, u'a')))
+        self.assertNotEqual(a, tokens.new_unquoted_text(ORIGIN, u'b'))
+        self.assertTrue(a != tokens.new_unquoted_text(ORIGIN, u'b'))
+        self.assertFalse(a != tokens.new_unquoted_text(other, u'a'))
+        # same key, different token class
+        self.assertNotEqual(tokens.new_comment(ORIGIN, u'a'), a)
+        self.assertNotEqual(tokens.new_string(ORIGIN, u'a'), a)
+        self.assertNotEqual(tokens.new_line(ORIGIN, 1),
+                            tokens.new_line(ORIGIN, 2))
+
+    def test_hash_cached(self):
+        t = tokens.new_string(ORIGIN, u'a')
+        h = hash(t)
+        self.assertEqual(t._hash, h)
+        self.assertEqual(hash(t), h)
+
+    def test_new_string_is_a_value(self):
+        t = tokens.new_string(ORIGIN, u'a')
+        self.assertTrue(tokens.is_value(t))
+        self.assertEqual(tokens.get_value(t).unwrapped(), u'a')
+
+    def test_strings_interned(self):
+        first, second = [t for t in tokenize(u'"key" = x\n"key" = x\n')
+                         if tokens.is_value(t)]
+        self.assertIs(tokens.get_value(first).unwrapped(),
+                      tokens.get_value(second).unwrapped())
+        texts = [tokens.get_unquoted_text(t)
+                 for t in tokenize(u'key.a = 1\nkey.a = 2\n')
+                 if tokens.is_unquoted_text(t)]
+        self.assertEqual(texts, [u'key.a', u'key.a'])
+        self.assertIs(texts[0], texts[1])
+
+    def test_unquoted_text_shared_within_a_line(self):
+        ts = tokenize(u'a = x y x y\nb = x y\n')
+        texts = [t for t in ts if tokens.is_unquoted_text(t)]
+        spaces = [t for t in texts if tokens.get_unquoted_text(t) == u' ']
+        xs = [t for t in texts if tokens.get_unquoted_text(t) == u'x']
+        self.assertEqual(len(spaces), 4)
+        self.assertTrue(all(s is spaces[0] for s in spaces[:3]))
+        self.assertIs(xs[0], xs[1])
+        # a later line has its own, with its own line number
+        self.assertIsNot(spaces[3], spaces[0])
+        self.assertIsNot(xs[2], xs[0])
+        self.assertEqual([t.line_number() for t in xs], [1, 1, 2])
+        self.assertEqual(xs[2].origin().line_number(), 2)
+
+    def test_interning_bounded(self):
+        text = u''.join(u'k%d = v\n' % i
+                        for i in range(tokenizer.MAX_INTERNED_STRINGS + 10))
+        iterator = tokenizer.tokenize(ORIGIN, io.StringIO(text),
+                                      ConfigSyntax.conf)
+        ts = list(iterator)
+        self.assertEqual(len(iterator.strings),
+                         tokenizer.MAX_INTERNED_STRINGS)
+        keys = [tokens.get_unquoted_text(t) for t in ts
+                if tokens.is_unquoted_text(t)
+                and tokens.get_unquoted_text(t).startswith(u'k')]
+        self.assertEqual(keys[-1],
+                         u'k%d' % (tokenizer.MAX_INTERNED_STRINGS + 9))
+
+
+if __name__ == '__main__':
+    unittest.main()
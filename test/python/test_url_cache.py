@@ -0,0 +1,211 @@
+"""
+Tests for UrlCache, against a local HTTP server.
+
+    python -m pytest test/python/test_url_cache.py
+"""
+
+import glob
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    # Python 3
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+from hocon.impl import ConfigImpl
+from hocon.impl.UrlCache import UrlCache
+
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Sat, 01 Jan 2000 00:00:00 GMT'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, dict(
+                (k.lower(), v) for k, v in self.headers.items())))
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+        else:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/hocon')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', ETAG)
+            self.send_header('Last-Modified', LAST_MODIFIED)
+            self.end_headers()
+            self.wfile.write(body)
+        if self.server.drop_idle:
+            # without saying so, as a server timing out an idle
+            # connection would
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Server(object):
+    """
+    Serves files from a dict on an ephemeral port, counting connections and
+    listing the requests with their headers.
+    """
+
+    def __init__(self, files):
+        self.httpd = _HTTPServer(('127.0.0.1', 0), _Handler)
+        self.httpd.files = files
+        self.httpd.drop_idle = False
+        self.httpd.lock = threading.Lock()
+        self.httpd.connections = 0
+        self.httpd.requests = []
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def url(self, path):
+        return 'http://127.0.0.1:%d%s' % (self.httpd.server_port, path)
+
+    def connections(self):
+        return self.httpd.connections
+
+    def requests(self):
+        return self.httpd.requests
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+
+class UrlCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _Server({'/a.conf': b'a = 1\n', '/b.conf': b'b = 2\n'})
+        self.addCleanup(self.server.close)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def cache(self, **kwargs):
+        cache = UrlCache(**kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_open(self):
+        cache = self.cache()
+        self.assertEqual(cache.open(self.server.url('/a.conf')),
+                         (b'a = 1\n', 'application/hocon'))
+        with self.assertRaises(IOError):
+            cache.open(self.server.url('/missing.conf'))
+
+    def test_connection_reused(self):
+        cache = self.cache()
+        cache.open(self.server.url('/a.conf'))
+        cache.open(self.server.url('/b.conf'))
+        cache.open(self.server.url('/a.conf'))
+        self.assertEqual(len(self.server.requests()), 3)
+        self.assertEqual(self.server.connections(), 1)
+
+    def test_not_modified_reuses_body(self):
+        cache = self.cache()
+        url = self.server.url('/a.conf')
+        first = cache.open(url)
+        self.assertEqual(cache.open(url), first)
+        headers = [h for path, h in self.server.requests()]
+        self.assertNotIn('if-none-match', headers[0])
+        self.assertEqual(headers[1]['if-none-match'], ETAG)
+        self.assertEqual(headers[1]['if-modified-since'], LAST_MODIFIED)
+
+    def test_traced(self):
+        self.addCleanup(setattr, ConfigImpl, '_trace_loads_enabled',
+                        ConfigImpl._trace_loads_enabled)
+        ConfigImpl._trace_loads_enabled = True
+        self.addCleanup(setattr, sys, 'stderr', sys.stderr)
+        sys.stderr = io.StringIO()
+        cache = self.cache()
+        url = self.server.url('/a.conf')
+        cache.open(url)
+        cache.open(url)
+        self.assertIn("URL not modified: " + url, sys.stderr.getvalue())
+
+    def test_disk_entry_used_by_fresh_cache(self):
+        url = self.server.url('/a.conf')
+        first = self.cache(directory=self.directory).open(url)
+        self.assertEqual(self.cache(directory=self.directory).open(url),
+                         first)
+        # the fresh cache's only request was conditional, and got a 304
+        path, headers = self.server.requests()[1]
+        self.assertEqual(headers['if-none-match'], ETAG)
+
+    def test_corrupt_disk_entry_is_a_miss(self):
+        url = self.server.url('/a.conf')
+        self.cache(directory=self.directory).open(url)
+        entries = glob.glob(os.path.join(self.directory, '*.url'))
+        self.assertEqual(len(entries), 1)
+        with open(entries[0], 'wb') as f:
+            f.write(b'\x80\x04not a pickle')
+        self.assertEqual(self.cache(directory=self.directory).open(url),
+                         (b'a = 1\n', 'application/hocon'))
+        path, headers = self.server.requests()[1]
+        self.assertNotIn('if-none-match', headers)
+
+    def test_stale_connection_retried(self):
+        cache = self.cache()
+        self.server.httpd.drop_idle = True
+        cache.open(self.server.url('/a.conf'))
+        # the pooled connection was closed by the server
+        self.assertEqual(cache.open(self.server.url('/b.conf')),
+                         (b'b = 2\n', 'application/hocon'))
+        self.assertEqual(self.server.connections(), 2)
+
+    def test_parses_bounded(self):
+        cache = self.cache(max_parses=2)
+        parsed = []
+
+        def parse_value(name):
+            url = self.server.url('/' + name)
+
+            def parse():
+                parsed.append(name)
+                return cache.open(url)[0]
+            return cache.parse_value(url, (url,), parse)
+
+        for name in ('a.conf', 'b.conf', 'a.conf'):
+            parse_value(name)
+        self.assertEqual(parsed, ['a.conf', 'b.conf'])
+        # evicts b.conf, the least recently used
+        self.server.httpd.files['/c.conf'] = b'c = 3\n'
+        parse_value('c.conf')
+        parse_value('a.conf')
+        parse_value('b.conf')
+        self.assertEqual(parsed, ['a.conf', 'b.conf', 'c.conf', 'b.conf'])
+
+
+if __name__ == '__main__':
+    unittest.main()